@@ -151,15 +151,8 @@ class Absorber:
             catalogue_entry=catalogue_entry,
         )
 
-        # Loop through attributes
-        for attribute in attributes:
-            # Create Attribute
-            models.layer_attributes.LayerAttribute.objects.create(
-                name=attribute.name,
-                type=attribute.type,
-                order=attribute.order,
-                catalogue_entry=catalogue_entry,
-            )
+        # Create Attributes
+        models.layer_attributes.LayerAttribute.bulk_write(catalogue_entry, attributes)
 
         # Create Layer Symbology
         models.layer_symbology.LayerSymbology.objects.create(
@@ -239,6 +239,14 @@ class WebhookNotificationAdmin(reversion.admin.VersionAdmin):
     url_link.short_description = 'URL'
 
 
+class WebhookDeliveryAdmin(admin.ModelAdmin):
+    search_fields = ('id', 'url', 'webhook__name')
+    list_display = ('id', 'url', 'status', 'attempts', 'response_status', 'next_attempt_at', 'delivered_at')
+    list_filter = ('status',)
+    ordering = ('-id',)
+    readonly_fields = ('created_at', 'last_attempt_at', 'heartbeat_at', 'delivered_at')
+
+
 class CatalogueEntryPermissionAdmin(reversion.admin.VersionAdmin):
     search_fields = ('id', 'catalogue_entry__name',)
     list_display = ('id', 'user_link', 'catalogue_entry_link', 'access_permission', 'active')
@@ -277,6 +285,7 @@ admin.site.register(models.layer_subscriptions.LayerSubscriptionData, LayerSubsc
 admin.site.register(models.layer_symbology.LayerSymbology, LayerSymbologyAdmin)
 admin.site.register(models.notifications.EmailNotification, EmailNotificationAdmin)
 admin.site.register(models.notifications.WebhookNotification, WebhookNotificationAdmin)
+admin.site.register(models.notifications.WebhookDelivery, WebhookDeliveryAdmin)
 admin.site.register(models.permission.CatalogueEntryPermission, CatalogueEntryPermissionAdmin)
 
 
@@ -0,0 +1,243 @@
+"""Kaartdijin Boodja Catalogue Django Application OGC Capabilities Cache.
+
+GetCapabilities documents of WMS and WFS layer subscriptions can be several
+megabytes and slow to fetch, so they are kept in the Django cache (shared by
+every process), keyed on the service, URL, version and credentials:
+
+* A document younger than `CAPABILITIES_CACHE_FRESH_SECONDS` is served
+  without contacting the upstream server.
+* An older document, up to `CAPABILITIES_CACHE_MAX_STALE_SECONDS`, is served
+  while a background thread revalidates it.
+* Otherwise the document is revalidated before being served.
+
+Revalidation sends the `ETag` and `Last-Modified` validators of the cached
+document, so an unchanged document is not downloaded again. The version
+negotiated with each server is also remembered, so versions the server does
+not support are not tried on every lookup.
+"""
+
+
+# Standard
+import hashlib
+import json
+import logging
+import threading
+import time
+import urllib.parse
+
+# Third-Party
+from django import conf
+from django.core.cache import cache
+import requests
+from requests.auth import HTTPBasicAuth
+
+# Typing
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+
+# Logging
+logger = logging.getLogger(__name__)
+
+
+# Constants
+CACHE_PREFIX = "catalogue.capabilities"
+TIMEOUT = 30  # seconds, as OWSLib
+
+# Type Variables
+T = TypeVar("T")
+
+
+def get_service(
+    service: str,
+    factory: Callable[..., T],
+    url: str,
+    versions: Iterable[str],
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+) -> T:
+    """Constructs an OWSLib service from its cached capabilities.
+
+    The versions are tried in order, starting with the version last
+    negotiated with the server.
+
+    Args:
+        service (str): OGC service type (e.g. "WMS").
+        factory (Callable[..., T]): OWSLib service class (e.g. `WebMapService`).
+        url (str): URL of the service.
+        versions (Iterable[str]): Versions to try, in order of preference.
+        username (Optional[str]): Username for the service.
+        password (Optional[str]): Password for the service.
+
+    Raises:
+        Exception: The error of the last version tried, if none succeeded.
+
+    Returns:
+        T: The OWSLib service.
+    """
+    # Order Versions
+    versions = list(versions)
+    version_key = _key("version", service, url, username, password)
+    negotiated = cache.get(version_key)
+    if negotiated in versions:
+        versions.remove(negotiated)
+        versions.insert(0, negotiated)
+
+    # Try Versions
+    error: Optional[Exception] = None
+    for version in versions:
+        try:
+            xml = get_capabilities(service, url, version, username, password)
+            result = factory(url=url, version=version, xml=xml, username=username, password=password)
+        except Exception as e:
+            logger.warning(f"Unable to read {service} [{url}] capabilities with version {version}: [{e}]")
+            error = e
+            continue
+
+        # Remember Negotiated Version and Return
+        if version != negotiated:
+            cache.set(version_key, version, timeout=None)
+        return result
+
+    # Raise
+    raise error or ValueError(f"No {service} versions to try for [{url}]")
+
+
+def get_capabilities(
+    service: str,
+    url: str,
+    version: str,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+) -> bytes:
+    """Retrieves a GetCapabilities document, from the cache if possible.
+
+    Args:
+        service (str): OGC service type (e.g. "WMS").
+        url (str): URL of the service.
+        version (str): Version of the service.
+        username (Optional[str]): Username for the service.
+        password (Optional[str]): Password for the service.
+
+    Returns:
+        bytes: The capabilities document.
+    """
+    # Check Cache
+    key = _key("document", service, url, version, username, password)
+    entry = cache.get(key)
+    if entry is not None:
+        age = time.time() - entry["fetched_at"]
+        if age < conf.settings.CAPABILITIES_CACHE_FRESH_SECONDS:
+            return entry["xml"]
+        if age < conf.settings.CAPABILITIES_CACHE_MAX_STALE_SECONDS:
+            _revalidate_in_background(key, service, url, version, username, password)
+            return entry["xml"]
+
+    # Fetch and Return
+    return _revalidate(key, entry, service, url, version, username, password)["xml"]
+
+
+def _revalidate(
+    key: str,
+    entry: Optional[dict[str, Any]],
+    service: str,
+    url: str,
+    version: str,
+    username: Optional[str],
+    password: Optional[str],
+) -> dict[str, Any]:
+    """Fetches a GetCapabilities document, unless the cached one is unchanged.
+
+    Args:
+        key (str): Cache key of the document.
+        entry (Optional[dict[str, Any]]): The cached document, if any.
+        service (str): OGC service type (e.g. "WMS").
+        url (str): URL of the service.
+        version (str): Version of the service.
+        username (Optional[str]): Username for the service.
+        password (Optional[str]): Password for the service.
+
+    Returns:
+        dict[str, Any]: The cached document.
+    """
+    # Construct Request
+    headers = {}
+    if entry is not None and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry is not None and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    auth = HTTPBasicAuth(username, password) if username else None
+
+    # Request
+    response = requests.get(_capabilities_url(service, url, version), headers=headers, auth=auth, timeout=TIMEOUT)
+    if response.status_code == 304 and entry is not None:
+        logger.info(f"{service} [{url}] capabilities version {version} are unchanged")
+        entry = {**entry, "fetched_at": time.time()}
+    else:
+        response.raise_for_status()
+        logger.info(f"Fetched {service} [{url}] capabilities version {version} ({len(response.content)} bytes)")
+        entry = {
+            "xml": response.content,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+
+    # Cache and Return
+    cache.set(key, entry, timeout=None)
+    return entry
+
+
+def _revalidate_in_background(key: str, *args: Any) -> None:
+    """Revalidates a cached document in a background thread.
+
+    Only one process revalidates a document at a time.
+
+    Args:
+        key (str): Cache key of the document.
+        *args (Any): Service, URL, version, username and password.
+    """
+    # Check no other Thread is Revalidating
+    lock_key = f"{key}.revalidating"
+    if not cache.add(lock_key, True, timeout=TIMEOUT * 2):
+        return
+
+    def revalidate() -> None:
+        try:
+            _revalidate(key, cache.get(key), *args)
+        except Exception as e:
+            logger.warning(f"Unable to revalidate {args[0]} [{args[1]}] capabilities: [{e}]")
+        finally:
+            cache.delete(lock_key)
+
+    # Start Thread
+    threading.Thread(target=revalidate, name="capabilities-revalidate", daemon=True).start()
+
+
+def _capabilities_url(service: str, url: str, version: str) -> str:
+    """Constructs the GetCapabilities URL of a service.
+
+    Args:
+        service (str): OGC service type (e.g. "WMS").
+        url (str): URL of the service, possibly with query parameters.
+        version (str): Version of the service.
+
+    Returns:
+        str: The GetCapabilities URL.
+    """
+    parts = urllib.parse.urlsplit(url)
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query) if k.lower() not in ("service", "request", "version")]
+    query += [("service", service), ("request", "GetCapabilities"), ("version", version)]
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+
+def _key(kind: str, *parts: Optional[str]) -> str:
+    """Constructs a cache key, without including the credentials in plain text.
+
+    Args:
+        kind (str): Kind of cached value.
+        *parts (Optional[str]): Values identifying the cached value.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"{CACHE_PREFIX}.{kind}.{hashlib.sha256(json.dumps(parts).encode()).hexdigest()}"
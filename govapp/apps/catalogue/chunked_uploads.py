@@ -0,0 +1,233 @@
+"""Kaartdijin Boodja Catalogue Django Application Resumable Chunked Uploads.
+
+A file is uploaded to the pending imports directory in chunks, each sent with
+the byte offset it starts at. Bytes are written to `<name>.tmp` and the total
+size is recorded in `<name>.tmp.size` (both are ignored by the directory
+scanner). The committed offset is simply the size of the `.tmp` file, so an
+interrupted upload can query it and resume from there:
+
+* A chunk entirely below the committed offset is a duplicate and is ignored.
+* A chunk overlapping the committed offset is written from its own offset,
+  rewriting the identical overlapping bytes.
+* A chunk starting beyond the committed offset is rejected, as it would
+  leave a gap.
+
+Chunks may carry a SHA-256 digest, checked before anything is written, and
+the final whole-file SHA-256 is checked before the `.tmp` file is renamed into
+place and so released to the scanner. Chunks are written and the file is
+released under an exclusive lock on the `.tmp` file. Only the first chunk
+creates the `.tmp` file, and late chunks or finishes of an upload that has
+already been released do nothing.
+"""
+
+
+# Standard
+import fcntl
+import hashlib
+import logging
+import os
+import pathlib
+
+# Third-Party
+from django.core.files import uploadedfile
+
+# Local
+from govapp.common.utils import file_sha256
+
+# Typing
+from typing import BinaryIO, Optional
+
+
+# Logging
+logger = logging.getLogger(__name__)
+
+
+class ChunkOutOfOrderError(Exception):
+    """Raised when a chunk starts beyond the committed offset."""
+
+    def __init__(self, offset: int) -> None:
+        super().__init__(f"Chunk starts beyond the committed offset {offset}.")
+        self.offset = offset
+
+
+class ChecksumMismatchError(Exception):
+    """Raised when a chunk or the completed file does not match its digest."""
+
+
+class ChunkedUpload:
+    """Resumable chunked upload of a file to a directory."""
+
+    def __init__(self, directory: str, file_name: str) -> None:
+        """Instantiates the Chunked Upload.
+
+        Args:
+            directory (str): Directory the completed file is placed in.
+            file_name (str): Name of the completed file.
+        """
+        # Paths
+        self.path = pathlib.Path(directory) / pathlib.Path(file_name).name
+        self.tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self.size_path = self.path.with_name(self.path.name + ".tmp.size")
+
+    @property
+    def complete(self) -> bool:
+        """Whether the upload has completed."""
+        return self.path.exists() and not self.tmp_path.exists()
+
+    @property
+    def offset(self) -> int:
+        """Number of bytes committed so far."""
+        if self.complete:
+            return self.path.stat().st_size
+        return self.tmp_path.stat().st_size if self.tmp_path.exists() else 0
+
+    @property
+    def total_size(self) -> Optional[int]:
+        """Total size of the file, if recorded."""
+        try:
+            return int(self.size_path.read_text().strip())
+        except (OSError, ValueError):
+            return None
+
+    def status(self) -> dict:
+        """Retrieves the status of the upload.
+
+        Returns:
+            dict: The committed offset, total size and whether it is complete.
+        """
+        # Return
+        return {"offset": self.offset, "totalSize": self.total_size, "complete": self.complete}
+
+    def write(
+        self,
+        chunk: uploadedfile.UploadedFile,
+        offset: int,
+        total_size: int,
+        sha256: Optional[str] = None,
+    ) -> int:
+        """Writes a chunk at its offset.
+
+        Args:
+            chunk (uploadedfile.UploadedFile): The chunk.
+            offset (int): Byte offset of the chunk within the file.
+            total_size (int): Total size of the file.
+            sha256 (Optional[str]): Expected hex SHA-256 of the chunk.
+
+        Raises:
+            ChecksumMismatchError: If the chunk does not match its digest.
+            ChunkOutOfOrderError: If the chunk would leave a gap in the file.
+
+        Returns:
+            int: The committed offset after the write.
+        """
+        # Check Chunk Digest
+        if sha256 is not None:
+            digest = hashlib.sha256()
+            for data in chunk.chunks():
+                digest.update(data)
+            if digest.hexdigest() != sha256.lower():
+                raise ChecksumMismatchError(f"Chunk at offset {offset} of [{self.path.name}] does not match its digest.")
+
+        # Open the Temporary File, locked against concurrent re-sends
+        # Only the first chunk creates it, so a late chunk cannot recreate it
+        # once the upload has finished.
+        try:
+            fd = os.open(self.tmp_path, os.O_RDWR | (os.O_CREAT if offset == 0 else 0), 0o644)
+        except FileNotFoundError:
+            if self.complete:
+                logger.info(f"Ignoring chunk at offset {offset} of finished upload [{self.path.name}]")
+                return self.offset
+            raise ChunkOutOfOrderError(0) from None
+        with os.fdopen(fd, "r+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+
+            # Check the File was not Released while Waiting for the Lock
+            committed = os.fstat(f.fileno()).st_size
+            if not self._is_tmp_file(f):
+                logger.info(f"Ignoring chunk at offset {offset} of finished upload [{self.path.name}]")
+                return committed
+
+            # Check a Late First Chunk did not Create the File after Finishing
+            if committed == 0 and self.path.exists():
+                logger.info(f"Ignoring chunk at offset {offset} of finished upload [{self.path.name}]")
+                self.tmp_path.unlink()
+                return self.path.stat().st_size
+
+            # Record the Total Size when Starting
+            if committed == 0:
+                self.size_path.write_text(str(total_size))
+
+            # Check Offset
+            if offset > committed:
+                raise ChunkOutOfOrderError(committed)
+            if offset + chunk.size <= committed:
+                logger.info(f"Ignoring duplicate chunk at offset {offset} of [{self.path.name}]")
+                return committed
+
+            # Write Chunk
+            f.seek(offset)
+            for data in chunk.chunks():
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+            # Return
+            return os.fstat(f.fileno()).st_size
+
+    def finish(self, sha256: Optional[str] = None) -> None:
+        """Verifies the uploaded file and releases it to the pending imports scanner.
+
+        Args:
+            sha256 (Optional[str]): Expected hex SHA-256 of the whole file.
+
+        Raises:
+            ChecksumMismatchError: If the file does not match its digest.
+            FileNotFoundError: If no chunks have been uploaded.
+        """
+        # Lock the Temporary File against Concurrent Chunks and Finishes
+        try:
+            fd = os.open(self.tmp_path, os.O_RDWR)
+        except FileNotFoundError:
+            if self.complete:
+                logger.info(f"Upload of [{self.path.name}] has already finished")
+                return
+            raise
+        with os.fdopen(fd, "r+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+
+            # Check the File was not Released while Waiting for the Lock
+            if not self._is_tmp_file(f):
+                logger.info(f"Upload of [{self.path.name}] has already finished")
+                return
+
+            # Check File Digest
+            if sha256 is not None and file_sha256(self.tmp_path) != sha256.lower():
+                raise ChecksumMismatchError(f"Uploaded file [{self.path.name}] does not match its digest.")
+
+            # Release the File
+            # The rename is the critical operation; size_path removal is cleanup only.
+            os.rename(self.tmp_path, self.path)
+
+        try:
+            self.size_path.unlink()
+        except OSError as cleanup_error:
+            logger.warning(f"Could not remove size metadata file [{self.size_path}]: {cleanup_error}")
+
+    def _is_tmp_file(self, f: BinaryIO) -> bool:
+        """Determines whether an open file is still the upload's temporary file.
+
+        Args:
+            f (BinaryIO): File opened at the temporary file's path.
+
+        Returns:
+            bool: False if the file has since been released (renamed) by `finish`.
+        """
+        try:
+            return os.stat(self.tmp_path).st_ino == os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            return False
+
+    def discard(self) -> None:
+        """Removes any partially uploaded data."""
+        for path in (self.tmp_path, self.size_path):
+            path.unlink(missing_ok=True)
@@ -52,4 +52,18 @@ class DirectoryScannerCronJob(django_cron.CronJobBase):
         log.info("Directory Scanner cron job triggered, running...")
 
         # Run Management Command
-        management.call_command("scan_dir")        
\ No newline at end of file
+        management.call_command("scan_dir")
+
+
+class WebhookDeliveryCronJob(django_cron.CronJobBase):
+    """Cron Job for delivering queued Webhook POSTs."""
+    schedule = django_cron.Schedule(run_every_mins=conf.settings.WEBHOOK_DELIVERY_PERIOD_MINS)
+    code = "govapp.catalogue.webhook_delivery"
+
+    def do(self) -> None:
+        """Perform the Webhook Delivery Cron Job."""
+        # Log
+        log.info("Webhook Delivery cron job triggered, running...")
+
+        # Run Management Command
+        management.call_command("deliver_webhooks")
@@ -23,6 +23,7 @@ from govapp.gis import compression, readers
 from govapp.gis.conversions import to_geojson
 from govapp.apps.catalogue import models
 from govapp.apps.catalogue import directory_notifications
+from govapp.apps.catalogue import timings
 from govapp.apps.catalogue import utils
 from govapp.gis.readers import types
 from govapp.apps.logs import utils as logs_utils
@@ -43,6 +44,17 @@ class Absorber:
     def absorb(self, path: str) -> None:
         """Absorbs new layers into the system.
 
+        The duration of each stage is saved against the layer submissions.
+
+        Args:
+            path (str): File to absorb.
+        """
+        with timings.start():
+            self._absorb(path)
+
+    def _absorb(self, path: str) -> None:
+        """Absorbs new layers into the system.
+
         Args:
             path (str): File to absorb.
         """
@@ -63,7 +75,8 @@ class Absorber:
         original_suffix = filepath.suffix
         absorbing_path = filepath.parent / (filepath.name + ".absorbing")
         try:
-            filepath.rename(absorbing_path)
+            with timings.span("rename"):
+                filepath.rename(absorbing_path)
             filepath = absorbing_path
             logger.info(f"Marked as in-progress: [{filepath}]")
         except OSError as e:
@@ -85,7 +98,8 @@ class Absorber:
 
         # Use original stem/suffix (not .absorbing) so the archived filename is correct.
         storage_path = os.path.join(storage_directory, original_stem + "." + timestamp_str + original_suffix)
-        archive = self.storage.move_to_storage(filepath, storage_path)  # Move file to archive
+        with timings.span("archive", nbytes=filepath.stat().st_size):
+            archive = self.storage.move_to_storage(filepath, storage_path)  # Move file to archive
 
         # # Log
         if archive:
@@ -117,7 +131,7 @@ class Absorber:
             if compressed_algorithm:
                 logger.info(f'Compressed algorithm detected: [{compressed_algorithm}] for the file: [{path_to_file}]')
                 # Decompress the file into the temp folder
-                with compressed_algorithm(path_to_file) as archive:
+                with timings.span("extract") as span, compressed_algorithm(path_to_file) as archive:
                     os.makedirs(temp_dir, exist_ok=True)
                     logger.info(f'Directory: [{temp_dir}] has been made for extract the file: [{path_to_file}]')
 
@@ -151,6 +165,9 @@ class Absorber:
                             )
                             raise
 
+                    # Count the Bytes Extracted
+                    span.bytes = sum(f.stat().st_size for f in pathlib.Path(temp_dir).rglob("*") if f.is_file())
+
                 # If extracted, loop through extracted files
                 for extracted_filepath in os.listdir(temp_dir):
                     filepaths_to_process.append(os.path.join(temp_dir, extracted_filepath))
@@ -209,13 +226,18 @@ class Absorber:
         logger.info(f" - Succeed layers : {result['success']}\n - Failed layers : {result['fail']}")
 
     def absorb_tiff_as_layer(self, pathlib_filepath):
+        with timings.start():
+            self._absorb_tiff_as_layer(pathlib_filepath)
+
+    def _absorb_tiff_as_layer(self, pathlib_filepath):
         # Open the file with GDAL
-        dataset = gdal.Open(str(pathlib_filepath))
-        if dataset is None:
-            logger.error(f'Failed to open the file: {str(pathlib_filepath)}')
-            return
+        with timings.span("read_metadata", nbytes=pathlib_filepath.stat().st_size):
+            dataset = gdal.Open(str(pathlib_filepath))
+            if dataset is None:
+                logger.error(f'Failed to open the file: {str(pathlib_filepath)}')
+                return
 
-        additional_data = utils.retrieve_additional_data(dataset)
+            additional_data = utils.retrieve_additional_data(dataset)
         if self.is_projcs_unknown(additional_data['Projection']):
             logger.warning(f"SRS for file '{str(pathlib_filepath)}' is identified as 'unknown'.  This indicates the file lacks a standard EPSG identifier.")
 
@@ -292,6 +314,16 @@ class Absorber:
     def absorb_vector_layer(self, layer: readers.base.LayerReader, archive: str) -> None:
         """Absorbs a layer into the system.
 
+        Args:
+            layer (readers.base.LayerReader): Layer to absorb.
+            archive (str): URL to the archived file for this layer.
+        """
+        with timings.start():
+            self._absorb_vector_layer(layer, archive)
+
+    def _absorb_vector_layer(self, layer: readers.base.LayerReader, archive: str) -> None:
+        """Absorbs a layer into the system.
+
         Args:
             layer (readers.base.LayerReader): Layer to absorb.
             archive (str): URL to the archived file for this layer.
@@ -300,9 +332,12 @@ class Absorber:
         logger.info(f"Extracting data from layer: '{layer.name}'")
 
         # Extract metadata, attributes and symbology
-        metadata = layer.metadata()
-        attributes = layer.attributes()
-        symbology = layer.symbology()
+        with timings.span("read_metadata"):
+            metadata = layer.metadata()
+        with timings.span("read_attributes"):
+            attributes = layer.attributes()
+        with timings.span("read_symbology"):
+            symbology = layer.symbology()
 
         logger.info(f"Extracting data from layer: '{attributes}'")
         # Retrieve existing catalogue entry from the database
@@ -369,38 +404,41 @@ class Absorber:
             attributes_str = attributes_str+str(attr)+"\n"
 
         # Create Catalogue Entry
-        catalogue_entry = models.catalogue_entries.CatalogueEntry.objects.create(
-            name=metadata.name,
-            description=metadata.description,
-        )
-        logger.info(f'New CatalogueEntry: [{catalogue_entry}] has been created.')
-        logs_utils.add_to_actions_log(
-            user=None,
-            model= catalogue_entry,
-            action=f"CatalogueEntry: [{catalogue_entry}] has been created.",
-            default_to_system=True
-        )
+        with timings.span("database"):
+            catalogue_entry = models.catalogue_entries.CatalogueEntry.objects.create(
+                name=metadata.name,
+                description=metadata.description,
+            )
+            logger.info(f'New CatalogueEntry: [{catalogue_entry}] has been created.')
+            logs_utils.add_to_actions_log(
+                user=None,
+                model= catalogue_entry,
+                action=f"CatalogueEntry: [{catalogue_entry}] has been created.",
+                default_to_system=True
+            )
 
         # Convert to a Geojson text
         extension = pathlib.Path(archive).suffix.lower()
         geojson_path = '' if extension in self.ext_not_convert_to_geojson else self.convert_to_geojson(archive, catalogue_entry)
 
-        # Create Layer Submission
-        self.create_layer_submission(metadata, archive, attributes_hash, attributes_str, catalogue_entry, geojson_path, True, crs=crs)
+        with timings.span("database"):
+            # Create Layer Submission
+            self.create_layer_submission(metadata, archive, attributes_hash, attributes_str, catalogue_entry, geojson_path, True, crs=crs)
 
-        # Create Layer Metadata
-        self.create_or_update_layer_metadata(metadata, catalogue_entry)
+            # Create Layer Metadata
+            self.create_or_update_layer_metadata(metadata, catalogue_entry)
 
-        # Loop through attributes
-        if attributes:
-            self.create_layer_attributes(attributes, catalogue_entry)
+            # Loop through attributes
+            if attributes:
+                self.create_layer_attributes(attributes, catalogue_entry)
 
-        # Create Layer Symbology
-        if symbology:
-            self.create_layer_symbology(symbology, catalogue_entry)
+            # Create Layer Symbology
+            if symbology:
+                self.create_layer_symbology(symbology, catalogue_entry)
 
         # Notify!
-        directory_notifications.catalogue_entry_creation(catalogue_entry)
+        with timings.span("notify"):
+            directory_notifications.catalogue_entry_creation(catalogue_entry)
 
         # Return
         return True
@@ -442,7 +480,8 @@ class Absorber:
         geojson_path = '' if extension in self.ext_not_convert_to_geojson else self.convert_to_geojson(archive, catalogue_entry)
 
         # Create New Layer Submission
-        layer_submission = self.create_layer_submission(metadata, archive, attributes_hash, attributes_str, catalogue_entry, geojson_path, False, crs=crs)
+        with timings.span("database"):
+            layer_submission = self.create_layer_submission(metadata, archive, attributes_hash, attributes_str, catalogue_entry, geojson_path, False, crs=crs)
 
         # CRS validation: if the catalogue has a configured default_crs and the file's
         # CRS is known but does not match, decline the submission immediately.
@@ -451,30 +490,33 @@ class Absorber:
                 f"CRS mismatch for CatalogueEntry [{catalogue_entry}]: "
                 f"expected '{catalogue_entry.default_crs.epsg_code}', got '{crs}'. Declining submission."
             )
-            layer_submission.decline()
-            directory_notifications.catalogue_entry_update_failure(catalogue_entry)
+            with timings.span("database"):
+                layer_submission.decline()
+            with timings.span("notify"):
+                directory_notifications.catalogue_entry_update_failure(catalogue_entry)
             return False
         
-        # Create Layer Metadata
-        self.create_or_update_layer_metadata(metadata, catalogue_entry)
+        with timings.span("database"):
+            # Create Layer Metadata
+            self.create_or_update_layer_metadata(metadata, catalogue_entry)
 
-        if catalogue_entry.type == models.catalogue_entries.CatalogueEntryType.SUBSCRIPTION_QUERY and not catalogue_entry.attributes.count():
-            # When subscribing a custom query in PostGIS, only the catalogue_entry object is created initially,
-            # and layer_attributes, layer_symbology, and layer_metadata need to be generated later here.
+            if catalogue_entry.type == models.catalogue_entries.CatalogueEntryType.SUBSCRIPTION_QUERY and not catalogue_entry.attributes.count():
+                # When subscribing a custom query in PostGIS, only the catalogue_entry object is created initially,
+                # and layer_attributes, layer_symbology, and layer_metadata need to be generated later here.
 
-            # # Create Layer Metadata
-            # self.create_layer_metadata(metadata, catalogue_entry)
+                # # Create Layer Metadata
+                # self.create_layer_metadata(metadata, catalogue_entry)
 
-            # Loop through attributes
-            if attributes:
-                self.create_layer_attributes(attributes, catalogue_entry)
+                # Loop through attributes
+                if attributes:
+                    self.create_layer_attributes(attributes, catalogue_entry)
 
-            # Create Layer Symbology
-            if symbology:
-                self.create_layer_symbology(symbology, catalogue_entry)
+                # Create Layer Symbology
+                if symbology:
+                    self.create_layer_symbology(symbology, catalogue_entry)
 
-        # Attempt to "Activate" this Layer Submission
-        layer_submission.activate(False)
+            # Attempt to "Activate" this Layer Submission
+            layer_submission.activate(False)
         
         # Check Success
         success = not layer_submission.is_declined()
@@ -484,14 +526,17 @@ class Absorber:
             # Check for Publish Entry
             if hasattr(catalogue_entry, "publish_entry"):                
                 # Publish
-                catalogue_entry.publish_entry.publish()  # type: ignore[union-attr]
+                with timings.span("publish"):
+                    catalogue_entry.publish_entry.publish()  # type: ignore[union-attr]
 
             # Notify!
-            directory_notifications.catalogue_entry_update_success(catalogue_entry)
+            with timings.span("notify"):
+                directory_notifications.catalogue_entry_update_success(catalogue_entry)
 
         else:
             # Send Update Failure Email
-            directory_notifications.catalogue_entry_update_failure(catalogue_entry)
+            with timings.span("notify"):
+                directory_notifications.catalogue_entry_update_failure(catalogue_entry)
         # Return
         return success
 
@@ -514,6 +559,7 @@ class Absorber:
             crs=crs,
         )
         logger.info(f'LayerSubmission: [{layer_submission}] has been created for the CatalogueEntry: [{catalogue_entry}].')
+        timings.attach(layer_submission)
         return layer_submission
 
     def create_or_update_layer_metadata(self, metadata, catalogue_entry):
@@ -545,15 +591,13 @@ class Absorber:
         if existing_attributes.count():
             logger.warning(f'There are already existing LayerAttributes: [{catalogue_entry.attributes}] of the CatalogueEntry: [{catalogue_entry}].')
         else:
-            for attribute in attributes:
-                # Create Attribute
-                layer_attribute = models.layer_attributes.LayerAttribute.objects.create(
-                    name=attribute.name,
-                    type=attribute.type,
-                    order=attribute.order,
-                    catalogue_entry=catalogue_entry,
-                )
-                logger.info(f'LayerMetadata: [{layer_attribute}] has been created for the CatalogueEntry: [{catalogue_entry}].')
+            # Create Attributes
+            created, _, _ = models.layer_attributes.LayerAttribute.bulk_write(
+                catalogue_entry,
+                attributes,
+                comment=f"LayerAttributes created for the CatalogueEntry: [{catalogue_entry}]",
+            )
+            logger.info(f'{len(created)} LayerAttributes have been created for the CatalogueEntry: [{catalogue_entry}].')
 
     def create_layer_symbology(self, symbology, catalogue_entry):
         """
@@ -581,11 +625,13 @@ class Absorber:
         filepath: str, 
         catalogue_entry: models.catalogue_entries.CatalogueEntry) -> pathlib.Path:
         # Convert to a Geojson file
-        path_from = to_geojson(
-            filepath=pathlib.Path(filepath),
-            layer=catalogue_entry.name
-        )
-        return self.move_file_to_storage_with_uniquename(path_from['full_filepath'])
+        with timings.span("convert_to_geojson") as span:
+            path_from = to_geojson(
+                filepath=pathlib.Path(filepath),
+                layer=catalogue_entry.name
+            )
+            span.bytes = path_from['full_filepath'].stat().st_size
+            return self.move_file_to_storage_with_uniquename(path_from['full_filepath'])
 
     def move_file_to_storage_with_uniquename(self, path_from:pathlib.Path):
         # Create a new folder hierarchically named to today's date(./yyyy/mm/dd) in the data storage when it dosen't exist
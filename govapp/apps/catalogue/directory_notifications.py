@@ -44,6 +44,7 @@ def catalogue_entry_creation(entry: "catalogue_entries.CatalogueEntry") -> None:
     emails.CatalogueEntryCreatedEmail().send_to(
         *utils.all_administrators(),  # All administrators
         context={"name": entry.name},
+        about=entry,
     )
 
 
@@ -65,6 +66,7 @@ def catalogue_entry_update_success(entry: "catalogue_entries.CatalogueEntry") ->
         *entry.email_notifications(manager="on_new_data").filter(active=True).all(),  # type: ignore[operator]
         *entry.email_notifications(manager="both").filter(active=True).all(),  # type: ignore[operator]
         context={"name": entry.name},
+        about=entry,
     )
 
     # Retrieve the File from Storage
@@ -80,13 +82,13 @@ def catalogue_entry_update_success(entry: "catalogue_entries.CatalogueEntry") ->
 
         try:
             if settings.WEBHOOK_ENABLED:
-                # Send Webhook Posts
-                webhooks.post_geojson(
+                # Queue Webhook Posts
+                webhooks.queue_geojson(
                     *entry.webhook_notifications(manager="on_new_data").all(),  # type: ignore[operator]
                     geojson=output_filepath['full_filepath'],
                 )
         finally:
-            # Remove the to_geojson() scratch directory now that the webhook payload has been sent/read.
+            # Remove the to_geojson() scratch directory now that the webhook payload has been spooled.
             scratch_dir = output_filepath['full_filepath'].parent
             if scratch_dir.is_dir():
                 shutil.rmtree(scratch_dir, ignore_errors=True)
@@ -116,6 +118,7 @@ def catalogue_entry_update_failure(entry: "catalogue_entries.CatalogueEntry") ->
         *entry.email_notifications(manager="on_new_data").filter(active=True).all(),  # type: ignore[operator]
         *entry.email_notifications(manager="both").filter(active=True).all(),  # type: ignore[operator]
         context={"name": entry.name},
+        about=entry,
     )
 
 
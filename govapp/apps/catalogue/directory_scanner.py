@@ -2,16 +2,23 @@
 
 
 # Standard
+from concurrent import futures
 import logging
+import multiprocessing
 import os 
 
 # Third-Party
 from django import conf
+from django import db
 
 # Local
 from govapp.common import local_storage
 from govapp.apps.catalogue import directory_absorber
 from govapp.apps.catalogue import notifications
+from govapp.apps.metrics import registry
+
+# Typing
+from typing import Optional
 
 
 # Logging
@@ -21,28 +28,54 @@ log = logging.getLogger(__name__)
 class Scanner:
     """Scans for files to be absorbed into the system."""
 
-    def __init__(self) -> None:
-        """Instantiates the Scanner."""
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Instantiates the Scanner.
+
+        Args:
+            max_workers (Optional[int]): Number of files to absorb
+                concurrently. Defaults to `DIRECTORY_SCANNER_MAX_WORKERS`.
+        """
         # Storage        
         self.storage = local_storage.LocalStorage()
 
+        # Concurrency
+        self.max_workers = max_workers or conf.settings.DIRECTORY_SCANNER_MAX_WORKERS
+        self.large_file_size = conf.settings.DIRECTORY_SCANNER_LARGE_FILE_MB * 1024 * 1024
+
     def scan(self) -> None:
         """Scans for new files in the staging area to be absorbed."""
         # Log
         log.info(f"Scanning storage staging area: [{self.storage.get_pending_import_path()}] for files to absorb")
 
-        # Retrieve file from remote storage staging area
-        import os
-
-        files_array = os.listdir(self.storage.get_pending_import_path())
+        # Retrieve files from the staging area
+        files = self.pending_files()
 
         # Check for files
-        if not files_array:
+        if not files:
             # Log
             log.info("No files found")
 
-        # Loop through files
-        for file in files_array:
+        elif self.max_workers <= 1:
+            # Absorb one at a time, smallest first
+            for file, _ in sorted(files, key=lambda f: f[1]):
+                absorb(file)
+
+        else:
+            # Absorb concurrently
+            self.absorb_concurrently(files)
+
+        # Log
+        log.info("Scanning storage staging area complete!")
+
+    def pending_files(self) -> list[tuple[str, int]]:
+        """Retrieves the files in the staging area ready to be absorbed.
+
+        Returns:
+            list[tuple[str, int]]: Names and sizes of the files.
+        """
+        # Retrieve file from remote storage staging area
+        files = []
+        for file in os.listdir(self.storage.get_pending_import_path()):
             # Skip files that are still being uploaded (written with .tmp suffix)
             # Also skip the companion .tmp.size metadata files created during chunked upload
             # Skip files currently being archived by another absorb() call: absorb() renames
@@ -52,21 +85,116 @@ class Scanner:
                 log.info(f"Skipping '{file}' as it is still being uploaded or processed")
                 continue
 
-            # Log
-            log.info(f"Discovered file '{file}'")
-
-            # Handle errors
-            # For example, if someone drops in a malformed file or a non-GIS file
+            # Retrieve Size
             try:
-                # Absorb!
-                directory_absorber.Absorber().absorb(file)
-
-            except Exception as exc:
-                # Log and continue
-                log.error(f"Error absorbing file '{file}': {exc}")
-
-                # Notify!                
-                #notifications.file_absorb_failure(file)
+                size = os.path.getsize(self.storage.get_path(file))
+            except OSError:
+                # Claimed by an overlapping scan since it was listed
+                log.info(f"Skipping '{file}' as it is no longer in the staging area")
+                continue
 
-        # Log
-        log.info("Scanning storage staging area complete!")
+            # Log
+            log.info(f"Discovered file '{file}' ({size} bytes)")
+            files.append((file, size))
+
+        # Return
+        return files
+
+    def absorb_concurrently(self, files: list[tuple[str, int]]) -> None:
+        """Absorbs files in a pool of worker processes.
+
+        Each file is claimed by the worker that absorbs it (see
+        `Absorber.absorb()`), so a file listed by overlapping scans is only
+        absorbed once. Large files are started largest first, but never take
+        up every worker while small files are waiting, and small files are
+        absorbed smallest first.
+
+        Args:
+            files (list[tuple[str, int]]): Names and sizes of the files.
+        """
+        # Split Small and Large Files
+        small = sorted((f for f in files if f[1] < self.large_file_size), key=lambda f: f[1])
+        large = sorted((f for f in files if f[1] >= self.large_file_size), key=lambda f: f[1], reverse=True)
+
+        # Close Database Connections
+        # Forked workers must not share the parent's connections, they each
+        # open their own when first used.
+        db.connections.close_all()
+
+        # Absorb!
+        log.info(f"Absorbing {len(files)} files with {self.max_workers} workers ({len(large)} large files)")
+        context = multiprocessing.get_context("fork")
+        with futures.ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context) as executor:
+            running: dict[futures.Future, tuple[str, bool]] = {}
+            while small or large or running:
+                # Fill the Free Workers
+                while len(running) < self.max_workers:
+                    selected = self.select(small, large, sum(is_large for _, is_large in running.values()))
+                    if selected is None:
+                        break
+                    file, is_large = selected
+                    running[executor.submit(absorb, file)] = (file, is_large)
+
+                # Wait for a Worker to Finish
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    file, _ = running.pop(future)
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        # Worker process died (e.g., killed for memory)
+                        log.error(f"Error absorbing file '{file}': {exc}")
+
+    def select(
+        self,
+        small: list[tuple[str, int]],
+        large: list[tuple[str, int]],
+        large_running: int,
+    ) -> Optional[tuple[str, bool]]:
+        """Selects the next file to absorb, removing it from its list.
+
+        Args:
+            small (list[tuple[str, int]]): Small files waiting, in order.
+            large (list[tuple[str, int]]): Large files waiting, in order.
+            large_running (int): Number of large files being absorbed.
+
+        Returns:
+            Optional[tuple[str, bool]]: Name of the file and whether it is
+                large, or None if no file can be started yet.
+        """
+        # Large files may use every worker but one while small files wait
+        if large and (not small or large_running < self.max_workers - 1):
+            return large.pop(0)[0], True
+
+        # Small Files
+        if small:
+            return small.pop(0)[0], False
+
+        # Nothing to Start
+        return None
+
+
+def absorb(file: str) -> None:
+    """Absorbs a file from the staging area.
+
+    Args:
+        file (str): Name of the file in the staging area.
+    """
+    # Handle errors
+    # For example, if someone drops in a malformed file or a non-GIS file
+    try:
+        # Absorb!
+        directory_absorber.Absorber().absorb(file)
+
+    except Exception as exc:
+        # Log and continue
+        log.error(f"Error absorbing file '{file}': {exc}")
+
+        # Notify!                
+        #notifications.file_absorb_failure(file)
+
+    finally:
+        # Flush Metrics
+        # Pool workers exit without running the exit handlers, so the values
+        # buffered while absorbing would otherwise be lost.
+        registry.flush()
@@ -0,0 +1,37 @@
+"""Kaartdijin Boodja Catalogue Deliver Webhooks Management Command."""
+
+
+# Standard
+import argparse
+
+# Third-Party
+from django.core.management import base
+
+# Local
+from govapp.apps.catalogue import webhooks
+
+# Typing
+from typing import Any
+
+
+class Command(base.BaseCommand):
+    """Deliver Webhooks Management Command."""
+    # Help string
+    help = "POSTs the queued webhook deliveries that are due"  # noqa: A003
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Adds command-line arguments to the management command.
+
+        Args:
+            parser (argparse.ArgumentParser): Argument parser to add to.
+        """
+        # Add arguments
+        parser.add_argument("--workers", type=int, default=None, help="Number of webhooks to POST concurrently")
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        """Handles the management command functionality."""
+        # Go!
+        delivered = webhooks.deliver_pending(max_workers=kwargs["workers"])
+
+        # Display information
+        self.stdout.write(f"Attempted {delivered} webhook deliveries")
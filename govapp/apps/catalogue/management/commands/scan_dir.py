@@ -1,6 +1,9 @@
 """Kaartdijin Boodja Catalogue Scan Management Command."""
 
 
+# Standard
+import argparse
+
 # Third-Party
 from django.core.management import base
 
@@ -16,11 +19,20 @@ class Command(base.BaseCommand):
     # Help string
     help = "Scans the staging area to absorb files"  # noqa: A003
 
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Adds command-line arguments to the management command.
+
+        Args:
+            parser (argparse.ArgumentParser): Argument parser to add to.
+        """
+        # Add arguments
+        parser.add_argument("--workers", type=int, default=None, help="Number of files to absorb concurrently")
+
     def handle(self, *args: Any, **kwargs: Any) -> None:
         """Handles the management command functionality."""
         # Display information
         self.stdout.write("Scanning staging area")
 
         # Go!
-        directory_scanner.Scanner().scan()
+        directory_scanner.Scanner(max_workers=kwargs["workers"]).scan()
 
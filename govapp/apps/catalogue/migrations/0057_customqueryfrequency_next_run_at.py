@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:04
+
+import calendar
+import datetime
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Frequency types, as they were when this migration was written
+EVERY_MINUTES = 1
+EVERY_HOURS = 2
+DAILY = 3
+WEEKLY = 4
+
+
+def calculate_next_run_at(frequency):
+    """Calculates when a query is next due, from when it was last run.
+
+    A copy of `custom_query_frequency.calculate_next_run_at` at the time of
+    this migration, so the migration does not change with the model module.
+    """
+    # Check
+    if frequency.last_job_run is None:
+        return None
+
+    # Retrieve the Last Run in Local Time
+    last = frequency.last_job_run.astimezone(ZoneInfo(settings.TIME_ZONE))
+
+    # Every X Minutes or Hours
+    if frequency.type == EVERY_MINUTES:
+        return last + datetime.timedelta(minutes=frequency.every_minutes)
+    if frequency.type == EVERY_HOURS:
+        return last + datetime.timedelta(hours=frequency.every_hours)
+
+    # Daily or Weekly
+    if frequency.type in (DAILY, WEEKLY):
+        days = 1 if frequency.type == DAILY else 7
+        ahead = 0 if frequency.type == DAILY else (frequency.day_of_week - 1 - last.weekday()) % 7
+        scheduled = (last + datetime.timedelta(days=ahead)).replace(hour=frequency.hour, minute=frequency.minute, second=0, microsecond=0)
+        return scheduled if scheduled > last else scheduled + datetime.timedelta(days=days)
+
+    # Monthly
+    year, month = last.year, last.month
+    while True:
+        day = min(frequency.date, calendar.monthrange(year, month)[1])
+        scheduled = datetime.datetime(year, month, day, frequency.hour, frequency.minute, tzinfo=last.tzinfo)
+        if scheduled > last:
+            return scheduled
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def populate_next_run_at(apps, schema_editor):
+    """Schedule existing queries from when they were last run."""
+    CustomQueryFrequency = apps.get_model('catalogue', 'CustomQueryFrequency')
+    for frequency in CustomQueryFrequency.objects.filter(last_job_run__isnull=False):
+        frequency.next_run_at = calculate_next_run_at(frequency)
+        frequency.save(update_fields=['next_run_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogue', '0056_webhookdelivery'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customqueryfrequency',
+            name='next_run_at',
+            field=models.DateTimeField(blank=True, db_index=True, default=None, null=True),
+        ),
+        migrations.RunPython(populate_next_run_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='catalogueentry',
+            index=models.Index(condition=models.Q(('force_run_postgres_scanner', True)), fields=['force_run_postgres_scanner'], name='catalogue_force_run_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogue', '0057_customqueryfrequency_next_run_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='layersubmission',
+            name='timings',
+            field=models.JSONField(blank=True, help_text='Duration and bytes processed of each stage of absorbing the file.', null=True),
+        ),
+    ]
@@ -174,6 +174,14 @@ class CatalogueEntry(mixins.RevisionedMixin):
         constraints = [
             models.UniqueConstraint(fields=['mapping_name', 'layer_subscription'], name='unique_mapping_subscription')
         ]
+        indexes = [
+            # Only the few entries waiting for a forced run are indexed
+            models.Index(
+                fields=['force_run_postgres_scanner'],
+                condition=models.Q(force_run_postgres_scanner=True),
+                name='catalogue_force_run_idx',
+            ),
+        ]
 
     @property
     def is_custom_query(self):
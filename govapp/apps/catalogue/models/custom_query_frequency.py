@@ -1,7 +1,13 @@
 """Kaartdijin Boodja Catalogue Django Application Custodian Models."""
 
 
+# Standard
+import calendar
+import datetime
+from zoneinfo import ZoneInfo
+
 # Third-Party
+from django import conf
 from django.db import models
 from django.core.validators import MaxValueValidator
 from django.core.validators import MinValueValidator
@@ -13,6 +19,7 @@ from govapp.common import mixins
 from govapp.apps.catalogue.models.catalogue_entries import CatalogueEntry
 
 # Typing
+from typing import Optional
 # from typing import TYPE_CHECKING
 # if TYPE_CHECKING:
     # from govapp.apps.catalogue.models.catalogue_entries import CatalogueEntry
@@ -64,6 +71,9 @@ class CustomQueryFrequency(mixins.RevisionedMixin):
         null=True, blank=True, 
         validators=[MinValueValidator(1), MaxValueValidator(31)])
     last_job_run = models.DateTimeField(null=True, blank=True, default=None)
+    # When the scanner should next run the query, maintained on save
+    # Null if the query has never been run, so it runs as soon as possible.
+    next_run_at = models.DateTimeField(null=True, blank=True, default=None, db_index=True)
 
     def clean(self):
         if (self.type == FrequencyType.EVERY_MINUTES and 
@@ -89,6 +99,9 @@ class CustomQueryFrequency(mixins.RevisionedMixin):
         
     def save(self, *args, **kwargs):
         self.full_clean()
+        self.next_run_at = calculate_next_run_at(self)
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "next_run_at"}
         super().save(*args, **kwargs)
 
     class Meta:
@@ -104,3 +117,47 @@ class CustomQueryFrequency(mixins.RevisionedMixin):
         """
         # Generate String and Return
         return f"{self.catalogue_entry.name}"
+
+
+def calculate_next_run_at(frequency: CustomQueryFrequency) -> Optional[datetime.datetime]:
+    """Calculates when a query is next due, from when it was last run.
+
+    Daily, weekly and monthly schedules are in the local time zone. A
+    monthly schedule on a date a month does not have (e.g. the 31st) runs
+    on the last day of that month.
+
+    Args:
+        frequency (CustomQueryFrequency): Frequency of the query.
+
+    Returns:
+        Optional[datetime.datetime]: The first scheduled time after the
+            last run, or None if the query has never been run.
+    """
+    # Check
+    if frequency.last_job_run is None:
+        return None
+
+    # Retrieve the Last Run in Local Time
+    last = frequency.last_job_run.astimezone(ZoneInfo(conf.settings.TIME_ZONE))
+
+    # Every X Minutes or Hours
+    if frequency.type == FrequencyType.EVERY_MINUTES:
+        return last + datetime.timedelta(minutes=frequency.every_minutes)
+    if frequency.type == FrequencyType.EVERY_HOURS:
+        return last + datetime.timedelta(hours=frequency.every_hours)
+
+    # Daily or Weekly
+    if frequency.type in (FrequencyType.DAILY, FrequencyType.WEEKLY):
+        days = 1 if frequency.type == FrequencyType.DAILY else 7
+        ahead = 0 if frequency.type == FrequencyType.DAILY else (frequency.day_of_week - 1 - last.weekday()) % 7
+        scheduled = (last + datetime.timedelta(days=ahead)).replace(hour=frequency.hour, minute=frequency.minute, second=0, microsecond=0)
+        return scheduled if scheduled > last else scheduled + datetime.timedelta(days=days)
+
+    # Monthly
+    year, month = last.year, last.month
+    while True:
+        day = min(frequency.date, calendar.monthrange(year, month)[1])
+        scheduled = datetime.datetime(year, month, day, frequency.hour, frequency.minute, tzinfo=last.tzinfo)
+        if scheduled > last:
+            return scheduled
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
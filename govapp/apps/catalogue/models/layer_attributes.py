@@ -9,6 +9,9 @@ import reversion
 from govapp.common import mixins
 from govapp.apps.catalogue.models import catalogue_entries
 
+# Typing
+from typing import Any, Iterable
+
 
 @reversion.register()
 class LayerAttribute(mixins.RevisionedMixin):
@@ -27,6 +30,55 @@ class LayerAttribute(mixins.RevisionedMixin):
         verbose_name = "Layer Attribute"
         verbose_name_plural = "Layer Attributes"
 
+    @classmethod
+    def bulk_write(
+        cls,
+        catalogue_entry: catalogue_entries.CatalogueEntry,
+        attributes: Iterable[Any],
+        comment: str = "",
+    ) -> tuple[list["LayerAttribute"], list["LayerAttribute"], list["LayerAttribute"]]:
+        """Writes the attributes of a catalogue entry in bulk.
+
+        The attributes are diffed against the existing attributes by name, so
+        unchanged attributes are left alone, attributes whose type or order
+        changed are updated, and the others are created or deleted. All of the
+        changes are recorded as a single revision.
+
+        Args:
+            catalogue_entry (CatalogueEntry): Catalogue entry of the attributes.
+            attributes (Iterable[Any]): Attributes, with `name`, `type` and `order`.
+            comment (str): Comment for the revision.
+
+        Returns:
+            tuple[list[LayerAttribute], list[LayerAttribute], list[LayerAttribute]]:
+                The created, updated and deleted attributes.
+        """
+        # Diff Attributes
+        existing = {attribute.name: attribute for attribute in catalogue_entry.attributes.all()}
+        created: list[LayerAttribute] = []
+        updated: list[LayerAttribute] = []
+        for attribute in attributes:
+            current = existing.pop(attribute.name, None)
+            if current is None:
+                created.append(cls(name=attribute.name, type=attribute.type, order=attribute.order, catalogue_entry=catalogue_entry))
+            elif (current.type, current.order) != (attribute.type, attribute.order):
+                current.type, current.order = attribute.type, attribute.order
+                updated.append(current)
+        deleted = list(existing.values())
+
+        # Write Attributes as a Single Revision
+        with reversion.create_revision():
+            reversion.set_comment(comment)
+            if deleted:
+                cls.objects.filter(id__in=[attribute.id for attribute in deleted]).delete()
+            cls.objects.bulk_update(updated, ["type", "order"])
+            cls.objects.bulk_create(created)
+            for attribute in (*created, *updated):
+                reversion.add_to_revision(attribute)
+
+        # Return
+        return created, updated, deleted
+
     def __str__(self) -> str:
         """Provides a string representation of the object.
 
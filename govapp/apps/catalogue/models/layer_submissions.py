@@ -51,6 +51,7 @@ class LayerSubmission(mixins.RevisionedMixin):
     layer_attribute = models.TextField(null=True, blank=True, help_text="This is the attribute data from the spatial file.")
     geojson = models.TextField(null=True, blank=True)
     crs = models.CharField(max_length=64, null=True, blank=True, help_text="CRS of the submitted spatial file, e.g. 'EPSG:7844'.")
+    timings = models.JSONField(null=True, blank=True, help_text="Duration and bytes processed of each stage of absorbing the file.")
 
     class Meta:
         """Layer Submission Model Metadata."""
@@ -197,16 +198,11 @@ class LayerSubmission(mixins.RevisionedMixin):
 
         with transaction.atomic():
             # Replace the Catalogue Entry's attributes with the new column structure
-            self.catalogue_entry.attributes.all().delete()
-            layer_attributes.LayerAttribute.objects.bulk_create([
-                layer_attributes.LayerAttribute(
-                    name=attribute["name"],
-                    type=attribute["type"],
-                    order=attribute["order"],
-                    catalogue_entry=self.catalogue_entry,
-                )
-                for attribute in parsed_attributes
-            ])
+            layer_attributes.LayerAttribute.bulk_write(
+                self.catalogue_entry,
+                [layer_attributes.LayerAttribute(**attribute) for attribute in parsed_attributes],
+                comment=f"Accepted new column structure from LayerSubmission LM{self.pk}",
+            )
             log.info(
                 f"Replaced LayerAttributes for CatalogueEntry: [{self.catalogue_entry}] with the new column "
                 f"structure from LayerSubmission: [{self}]."
@@ -9,15 +9,18 @@ from django.core.cache import cache
 from django import conf
 from rest_framework.exceptions import ValidationError
 import reversion
+import contextlib
 import logging
+import math
 import requests
-import psycopg2
 from owslib.wms import WebMapService
 from owslib.wfs import WebFeatureService
 from requests.auth import HTTPBasicAuth
 from typing import Union, Optional
 
 # Local
+from govapp.apps.catalogue import capabilities
+from govapp.apps.catalogue import postgis_pools
 from govapp.apps.catalogue import utils as catalogue_utils
 from govapp.common import mixins
 from govapp.apps.catalogue.models import catalogue_entries
@@ -127,37 +130,60 @@ class LayerSubscription(mixins.RevisionedMixin):
         # Try WMS 1.1.1 first, then fall back to 1.3.0.
         # Some servers (e.g. DEA) respond with WMS 1.3.0 capabilities which
         # owslib's default 1.1.1 parser cannot handle, causing an AttributeError.
-        for version in ('1.1.1', '1.3.0'):
-            try:
-                wms = WebMapService(url=self.url, version=version, username=self.username, password=self.userpassword)
-                return wms
-            except Exception as e:
-                logger.warning(f"Unable to connect to WMS [{self.url}] with version {version}: [{e}]")
-                last_exc = e
-        logger.error(f"Unable to connect to WMS: [{self.url}]: [{last_exc}]")
-        raise last_exc
+        # The capabilities and the version that worked are cached.
+        try:
+            return capabilities.get_service(
+                "WMS", WebMapService, self.url, ('1.1.1', '1.3.0'), self.username, self.userpassword)
+        except Exception as e:
+            logger.error(f"Unable to connect to WMS: [{self.url}]: [{e}]")
+            raise
 
     def get_wfs(self):
         try:
-            wfs = WebFeatureService(url=self.url, username=self.username, password=self.userpassword)
-            return wfs  
+            return capabilities.get_service(
+                "WFS", WebFeatureService, self.url, ('1.0.0',), self.username, self.userpassword)
         except Exception as e:
             logger.error(f"Unable to connect to WFS: [{self.url}]: [{e}]")
             raise
 
+    def postgis_connection_parameters(self) -> dict:
+        """Constructs the `psycopg2.connect` arguments for the PostGIS database.
+
+        Returns:
+            dict: Connection parameters.
+        """
+        return {
+            "host": self.host,
+            "database": self.database,
+            "user": self.username,
+            "password": self.userpassword,
+            "port": self.port,
+            "connect_timeout": math.ceil(self.connection_timeout / 1000) if self.connection_timeout else None,
+            "application_name": f"kb-subscription-{self.id}",
+        }
+
+    @contextlib.contextmanager
     def get_postgis(self):
+        """Borrows a connection to the PostGIS database from the subscription's pool.
+
+        Yields:
+            psycopg2.extensions.connection: The borrowed connection.
+        """
         try:
-            conn = psycopg2.connect(
-                host=self.host,
-                database=self.database,
-                user=self.username,
-                password=self.userpassword,
-                port=self.port
+            pool = postgis_pools.get_pool(
+                self.id,
+                self.postgis_connection_parameters(),
+                max_size=self.max_connections or 1,
+                timeout=self.connection_timeout / 1000 if self.connection_timeout else 10,
             )
-            return conn
+            conn = pool.acquire()
         except Exception as e:
             logger.error(f"Unable to connect to PostGIS: [{self.host}]: [{e}]")
             raise
+        try:
+            yield conn
+        finally:
+            pool.release(conn)
 
     def get_wms_layer_names(self):
         res = self.get_wms()
@@ -180,13 +206,12 @@ class LayerSubscription(mixins.RevisionedMixin):
         return result
 
     def get_postgis_table_names(self):
-        conn = self.get_postgis()
         query = """
                     SELECT table_name 
                     FROM information_schema.tables 
                     WHERE table_schema = %s;
                 """
-        with conn.cursor() as cursor:
+        with self.get_postgis() as conn, conn.cursor() as cursor:
             cursor.execute(query, [self.schema])
             result = []
             for e in cursor.fetchall():
@@ -203,7 +228,8 @@ class LayerSubscription(mixins.RevisionedMixin):
             elif self.type == LayerSubscriptionType.WFS:
                 return self.get_wfs()
             elif self.type == LayerSubscriptionType.POST_GIS:
-                return self.get_postgis()
+                with self.get_postgis() as conn:
+                    return not conn.closed
             else:
                 msg = f'Something wrong with the type of the layer subscription: [{self}].'
                 logger.error(msg)
@@ -352,6 +378,12 @@ class LayerSubscription(mixins.RevisionedMixin):
     def save(self, *args, **kwargs):
         cache.delete(conf.settings.POST_GIS_CACHE_KEY + str(self.id))
         super(LayerSubscription, self).save(*args, **kwargs)
+        # Close pooled connections opened with outdated parameters (e.g. credentials)
+        postgis_pools.invalidate(self.id, self.postgis_connection_parameters())
+
+    def delete(self, *args, **kwargs):
+        postgis_pools.invalidate(self.id)
+        return super(LayerSubscription, self).delete(*args, **kwargs)
         
     def assign(self, user: auth_models.User) -> bool:
         """Assigns a user to the Layer Subscription if applicable.
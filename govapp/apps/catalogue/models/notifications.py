@@ -3,6 +3,7 @@
 
 # Third-Party
 from django.db import models
+from django.utils import timezone
 import reversion
 
 # Local
@@ -23,6 +24,14 @@ class WebhookNotificationType(models.IntegerChoices):
     ON_NEW_DATA = 1
 
 
+class WebhookDeliveryStatus(models.IntegerChoices):
+    """Enumeration for a Webhook Delivery Status."""
+    PENDING = 1
+    DELIVERING = 2
+    DELIVERED = 3
+    FAILED = 4
+
+
 @reversion.register()
 class EmailNotification(mixins.RevisionedMixin):
     """Model for an Email Notification."""
@@ -98,3 +107,38 @@ class WebhookNotification(mixins.RevisionedMixin):
         """
         # Generate String and Return
         return f"{self.name}"
+
+
+class WebhookDelivery(models.Model):
+    """Model for a queued POST of a payload to a Webhook Notification."""
+    webhook = models.ForeignKey(
+        WebhookNotification,
+        related_name="deliveries",
+        on_delete=models.CASCADE,
+    )
+    url = models.URLField()
+    payload = models.TextField()  # Path to the spooled payload file
+    status = models.IntegerField(choices=WebhookDeliveryStatus.choices, default=WebhookDeliveryStatus.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_attempt_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)  # Refreshed while the POST is in progress
+    delivered_at = models.DateTimeField(null=True, blank=True)
+    response_status = models.IntegerField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Webhook Delivery Model Metadata."""
+        verbose_name = "Webhook Delivery"
+        verbose_name_plural = "Webhook Deliveries"
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+
+    def __str__(self) -> str:
+        """Provides a string representation of the object.
+
+        Returns:
+            str: Human readable string representation of the object.
+        """
+        # Generate String and Return
+        return f"{self.id}: {self.url}"
@@ -42,6 +42,7 @@ def catalogue_entry_creation(entry: "catalogue_entries.CatalogueEntry") -> None:
     emails.CatalogueEntryCreatedEmail().send_to(
         *utils.all_administrators(),  # All administrators
         context={"name": entry.name},
+        about=entry,
     )
 
 
@@ -63,6 +64,7 @@ def catalogue_entry_update_success(entry: "catalogue_entries.CatalogueEntry") ->
         *entry.email_notifications(manager="on_new_data").filter(active=True).all(),  # type: ignore[operator]
         *entry.email_notifications(manager="both").filter(active=True).all(),  # type: ignore[operator]
         context={"name": entry.name},
+        about=entry,
     )
 
     # Retrieve the File from Storage
@@ -77,13 +79,13 @@ def catalogue_entry_update_success(entry: "catalogue_entries.CatalogueEntry") ->
 
         try:
             if settings.WEBHOOK_ENABLED:
-                # Send Webhook Posts
-                webhooks.post_geojson(
+                # Queue Webhook Posts
+                webhooks.queue_geojson(
                     *entry.webhook_notifications(manager="on_new_data").all(),  # type: ignore[operator]
                     geojson=geojson['full_filepath'],
                 )
         finally:
-            # Remove the to_geojson() scratch directory now that the webhook payload has been sent/read.
+            # Remove the to_geojson() scratch directory now that the webhook payload has been spooled.
             scratch_dir = geojson['full_filepath'].parent
             if scratch_dir.is_dir():
                 shutil.rmtree(scratch_dir, ignore_errors=True)
@@ -109,6 +111,7 @@ def catalogue_entry_update_failure(entry: "catalogue_entries.CatalogueEntry") ->
         *utils.all_administrators(),  # All administrators
         *editors_list,  # All editors
         context={"name": entry.name},
+        about=entry,
     )
 
 
@@ -131,4 +134,5 @@ def catalogue_entry_lock(entry: "catalogue_entries.CatalogueEntry") -> None:
         *entry.email_notifications(manager="on_lock").filter(active=True).all(),  # type: ignore[operator]
         *entry.email_notifications(manager="both").filter(active=True).all(),  # type: ignore[operator]
         context={"name": entry.name},
+        about=entry,
     )
@@ -0,0 +1,261 @@
+"""Kaartdijin Boodja Catalogue Django Application PostGIS Connection Pools.
+
+Each PostGIS layer subscription borrows connections to its upstream database
+from its own pool, rather than opening a new connection for every request:
+
+* At most `max_connections` connections are open per subscription. Borrowers
+  wait for a connection to be returned once the pool is full.
+* Connections idle for longer than `POSTGIS_POOL_IDLE_SECONDS` are closed.
+* Connections idle for longer than `POSTGIS_POOL_HEALTH_CHECK_SECONDS` are
+  checked with `SELECT 1` before being lent, and replaced if broken.
+* A pool is closed and replaced when the connection parameters of its
+  subscription (e.g. the credentials) change.
+
+Pools are per process, as connections cannot be shared across a fork.
+"""
+
+
+# Standard
+import contextlib
+import logging
+import os
+import threading
+import time
+
+# Third-Party
+from django import conf
+import psycopg2
+import psycopg2.extensions
+
+# Typing
+from typing import Any, Iterator, Optional
+
+
+# Logging
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection is returned to a full pool in time."""
+
+
+class ConnectionPool:
+    """Bounded pool of connections to a PostGIS database."""
+
+    def __init__(self, parameters: dict[str, Any], max_size: int, timeout: float) -> None:
+        """Instantiates the Pool.
+
+        Args:
+            parameters (dict[str, Any]): Keyword arguments for `psycopg2.connect`.
+            max_size (int): Maximum number of open connections.
+            timeout (float): Seconds to wait for a connection when the pool is full.
+        """
+        # Instance Attributes
+        self.parameters = parameters
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self.size = 0
+        self.closed = False
+        self._idle: list[tuple[psycopg2.extensions.connection, float]] = []
+        self._condition = threading.Condition()
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """Borrows a connection from the pool.
+
+        The connection is returned to the pool when the context exits, with
+        any open transaction rolled back, or discarded if it was broken.
+
+        Yields:
+            psycopg2.extensions.connection: The borrowed connection.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Closes the idle connections, and borrowed connections once returned."""
+        with self._condition:
+            self.closed = True
+            idle, self._idle = self._idle, []
+            self.size -= len(idle)
+            self._condition.notify_all()
+        for conn, _ in idle:
+            _close(conn)
+
+    def close_idle(self) -> None:
+        """Closes the connections idle for longer than the idle timeout."""
+        expired_before = time.monotonic() - conf.settings.POSTGIS_POOL_IDLE_SECONDS
+        with self._condition:
+            expired = [(conn, t) for conn, t in self._idle if t < expired_before]
+            self._idle = [(conn, t) for conn, t in self._idle if t >= expired_before]
+            self.size -= len(expired)
+            if expired:
+                self._condition.notify_all()
+        for conn, _ in expired:
+            _close(conn)
+
+    def acquire(self) -> psycopg2.extensions.connection:
+        """Takes an idle connection, or opens a new one if the pool is not full.
+
+        Raises:
+            PoolTimeoutError: If the pool stays full for longer than the timeout.
+
+        Returns:
+            psycopg2.extensions.connection: The connection.
+        """
+        self.close_idle()
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self._condition:
+                # Wait for a Connection
+                while not self._idle and self.size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(f"No connection available to [{self.parameters.get('host')}] within {self.timeout} seconds")
+                    self._condition.wait(remaining)
+
+                # Open a New Connection
+                if not self._idle:
+                    self.size += 1
+                    break
+
+                # Take the Most Recently Used Connection
+                conn, last_used = self._idle.pop()
+
+            # Check Idle Connection
+            if time.monotonic() - last_used < conf.settings.POSTGIS_POOL_HEALTH_CHECK_SECONDS or _is_healthy(conn):
+                return conn
+            logger.info(f"Discarding broken PostGIS connection to [{self.parameters.get('host')}]")
+            self.release(conn, discard=True)
+
+        # Connect
+        try:
+            return psycopg2.connect(**self.parameters)
+        except Exception:
+            with self._condition:
+                self.size -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, conn: psycopg2.extensions.connection, discard: bool = False) -> None:
+        """Returns a connection to the pool.
+
+        Args:
+            conn (psycopg2.extensions.connection): The connection.
+            discard (bool): Whether to close the connection rather than keep it.
+        """
+        # End any Transaction left Open by the Borrower
+        if not discard and not conn.closed:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                discard = True
+
+        with self._condition:
+            if discard or conn.closed or self.closed:
+                self.size -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+                conn = None
+            self._condition.notify()
+        if conn is not None:
+            _close(conn)
+
+
+# Pools of this Process, keyed on Subscription
+_pools: dict[int, ConnectionPool] = {}
+_pools_pid: Optional[int] = None
+_pools_lock = threading.Lock()
+
+
+def get_pool(subscription_id: int, parameters: dict[str, Any], max_size: int, timeout: float) -> ConnectionPool:
+    """Retrieves the pool of a subscription.
+
+    The pool is replaced if the connection parameters have changed since it
+    was created. Connections idle for too long in any pool are closed.
+
+    Args:
+        subscription_id (int): Primary key of the layer subscription.
+        parameters (dict[str, Any]): Keyword arguments for `psycopg2.connect`.
+        max_size (int): Maximum number of open connections.
+        timeout (float): Seconds to wait for a connection when the pool is full.
+
+    Returns:
+        ConnectionPool: The subscription's pool.
+    """
+    global _pools_pid
+
+    replaced = None
+    with _pools_lock:
+        # Discard Pools Inherited from a Parent Process
+        if _pools_pid != os.getpid():
+            _pools.clear()
+            _pools_pid = os.getpid()
+
+        # Create or Replace Pool
+        pool = _pools.get(subscription_id)
+        if pool is None or pool.parameters != parameters or pool.max_size != max(1, max_size):
+            replaced = pool
+            pool = _pools[subscription_id] = ConnectionPool(parameters, max_size, timeout)
+        pools = list(_pools.values())
+
+    # Close Replaced Pool and Idle Connections
+    if replaced is not None:
+        logger.info(f"Connection parameters of layer subscription [{subscription_id}] changed; replacing its pool")
+        replaced.close()
+    for other in pools:
+        other.close_idle()
+
+    # Return
+    return pool
+
+
+def invalidate(subscription_id: int, parameters: Optional[dict[str, Any]] = None) -> None:
+    """Closes the pool of a subscription.
+
+    Args:
+        subscription_id (int): Primary key of the layer subscription.
+        parameters (Optional[dict[str, Any]]): If given, the pool is only
+            closed if it was created with different connection parameters.
+    """
+    with _pools_lock:
+        pool = _pools.get(subscription_id)
+        if pool is None or (parameters is not None and pool.parameters == parameters):
+            return
+        del _pools[subscription_id]
+    pool.close()
+
+
+def _is_healthy(conn: psycopg2.extensions.connection) -> bool:
+    """Checks a connection is still usable.
+
+    Args:
+        conn (psycopg2.extensions.connection): The connection.
+
+    Returns:
+        bool: Whether the connection answered `SELECT 1`.
+    """
+    if conn.closed:
+        return False
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+def _close(conn: psycopg2.extensions.connection) -> None:
+    """Closes a connection, ignoring errors from already broken connections.
+
+    Args:
+        conn (psycopg2.extensions.connection): The connection.
+    """
+    try:
+        conn.close()
+    except psycopg2.Error:
+        pass
@@ -32,6 +32,7 @@ class LayerSubmissionSerializer(serializers.ModelSerializer):
             "permission_type",
             "permission_type_str",
             "crs",
+            "timings",
             "is_declined_due_to_hash_mismatch",
         )
         read_only_fields = (
@@ -50,6 +51,7 @@ class LayerSubmissionSerializer(serializers.ModelSerializer):
             "permission_type",
             "permission_type_str",
             "crs",
+            "timings",
             "is_declined_due_to_hash_mismatch",
         )
 
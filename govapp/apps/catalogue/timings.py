@@ -0,0 +1,203 @@
+"""Kaartdijin Boodja Catalogue Django Application Ingestion Timings.
+
+The stages of absorbing a file are timed, so slow stages can be found from
+the recorded data:
+
+* `start()` begins a timer for the current context. A timer started while
+  another is running inherits the stages already recorded by it, so each
+  layer of an archive carries the timings of the file it was absorbed from.
+* `span()` times a stage of the current timer, optionally with the number of
+  bytes it processed. Repeated stages are accumulated, and spans outside of a
+  timer are not recorded.
+* `attach()` marks the layer submission the current timer's stages are saved
+  against when the timer ends.
+* `percentiles()` summarises the timings of many layer submissions.
+"""
+
+
+# Standard
+import contextlib
+import contextvars
+import dataclasses
+import logging
+import math
+import time
+
+# Local
+from govapp.apps.catalogue import models
+
+# Typing
+from typing import Any, Iterable, Iterator, Optional
+
+
+# Logging
+logger = logging.getLogger(__name__)
+
+
+# Constants
+PERCENTILES = (50, 90, 99)
+TOTAL = "total"
+
+# Timer of the Current Context
+_current: contextvars.ContextVar[Optional["Timer"]] = contextvars.ContextVar("catalogue_timer", default=None)
+
+
+@dataclasses.dataclass
+class Span:
+    """A stage being timed."""
+    bytes: Optional[int] = None  # noqa: A003
+
+
+class Timer:
+    """Per-stage durations and byte counts of an absorbed file."""
+
+    def __init__(self, stages: Optional[dict[str, dict[str, Any]]] = None) -> None:
+        """Instantiates the Timer.
+
+        Args:
+            stages (Optional[dict[str, dict[str, Any]]]): Stages already recorded.
+        """
+        # Instance Attributes
+        self.stages = {stage: dict(values) for stage, values in (stages or {}).items()}
+        self.layer_submission: Optional["models.layer_submissions.LayerSubmission"] = None
+
+    def record(self, stage: str, seconds: float, nbytes: Optional[int] = None) -> None:
+        """Records the duration and byte count of a stage.
+
+        Args:
+            stage (str): Name of the stage.
+            seconds (float): Duration of the stage.
+            nbytes (Optional[int]): Number of bytes processed by the stage.
+        """
+        values = self.stages.setdefault(stage, {"seconds": 0.0})
+        values["seconds"] = round(values["seconds"] + seconds, 6)
+        if nbytes is not None:
+            values["bytes"] = values.get("bytes", 0) + nbytes
+
+    def save(self) -> None:
+        """Saves the recorded stages against the attached layer submission."""
+        # Check
+        if self.layer_submission is None:
+            return
+
+        # Save
+        # The layer submission is updated directly, as it may have been
+        # declined or activated since it was attached.
+        try:
+            models.layer_submissions.LayerSubmission.objects.filter(
+                id=self.layer_submission.id,
+            ).update(timings=self.stages)
+        except Exception as exc:
+            logger.warning(f"Unable to save timings of LayerSubmission: [{self.layer_submission.id}]: [{exc}]")
+
+
+@contextlib.contextmanager
+def start() -> Iterator[Timer]:
+    """Begins a timer for the current context.
+
+    The stages are saved against the attached layer submission, if any, when
+    the context exits.
+
+    Yields:
+        Timer: The timer.
+    """
+    parent = _current.get()
+    timer = Timer(parent.stages if parent else None)
+    token = _current.set(timer)
+    try:
+        yield timer
+    finally:
+        _current.reset(token)
+        timer.save()
+
+
+@contextlib.contextmanager
+def span(stage: str, nbytes: Optional[int] = None) -> Iterator[Span]:
+    """Times a stage of the current timer.
+
+    The byte count can also be set on the yielded span once it is known.
+
+    Args:
+        stage (str): Name of the stage.
+        nbytes (Optional[int]): Number of bytes processed by the stage.
+
+    Yields:
+        Span: The stage being timed.
+    """
+    current = Span(nbytes)
+    started = time.perf_counter()
+    try:
+        yield current
+    finally:
+        timer = _current.get()
+        if timer is not None:
+            timer.record(stage, time.perf_counter() - started, current.bytes)
+
+
+def attach(layer_submission: "models.layer_submissions.LayerSubmission") -> None:
+    """Saves the current timer's stages against a layer submission.
+
+    Args:
+        layer_submission (LayerSubmission): Layer submission being absorbed.
+    """
+    timer = _current.get()
+    if timer is not None:
+        timer.layer_submission = layer_submission
+
+
+def percentiles(timings: Iterable[dict[str, dict[str, Any]]]) -> dict[str, Any]:
+    """Summarises the per-stage timings of many layer submissions.
+
+    Args:
+        timings (Iterable[dict[str, dict[str, Any]]]): Recorded stages of each
+            layer submission.
+
+    Returns:
+        dict[str, Any]: Number of layer submissions, and the percentiles of
+            the duration and byte count of each stage, and of their total.
+    """
+    # Collect Values per Stage
+    count = 0
+    seconds: dict[str, list[float]] = {}
+    nbytes: dict[str, list[int]] = {}
+    for stages in timings:
+        count += 1
+        for stage, values in stages.items():
+            seconds.setdefault(stage, []).append(values["seconds"])
+            if values.get("bytes") is not None:
+                nbytes.setdefault(stage, []).append(values["bytes"])
+        seconds.setdefault(TOTAL, []).append(sum(values["seconds"] for values in stages.values()))
+
+    # Summarise and Return
+    return {
+        "count": count,
+        "stages": {
+            stage: {
+                "count": len(values),
+                "seconds": _summarise(values),
+                "bytes": _summarise(nbytes[stage]) if stage in nbytes else None,
+            }
+            for stage, values in sorted(seconds.items())
+        },
+    }
+
+
+def _summarise(values: list[float]) -> dict[str, float]:
+    """Calculates the percentiles and maximum of some values.
+
+    Percentiles are linearly interpolated between the closest ranks.
+
+    Args:
+        values (list[float]): Values to summarise.
+
+    Returns:
+        dict[str, float]: The percentiles and maximum.
+    """
+    values = sorted(values)
+    summary = {}
+    for percentile in PERCENTILES:
+        rank = (len(values) - 1) * percentile / 100
+        lower, upper = values[math.floor(rank)], values[math.ceil(rank)]
+        summary[f"p{percentile}"] = round(lower + (upper - lower) * (rank - math.floor(rank)), 6)
+    summary["max"] = values[-1]
+    return summary
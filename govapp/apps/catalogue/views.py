@@ -8,7 +8,8 @@ from django import shortcuts
 from django.contrib import auth
 from django.db import connection
 from django.db import transaction
-from django.http import HttpResponse, JsonResponse, FileResponse
+from django.http import HttpResponse, JsonResponse, FileResponse, StreamingHttpResponse
+from django.middleware.gzip import GZipMiddleware
 from django.core.paginator import Paginator
 from drf_spectacular import utils as drf_utils
 from rest_framework import decorators
@@ -25,8 +26,11 @@ from django.core.cache import cache
 from owslib.wms import WebMapService
 from owslib.wfs import WebFeatureService
 import psycopg2
+import hashlib
 import json
 import os
+import pathlib
+import re
 from django.db.models import F, Q
 from django.core.exceptions import ObjectDoesNotExist
 
@@ -35,21 +39,24 @@ from govapp import settings
 from govapp.apps.publisher.models.publish_channels import GeoServerPublishChannel
 from govapp.common import mixins
 from govapp.apps.accounts import permissions as accounts_permissions
+from govapp.apps.catalogue import chunked_uploads
 from govapp.apps.catalogue import filters
 from govapp.apps.catalogue import models
 from govapp.apps.publisher import models as publish_models
 from govapp.apps.catalogue import permissions
 from govapp.apps.catalogue import serializers
+from govapp.apps.catalogue import timings
 from govapp.apps.catalogue import utils as catalogue_utils
 from govapp.apps.catalogue.postgres_scanner import Scanner
 from govapp.apps.catalogue.utils import validate_request
 from govapp.apps.catalogue.models import layer_submissions as catalogue_layer_submissions_models
 from govapp.apps.logs import mixins as logs_mixins
 from govapp.apps.logs import utils as logs_utils
+from govapp.gis import features
 
 
 # Typing
-from typing import Callable, cast
+from typing import Callable, Iterator, cast
 from typing import Any
 
 
@@ -58,6 +65,25 @@ UserModel = auth.get_user_model()
 
 logger = logging.getLogger(__name__)
 
+# Layer Query Parameters
+# Property filters are namespaced (e.g. `filter[name]=value`), so any other
+# parameter (e.g. a cache buster) is ignored rather than filtered on.
+LAYER_QUERY_FILTER = re.compile(r"^filter\[(?P<property>[^\]]+)\]$")
+LAYER_QUERY_DEFAULT = {"bbox": None, "filters": {}, "properties": None, "offset": 0, "limit": None}
+LAYER_QUERY_PARAMETERS = [
+    drf_utils.OpenApiParameter("bbox", type=str, description="Bounding box: min x, min y, max x, max y"),
+    drf_utils.OpenApiParameter("limit", type=int),
+    drf_utils.OpenApiParameter("offset", type=int),
+    drf_utils.OpenApiParameter("properties", type=str, description="Comma separated properties to include"),
+    drf_utils.OpenApiParameter(
+        "filter",
+        type={"type": "object", "additionalProperties": {"type": "string"}},
+        style="deepObject",
+        explode=True,
+        description="Property values to match, e.g. filter[name]=value",
+    ),
+]
+
 
 @drf_utils.extend_schema(tags=["Catalogue - Catalogue Entries"])
 class CatalogueEntryViewSet(
@@ -115,8 +141,27 @@ class CatalogueEntryViewSet(
         else:
             return JsonResponse({'message': 'No file specified.'})
 
+    @decorators.action(detail=False, methods=["GET"], permission_classes=[accounts_permissions.IsInCatalogueAdminGroup])
+    def upload_status(self, request: request.Request):
+        """Returns the committed offset of a chunked upload, so it can be resumed."""
+        new_file_name = request.query_params.get('newFileName', '')
+        if not new_file_name:
+            return JsonResponse({'error': 'No file name provided.'}, status=400)
+
+        upload = chunked_uploads.ChunkedUpload(settings.PENDING_IMPORT_PATH, new_file_name)
+        return JsonResponse(upload.status())
+
     @decorators.action(detail=False, methods=["POST"], permission_classes=[accounts_permissions.IsInCatalogueAdminGroup])
     def upload_file(self, request: request.Request):
+        """Receives one chunk of a resumable upload to the pending imports folder.
+
+        Each chunk is sent with its byte ``offset`` (derived from ``chunkIndex`` when
+        omitted) and optionally its ``chunkSha256``. Duplicate chunks are ignored and
+        a chunk that would leave a gap is rejected with 409 and the committed offset
+        (also available from ``upload_status``). Once ``totalSize`` bytes have been
+        committed, the optional whole-file ``fileSha256`` is checked before the file
+        is released to the pending imports scanner.
+        """
         chunk = request.FILES.get('chunk')
         if not chunk:
             return JsonResponse({'error': 'No chunk provided.'}, status=400)
@@ -129,11 +174,13 @@ class CatalogueEntryViewSet(
             chunk_index = int(request.POST.get('chunkIndex', 0))
             total_chunks = int(request.POST.get('totalChunks', 1))
             total_size = int(request.POST.get('totalSize', 0))
+            offset = request.POST.get('offset')
+            offset = int(offset) if offset is not None else None
         except (ValueError, TypeError):
             return JsonResponse({'error': 'Invalid chunk parameters.'}, status=400)
 
         # Validate file extension on the first chunk only
-        if chunk_index == 0:
+        if chunk_index == 0 or offset == 0:
             allowed_extensions = settings.ALLOWED_EXTENSIONS_TO_UPLOAD
             _, file_extension = os.path.splitext(new_file_name)
             if file_extension.lower() not in allowed_extensions:
@@ -144,63 +191,58 @@ class CatalogueEntryViewSet(
                 )
                 return JsonResponse({'error': 'Invalid file type. Only .zip and .7z files are allowed.'}, status=400)
 
-        save_path = os.path.join(settings.PENDING_IMPORT_PATH, new_file_name)
-        tmp_path = save_path + '.tmp'
-        size_path = save_path + '.tmp.size'
+        upload = chunked_uploads.ChunkedUpload(settings.PENDING_IMPORT_PATH, new_file_name)
+        if upload.complete:
+            # A re-sent final chunk of an upload that has already been released
+            return JsonResponse({'complete': True, 'offset': upload.offset})
+
+        if offset is None:
+            # Clients not sending offsets send chunks in order: the first starts the file
+            # and every other one is appended.
+            offset = 0 if chunk_index == 0 else upload.offset
 
         try:
-            if chunk_index == 0:
+            if offset == 0 and upload.offset == 0:
                 logger.info(
                     f'Chunk upload started: [{new_file_name}] total_size={total_size} bytes '
                     f'total_chunks={total_chunks} by user: [{request.user}] (id: {request.user.id})'
                 )
-                # Write total size metadata and start a new .tmp file
-                with open(size_path, 'w') as sf:
-                    sf.write(str(total_size))
-                open_mode = 'wb'
-            else:
-                open_mode = 'ab'
 
-            with open(tmp_path, open_mode) as f:
-                for data in chunk.chunks(chunk_size=1048576):
-                    f.write(data)
+            committed = upload.write(chunk, offset, total_size, sha256=request.POST.get('chunkSha256') or None)
 
-            if chunk_index == total_chunks - 1:
-                # All chunks received — atomically rename to final filename.
-                # The rename is the critical operation; size_path removal is cleanup only.
-                os.rename(tmp_path, save_path)
-                try:
-                    os.remove(size_path)
-                except OSError as cleanup_error:
-                    logger.warning(
-                        f'Could not remove size metadata file [{size_path}]: {cleanup_error}'
-                    )
+            finished = committed >= total_size if total_size > 0 else chunk_index == total_chunks - 1
+            if finished:
+                # All chunks received — verify and atomically rename to final filename.
+                upload.finish(sha256=request.POST.get('fileSha256') or None)
                 logger.info(
-                    f'Chunk upload complete: [{new_file_name}] ({total_chunks} chunks) '
+                    f'Chunk upload complete: [{new_file_name}] ({committed} bytes) '
                     f'by user: [{request.user}] (id: {request.user.id})'
                 )
-                return JsonResponse({'complete': True})
-
-            return JsonResponse({'received': chunk_index})
-
+                return JsonResponse({'complete': True, 'offset': committed})
+
+            return JsonResponse({'received': chunk_index, 'offset': committed})
+
+        except chunked_uploads.ChunkOutOfOrderError as e:
+            logger.warning(f'Out of order chunk at offset {offset} of [{new_file_name}]: {e}')
+            return JsonResponse({'error': 'Chunk is out of order.', 'offset': e.offset}, status=409)
+        except chunked_uploads.ChecksumMismatchError as e:
+            logger.warning(f'Checksum mismatch for [{new_file_name}] from user: [{request.user}]: {e}')
+            if upload.offset >= total_size > 0:
+                # The whole file is corrupt, it must be uploaded again from the start
+                upload.discard()
+            return JsonResponse({'error': 'Checksum mismatch.', 'offset': upload.offset}, status=400)
         except OSError as e:
             logger.error(
                 f'Failed to write chunk {chunk_index} of [{new_file_name}] '
                 f'for user: [{request.user}] (id: {request.user.id}). OS error: {e}'
             )
-            for path in (tmp_path, size_path):
-                if os.path.exists(path):
-                    os.remove(path)
-            return JsonResponse({'error': 'Failed to save chunk on server.'}, status=500)
+            return JsonResponse({'error': 'Failed to save chunk on server.', 'offset': upload.offset}, status=500)
         except Exception as e:
             logger.error(
                 f'Unexpected error writing chunk {chunk_index} of [{new_file_name}] '
                 f'for user: [{request.user}] (id: {request.user.id}). Error: {e}'
             )
-            for path in (tmp_path, size_path):
-                if os.path.exists(path):
-                    os.remove(path)
-            return JsonResponse({'error': 'An unexpected error occurred while saving the chunk.'}, status=500)
+            return JsonResponse({'error': 'An unexpected error occurred while saving the chunk.', 'offset': upload.offset}, status=500)
 
     @drf_utils.extend_schema(request=None, responses={status.HTTP_204_NO_CONTENT: None})
     @decorators.action(detail=True, methods=["POST"])
@@ -384,6 +426,7 @@ class CatalogueEntryViewSet(
         # Return Response
         return response.Response(status=status.HTTP_204_NO_CONTENT)
     
+    @drf_utils.extend_schema(parameters=LAYER_QUERY_PARAMETERS)
     @decorators.action(detail=False, methods=["GET"], permission_classes=[accounts_permissions.IsAuthenticated],
                        url_path=r'(?P<name>\w+)/layer')
     def layer_by_name(self, request: request.Request, name: str):
@@ -403,11 +446,17 @@ class CatalogueEntryViewSet(
             return response.Response({"error": 'Invalid query param "name:{name}".'}, 
                                      status=status.HTTP_400_BAD_REQUEST)
         
+    @drf_utils.extend_schema(parameters=LAYER_QUERY_PARAMETERS)
     @decorators.action(detail=False, methods=["GET"], permission_classes=[accounts_permissions.IsAuthenticated],
                        url_path=r'(?P<id>\d+)/layer')
     def layer_by_id(self, request: request.Request, id: int):
         """ Api to provide geojson file
 
+        The features can optionally be filtered by `bbox` (min x, min y, max x,
+        max y) and by property equality (`filter[<property>]`), paginated
+        with `limit`/`offset` and trimmed to a comma separated list of
+        `properties`. Filtered responses are streamed from the stored file.
+
         Args:
             request (request.Request): request object passed by Django framework
             pk (int): uri parameter represents id of layer submission(catalogue id)
@@ -427,12 +476,31 @@ class CatalogueEntryViewSet(
                 {"error": f'The geojson file does not exist at the specified path: [{layer_submission.geojson}].'},
                 status=status.HTTP_404_NOT_FOUND)
             
+        # Revalidate against the File and Query
+        query = layer_query(request.query_params)
+        file_stat = os.stat(layer_submission.geojson)
+        etag = '"' + hashlib.sha256(
+            f"{layer_submission.geojson}:{file_stat.st_mtime_ns}:{file_stat.st_size}:{sorted(request.query_params.lists())}".encode()
+        ).hexdigest()[:32] + '"'
+        if etag in [tag.strip().removeprefix("W/") for tag in request.headers.get("If-None-Match", "").split(",")]:
+            resp = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+            resp['ETag'] = etag
+            return resp
+
         try:
-            resp = FileResponse(open(layer_submission.geojson, 'rb'), 
-                                content_type='application/json', 
-                                status=status.HTTP_200_OK)
+            if query != LAYER_QUERY_DEFAULT:
+                resp = StreamingHttpResponse(stream_layer(layer_submission.geojson, **query),
+                                             content_type='application/json',
+                                             status=status.HTTP_200_OK)
+            else:
+                resp = FileResponse(open(layer_submission.geojson, 'rb'), 
+                                    content_type='application/json', 
+                                    status=status.HTTP_200_OK)
             resp['Content-Disposition'] = 'attachment; filename=' + layer_submission.catalogue_entry.name + '.geojson'
-            return resp
+            resp['ETag'] = etag
+
+            # Compress if Accepted
+            return GZipMiddleware(lambda request: resp).process_response(request, resp)
         except Exception as e:
             return response.Response({"error": f'An exception occurred while opening the target file: [{ layer_submission.geojson }]. Error: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
@@ -480,6 +548,73 @@ class CatalogueEntryViewSet(
         return current_time
     
 
+def layer_query(query_params: Any) -> dict[str, Any]:
+    """Parses the feature selection of a layer request.
+
+    Args:
+        query_params (Any): Query parameters of the request.
+
+    Raises:
+        ValidationError: If a parameter is invalid.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for `features.select_features`.
+    """
+    # Bounding Box
+    bbox = None
+    if query_params.get("bbox"):
+        try:
+            bbox = tuple(float(v) for v in query_params["bbox"].split(","))
+        except ValueError:
+            bbox = ()
+        if len(bbox) != 4 or bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+            raise ValidationError({"bbox": "Must be four comma separated numbers: min x, min y, max x, max y."})
+
+    # Pagination
+    page = {}
+    for name in ("limit", "offset"):
+        value = query_params.get(name)
+        if value is not None:
+            if not value.isdigit():
+                raise ValidationError({name: "Must be a non-negative integer."})
+            page[name] = int(value)
+
+    # Properties
+    properties = None
+    if query_params.get("properties") is not None:
+        properties = [p for p in query_params["properties"].split(",") if p]
+
+    # Property Filters
+    filters = {
+        match["property"]: v for k, v in query_params.items()
+        if (match := LAYER_QUERY_FILTER.match(k))
+    }
+
+    # Return
+    return {
+        "bbox": bbox,
+        "filters": filters,
+        "properties": properties,
+        "offset": page.get("offset", 0),
+        "limit": page.get("limit"),
+    }
+
+
+def stream_layer(filepath: str, **query: Any) -> Iterator[bytes]:
+    """Streams the selected features of a GeoJSON layer.
+
+    Args:
+        filepath (str): Path to the GeoJSON file.
+        **query (Any): Keyword arguments for `features.select_features`.
+
+    Yields:
+        bytes: Successive parts of the filtered GeoJSON document.
+    """
+    with features.FeatureCollectionReader(pathlib.Path(filepath)) as reader:
+        members = reader.members()
+        yield from features.dump_feature_collection(members, features.select_features(reader.features(), **query))
+
+
 @drf_utils.extend_schema(tags=["Catalogue - Custodians"])
 class CustodianViewSet(mixins.ChoicesMixin, viewsets.ReadOnlyModelViewSet):
     """Custodian View Set."""
@@ -745,6 +880,28 @@ class LayerSubmissionViewSet(
         res['Filename'] = filename
         return res
 
+    @decorators.action(detail=False, methods=["GET"], url_path="timings", permission_classes=[accounts_permissions.IsInAdministratorsGroup])
+    def timing_percentiles(self, request: request.Request) -> response.Response:
+        """Reports percentiles of the time spent in each stage of absorbing files.
+
+        The Layer Submissions can be narrowed with the usual filters, e.g.
+        `?submitted_after=2024-01-01T00:00:00Z&catalogue_entry_id=1`.
+
+        Args:
+            request (request.Request): API request.
+
+        Returns:
+            response.Response: Number of timed Layer Submissions, and the
+                p50, p90, p99 and maximum duration (seconds) and bytes
+                processed of each stage.
+        """
+        # Retrieve Timings
+        queryset = self.filter_queryset(self.get_queryset()).filter(timings__isnull=False)
+        recorded = queryset.values_list("timings", flat=True).iterator()
+
+        # Summarise and Return
+        return response.Response(timings.percentiles(recorded))
+
     @drf_utils.extend_schema(request=None, responses={status.HTTP_204_NO_CONTENT: None})
     @decorators.action(detail=True, methods=["POST"], url_path="accept-new-column-structure")
     def accept_new_column_structure(self, request: request.Request, pk: str) -> response.Response:
@@ -1,64 +1,300 @@
-"""Kaartdijin Boodja Catalogue Django Application Webhook Utilities."""
+"""Kaartdijin Boodja Catalogue Django Application Webhook Utilities.
+
+Webhook POSTs are delivered asynchronously, so absorbing a layer does not wait
+on webhook receivers:
+
+* `queue_geojson()` spools a copy of the GeoJSON and records a pending
+  `WebhookDelivery` for each webhook URL.
+* `deliver_pending()`, run by a cron job, POSTs due deliveries concurrently,
+  streaming the payload from the spool. Failed deliveries are retried with
+  exponential backoff, and the spooled payload is removed once every delivery
+  of it has finished.
+
+The heartbeat of a delivery is refreshed while its POST is in progress, so a
+delivery is only recovered once the run POSTing it has died, however long the
+POST takes. A recovered delivery counts as an attempt.
+"""
 
 
 # Standard
+import concurrent.futures
+import datetime
 import logging
 import pathlib
+import shutil
+import uuid
 
 # Third-Party
+from django import conf
+from django.db import models as db_models
+from django.utils import timezone
 import httpx
 
+# Local
+from govapp.apps.catalogue import models
+
 # Typing
-from typing import Any
+from typing import Any, Iterator, Optional
 
 
 # Logging
 log = logging.getLogger(__name__)
 
 
-def post_geojson(*webhooks: Any, geojson: pathlib.Path) -> None:
-    """Posts a GeoJSON individually to many webhook URLs.
+# Constants
+CHUNK_SIZE = 64 * 1024  # 64 KiB
+HEARTBEAT = datetime.timedelta(seconds=30)
+STALLED_AFTER = HEARTBEAT * 4  # Deliveries without a heartbeat for this long are recovered
+MAX_BACKOFF = datetime.timedelta(days=1)
+RETRY_STATUS_CODES = {408, 425, 429}  # Retried, as well as any 5xx status
+
+
+def queue_geojson(*webhooks: Any, geojson: pathlib.Path) -> list["models.notifications.WebhookDelivery"]:
+    """Queues a GeoJSON to be posted individually to many webhook URLs.
 
     Args:
-        *webhook (Any): List of webhooks to post the GeoJSON to.
+        *webhooks (Any): List of webhooks to post the GeoJSON to.
         geojson (pathlib.Path): GeoJSON filepath to post.
+
+    Returns:
+        list[models.notifications.WebhookDelivery]: The queued deliveries.
     """
     # Filter the supplied webhooks to only objects that have a `url`
-    # attribute, and cast them to a set to eliminate any duplicates
-    filtered_urls = set(w.url for w in webhooks if hasattr(w, "url"))
+    # attribute, and eliminate any duplicate URLs
+    filtered = {w.url: w for w in webhooks if hasattr(w, "url")}
+
+    # Check
+    if not filtered:
+        return []
+
+    # Log
+    log.info(f"Queueing GeoJSON for: {set(filtered)}")
+
+    # Spool a Copy of the GeoJSON, as the original is only temporary
+    spool = pathlib.Path(conf.settings.WEBHOOK_SPOOL_DIR)
+    spool.mkdir(parents=True, exist_ok=True)
+    payload = spool / f"{uuid.uuid4().hex}.geojson"
+    shutil.copyfile(geojson, payload)
+
+    # Queue Deliveries and Return
+    return models.notifications.WebhookDelivery.objects.bulk_create(
+        models.notifications.WebhookDelivery(webhook=webhook, url=url, payload=str(payload))
+        for url, webhook in filtered.items()
+    )
+
+
+def deliver_pending(max_workers: Optional[int] = None, limit: int = 100) -> int:
+    """POSTs the due webhook deliveries concurrently.
+
+    Args:
+        max_workers (Optional[int]): Number of deliveries to POST at once.
+        limit (int): Maximum number of deliveries to attempt.
+
+    Returns:
+        int: Number of deliveries attempted.
+    """
+    # Recover Deliveries Interrupted Mid-POST
+    now = timezone.now()
+    _recover_stalled(now)
+
+    # Claim Due Deliveries
+    # A delivery is only claimed if it is still pending, so concurrent runs
+    # never POST the same delivery twice.
+    due = models.notifications.WebhookDelivery.objects.filter(
+        status=models.notifications.WebhookDeliveryStatus.PENDING,
+        next_attempt_at__lte=now,
+    ).order_by("next_attempt_at").values_list("id", flat=True)[:limit]
+    claimed = [
+        delivery_id for delivery_id in list(due)
+        if models.notifications.WebhookDelivery.objects.filter(
+            id=delivery_id,
+            status=models.notifications.WebhookDeliveryStatus.PENDING,
+        ).update(status=models.notifications.WebhookDeliveryStatus.DELIVERING, last_attempt_at=now, heartbeat_at=now)
+    ]
+    deliveries = list(models.notifications.WebhookDelivery.objects.filter(id__in=claimed))
+
+    # Check
+    if not deliveries:
+        return 0
 
     # Log
-    log.info(f"POSTing GeoJSON to: {filtered_urls}")
-
-    # Read GeoJSON
-    content = geojson.read_bytes()
-
-    # Enter HTTP Client Context
-    with httpx.Client() as client:
-        # Loop through the URLs
-        for url in filtered_urls:
-            # Handle Errors
-            try:
-                # Log
-                log.info(f"POSTing to: '{url}'")
-
-                # POST the GeoJSON
-                response = client.post(
-                    url=url,
-                    content=content,
-                    headers={"Content-Type": "application/json"}
+    max_workers = max_workers or conf.settings.WEBHOOK_MAX_WORKERS
+    log.info(f"Delivering {len(deliveries)} webhook POSTs with {max_workers} workers")
+
+    # POST Concurrently
+    # Only the POSTs run in the worker threads, the results are saved and the
+    # heartbeats of the unfinished deliveries refreshed here.
+    timeout = httpx.Timeout(conf.settings.WEBHOOK_TIMEOUT_SECONDS)
+    limits = httpx.Limits(max_connections=max_workers)
+    with httpx.Client(timeout=timeout, limits=limits) as client:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = {executor.submit(_post, client, delivery): delivery for delivery in deliveries}
+            unfinished = set(results)
+            while unfinished:
+                finished, unfinished = concurrent.futures.wait(
+                    unfinished,
+                    timeout=HEARTBEAT.total_seconds(),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
                 )
+                for future in finished:
+                    _record(results[future], *future.result())
+                models.notifications.WebhookDelivery.objects.filter(
+                    id__in=[results[future].id for future in unfinished],
+                ).update(heartbeat_at=timezone.now())
+
+    # Remove Payloads that are no longer Needed
+    for payload in {d.payload for d in deliveries}:
+        _remove_payload_if_finished(payload)
+
+    # Return
+    return len(deliveries)
+
+
+def _recover_stalled(now: datetime.datetime) -> None:
+    """Recovers deliveries whose run died mid-POST, counting it as an attempt.
+
+    Args:
+        now (datetime.datetime): Current time.
+    """
+    # Find Stalled Deliveries
+    # Deliveries claimed before heartbeats were recorded only have their
+    # claim time.
+    stalled = models.notifications.WebhookDelivery.objects.filter(
+        db_models.Q(heartbeat_at__lt=now - STALLED_AFTER)
+        | db_models.Q(heartbeat_at__isnull=True, last_attempt_at__lt=now - STALLED_AFTER),
+        status=models.notifications.WebhookDeliveryStatus.DELIVERING,
+    )
+    exhausted = stalled.filter(attempts__gte=conf.settings.WEBHOOK_MAX_ATTEMPTS - 1)
+    payloads = set(exhausted.values_list("payload", flat=True))
+
+    # Give up on Deliveries with no Attempts Left, and Retry the Others
+    error = "Delivery was interrupted mid-POST"
+    failed = exhausted.update(
+        status=models.notifications.WebhookDeliveryStatus.FAILED,
+        attempts=db_models.F("attempts") + 1,
+        error=error,
+    )
+    retried = stalled.update(
+        status=models.notifications.WebhookDeliveryStatus.PENDING,
+        attempts=db_models.F("attempts") + 1,
+        error=error,
+    )
+
+    # Log
+    if failed or retried:
+        log.warning(f"Recovered {failed + retried} stalled webhook deliveries, {failed} of which have failed")
+
+    # Remove Payloads that are no longer Needed
+    for payload in payloads:
+        _remove_payload_if_finished(payload)
 
-            except Exception as exc:
-                # Log
-                log.error(f"POST failed: {exc}")
 
-            else:
-                # Check response
-                if response.is_error:
-                    # Log
-                    log.error(f"POST failed: {response.status_code} - {response.text}")
+def _post(client: httpx.Client, delivery: "models.notifications.WebhookDelivery") -> tuple[Optional[int], str]:
+    """POSTs the payload of a delivery, streamed from the spool.
 
-                else:
-                    # Log
-                    log.info(f"POST successful: {response.status_code} - {response.text}")
+    Args:
+        client (httpx.Client): HTTP client to POST with.
+        delivery (models.notifications.WebhookDelivery): Delivery to POST.
+
+    Returns:
+        tuple[Optional[int], str]: Response status code, if any, and an error
+            message if the POST failed.
+    """
+    # Handle Errors
+    try:
+        # Log
+        log.info(f"POSTing to: '{delivery.url}'")
+
+        # POST the GeoJSON
+        payload = pathlib.Path(delivery.payload)
+        response = client.post(
+            url=delivery.url,
+            content=_read_chunks(payload),
+            headers={"Content-Type": "application/json", "Content-Length": str(payload.stat().st_size)},
+        )
+
+    except Exception as exc:
+        # Log
+        log.error(f"POST to '{delivery.url}' failed: {exc}")
+        return None, str(exc) or type(exc).__name__
+
+    # Check Response
+    if response.is_error:
+        # Log
+        log.error(f"POST to '{delivery.url}' failed: {response.status_code} - {response.text}")
+        return response.status_code, response.text[:1000] or response.reason_phrase or "HTTP error"
+
+    # Log
+    log.info(f"POST to '{delivery.url}' successful: {response.status_code}")
+    return response.status_code, ""
+
+
+def _record(delivery: "models.notifications.WebhookDelivery", status_code: Optional[int], error: str) -> None:
+    """Records the outcome of a delivery attempt, scheduling a retry if needed.
+
+    Args:
+        delivery (models.notifications.WebhookDelivery): Delivery attempted.
+        status_code (Optional[int]): Response status code, if any.
+        error (str): Error message if the POST failed.
+    """
+    # Record Attempt
+    delivery.attempts += 1
+    delivery.response_status = status_code
+    delivery.error = error
+
+    # Check Outcome
+    if not error:
+        delivery.status = models.notifications.WebhookDeliveryStatus.DELIVERED
+        delivery.delivered_at = timezone.now()
+    elif _is_retryable(status_code) and delivery.attempts < conf.settings.WEBHOOK_MAX_ATTEMPTS:
+        backoff = datetime.timedelta(seconds=conf.settings.WEBHOOK_BACKOFF_SECONDS * 2 ** (delivery.attempts - 1))
+        delivery.status = models.notifications.WebhookDeliveryStatus.PENDING
+        delivery.next_attempt_at = timezone.now() + min(backoff, MAX_BACKOFF)
+    else:
+        log.error(f"Giving up on POST to '{delivery.url}' after {delivery.attempts} attempts")
+        delivery.status = models.notifications.WebhookDeliveryStatus.FAILED
+
+    # Save
+    # The heartbeat is left as last refreshed.
+    delivery.save(update_fields=["attempts", "response_status", "error", "status", "delivered_at", "next_attempt_at"])
+
+
+def _is_retryable(status_code: Optional[int]) -> bool:
+    """Determines whether a failed POST should be retried.
+
+    Args:
+        status_code (Optional[int]): Response status code, or None if the
+            POST failed without a response (e.g. timed out).
+
+    Returns:
+        bool: Whether the POST should be retried.
+    """
+    return status_code is None or status_code >= 500 or status_code in RETRY_STATUS_CODES
+
+
+def _read_chunks(filepath: pathlib.Path) -> Iterator[bytes]:
+    """Reads a file in chunks, so it is not read into memory at once.
+
+    Args:
+        filepath (pathlib.Path): File to read.
+
+    Yields:
+        bytes: Chunks of the file.
+    """
+    with filepath.open("rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _remove_payload_if_finished(payload: str) -> None:
+    """Removes a spooled payload once every delivery of it has finished.
+
+    Args:
+        payload (str): Path to the spooled payload.
+    """
+    unfinished = models.notifications.WebhookDelivery.objects.filter(
+        payload=payload,
+        status__in=[models.notifications.WebhookDeliveryStatus.PENDING, models.notifications.WebhookDeliveryStatus.DELIVERING],
+    )
+    if not unfinished.exists():
+        pathlib.Path(payload).unlink(missing_ok=True)
@@ -0,0 +1,19 @@
+"""Kaartdijin Boodja Emails Django Application Admin."""
+
+
+# Third-Party
+from django.contrib import admin
+
+# Local
+from govapp.apps.emails import models
+
+
+class OutboxEmailAdmin(admin.ModelAdmin):
+    search_fields = ('id', 'subject', 'to')
+    list_display = ('id', 'subject', 'to', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    list_filter = ('status',)
+    ordering = ('-id',)
+    readonly_fields = ('created_at', 'last_attempt_at', 'sent_at')
+
+
+admin.site.register(models.OutboxEmail, OutboxEmailAdmin)
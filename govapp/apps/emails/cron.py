@@ -0,0 +1,28 @@
+"""Kaartdijin Boodja Emails Django Application Cron Jobs."""
+
+
+# Standard
+import logging
+
+# Third-Party
+from django import conf
+from django.core import management
+import django_cron
+
+
+# Logging
+log = logging.getLogger(__name__)
+
+
+class SendOutboxCronJob(django_cron.CronJobBase):
+    """Cron Job for sending the Email Outbox."""
+    schedule = django_cron.Schedule(run_every_mins=conf.settings.EMAIL_OUTBOX_PERIOD_MINS)
+    code = "govapp.emails.send_outbox"
+
+    def do(self) -> None:
+        """Perform the Send Outbox Cron Job."""
+        # Log
+        log.info("Send Outbox cron job triggered, running...")
+
+        # Run Management Command
+        management.call_command("send_outbox")
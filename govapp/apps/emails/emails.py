@@ -8,9 +8,13 @@ import logging
 from django import conf
 from django import template
 from django.core import mail
+from django.db import models
 from django.template import loader
 from django.utils import html
 
+# Local
+from govapp.apps.emails import models as emails_models
+
 # Typing
 from typing import Any, Optional, Union
 
@@ -26,22 +30,73 @@ class TemplateEmailBase(WAGovUtilsTemplateEmailBase):
         self,
         *users: Any,
         context: Optional[dict[str, Any]] = None,
-    ) -> None:
-        """Sends an email individually to many users.
+        about: Optional[models.Model] = None,
+    ) -> list[emails_models.OutboxEmail]:
+        """Queues an email individually to many users, to be sent by the outbox.
+
+        The templates are rendered once per distinct greeting, rather than
+        once per user.
 
         Args:
             *users (Any): Possible users to send the email to.
             context (Optional[dict[str, Any]]): Context for the template.
+            about (Optional[models.Model]): Object the email is about, to
+                record the sent emails in its communications log.
+
+        Returns:
+            list[emails_models.OutboxEmail]: The queued emails.
         """
         # Filter the supplied users to only objects that have an `email`
-        # attribute, and cast them to a set to eliminate any duplicated
-            
+        # attribute, and eliminate any duplicated addresses
+        recipients: dict[str, str] = {}
         for user in users:
-            if not hasattr(user, 'email'):
+            if not getattr(user, 'email', None):
                 continue
-            context = context if context else {}
-            context['first_name'] = user.first_name if hasattr(user, 'first_name') else user.name
-            self.send(user.email, context=context)
+            recipients.setdefault(user.email, user.first_name if hasattr(user, 'first_name') else user.name)
+
+        # Render Templates
+        rendered = {
+            first_name: self.render({**(context or {}), 'first_name': first_name})
+            for first_name in set(recipients.values())
+        }
+
+        # Log
+        log.info(f"Queueing email '{self.subject}' to '{list(recipients)}'")
+
+        # Queue Emails and Return
+        return emails_models.OutboxEmail.objects.bulk_create(
+            emails_models.OutboxEmail(
+                content_object=about,
+                subject=self.subject,
+                to=email,
+                fromm=conf.settings.DEFAULT_FROM_EMAIL,
+                text=rendered[first_name][0],
+                html=rendered[first_name][1],
+            )
+            for email, first_name in recipients.items()
+        )
+
+    def render(self, context: dict[str, Any]) -> tuple[str, str]:
+        """Renders the text and HTML templates of the email.
+
+        Args:
+            context (dict[str, Any]): Context for the templates.
+
+        Returns:
+            tuple[str, str]: The text and HTML bodies.
+        """
+        # Render the HTML template
+        # This will raise a TemplateDoesNotExist error if it cannot be found
+        html_body = render(loader.get_template(self.html_template), context)
+
+        # Render the text template, or strip the HTML tags from the HTML body
+        if self.txt_template is not None:
+            txt_body = render(loader.get_template(self.txt_template), context)
+        else:
+            txt_body = html.strip_tags(html_body)
+
+        # Return
+        return txt_body, html_body
 
 
 class OLDTemplateEmailBase:
@@ -0,0 +1,25 @@
+"""Kaartdijin Boodja Emails Send Outbox Management Command."""
+
+
+# Third-Party
+from django.core.management import base
+
+# Local
+from govapp.apps.emails import outbox
+
+# Typing
+from typing import Any
+
+
+class Command(base.BaseCommand):
+    """Send Outbox Management Command."""
+    # Help string
+    help = "Sends the queued emails in the outbox that are due"  # noqa: A003
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        """Handles the management command functionality."""
+        # Go!
+        sent = outbox.send_pending()
+
+        # Display information
+        self.stdout.write(f"Attempted {sent} emails")
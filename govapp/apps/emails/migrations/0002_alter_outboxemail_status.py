@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emails', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxemail',
+            name='status',
+            field=models.IntegerField(choices=[(1, 'Pending'), (2, 'Sending'), (3, 'Sent'), (4, 'Failed'), (5, 'Suppressed')], default=1),
+        ),
+    ]
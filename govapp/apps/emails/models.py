@@ -0,0 +1,55 @@
+"""Kaartdijin Boodja Emails Django Application Models."""
+
+
+# Third-Party
+from django.contrib.contenttypes import fields
+from django.contrib.contenttypes import models as ct_models
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxEmailStatus(models.IntegerChoices):
+    """Enumeration for an Outbox Email Status."""
+    PENDING = 1
+    SENDING = 2
+    SENT = 3
+    FAILED = 4
+    SUPPRESSED = 5  # Not sent, as email delivery is off
+
+
+class OutboxEmail(models.Model):
+    """Model for a rendered email waiting to be sent to one recipient."""
+    # Generic Foreign Key to the Object the Email is About, if any
+    # See: https://docs.djangoproject.com/en/3.2/ref/contrib/contenttypes/#generic-relations
+    content_type = models.ForeignKey(ct_models.ContentType, null=True, blank=True, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField(null=True, blank=True)
+    content_object = fields.GenericForeignKey("content_type", "object_id")
+
+    # Outbox Email Fields
+    subject = models.TextField()
+    to = models.TextField()
+    fromm = models.TextField(blank=True)
+    text = models.TextField()
+    html = models.TextField()
+    status = models.IntegerField(choices=OutboxEmailStatus.choices, default=OutboxEmailStatus.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_attempt_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Outbox Email Model Metadata."""
+        verbose_name = "Outbox Email"
+        verbose_name_plural = "Outbox Emails"
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+
+    def __str__(self) -> str:
+        """Provides a string representation of the object.
+
+        Returns:
+            str: Human readable string representation of the object.
+        """
+        # Generate String and Return
+        return f"{self.subject} - {self.to}"
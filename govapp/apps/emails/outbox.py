@@ -0,0 +1,203 @@
+"""Kaartdijin Boodja Emails Django Application Outbox.
+
+Emails are queued in the outbox by `TemplateEmailBase.send_to()`, rather than
+sent while the caller waits, so a slow or failing mail server does not slow or
+fail ingestion. `send_pending()`, run by a cron job, sends the due emails over
+a single SMTP connection, retrying failures with exponential backoff. Emails
+about an object are recorded in its communications log once sent, or once
+they are given up on.
+
+The outbox applies the same delivery settings as sending an email directly:
+
+* Nothing is sent unless `EMAIL_DELIVERY` is "on"; the emails are marked as
+  suppressed instead.
+* Unless `PRODUCTION_EMAIL` is set, emails are redirected to the
+  `NON_PROD_EMAIL` addresses (or suppressed if there are none), with the
+  `EMAIL_INSTANCE` in their subject.
+"""
+
+
+# Standard
+import datetime
+import logging
+
+# Third-Party
+from django import conf
+from django.core import mail
+from django.utils import timezone
+
+# Local
+from govapp.apps.emails import models
+from govapp.apps.logs import utils as logs_utils
+
+# Typing
+from typing import Any
+
+
+# Logging
+log = logging.getLogger(__name__)
+
+
+# Constants
+STALLED_AFTER = datetime.timedelta(minutes=10)
+MAX_BACKOFF = datetime.timedelta(hours=6)
+
+
+def send_pending(limit: int = 100) -> int:
+    """Sends the due emails in the outbox over a single connection.
+
+    Args:
+        limit (int): Maximum number of emails to send.
+
+    Returns:
+        int: Number of emails attempted.
+    """
+    # Recover Emails Interrupted Mid-Send
+    now = timezone.now()
+    models.OutboxEmail.objects.filter(
+        status=models.OutboxEmailStatus.SENDING,
+        last_attempt_at__lt=now - STALLED_AFTER,
+    ).update(status=models.OutboxEmailStatus.PENDING)
+
+    # Claim Due Emails
+    # An email is only claimed if it is still pending, so concurrent runs
+    # never send the same email twice.
+    due = models.OutboxEmail.objects.filter(
+        status=models.OutboxEmailStatus.PENDING,
+        next_attempt_at__lte=now,
+    ).order_by("next_attempt_at").values_list("id", flat=True)[:limit]
+    claimed = [
+        email_id for email_id in list(due)
+        if models.OutboxEmail.objects.filter(
+            id=email_id,
+            status=models.OutboxEmailStatus.PENDING,
+        ).update(status=models.OutboxEmailStatus.SENDING, last_attempt_at=now)
+    ]
+    emails = list(models.OutboxEmail.objects.filter(id__in=claimed).order_by("id"))
+
+    # Check
+    if not emails:
+        return 0
+
+    # Check Email Delivery
+    if conf.settings.EMAIL_DELIVERY != "on":
+        log.info(f"Suppressing {len(emails)} emails from the outbox, as EMAIL_DELIVERY is not 'on'")
+        models.OutboxEmail.objects.filter(id__in=claimed).update(status=models.OutboxEmailStatus.SUPPRESSED)
+        return len(emails)
+
+    # Log
+    log.info(f"Sending {len(emails)} emails from the outbox")
+
+    # Open Connection
+    connection = mail.get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        log.error(f"Unable to connect to the mail server: {exc}")
+        for email in emails:
+            _record(email, str(exc) or type(exc).__name__)
+        return len(emails)
+
+    # Send
+    try:
+        for email in emails:
+            to, subject = _address(email)
+            if not to:
+                log.warning(f"Suppressing email '{email.subject}' to {email.to}, as NON_PROD_EMAIL is not set")
+                email.status = models.OutboxEmailStatus.SUPPRESSED
+                email.save(update_fields=["status"])
+                continue
+            message = mail.EmailMultiAlternatives(
+                subject=subject,
+                body=email.text,
+                from_email=email.fromm or None,
+                to=to,
+                connection=connection,
+            )
+            message.attach_alternative(email.html, "text/html")
+            try:
+                message.send(fail_silently=False)
+            except Exception as exc:
+                log.error(f"Error while sending email to {email.to}: {exc}")
+                _record(email, str(exc) or type(exc).__name__)
+                _reconnect(connection)
+            else:
+                _record(email, "")
+    finally:
+        connection.close()
+
+    # Return
+    return len(emails)
+
+
+def _address(email: models.OutboxEmail) -> tuple[list[str], str]:
+    """Determines the recipients and subject an email is sent with.
+
+    Args:
+        email (models.OutboxEmail): Email to send.
+
+    Returns:
+        tuple[list[str], str]: Addresses to send the email to, and its subject.
+    """
+    # Check for Production
+    if conf.settings.PRODUCTION_EMAIL:
+        return [email.to], email.subject
+
+    # Redirect Non-Production Emails
+    to = [address.strip() for address in conf.settings.NON_PROD_EMAIL.split(",") if address.strip()]
+    return to, f"[{conf.settings.EMAIL_INSTANCE}] {email.subject}"
+
+
+def _record(email: models.OutboxEmail, error: str) -> None:
+    """Records the outcome of a send attempt, scheduling a retry if needed.
+
+    Args:
+        email (models.OutboxEmail): Email attempted.
+        error (str): Error message if the send failed.
+    """
+    # Record Attempt
+    email.attempts += 1
+    email.error = error
+
+    # Check Outcome
+    if not error:
+        email.status = models.OutboxEmailStatus.SENT
+        email.sent_at = timezone.now()
+        _log_communication(email, email.subject, email.text)
+    elif email.attempts < conf.settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        backoff = datetime.timedelta(seconds=conf.settings.EMAIL_OUTBOX_BACKOFF_SECONDS * 2 ** (email.attempts - 1))
+        email.status = models.OutboxEmailStatus.PENDING
+        email.next_attempt_at = timezone.now() + min(backoff, MAX_BACKOFF)
+    else:
+        log.error(f"Giving up on email '{email.subject}' to {email.to} after {email.attempts} attempts")
+        email.status = models.OutboxEmailStatus.FAILED
+        _log_communication(email, f"[Undelivered] {email.subject}", f"{error}\n\n{email.text}")
+
+    # Save
+    email.save()
+
+
+def _log_communication(email: models.OutboxEmail, subject: str, text: str) -> None:
+    """Records an email in the communications log of the object it is about.
+
+    Args:
+        email (models.OutboxEmail): Email to record.
+        subject (str): Subject to record.
+        text (str): Text to record.
+    """
+    if email.content_object is not None:
+        logs_utils.add_to_communications_log(email.content_object, email.to, email.fromm, subject, text)
+
+
+def _reconnect(connection: Any) -> None:
+    """Reopens a connection after a failed send, which may have broken it.
+
+    Args:
+        connection (Any): Email backend connection.
+    """
+    connection.close()
+    try:
+        connection.open()
+    except Exception as exc:
+        # The next send will try to connect again
+        log.warning(f"Unable to reconnect to the mail server: {exc}")
@@ -21,23 +21,7 @@ def add_to_actions_log(
 ) -> logs_models.ActionsLogEntry:
 
     if user is None and default_to_system:
-        UserModel = auth.get_user_model()
-        system_email = 'gis_system@dbca.wa.gov.au'
-        first_name = 'GIS'
-        last_name = 'System'
-        
-        try:
-            user = UserModel.objects.get(email=system_email)
-        except (UserModel.DoesNotExist, auth_models.user.DoesNotExist):
-            user = UserModel.objects.create_user(
-                username=system_email,
-                email=system_email,
-                password=UserModel.objects.make_random_password(),
-                is_staff=True,
-                is_superuser=False,
-                first_name=first_name,
-                last_name=last_name,
-            )
+        user = system_user()
 
     # Create and Return Actions Log Entry
     return logs_models.ActionsLogEntry.objects.create(
@@ -45,3 +29,62 @@ def add_to_actions_log(
         who=user,
         what=action,
     )
+
+
+def system_user() -> auth_models.User:
+    """Retrieves the GIS System user, creating it if it does not exist.
+
+    Returns:
+        auth_models.User: The GIS System user.
+    """
+    UserModel = auth.get_user_model()
+    system_email = 'gis_system@dbca.wa.gov.au'
+    first_name = 'GIS'
+    last_name = 'System'
+
+    try:
+        user = UserModel.objects.get(email=system_email)
+    except UserModel.DoesNotExist:
+        user = UserModel.objects.create_user(
+            username=system_email,
+            email=system_email,
+            password=None,  # Unusable password
+            is_staff=True,
+            is_superuser=False,
+            first_name=first_name,
+            last_name=last_name,
+        )
+
+    # Return
+    return user
+
+
+def add_to_communications_log(
+    model: models.Model,
+    to: str,
+    fromm: str,
+    subject: str,
+    text: str,
+) -> logs_models.CommunicationsLogEntry:
+    """Records an email sent by the system in the communications log.
+
+    Args:
+        model (models.Model): Object the email was about.
+        to (str): Recipient of the email.
+        fromm (str): Sender of the email.
+        subject (str): Subject of the email.
+        text (str): Text body of the email.
+
+    Returns:
+        logs_models.CommunicationsLogEntry: The communications log entry.
+    """
+    # Create and Return Communications Log Entry
+    return logs_models.CommunicationsLogEntry.objects.create(
+        content_object=model,  # type: ignore
+        type=logs_models.CommunicationsLogEntryType.EMAIL,
+        to=to,
+        fromm=fromm,
+        subject=subject,
+        text=text,
+        user=system_user(),
+    )
@@ -0,0 +1 @@
+"""Kaartdijin Boodja Metrics Django Application."""
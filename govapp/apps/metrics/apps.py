@@ -0,0 +1,16 @@
+"""Kaartdijin Boodja Metrics Django Application Configuration."""
+
+
+# Third-Party
+from django import apps
+
+
+class MetricsConfig(apps.AppConfig):
+    """Metrics Application Configuration."""
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "govapp.apps.metrics"
+
+    def ready(self) -> None:
+        import govapp.apps.metrics.signals  # noqa: F401
+
+        return super().ready()
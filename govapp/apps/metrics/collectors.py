@@ -0,0 +1,80 @@
+"""Kaartdijin Boodja Metrics Collectors.
+
+Gauges calculated from the database when the metrics are scraped, so queue
+backlogs and stalled cron jobs can be alerted on.
+"""
+
+
+# Third-Party
+from django.db import models as db_models
+import django_cron.models
+
+# Local
+from govapp.apps.catalogue.models import notifications
+from govapp.apps.emails import models as emails_models
+from govapp.apps.metrics import registry
+from govapp.apps.publisher.models import geoserver_queues
+
+# Typing
+from typing import Iterator
+
+
+def status_counts(
+    model: type[db_models.Model],
+    choices: type[db_models.IntegerChoices],
+) -> Iterator[tuple[dict[str, object], float]]:
+    """Counts the objects of a model in each status, including empty statuses.
+
+    Args:
+        model (type[db_models.Model]): Model with a `status` field.
+        choices (type[db_models.IntegerChoices]): Choices of the `status` field.
+
+    Yields:
+        tuple[dict[str, object], float]: Status label and number of objects.
+    """
+    counts = dict(model.objects.values_list("status").annotate(count=db_models.Count("id")).order_by())
+    for status in choices:
+        yield {"status": status.name.lower()}, counts.get(status.value, 0)
+
+
+def cron_job_last_success() -> Iterator[tuple[dict[str, object], float]]:
+    """Retrieves when each cron job last finished successfully.
+
+    Yields:
+        tuple[dict[str, object], float]: Job label and Unix timestamp.
+    """
+    last = (
+        django_cron.models.CronJobLog.objects.filter(is_success=True)
+        .values_list("code")
+        .annotate(end_time=db_models.Max("end_time"))
+        .order_by("code")
+    )
+    for code, end_time in last:
+        yield {"job": code}, end_time.timestamp()
+
+
+# Metrics
+GEOSERVER_QUEUE_DEPTH = registry.Gauge(
+    "kb_geoserver_queue_items",
+    "Number of GeoServer queue items in each status.",
+    ["status"],
+    lambda: status_counts(geoserver_queues.GeoServerQueue, geoserver_queues.GeoServerQueueStatus),
+)
+WEBHOOK_DELIVERIES = registry.Gauge(
+    "kb_webhook_deliveries",
+    "Number of webhook deliveries in each status.",
+    ["status"],
+    lambda: status_counts(notifications.WebhookDelivery, notifications.WebhookDeliveryStatus),
+)
+OUTBOX_EMAILS = registry.Gauge(
+    "kb_outbox_emails",
+    "Number of outbox emails in each status.",
+    ["status"],
+    lambda: status_counts(emails_models.OutboxEmail, emails_models.OutboxEmailStatus),
+)
+CRON_JOB_LAST_SUCCESS = registry.Gauge(
+    "kb_cron_job_last_success_timestamp_seconds",
+    "When each cron job last finished successfully.",
+    ["job"],
+    cron_job_last_success,
+)
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MetricSample',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('labels', models.CharField(blank=True, max_length=500)),
+                ('value', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Metric Sample',
+                'verbose_name_plural': 'Metric Samples',
+                'constraints': [models.UniqueConstraint(fields=('name', 'labels'), name='unique_metric_sample')],
+            },
+        ),
+    ]
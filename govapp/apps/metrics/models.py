@@ -0,0 +1,28 @@
+"""Kaartdijin Boodja Metrics Django Application Models."""
+
+
+# Third-Party
+from django.db import models
+
+
+class MetricSample(models.Model):
+    """Model for the value of a metric sample, summed across every process."""
+    name = models.CharField(max_length=200)
+    labels = models.CharField(max_length=500, blank=True)  # e.g. 'job="scan",le="0.5"'
+    value = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Metric Sample Model Metadata."""
+        verbose_name = "Metric Sample"
+        verbose_name_plural = "Metric Samples"
+        constraints = [models.UniqueConstraint(fields=["name", "labels"], name="unique_metric_sample")]
+
+    def __str__(self) -> str:
+        """Provides a string representation of the object.
+
+        Returns:
+            str: Human readable string representation of the object.
+        """
+        # Generate String and Return
+        return f"{self.name}{{{self.labels}}}"
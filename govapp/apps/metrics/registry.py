@@ -0,0 +1,404 @@
+"""Kaartdijin Boodja Metrics Registry.
+
+Metrics are exported in the Prometheus text format, and must add up across
+every gunicorn worker and cron process:
+
+* `Counter.inc()` and `Histogram.observe()` only add to a buffer in the
+  current process, so instrumented code never waits on the database.
+* `flush()` adds the buffered values to the `MetricSample` rows shared by
+  every process. It is called after each request (at most every
+  `METRICS_FLUSH_SECONDS`) and after each cron job, by the signal handlers
+  in `signals.py`. Values left when the process exits are flushed if the
+  database is available, and otherwise dropped quietly. Process pool workers
+  exit without running exit handlers, so they flush after each task.
+* `Gauge` values are calculated from the database when the metrics are
+  scraped, so they are always current.
+* `exposition()` renders every registered metric for scraping.
+"""
+
+
+# Standard
+import atexit
+import contextlib
+import logging
+import re
+import threading
+import time
+
+# Third-Party
+from django import conf
+from django import db
+from django.db import models as db_models
+
+# Local
+from govapp.apps.metrics import models
+
+# Typing
+from typing import Callable, Iterable, Iterator
+
+
+# Logging
+log = logging.getLogger(__name__)
+
+
+# Constants
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900, 3600)
+LE = re.compile(r'(?:^|,)le="([^"]*)"')
+
+# Registered Metrics
+REGISTRY: dict[str, "Metric"] = {}
+
+# Values Buffered in this Process, keyed on Sample Name and Labels
+_pending: dict[tuple[str, str], float] = {}
+_pending_lock = threading.Lock()
+_flushed_at = time.monotonic()
+
+
+class Metric:
+    """A family of metric samples."""
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        """Instantiates and registers the Metric.
+
+        Args:
+            name (str): Name of the metric.
+            documentation (str): Description of the metric.
+            labelnames (Iterable[str]): Names of the metric's labels.
+        """
+        # Instance Attributes
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+        # Register
+        REGISTRY[name] = self
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        """Retrieves the samples of this metric shared by every process.
+
+        Yields:
+            tuple[str, str, float]: Sample name, rendered labels and value.
+        """
+        rows = models.MetricSample.objects.filter(name__in=self.sample_names()).values_list("name", "labels", "value")
+        yield from sorted(rows, key=_sort_key)
+
+    def sample_names(self) -> list[str]:
+        """Names of the samples of this metric.
+
+        Returns:
+            list[str]: The sample names.
+        """
+        return [self.name]
+
+    def _labels(self, labels: dict[str, object]) -> str:
+        """Renders label values in the Prometheus text format.
+
+        Args:
+            labels (dict[str, object]): Value of each of the metric's labels.
+
+        Raises:
+            ValueError: If the labels do not match the metric's label names.
+
+        Returns:
+            str: The rendered labels, e.g. 'job="scan",status="200"'.
+        """
+        # Check
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric '{self.name}' requires the labels {self.labelnames}, not {tuple(labels)}")
+
+        # Render and Return
+        return render_labels((name, labels[name]) for name in self.labelnames)
+
+
+class Counter(Metric):
+    """A total which only increases."""
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        """Increments the counter.
+
+        Args:
+            amount (float): Amount to increment by.
+            **labels (object): Value of each of the metric's labels.
+        """
+        _buffer(self.name, self._labels(labels), amount)
+
+
+class Histogram(Metric):
+    """Counts of observations in cumulative buckets, with their sum."""
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Instantiates and registers the Histogram.
+
+        Args:
+            name (str): Name of the metric.
+            documentation (str): Description of the metric.
+            labelnames (Iterable[str]): Names of the metric's labels.
+            buckets (Iterable[float]): Upper bounds of the buckets.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = sorted(buckets)
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Records an observation.
+
+        Args:
+            value (float): Value observed, e.g. a duration in seconds.
+            **labels (object): Value of each of the metric's labels.
+        """
+        # Every bucket is buffered, so each series exports the same buckets
+        rendered = self._labels(labels)
+        prefix = f"{rendered}," if rendered else ""
+        for bound in [*self.buckets, float("inf")]:
+            _buffer(f"{self.name}_bucket", f'{prefix}le="{_format(bound)}"', 1 if value <= bound else 0)
+        _buffer(f"{self.name}_sum", rendered, value)
+        _buffer(f"{self.name}_count", rendered, 1)
+
+    @contextlib.contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        """Observes the duration of the context in seconds.
+
+        Args:
+            **labels (object): Value of each of the metric's labels.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def sample_names(self) -> list[str]:
+        """Names of the samples of this metric.
+
+        Returns:
+            list[str]: The sample names.
+        """
+        return [f"{self.name}_bucket", f"{self.name}_sum", f"{self.name}_count"]
+
+
+class Gauge(Metric):
+    """A value calculated when the metrics are scraped."""
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str],
+        collect: Callable[[], Iterable[tuple[dict[str, object], float]]],
+    ) -> None:
+        """Instantiates and registers the Gauge.
+
+        Args:
+            name (str): Name of the metric.
+            documentation (str): Description of the metric.
+            labelnames (Iterable[str]): Names of the metric's labels.
+            collect (Callable[[], Iterable[tuple[dict[str, object], float]]]):
+                Calculates the labels and value of each sample.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        """Calculates the samples of this metric.
+
+        Yields:
+            tuple[str, str, float]: Sample name, rendered labels and value.
+        """
+        for labels, value in self.collect():
+            yield self.name, self._labels(labels), value
+
+
+def flush() -> None:
+    """Adds the values buffered in this process to the shared samples."""
+    global _flushed_at
+
+    # Take the Buffered Values
+    with _pending_lock:
+        pending = list(_pending.items())
+        _pending.clear()
+        _flushed_at = time.monotonic()
+
+    # Add to the Shared Samples
+    # Each sample is added atomically, so concurrent processes never lose an
+    # increment. Values which could not be added are kept for the next flush.
+    for index, ((name, labels), amount) in enumerate(pending):
+        try:
+            _add(name, labels, amount)
+        except Exception as exc:
+            log.warning(f"Unable to flush metrics: [{exc}]")
+            for (name, labels), amount in pending[index:]:
+                _buffer(name, labels, amount)
+            return
+
+
+def _flush_at_exit() -> None:
+    """Flushes the values left buffered when the process exits.
+
+    The exit flush is skipped quietly if there is nothing to flush, or the
+    database is unavailable (e.g. it was torn down before the process exits).
+    """
+    # Check
+    if not _pending:
+        return
+    try:
+        db.connection.ensure_connection()
+    except Exception:
+        return
+
+    # Flush
+    flush()
+
+
+def flush_if_due() -> None:
+    """Flushes the buffered values if `METRICS_FLUSH_SECONDS` have passed."""
+    if time.monotonic() - _flushed_at >= conf.settings.METRICS_FLUSH_SECONDS:
+        flush()
+
+
+def exposition() -> str:
+    """Renders every registered metric in the Prometheus text format.
+
+    Returns:
+        str: The metrics, for scraping.
+    """
+    lines = []
+    for metric in REGISTRY.values():
+        lines.append(f"# HELP {metric.name} {_escape(metric.documentation, is_help=True)}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{{{labels}}} {_format(value)}" if labels else f"{name} {_format(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def render_labels(labels: Iterable[tuple[str, object]]) -> str:
+    """Renders label names and values in the Prometheus text format.
+
+    Args:
+        labels (Iterable[tuple[str, object]]): Name and value of each label.
+
+    Returns:
+        str: The rendered labels.
+    """
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels)
+
+
+def _add(name: str, labels: str, amount: float) -> None:
+    """Adds to a shared sample, creating it if needed.
+
+    Args:
+        name (str): Name of the sample.
+        labels (str): Rendered labels of the sample.
+        amount (float): Amount to add.
+    """
+    samples = models.MetricSample.objects.filter(name=name, labels=labels)
+    if samples.update(value=db_models.F("value") + amount):
+        return
+    try:
+        with db.transaction.atomic():
+            models.MetricSample.objects.create(name=name, labels=labels, value=amount)
+    except db.IntegrityError:
+        # Created concurrently by another process
+        samples.update(value=db_models.F("value") + amount)
+
+
+def _buffer(name: str, labels: str, amount: float) -> None:
+    """Adds to a sample's value buffered in this process.
+
+    Args:
+        name (str): Name of the sample.
+        labels (str): Rendered labels of the sample.
+        amount (float): Amount to add.
+    """
+    with _pending_lock:
+        _pending[(name, labels)] = _pending.get((name, labels), 0) + amount
+
+
+def _escape(value: str, is_help: bool = False) -> str:
+    """Escapes a label value, or help text, for the Prometheus text format.
+
+    Args:
+        value (str): Value to escape.
+        is_help (bool): Whether the value is help text, where quotes are not escaped.
+
+    Returns:
+        str: The escaped value.
+    """
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return value if is_help else value.replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    """Formats a sample value for the Prometheus text format.
+
+    Args:
+        value (float): Value to format.
+
+    Returns:
+        str: The formatted value.
+    """
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _sort_key(sample: tuple[str, str, float]) -> tuple[str, str, float]:
+    """Orders samples by name and labels, with histogram buckets in ascending order.
+
+    Args:
+        sample (tuple[str, str, float]): Sample name, rendered labels and value.
+
+    Returns:
+        tuple[str, str, float]: The sort key.
+    """
+    name, labels, _ = sample
+    bound = LE.search(labels)
+    if bound is None:
+        return name, labels, 0
+    return name, LE.sub("", labels), float(bound.group(1).replace("+Inf", "inf"))
+
+
+# Flush when the Process Exits
+atexit.register(_flush_at_exit)
+
+
+# Metrics
+CRON_JOB_RUNS = Counter(
+    "kb_cron_job_runs_total",
+    "Number of cron job runs.",
+    ["job"],
+)
+CRON_JOB_FAILURES = Counter(
+    "kb_cron_job_failures_total",
+    "Number of cron job runs which raised an exception.",
+    ["job"],
+)
+CRON_JOB_DURATION = Histogram(
+    "kb_cron_job_duration_seconds",
+    "Duration of cron job runs.",
+    ["job"],
+)
+CONVERSIONS = Counter(
+    "kb_conversions_total",
+    "Number of GIS file conversions, excluding conversion cache hits.",
+    ["format"],
+)
+CONVERSION_BYTES = Counter(
+    "kb_conversion_bytes_total",
+    "Bytes read and written by GIS file conversions.",
+    ["format", "direction"],
+)
+GEOSERVER_REQUEST_DURATION = Histogram(
+    "kb_geoserver_request_duration_seconds",
+    "Latency of requests to GeoServer, including retries.",
+    ["method", "status"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+)
@@ -0,0 +1,38 @@
+"""Kaartdijin Boodja Metrics Django Application Signals."""
+
+
+# Third-Party
+from django.core import signals
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+import django_cron.models
+
+# Local
+from govapp.apps.metrics import registry
+
+
+@receiver(post_save, sender=django_cron.models.CronJobLog)
+def cron_job_log_post_save(sender, instance, created, **kwargs):
+    """Records the metrics of a cron job run, and flushes this process's metrics.
+
+    django_cron saves a log after every run of every cron job, so this covers
+    each job without changing it.
+    """
+    # Check
+    if not created:
+        return
+
+    # Record
+    registry.CRON_JOB_RUNS.inc(job=instance.code)
+    if not instance.is_success:
+        registry.CRON_JOB_FAILURES.inc(job=instance.code)
+    registry.CRON_JOB_DURATION.observe((instance.end_time - instance.start_time).total_seconds(), job=instance.code)
+
+    # Flush
+    registry.flush()
+
+
+@receiver(signals.request_finished)
+def request_finished(sender, **kwargs):
+    """Periodically flushes the metrics recorded by gunicorn workers."""
+    registry.flush_if_due()
@@ -0,0 +1,14 @@
+"""Kaartdijin Boodja Metrics Django Application URLs."""
+
+
+# Third-Party
+from django import urls
+
+# Local
+from govapp.apps.metrics import views
+
+
+# Metrics URL Patterns
+urlpatterns = [
+    urls.path("", views.metrics, name="metrics"),
+]
@@ -0,0 +1,40 @@
+"""Kaartdijin Boodja Metrics Django Application Views."""
+
+
+# Standard
+import secrets
+
+# Third-Party
+from django import conf
+from django import http
+
+# Local
+from govapp.apps.accounts import utils as accounts_utils
+from govapp.apps.metrics import collectors  # noqa: F401
+from govapp.apps.metrics import registry
+
+
+def metrics(request: http.HttpRequest) -> http.HttpResponse:
+    """Exports the metrics in the Prometheus text format.
+
+    Prometheus scrapes with the `METRICS_TOKEN` as a bearer token, while
+    Administrators can view the metrics when logged in.
+
+    Args:
+        request (http.HttpRequest): The request.
+
+    Returns:
+        http.HttpResponse: The metrics.
+    """
+    # Check Permissions
+    authorization = request.headers.get("Authorization", "")
+    token = conf.settings.METRICS_TOKEN
+    if not (
+        (token and secrets.compare_digest(authorization, f"Bearer {token}"))
+        or accounts_utils.is_administrator(request.user)
+    ):
+        return http.HttpResponseForbidden()
+
+    # Flush this Process's Metrics and Return
+    registry.flush()
+    return http.HttpResponse(registry.exposition(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,251 @@
+"""Kaartdijin Boodja Publisher CDDP File Index.
+
+Listing the CDDP output share by walking it and stating every file is slow
+over SMB, so the listing is served from an index of the files in the
+database instead.
+
+The index is refreshed incrementally using directory modification times:
+adding, removing or renaming a file changes the modification time of its
+directory, so only directories whose modification time has changed are
+listed again. Files rewritten in place do not change their directory, so a
+full refresh is also run periodically by a cron job.
+"""
+
+
+# Standard
+import datetime
+import logging
+import os
+import pathlib
+
+# Third-Party
+from django import conf
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+# Local
+from govapp.apps.publisher.models import cddp_files
+
+# Typing
+from typing import Any, Optional
+
+
+# Logging
+log = logging.getLogger(__name__)
+
+
+# Constants
+DATETIME_FORMAT = "%d-%m-%Y %H:%M:%S"
+STAT_FIELDS = ("size_bytes", "created_at", "last_accessed_at", "last_modified_at")
+ORDER_FIELDS = ("filepath", "size_bytes", "created_at", "last_accessed_at", "last_modified_at")
+REFRESH_CACHE_KEY = "publisher.cddp_index.refreshed"
+
+
+def refresh(root: str, full: bool = False) -> int:
+    """Refreshes the index of the files below a directory.
+
+    Args:
+        root (str): Directory to index.
+        full (bool): Whether to list every directory, regardless of whether
+            its modification time has changed.
+
+    Returns:
+        int: Number of directories listed.
+    """
+    # Load Indexed Directories
+    indexed = {d.path: d for d in cddp_files.CDDPDirectory.objects.all()}
+    children: dict[str, list[str]] = {}
+    for path in indexed:
+        if path:
+            children.setdefault(os.path.dirname(path), []).append(path)
+
+    # Walk the Directories
+    listed = 0
+    seen = set()
+    stack = [""]
+    while stack:
+        path = stack.pop()
+        try:
+            modified_ns = os.stat(os.path.join(root, path)).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        seen.add(path)
+
+        # Skip Unchanged Directories, but not their Subdirectories
+        directory = indexed.get(path)
+        if not full and directory is not None and directory.modified_ns == modified_ns:
+            stack.extend(children.get(path, []))
+            continue
+
+        # List Directory
+        stack.extend(_index_directory(root, path, modified_ns, directory))
+        listed += 1
+
+    # Remove Deleted Directories (and their Files)
+    cddp_files.CDDPDirectory.objects.filter(path__in=set(indexed) - seen).delete()
+
+    # Log
+    log.info(f"Refreshed CDDP file index of [{root}]: listed {listed} of {len(seen)} directories")
+
+    # Return
+    return listed
+
+
+def refresh_if_stale(root: str) -> None:
+    """Refreshes the index incrementally, at most once per refresh period.
+
+    Args:
+        root (str): Directory to index.
+    """
+    # Refresh if no other Request has Recently
+    if cache.add(REFRESH_CACHE_KEY, True, timeout=conf.settings.CDDP_INDEX_REFRESH_SECONDS):
+        refresh(root)
+
+
+def _index_directory(
+    root: str,
+    path: str,
+    modified_ns: int,
+    directory: Optional[cddp_files.CDDPDirectory],
+) -> list[str]:
+    """Lists a directory and updates the index of its files.
+
+    Args:
+        root (str): Indexed root directory.
+        path (str): Directory to list, relative to the root.
+        modified_ns (int): Modification time of the directory.
+        directory (Optional[CDDPDirectory]): Indexed directory, if any.
+
+    Returns:
+        list[str]: Subdirectories, relative to the root.
+    """
+    # List Directory
+    subdirectories = []
+    files = {}
+    with os.scandir(os.path.join(root, path)) as entries:
+        for entry in entries:
+            filepath = str(pathlib.PurePosixPath(path, entry.name))
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(filepath)
+                elif entry.is_file():
+                    files[filepath] = entry.stat()
+            except FileNotFoundError:
+                continue
+
+    with transaction.atomic():
+        # Update Directory
+        # A concurrent refresh may have indexed the directory since the index
+        # was loaded, so its files may already be indexed as well.
+        if directory is None:
+            directory, _ = cddp_files.CDDPDirectory.objects.update_or_create(
+                path=path,
+                defaults={"modified_ns": modified_ns},
+            )
+        else:
+            directory.modified_ns = modified_ns
+            directory.save(update_fields=["modified_ns"])
+
+        # Update Files
+        indexed = {f.filepath: f for f in directory.files.all()}
+        created = []
+        updated = []
+        for filepath, stat in files.items():
+            values = {
+                "size_bytes": stat.st_size,
+                "created_at": _timestamp(stat.st_ctime),
+                "last_accessed_at": _timestamp(stat.st_atime),
+                "last_modified_at": _timestamp(stat.st_mtime),
+            }
+            file = indexed.get(filepath)
+            if file is None:
+                created.append(cddp_files.CDDPFile(directory=directory, filepath=filepath, **values))
+            elif any(getattr(file, k) != v for k, v in values.items()):
+                for k, v in values.items():
+                    setattr(file, k, v)
+                updated.append(file)
+        cddp_files.CDDPFile.objects.bulk_create(created, batch_size=1000, ignore_conflicts=True)
+        cddp_files.CDDPFile.objects.bulk_update(updated, list(STAT_FIELDS), batch_size=1000)
+        directory.files.exclude(filepath__in=list(files)).delete()
+
+    # Return
+    return subdirectories
+
+
+def remove(filepath: str) -> None:
+    """Removes a file from the index.
+
+    Args:
+        filepath (str): Path of the file, relative to the indexed root.
+    """
+    cddp_files.CDDPFile.objects.filter(filepath=filepath).delete()
+
+
+def list_files(
+    order_by: str = "created_at",
+    offset: int = 0,
+    limit: Optional[int] = None,
+    search: Optional[str] = None,
+) -> dict[str, Any]:
+    """Lists indexed files, sorted, filtered and paginated in the database.
+
+    Args:
+        order_by (str): Field to sort by, prefixed with "-" for descending.
+        offset (int): Number of files to skip.
+        limit (Optional[int]): Maximum number of files to return.
+        search (Optional[str]): Text the file paths must contain.
+
+    Raises:
+        ValueError: If the sort field is not supported.
+
+    Returns:
+        dict[str, Any]: Number of matching files and the requested page.
+    """
+    # Check Sort Field
+    if order_by.lstrip("-") not in ORDER_FIELDS:
+        raise ValueError(f"Cannot order by [{order_by}], must be one of {', '.join(ORDER_FIELDS)}")
+
+    # Query
+    queryset = cddp_files.CDDPFile.objects.all()
+    if search:
+        queryset = queryset.filter(filepath__icontains=search)
+    count = queryset.count()
+    queryset = queryset.order_by(order_by, "filepath")[offset:offset + limit if limit else None]
+
+    # Return
+    return {
+        "count": count,
+        "results": [_serialize(f) for f in queryset],
+    }
+
+
+def _serialize(file: cddp_files.CDDPFile) -> dict[str, Any]:
+    """Serializes an indexed file as returned by `get_file_list`.
+
+    Args:
+        file (CDDPFile): The indexed file.
+
+    Returns:
+        dict[str, Any]: The file's path and metadata.
+    """
+    return {
+        "filepath": file.filepath,
+        "created_at": timezone.localtime(file.created_at).strftime(DATETIME_FORMAT),
+        "last_accessed_at": timezone.localtime(file.last_accessed_at).strftime(DATETIME_FORMAT),
+        "last_modified_at": timezone.localtime(file.last_modified_at).strftime(DATETIME_FORMAT),
+        "size_bytes": file.size_bytes,
+        "size_kb": -(-file.size_bytes // 1024),
+    }
+
+
+def _timestamp(value: float) -> datetime.datetime:
+    """Converts a `stat` timestamp to an aware datetime.
+
+    Args:
+        value (float): Seconds since the epoch.
+
+    Returns:
+        datetime.datetime: The aware datetime.
+    """
+    return datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
@@ -61,6 +61,18 @@ class GeoServerSyncRulesCronJob(django_cron.CronJobBase):  # rules
         management.call_command("geoserver_sync_rules")
 
 
+class CDDPIndexCronJob(django_cron.CronJobBase):
+    """Cron Job for fully refreshing the CDDP file index."""
+    schedule = django_cron.Schedule(run_every_mins=conf.settings.CDDP_INDEX_FULL_REFRESH_PERIOD_MINS)
+    code = "govapp.publisher.cddp_index_refresh"
+
+    def do(self) -> None:
+        log.info("CDDP index cron job triggered, running...")
+
+        # Run Management Command
+        management.call_command("cddp_index_refresh", full=True)
+
+
 class PublishGeoServerReadyToPublishCronJob(django_cron.CronJobBase):
     """Cron Job for Phase 2 of GeoServer publishing.
 
@@ -1,15 +1,19 @@
 """Kaartdijin Boodja Publisher GeoServer Queue Excutor."""
 
 # Standard
+import concurrent.futures
+import contextlib
 import logging
 import pathlib
 import shutil
+import threading
 
 # Third-Party
 import decouple
 import requests
 from requests.auth import HTTPBasicAuth
 from django.conf import settings
+from django import db
 from django.db.models import Q
 from django.utils import timezone
 from django.contrib import auth
@@ -24,10 +28,11 @@ from govapp.apps.publisher.models.geoserver_roles_groups import GeoServerGroup,
 from govapp.apps.publisher.models.publish_channels import GeoServerPublishChannel, StoreType
 from govapp.apps.publisher.models.workspaces import Workspace
 from govapp.apps.catalogue.models.catalogue_entries import CatalogueEntryType
+from govapp.common.utils import file_sha256
 from govapp.gis import geoserver
 
 # Typing
-from typing import TYPE_CHECKING 
+from typing import TYPE_CHECKING, Iterator, Optional
 
 if TYPE_CHECKING:
     from govapp.apps.publisher.models.publish_entries import PublishEntry
@@ -37,8 +42,6 @@ UserModel = auth.get_user_model()
 # Logging
 log = logging.getLogger(__name__)
 
-QUEUE_EXPIRED_MINUTES = 1
-
 class GeoServerQueueExcutor:
     def __init__(self) -> None:
         self.result_status = GeoServerQueueStatus.PUBLISHED
@@ -89,80 +92,193 @@ class GeoServerQueueExcutor:
         log.info(f"Auto-enqueue process completed. Added {count} entries to queue")
 
     def excute(self) -> None:
-        queue_items = self._retrieve_target_items()
-        log.info(f"Start publishing for {queue_items.count()} geoserver queue items.")
+        """Claims and processes geoserver queue items until none are left.
 
-        for queue_item in queue_items:
+        Items are processed by GEOSERVER_QUEUE_MAX_WORKERS worker threads. Each item is
+        claimed atomically with SELECT ... FOR UPDATE SKIP LOCKED, so workers (including
+        those of another process running this command) never process the same item.
+        """
+        max_workers = settings.GEOSERVER_QUEUE_MAX_WORKERS
+        log.info(f"Start publishing for {self._retrieve_target_items().count()} geoserver queue items with {max_workers} worker(s).")
+
+        # Items claimed during this run, so that an item is never processed twice per run
+        claimed: set[int] = set()
+        claimed_lock = threading.Lock()
+
+        if max_workers <= 1:
+            self._work(claimed, claimed_lock)
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="geoserver-queue") as executor:
+            # Each worker has its own executor, as the publishing state is per item
+            futures = [
+                executor.submit(GeoServerQueueExcutor()._work_in_thread, claimed, claimed_lock)
+                for _ in range(max_workers)
+            ]
+        for future in futures:
+            future.result()
+
+    def _work_in_thread(self, claimed: set[int], claimed_lock: threading.Lock) -> None:
+        """Runs a worker in a thread, closing the thread's database connection afterwards.
+
+        Args:
+            claimed (set[int]): Primary keys of the items claimed during this run.
+            claimed_lock (threading.Lock): Lock guarding the claimed items.
+        """
+        try:
+            self._work(claimed, claimed_lock)
+        finally:
+            db.connection.close()
+
+    def _work(self, claimed: set[int], claimed_lock: threading.Lock) -> None:
+        """Claims and processes queue items until none are left.
+
+        Args:
+            claimed (set[int]): Primary keys of the items claimed during this run.
+            claimed_lock (threading.Lock): Lock guarding the claimed items.
+        """
+        while (queue_item := self._claim_next_item(claimed, claimed_lock)) is not None:
+            with self._heartbeat(queue_item):
+                self._excute_item(queue_item)
+
+    def _claim_next_item(self, claimed: set[int], claimed_lock: threading.Lock) -> Optional[geoserver_queues.GeoServerQueue]:
+        """Atomically claims the oldest claimable queue item.
+
+        Args:
+            claimed (set[int]): Primary keys of the items claimed during this run.
+            claimed_lock (threading.Lock): Lock guarding the claimed items.
+
+        Returns:
+            Optional[GeoServerQueue]: The claimed item (now PROCESSING), or None if
+                there is nothing left to claim.
+        """
+        with claimed_lock:
+            exclude = list(claimed)
+
+        with db.transaction.atomic():
+            queue_item = (
+                self._retrieve_target_items()
+                .exclude(pk__in=exclude)
+                .select_for_update(skip_locked=True)
+                .first()
+            )
+            if queue_item is None:
+                return None
+            queue_item.change_status(GeoServerQueueStatus.PROCESSING)
+
+        with claimed_lock:
+            claimed.add(queue_item.pk)
+
+        log.info(f"Claimed geoserver queue item pk={queue_item.pk}.")
+        return queue_item
+
+    @contextlib.contextmanager
+    def _heartbeat(self, queue_item: geoserver_queues.GeoServerQueue) -> Iterator[None]:
+        """Records a heartbeat for a queue item while it is being processed.
+
+        Args:
+            queue_item (GeoServerQueue): The item being processed.
+        """
+        stop = threading.Event()
+
+        def beat() -> None:
             try:
-                self._init_excuting(queue_item=queue_item)
+                while not stop.wait(settings.GEOSERVER_QUEUE_HEARTBEAT_SECONDS):
+                    try:
+                        geoserver_queues.GeoServerQueue.objects.filter(
+                            pk=queue_item.pk,
+                            status=GeoServerQueueStatus.PROCESSING,
+                        ).update(heartbeat_at=timezone.now())
+                    except Exception as e:
+                        log.warning(f"Failed to record heartbeat for queue item pk={queue_item.pk}: {e}")
+            finally:
+                db.connection.close()
 
-                if queue_item.queue_type == GeoServerQueueType.PURGE_CACHE:
-                    self._purge_cache_for_queue_item(queue_item)
+        thread = threading.Thread(target=beat, name=f"geoserver-queue-heartbeat-{queue_item.pk}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _excute_item(self, queue_item: geoserver_queues.GeoServerQueue) -> None:
+        """Converts or publishes a claimed queue item and records the result.
+
+        Args:
+            queue_item (GeoServerQueue): The claimed item.
+        """
+        try:
+            self._init_excuting(queue_item=queue_item)
+
+            if queue_item.queue_type == GeoServerQueueType.PURGE_CACHE:
+                self._purge_cache_for_queue_item(queue_item)
+            else:
+                if queue_item.symbology_only:
+                    # Symbology-only: publish style directly to GeoServer, no file transfer needed
+                    for geoserver_publish_channel in queue_item.publish_entry.geoserver_channels.all():
+                        geoserver_pool = geoserver_publish_channel.geoserver_pool
+                        if not geoserver_pool:
+                            self.result_status = GeoServerQueueStatus.FAILED
+                            self.result_success = False
+                            self._add_publishing_log(f"[{queue_item.publish_entry.name}] Publishing failed.  No geoserver_pool configured.")
+                            continue
+                        if not geoserver_pool.enabled:
+                            self.result_status = GeoServerQueueStatus.FAILED
+                            self.result_success = False
+                            self._add_publishing_log(f"[{queue_item.publish_entry.name} - {geoserver_pool.url}] Publishing failed.  Geoserver_pool is not enabled.")
+                            continue
+                        workspaces_in_kb = Workspace.objects.all()
+                        for workspace in workspaces_in_kb:
+                            geoserver_pool.create_workspace_if_not_exists(workspace.name)
+                        self._publish_to_a_geoserver(geoserver_publish_channel)
                 else:
-                    if queue_item.symbology_only:
-                        # Symbology-only: publish style directly to GeoServer, no file transfer needed
+                    catalogue_entry_type = queue_item.publish_entry.catalogue_entry.type
+                    if catalogue_entry_type in [CatalogueEntryType.SPATIAL_FILE, CatalogueEntryType.SUBSCRIPTION_QUERY]:
+                        # Phase 1: convert file only; kb_geoserver_manager will transfer it to the shared volume
+                        self.result_status = GeoServerQueueStatus.CONVERTED
+                        self._convert_publish_queue_item(queue_item)
+                    else:
+                        # Subscription types (WMS/WFS/PostGIS): no file needed, publish directly to GeoServer
                         for geoserver_publish_channel in queue_item.publish_entry.geoserver_channels.all():
                             geoserver_pool = geoserver_publish_channel.geoserver_pool
                             if not geoserver_pool:
                                 self.result_status = GeoServerQueueStatus.FAILED
                                 self.result_success = False
-                                self._add_publishing_log(f"[{queue_item.publish_entry.name}] Publishing failed.  No geoserver_pool configured.")
+                                self._add_publishing_log(f"[{queue_item.publish_entry.name}] Publishing failed. No geoserver_pool configured.")
                                 continue
                             if not geoserver_pool.enabled:
                                 self.result_status = GeoServerQueueStatus.FAILED
                                 self.result_success = False
-                                self._add_publishing_log(f"[{queue_item.publish_entry.name} - {geoserver_pool.url}] Publishing failed.  Geoserver_pool is not enabled.")
+                                self._add_publishing_log(f"[{queue_item.publish_entry.name} - {geoserver_pool.url}] Publishing failed. Geoserver_pool is not enabled.")
                                 continue
                             workspaces_in_kb = Workspace.objects.all()
                             for workspace in workspaces_in_kb:
                                 geoserver_pool.create_workspace_if_not_exists(workspace.name)
                             self._publish_to_a_geoserver(geoserver_publish_channel)
-                    else:
-                        catalogue_entry_type = queue_item.publish_entry.catalogue_entry.type
-                        if catalogue_entry_type in [CatalogueEntryType.SPATIAL_FILE, CatalogueEntryType.SUBSCRIPTION_QUERY]:
-                            # Phase 1: convert file only; kb_geoserver_manager will transfer it to the shared volume
-                            self.result_status = GeoServerQueueStatus.CONVERTED
-                            self._convert_publish_queue_item(queue_item)
-                        else:
-                            # Subscription types (WMS/WFS/PostGIS): no file needed, publish directly to GeoServer
-                            for geoserver_publish_channel in queue_item.publish_entry.geoserver_channels.all():
-                                geoserver_pool = geoserver_publish_channel.geoserver_pool
-                                if not geoserver_pool:
-                                    self.result_status = GeoServerQueueStatus.FAILED
-                                    self.result_success = False
-                                    self._add_publishing_log(f"[{queue_item.publish_entry.name}] Publishing failed. No geoserver_pool configured.")
-                                    continue
-                                if not geoserver_pool.enabled:
-                                    self.result_status = GeoServerQueueStatus.FAILED
-                                    self.result_success = False
-                                    self._add_publishing_log(f"[{queue_item.publish_entry.name} - {geoserver_pool.url}] Publishing failed. Geoserver_pool is not enabled.")
-                                    continue
-                                workspaces_in_kb = Workspace.objects.all()
-                                for workspace in workspaces_in_kb:
-                                    geoserver_pool.create_workspace_if_not_exists(workspace.name)
-                                self._publish_to_a_geoserver(geoserver_publish_channel)
 
-                self._update_result(queue_item=queue_item)
+            self._update_result(queue_item=queue_item)
 
-            except Exception as e:
-                log.error(f"Unexpected error while processing queue item pk={queue_item.pk}: {e}", exc_info=True)
-                self.result_status = GeoServerQueueStatus.FAILED
-                self.result_success = False
-                self._add_publishing_log(f"Unexpected error: {e}")
-                try:
-                    self._update_result(queue_item=queue_item)
-                except Exception as save_error:
-                    log.error(f"Failed to save error state for queue item pk={queue_item.pk}: {save_error}", exc_info=True)
+        except Exception as e:
+            log.error(f"Unexpected error while processing queue item pk={queue_item.pk}: {e}", exc_info=True)
+            self.result_status = GeoServerQueueStatus.FAILED
+            self.result_success = False
+            self._add_publishing_log(f"Unexpected error: {e}")
+            try:
+                self._update_result(queue_item=queue_item)
+            except Exception as save_error:
+                log.error(f"Failed to save error state for queue item pk={queue_item.pk}: {save_error}", exc_info=True)
 
     def _retrieve_target_items(self):
-        """ Retrieve items that their status is ready or status is processing & started before 30 minutes from now """
+        """ Retrieve items that their status is ready, or status is processing & their heartbeat has stopped """
+        stale = timezone.now() - timezone.timedelta(seconds=settings.GEOSERVER_QUEUE_HEARTBEAT_TIMEOUT_SECONDS)
         query = Q(status=GeoServerQueueStatus.READY) | \
-                Q(status=GeoServerQueueStatus.PROCESSING, started_at__lte=timezone.now() - timezone.timedelta(minutes=QUEUE_EXPIRED_MINUTES))
+                Q(status=GeoServerQueueStatus.PROCESSING, heartbeat_at__lte=stale) | \
+                Q(status=GeoServerQueueStatus.PROCESSING, heartbeat_at__isnull=True, started_at__lte=stale)
         target_items = geoserver_queues.GeoServerQueue.objects.filter(query).order_by('created_at')
         return target_items
     
     def _init_excuting(self, queue_item):
-        queue_item.change_status(GeoServerQueueStatus.PROCESSING)
         self.publishing_log = queue_item.publishing_result if queue_item.publishing_result is not None else ""
         self.result_status = GeoServerQueueStatus.PUBLISHED
         self.result_success = True
@@ -280,15 +396,12 @@ class GeoServerQueueExcutor:
         try:
             converted_path = channel.convert_layer()
             queue_item.converted_file_path = str(converted_path)
-            queue_item.save(update_fields=['converted_file_path'])
-            if channel.store_type == StoreType.GEOTIFF:
-                self._add_publishing_log(
-                    f"[{queue_item.publish_entry.name}] File ready (no conversion needed for GeoTIFF): {converted_path}"
-                )
-            else:
-                self._add_publishing_log(
-                    f"[{queue_item.publish_entry.name}] File converted successfully: {converted_path}"
-                )
+            # Hash once here, so every (resumed) download can be verified against it
+            queue_item.converted_file_sha256 = file_sha256(converted_path) if converted_path.is_file() else None
+            queue_item.save(update_fields=['converted_file_path', 'converted_file_sha256'])
+            self._add_publishing_log(
+                f"[{queue_item.publish_entry.name}] File converted successfully: {converted_path}"
+            )
         except Exception as e:
             self.result_status = GeoServerQueueStatus.FAILED
             self.result_success = False
@@ -422,12 +535,17 @@ class GeoServerQueueExcutor:
                         geoserver_data_dir=geoserver_data_dir,
                     )
                 elif channel.store_type == StoreType.GEOTIFF:
-                    geoserver_obj.configure_geotiff_from_path(
+                    configured = geoserver_obj.configure_geotiff_from_path(
                         workspace=workspace_name,
                         layer=layer_name,
                         file_path_on_volume=volume_file_path,
                         geoserver_data_dir=geoserver_data_dir,
+                        sha256=queue_item.converted_file_sha256,
                     )
+                    if not configured:
+                        self._add_publishing_log(
+                            f"[{queue_item.publish_entry.name} - {pool.url}] GeoTIFF is unchanged; coverage store left as is."
+                        )
                 else:
                     self.result_status = GeoServerQueueStatus.PUBLISH_FAILED
                     self.result_success = False
@@ -496,8 +614,8 @@ class GeoServerQueueExcutor:
         converted_path = pathlib.Path(queue_item.converted_file_path)
 
         # Guard 1: only delete paths inside GIS_TMP_DIR.
-        # For GEOTIFF store_type, convert_layer() returns the original source file path
-        # (no conversion is performed). That path is under data_storage/, not GIS_TMP_DIR.
+        # Items queued before GeoTIFFs were converted to COGs still point at the
+        # original source file under data_storage/, not GIS_TMP_DIR.
         # relative_to() raises ValueError for paths outside GIS_TMP_DIR.
         try:
             converted_path.relative_to(gis_tmp_dir)
@@ -0,0 +1,207 @@
+"""Kaartdijin Boodja Publisher GeoServer Layer Health Checks.
+
+The layers of every GeoServer publish channel are checked without a REST
+request per channel run one after another:
+
+* The layer inventory of each GeoServer pool is listed once, and channels
+  whose layer is missing from it are unhealthy without further requests.
+* The details of the remaining layers are retrieved concurrently, bounded by
+  the size of the GeoServer connection pool. A random sample of
+  `GEOSERVER_LAYER_HEALTH_CHECK_GETMAP_SAMPLE` layers per pool is also
+  rendered with a tiny GetMap request.
+* The results are written as `GeoServerLayerHealthcheck` rows in bulk.
+"""
+
+
+# Standard
+import concurrent.futures
+import logging
+import random
+
+# Third-Party
+from django import conf
+from django.db import transaction
+from django.utils import timezone
+
+# Local
+from govapp.apps.publisher.models import geoserver_pools
+from govapp.apps.publisher.models import publish_channels
+from govapp.gis import geoserver
+
+# Typing
+from typing import Iterable, Optional
+
+
+# Logging
+log = logging.getLogger(__name__)
+
+
+# Constants
+FIELDS = ("layer_name", "health_status", "error_message", "last_check_time")
+
+
+def check_layers(
+    channels: Optional[Iterable[publish_channels.GeoServerPublishChannel]] = None,
+) -> list[publish_channels.GeoServerLayerHealthcheck]:
+    """Checks the layers of GeoServer publish channels, recording their health.
+
+    Args:
+        channels (Optional[Iterable[GeoServerPublishChannel]]): Channels to
+            check. By default every active channel of an enabled pool.
+
+    Returns:
+        list[GeoServerLayerHealthcheck]: The recorded health checks.
+    """
+    # Retrieve Channels
+    if channels is None:
+        channels = publish_channels.GeoServerPublishChannel.objects.filter(
+            active=True,
+            geoserver_pool__enabled=True,
+        ).select_related("geoserver_pool", "workspace", "publish_entry__catalogue_entry")
+
+    # Group Channels by GeoServer Pool
+    pools: dict[int, tuple[geoserver_pools.GeoServerPool, list[publish_channels.GeoServerPublishChannel]]] = {}
+    for channel in channels:
+        if channel.geoserver_pool and channel.geoserver_pool.enabled:
+            pools.setdefault(channel.geoserver_pool.id, (channel.geoserver_pool, []))[1].append(channel)
+
+    # Check each Pool
+    results: dict[publish_channels.GeoServerPublishChannel, Optional[str]] = {}
+    for pool, pool_channels in pools.values():
+        results.update(_check_pool(pool, pool_channels))
+
+    # Save and Return
+    return _save(results)
+
+
+def _check_pool(
+    pool: geoserver_pools.GeoServerPool,
+    channels: list[publish_channels.GeoServerPublishChannel],
+) -> dict[publish_channels.GeoServerPublishChannel, Optional[str]]:
+    """Checks the layers of the channels publishing to a GeoServer pool.
+
+    Args:
+        pool (GeoServerPool): GeoServer pool to check.
+        channels (list[GeoServerPublishChannel]): Channels publishing to it.
+
+    Returns:
+        dict[GeoServerPublishChannel, Optional[str]]: Error message for each
+            channel whose layer is unhealthy, or None if it is healthy.
+    """
+    # Log
+    log.info(f"Checking {len(channels)} layers on GeoServer: [{pool.url}]")
+
+    with geoserver.geoserverWithCustomCreds(pool.url, pool.username, pool.password) as server:
+        # List the Layer Inventory
+        try:
+            inventory = {layer["name"] for layer in server.get_layers() or []}
+        except Exception as exc:
+            log.error(f"Unable to list the layers on GeoServer: [{pool.url}]: {exc}")
+            return {channel: f"Unable to list the layers on GeoServer: {exc}" for channel in channels}
+
+        # Reconcile the Channels with the Inventory
+        # The inventory names include the workspace, so the names of channels
+        # without a workspace are matched against the rest of the name.
+        unqualified = {name.rsplit(":", 1)[-1] for name in inventory}
+        results: dict[publish_channels.GeoServerPublishChannel, Optional[str]] = {}
+        present: list[publish_channels.GeoServerPublishChannel] = []
+        for channel in channels:
+            name = channel.layer_name_with_workspace
+            if name in inventory or (":" not in name and name in unqualified):
+                present.append(channel)
+            else:
+                results[channel] = f"Layer [{name}] was not found on GeoServer: [{pool.url}]"
+
+        # Check the Present Layers Concurrently
+        names = sorted({channel.layer_name_with_workspace for channel in present})
+        sample = set(random.sample(names, min(conf.settings.GEOSERVER_LAYER_HEALTH_CHECK_GETMAP_SAMPLE, len(names))))
+        max_workers = max(1, min(conf.settings.GEOSERVER_MAX_CONNECTIONS, len(names)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            errors = dict(zip(names, executor.map(lambda name: _check_layer(server, name, name in sample), names)))
+
+    # Return
+    results.update({channel: errors[channel.layer_name_with_workspace] for channel in present})
+    return results
+
+
+def _check_layer(server: geoserver.GeoServer, layer_name: str, probe: bool) -> Optional[str]:
+    """Checks a layer on GeoServer.
+
+    Args:
+        server (geoserver.GeoServer): GeoServer the layer is published to.
+        layer_name (str): Name of the layer, including its workspace.
+        probe (bool): Whether to also check the layer can be rendered.
+
+    Returns:
+        Optional[str]: Error message if the layer is unhealthy, otherwise None.
+    """
+    try:
+        if not server.get_layer_details(layer_name):
+            return f"GeoServer returned no details for layer [{layer_name}]"
+        if probe:
+            server.probe_layer_rendering(layer_name)
+    except Exception as exc:
+        return str(exc) or type(exc).__name__
+    return None
+
+
+def _save(
+    results: dict[publish_channels.GeoServerPublishChannel, Optional[str]],
+) -> list[publish_channels.GeoServerLayerHealthcheck]:
+    """Records the health of each channel's layer in bulk.
+
+    Each channel keeps a single health check for its current layer name, so
+    health checks created with a different layer name (e.g. before a
+    workspace was configured on the channel) are deleted.
+
+    Args:
+        results (dict[GeoServerPublishChannel, Optional[str]]): Error message
+            for each channel whose layer is unhealthy, or None if it is healthy.
+
+    Returns:
+        list[GeoServerLayerHealthcheck]: The recorded health checks.
+    """
+    # Load Existing Health Checks
+    existing: dict[int, publish_channels.GeoServerLayerHealthcheck] = {}
+    stale: list[int] = []
+    channel_ids = {channel.id: channel for channel in results}
+    for health_check in publish_channels.GeoServerLayerHealthcheck.objects.filter(
+        geoserver_publish_channel_id__in=channel_ids,
+    ).order_by("id"):
+        channel = channel_ids[health_check.geoserver_publish_channel_id]
+        if health_check.layer_name == channel.layer_name_with_workspace and channel.id not in existing:
+            existing[channel.id] = health_check
+        else:
+            stale.append(health_check.id)
+
+    # Record Results
+    now = timezone.now()
+    updated: list[publish_channels.GeoServerLayerHealthcheck] = []
+    created: list[publish_channels.GeoServerLayerHealthcheck] = []
+    for channel, error in results.items():
+        health_check = existing.get(channel.id)
+        if health_check is None:
+            health_check = publish_channels.GeoServerLayerHealthcheck(geoserver_publish_channel=channel)
+            created.append(health_check)
+        else:
+            updated.append(health_check)
+        health_check.layer_name = channel.layer_name_with_workspace
+        health_check.health_status = (
+            publish_channels.GeoServerLayerHealthcheck.HEALTHY if error is None
+            else publish_channels.GeoServerLayerHealthcheck.UNHEALTHY
+        )
+        health_check.error_message = error
+        health_check.last_check_time = now
+
+    # Save
+    with transaction.atomic():
+        publish_channels.GeoServerLayerHealthcheck.objects.filter(id__in=stale).delete()
+        publish_channels.GeoServerLayerHealthcheck.objects.bulk_update(updated, FIELDS, batch_size=1000)
+        publish_channels.GeoServerLayerHealthcheck.objects.bulk_create(created, batch_size=1000)
+
+    # Log
+    unhealthy = sum(error is not None for error in results.values())
+    log.info(f"Checked {len(results)} layers, {unhealthy} unhealthy")
+
+    # Return
+    return updated + created
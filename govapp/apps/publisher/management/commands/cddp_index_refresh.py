@@ -0,0 +1,41 @@
+"""Kaartdijin Boodja Publisher CDDP Index Refresh Management Command."""
+
+
+# Third-Party
+from django import conf
+from django.core.management import base
+
+# Local
+from govapp.apps.publisher import cddp_index
+
+# Typing
+from typing import Any
+
+
+class Command(base.BaseCommand):
+    """Refreshes the index of the CDDP output share."""
+
+    # Help string
+    help = "Refreshes the index of the CDDP output share."
+
+    def add_arguments(self, parser: base.CommandParser) -> None:
+        """Adds arguments to the management command.
+
+        Args:
+            parser (base.CommandParser): Parser to add arguments to.
+        """
+        # Add Arguments
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="List every directory, not only those modified since the last refresh.",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        """Handles the management command functionality."""
+        # Display information
+        self.stdout.write("Refreshing the CDDP file index")
+
+        # Go!
+        listed = cddp_index.refresh(conf.settings.AZURE_OUTPUT_SYNC_DIRECTORY, full=kwargs["full"])
+        self.stdout.write(f"Listed {listed} directories")
@@ -1,6 +1,7 @@
 from django.core.management import base
 from typing import Any
-from govapp.apps.publisher.models.publish_channels import GeoServerPublishChannel
+from govapp.apps.publisher import health_checks
+from govapp.apps.publisher.models.publish_channels import GeoServerLayerHealthcheck
 
 
 class Command(base.BaseCommand):
@@ -12,6 +13,6 @@ class Command(base.BaseCommand):
         self.stdout.write("Performing geoserver layer healthcheck...")
 
         # Go!
-        geoserver_publish_channels = GeoServerPublishChannel.objects.filter(active=True, geoserver_pool__enabled=True)
-        for geoserver_publish_channel in geoserver_publish_channels:
-            geoserver_publish_channel.perform_geoserver_layer_health_check()
\ No newline at end of file
+        checked = health_checks.check_layers()
+        unhealthy = sum(h.health_status == GeoServerLayerHealthcheck.UNHEALTHY for h in checked)
+        self.stdout.write(f"Checked {len(checked)} layers, {unhealthy} unhealthy")
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.12 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publisher', '0064_remove_active_from_geoserverlayergroup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geoserverqueue',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.12 on 2026-10-18 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publisher', '0065_geoserverqueue_heartbeat_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geoserverqueue',
+            name='converted_file_sha256',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.12 on 2026-10-18 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publisher', '0066_geoserverqueue_converted_file_sha256'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CDDPDirectory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.TextField(unique=True)),
+                ('modified_ns', models.BigIntegerField()),
+            ],
+            options={
+                'verbose_name': 'CDDP Directory',
+                'verbose_name_plural': 'CDDP Directories',
+            },
+        ),
+        migrations.CreateModel(
+            name='CDDPFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('filepath', models.TextField(unique=True)),
+                ('size_bytes', models.BigIntegerField()),
+                ('created_at', models.DateTimeField(db_index=True)),
+                ('last_accessed_at', models.DateTimeField()),
+                ('last_modified_at', models.DateTimeField(db_index=True)),
+                ('directory', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='files', to='publisher.cddpdirectory')),
+            ],
+            options={
+                'verbose_name': 'CDDP File',
+                'verbose_name_plural': 'CDDP Files',
+            },
+        ),
+    ]
@@ -8,3 +8,4 @@ from . import geoserver_pools
 from . import geoserver_queues
 from . import geoserver_roles_groups
 from . import geoserver_layer_groups
+from . import cddp_files
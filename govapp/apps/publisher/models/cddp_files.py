@@ -0,0 +1,49 @@
+"""Kaartdijin Boodja Publisher Django Application CDDP File Index Models."""
+
+
+# Third-Party
+from django.db import models
+
+
+class CDDPDirectory(models.Model):
+    """Model for an indexed directory of the CDDP output share."""
+    path = models.TextField(unique=True)  # Relative to the share, "" for the root
+    modified_ns = models.BigIntegerField()
+
+    class Meta:
+        """CDDP Directory Model Metadata."""
+        verbose_name = "CDDP Directory"
+        verbose_name_plural = "CDDP Directories"
+
+    def __str__(self) -> str:
+        """Provides a string representation of the object.
+
+        Returns:
+            str: Human readable string representation of the object.
+        """
+        # Generate String and Return
+        return f"{self.path or '/'}"
+
+
+class CDDPFile(models.Model):
+    """Model for an indexed file of the CDDP output share."""
+    directory = models.ForeignKey(CDDPDirectory, related_name="files", on_delete=models.CASCADE)
+    filepath = models.TextField(unique=True)  # Relative to the share
+    size_bytes = models.BigIntegerField()
+    created_at = models.DateTimeField(db_index=True)
+    last_accessed_at = models.DateTimeField()
+    last_modified_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        """CDDP File Model Metadata."""
+        verbose_name = "CDDP File"
+        verbose_name_plural = "CDDP Files"
+
+    def __str__(self) -> str:
+        """Provides a string representation of the object.
+
+        Returns:
+            str: Human readable string representation of the object.
+        """
+        # Generate String and Return
+        return f"{self.filepath}"
@@ -1,6 +1,9 @@
 """Kaartdijin Boodja Publisher Django Application GeoserverPool Models."""
 
 
+# Standard
+import concurrent.futures
+
 # Third-Party
 from django.db import models
 from django.forms import ValidationError
@@ -17,11 +20,11 @@ from govapp import settings
 from govapp.apps.publisher.models.geoserver_roles_groups import GeoServerGroup, GeoServerGroupUser, GeoServerRole, GeoServerRoleUser
 from govapp.common import mixins
 from govapp.common.utils import calculate_dict_differences, generate_random_password, handle_http_exceptions
+from govapp.gis import geoserver
 
 log = logging.getLogger(__name__)
 UserModel = get_user_model()
 
-
 def encode(s):
     # s = urllib.parsquote(s, safe='')
     s = urllib.parse.quote(s) 
@@ -61,6 +64,16 @@ class GeoServerPool(mixins.RevisionedMixin):
     def auth(self):
         return (self.username, self.password)
 
+    @property
+    def client(self) -> httpx.Client:
+        """Keep-alive HTTP client shared by every request to this GeoServer.
+
+        Returns:
+            httpx.Client: Client with a connection pool, timeouts and retries.
+        """
+        # Return
+        return geoserver.shared_client(self.url, self.username, self.password)
+
     @property
     def headers_json(self):
         return {"content-type": "application/json","Accept": "application/json"}
@@ -111,7 +124,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     @handle_http_exceptions(log)
     def get_all_workspaces(self, service_name=''):
         url = f"{self.url}/rest/workspaces"
-        response = httpx.get(
+        response = self.client.get(
             url=url,
             headers=self.headers_json,
             auth=self.auth
@@ -200,7 +213,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def fetch_rules(self):
         """Fetch all access control rules."""
         url = f"{self.base_url_security}/acl/layers.json"
-        response = httpx.get(url, auth=self.auth)
+        response = self.client.get(url, auth=self.auth)
         response.raise_for_status()
         rules_data = response.json()
         log.info(f'Successfully fetched ACL rules: [{json.dumps(rules_data, indent=4)}] from the geoserver: [{self}].')
@@ -210,7 +223,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def create_rules(self, rules):
         """Add a set of access control rules."""
         url = f"{self.base_url_security}/acl/layers"
-        response = httpx.post(url, json=rules, headers=self.headers_json, auth=self.auth)
+        response = self.client.post(url, json=rules, headers=self.headers_json, auth=self.auth)
         response.raise_for_status()
         log.info(f'Successfully added ACL rules: [{json.dumps(rules)}] to the geoserver: [{self}].')
         return {}
@@ -219,7 +232,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def update_rules(self, rules):
         """Modify a set of access control rules."""
         url = f"{self.base_url_security}/acl/layers"
-        response = httpx.put(url, json=rules, headers=self.headers_json, auth=self.auth)
+        response = self.client.put(url, json=rules, headers=self.headers_json, auth=self.auth)
         response.raise_for_status()
         log.info(f'Successfully updated ACL rules: [{json.dumps(rules)}] in the geoserver: [{self}].')
         return {}
@@ -228,7 +241,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def delete_rule(self, key):
         """Delete a specific access control rule."""
         url = f"{self.base_url_security}/acl/layers/{key}"
-        response = httpx.delete(url, auth=self.auth)
+        response = self.client.delete(url, auth=self.auth)
         response.raise_for_status()
         log.info(f'Successfully deleted ACL rule: key=[{key}] from the geoserver: [{self}].')
         return {}
@@ -237,7 +250,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     @handle_http_exceptions(log)
     def get_all_users(self, service_name=''):
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/users/" if service_name else f"{self.base_url_security}/usergroup/users/"
-        response = httpx.get(
+        response = self.client.get(
             url=url,
             headers=self.headers_json,
             auth=self.auth
@@ -249,7 +262,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     @handle_http_exceptions(log)
     def update_existing_user(self, user_data, service_name=''):
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/user/{encode(user_data['user']['userName'])}.json" if service_name else f"{self.base_url_security}/usergroup/user/{encode(user_data['user']['userName'])}.json"
-        response = httpx.post(
+        response = self.client.post(
             url=url,
             headers=self.headers_json,
             content=json.dumps(user_data),
@@ -262,7 +275,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     @handle_http_exceptions(log)
     def create_new_user(self, user_data, service_name=''):
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/users/" if service_name else f"{self.base_url_security}/usergroup/users/"
-        response = httpx.post(
+        response = self.client.post(
             url=url,
             headers=self.headers_json,
             content=json.dumps(user_data),
@@ -280,7 +293,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def delete_existing_user(self, username, service_name=''):
         self.check_variable(username, 'Username')
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/user/{encode(username)}.json" if service_name else f"{self.base_url_security}/usergroup/user/{encode(username)}.json"
-        response = httpx.delete(
+        response = self.client.delete(
             url=url,
             auth=self.auth
         )
@@ -290,7 +303,7 @@ class GeoServerPool(mixins.RevisionedMixin):
 
     @handle_http_exceptions(log)
     def get_about_version(self):
-        response = httpx.get(
+        response = self.client.get(
             url=f"{self.url}/rest/about/version",
             headers=self.headers_json,
             auth=self.auth
@@ -303,7 +316,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     @handle_http_exceptions(log)
     def get_all_groups(self, service_name=''):
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/groups/" if service_name else f"{self.base_url_security}/usergroup/groups/"
-        response = httpx.get(
+        response = self.client.get(
             url=url,
             headers=self.headers_json,
             auth=self.auth
@@ -316,7 +329,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def get_all_groups_for_user(self, username, service_name=''):
         self.check_variable(username, 'Username')
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/user/{encode(username)}/groups" if service_name else f"{self.base_url_security}/usergroup/user/{encode(username)}/groups"
-        response = httpx.get(
+        response = self.client.get(
             url=url,
             headers=self.headers_json,
             auth=self.auth
@@ -329,7 +342,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def create_new_group(self, group_name, service_name=''):
         self.check_variable(group_name, 'Group name')
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/group/{encode(group_name)}.json" if service_name else f"{self.base_url_security}/usergroup/group/{encode(group_name)}.json"
-        response = httpx.post(
+        response = self.client.post(
             url=url,
             auth=self.auth
         )
@@ -344,7 +357,7 @@ class GeoServerPool(mixins.RevisionedMixin):
             return
         
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/group/{encode(group_name)}.json" if service_name else f"{self.base_url_security}/usergroup/group/{encode(group_name)}.json"
-        response = httpx.delete(
+        response = self.client.delete(
             url=url,
             auth=self.auth
         )
@@ -357,7 +370,7 @@ class GeoServerPool(mixins.RevisionedMixin):
         self.check_variable(username, 'Username')
         self.check_variable(group_name, 'Group name')
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/user/{encode(username)}/group/{encode(group_name)}.json" if service_name else f"{self.base_url_security}/usergroup/user/{encode(username)}/group/{encode(group_name)}.json"
-        response = httpx.post(
+        response = self.client.post(
             url=url,
             auth=self.auth
         )
@@ -370,7 +383,7 @@ class GeoServerPool(mixins.RevisionedMixin):
         self.check_variable(username, 'Username')
         self.check_variable(group_name, 'Group name')
         url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/user/{encode(username)}/group/{encode(group_name)}.json" if service_name else f"{self.base_url_security}/usergroup/user/{encode(username)}/group/{encode(group_name)}.json"
-        response = httpx.delete(
+        response = self.client.delete(
             url=url,
             auth=self.auth
         )
@@ -378,10 +391,23 @@ class GeoServerPool(mixins.RevisionedMixin):
         log.info(f"User: [{username}] has been successfully unassociated from the group: [{group_name}] in the GeoServer: [{self}].")
         return response
 
+    @handle_http_exceptions(log)
+    def get_all_users_for_group(self, group_name, service_name=''):
+        self.check_variable(group_name, 'Group name')
+        url = f"{self.base_url_security}/usergroup/service/{encode(service_name)}/group/{encode(group_name)}/users/" if service_name else f"{self.base_url_security}/usergroup/group/{encode(group_name)}/users/"
+        response = self.client.get(
+            url=url,
+            headers=self.headers_json,
+            auth=self.auth
+        )
+        response.raise_for_status()
+        users_for_group = response.json()
+        return [user['userName'] if isinstance(user, dict) else user for user in users_for_group['users']]
+
     ### Role
     @handle_http_exceptions(log)
     def get_all_roles(self):
-        response = httpx.get(
+        response = self.client.get(
             url=f"{self.base_url_security}/roles/",
             headers=self.headers_json,
             auth=self.auth
@@ -392,7 +418,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     
     def get_all_roles_for_user(self, username):
         self.check_variable(username, 'Username')
-        response = httpx.get(
+        response = self.client.get(
             url=f"{self.base_url_security}/roles/user/{encode(username)}.json",
             headers=self.headers_json,
             auth=self.auth
@@ -403,7 +429,7 @@ class GeoServerPool(mixins.RevisionedMixin):
 
     def get_all_roles_for_group(self, group_name):
         self.check_variable(group_name, 'Group name')
-        response = httpx.get(
+        response = self.client.get(
             url=f"{self.base_url_security}/roles/group/{encode(group_name)}.json",
             headers=self.headers_json,
             auth=self.auth
@@ -414,7 +440,7 @@ class GeoServerPool(mixins.RevisionedMixin):
 
     def create_new_role(self, role_name):
         self.check_variable(role_name, 'Role name')
-        response = httpx.post(
+        response = self.client.post(
             url=f"{self.base_url_security}/roles/role/{encode(role_name)}.json",
             auth=self.auth
         )
@@ -428,7 +454,7 @@ class GeoServerPool(mixins.RevisionedMixin):
             log.info(f'Role: [{role_name}] cannot be deleted from the geoserver: [{self}]. (ROLES_TO_KEEP: [{settings.NON_DELETABLE_ROLES}])')
             return
 
-        response = httpx.delete(
+        response = self.client.delete(
             url=f"{self.base_url_security}/roles/role/{encode(role_name)}.json",
             auth=self.auth
         )
@@ -439,7 +465,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def associate_role_with_user(self, username, role_name):
         self.check_variable(username, 'Username')
         self.check_variable(role_name, 'Role name')
-        response = httpx.post(
+        response = self.client.post(
             url=f"{self.base_url_security}/roles/role/{encode(role_name)}/user/{encode(username)}.json",
             auth=self.auth
         )
@@ -450,7 +476,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def disassociate_role_from_user(self, username, role_name):
         self.check_variable(username, 'Username')
         self.check_variable(role_name, 'Role name')
-        response = httpx.delete(
+        response = self.client.delete(
             url=f"{self.base_url_security}/roles/role/{encode(role_name)}/user/{encode(username)}.json",
             auth=self.auth
         )
@@ -461,7 +487,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def associate_role_with_group(self, role_name, group_name):
         self.check_variable(role_name, 'Role name')
         self.check_variable(group_name, 'Group name')
-        response = httpx.post(
+        response = self.client.post(
             url=f"{self.base_url_security}/roles/role/{encode(role_name)}/group/{encode(group_name)}.json",
             auth=self.auth
         )
@@ -472,7 +498,7 @@ class GeoServerPool(mixins.RevisionedMixin):
     def disassociate_role_from_group(self, role_name, group_name):
         self.check_variable(role_name, 'Role name')
         self.check_variable(group_name, 'Group name')
-        response = httpx.delete(
+        response = self.client.delete(
             url=f"{self.base_url_security}/roles/role/{encode(role_name)}/group/{encode(group_name)}.json",
             auth=self.auth
         )
@@ -495,182 +521,111 @@ class GeoServerPool(mixins.RevisionedMixin):
                 log.info(f'User: [{user_in_geoserver}] exists in the geoserver: [{self}], but not in KB.')
                 self.delete_existing_user(user_in_geoserver['userName'], settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
 
-    def sync_groups(self):
-        all_groups_in_kb = set(list(GeoServerGroup.objects.filter(active=True).values_list('name', flat=True)))
-        all_groups_in_geoserver = set(self.get_all_groups(settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM))
-
-        groups_only_in_kb = all_groups_in_kb - all_groups_in_geoserver 
-        groups_only_in_geoserver = all_groups_in_geoserver - all_groups_in_kb
-
-        for group_name in groups_only_in_kb:
-            if group_name not in settings.DEFAULT_USERGROUPS_IN_GEOSERVER:
-                self.create_new_group(group_name, settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-        
-        for group_name in groups_only_in_geoserver:
-            if group_name not in settings.NON_DELETABLE_USERGROUPS:
-                self.delete_existing_group(group_name, settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-
-    def sync_roles(self):
-        all_roles_in_kb = set(list(GeoServerRole.objects.filter(active=True).values_list('name', flat=True)))
-        all_roles_in_geoserver = set(self.get_all_roles())
-
-        roles_only_in_kb = all_roles_in_kb - all_roles_in_geoserver 
-        roles_only_in_geoserver = all_roles_in_geoserver - all_roles_in_kb
-
-        for role_name in roles_only_in_kb:
-            if role_name not in settings.DEFAULT_ROLES_IN_GEOSERVER:
-                self.create_new_role(role_name)
-        
-        for role_name in roles_only_in_geoserver:
-            if role_name not in settings.NON_DELETABLE_ROLES:
-                self.delete_existing_role(role_name)
-
-    def associate_user_with_groups(self, user):
-        group_user_in_kb = GeoServerGroupUser.objects.filter(user=user, geoserver_group__active=True)
-        groups_for_user_in_kb = [obj.geoserver_group for obj in group_user_in_kb]
-        if groups_for_user_in_kb:
-            log.info(f'Group(s): [{groups_for_user_in_kb}] found for the user: [{user.email}] in the KB')
-        else:
-            log.info(f'No groups found for the user: [{user.email}] in the KB')
-
-        all_groups_in_geoserver = self.get_all_groups(settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-        if all_groups_in_geoserver:
-            log.info(f'Group(s): [{all_groups_in_geoserver}] found in the geoserver: [{self}].')
-        else:
-            log.info(f'No groups found in the geoserver: [{self}].')
-
-        groups_for_user_in_geoserver = self.get_all_groups_for_user(user.email, settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-        if groups_for_user_in_geoserver:
-            log.info(f'Group(s): [{groups_for_user_in_geoserver}] for the user: [{user.email}] found in the geoserver: [{self}].')
-        else:
-            log.info(f'No groups for the user: [{user.email}] found in the geoserver: [{self}].')
-
-        for group_in_kb in groups_for_user_in_kb:
-            group_associated = any(group_in_kb.name == group_in_geoserver for group_in_geoserver in groups_for_user_in_geoserver)
-            if group_associated:
-                log.info(f'Group: [{group_in_kb.name}] is already associated with the user: [{user.email}] in the geoserver: [{self}].')
-            else:
-                log.info(f'Group: [{group_in_kb.name}] is not associated with the user: [{user.email}] in the geoserver: [{self}].')
-                group_exists = any(group_in_kb.name == group_in_geoserver for group_in_geoserver in all_groups_in_geoserver)
-                if not group_exists:
-                    log.info(f'Group: [{group_in_kb.name}] does not exist in the geoserver: [{self}].')
-                    self.create_new_group(group_in_kb.name, settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-                self.associate_user_with_group(user.email, group_in_kb.name, settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-        return groups_for_user_in_kb
-
-    def disassociate_user_from_groups(self, user, groups_for_user_in_kb):
-        groups_for_user_in_geoserver = self.get_all_groups_for_user(user.email, settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-        if groups_for_user_in_geoserver:
-            log.info(f'Group(s): [{groups_for_user_in_geoserver}] for the user: [{user.email}] found in the geoserver: [{self}].')
-        else:
-            log.info(f'No groups for the user: [{user.email}] found in the geoserver: [{self}].')
-
-        for group_in_geoserver in groups_for_user_in_geoserver:
-            group_associated = any(group_in_geoserver == group_in_kb.name for group_in_kb in groups_for_user_in_kb)
-            if not group_associated:
-                log.info(f'Group: [{group_in_geoserver}] is associated with the user: [{user.email}] in the geoserver: [{self}], but not in KB')
-                self.disassociate_user_from_group(user.email, group_in_geoserver, settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-
-    def disassociate_user_from_roles(self, user, roles_for_user_in_kb):
-        roles_for_user_in_geoserver = self.get_all_roles_for_user(user.email)
-        if roles_for_user_in_geoserver:
-            log.info(f'Role(s): [{roles_for_user_in_geoserver}] found for the user: [{user.email}] in the geoserver: [{self}].')
-        else:
-            log.info(f'No roles found for the user: [{user.email}] in the geoserver: [{self}].')
-
-        for role_in_geoserver in roles_for_user_in_geoserver:
-            role_associated = any(role_in_geoserver == role_in_kb.name for role_in_kb in roles_for_user_in_kb)
-            if not role_associated:
-                log.info(f'Role: [{role_in_geoserver}] is associated with the user: [{user.email}] in the geoserver: [{self}], but not in KB')
-                self.disassociate_role_from_user(user.email, role_in_geoserver)
-
-    def associate_user_with_roles(self, user):
-        role_user_in_kb = GeoServerRoleUser.objects.filter(user=user, geoserver_role__active=True)
-        roles_for_user_in_kb = [obj.geoserver_role for obj in role_user_in_kb]
-        if roles_for_user_in_kb:
-            log.info(f'Role(s): [{roles_for_user_in_kb}] found for the user: [{user.email}] in the geoserver: [{self}].')
-        else:
-            log.info(f'No roles found for the user: [{user.email}] in the geoserver: [{self}].')
-
-        all_roles_in_geoserver = self.get_all_roles()
-        if all_roles_in_geoserver:
-            log.info(f'Role(s): [{all_roles_in_geoserver}] found in the geoserver: [{self}].')
-        else:
-            log.info(f'No roles found in the geoserver: [{self}].')
-
-        roles_for_user_in_geoserver = self.get_all_roles_for_user(user.email)
-        if roles_for_user_in_geoserver:
-            log.info(f'Role(s): [{roles_for_user_in_geoserver}] for the user: [{user.email}] found in the geoserver: [{self}].')
-        else:
-            log.info(f'No roles for the user: [{user.email}] found in the geoserver: [{self}].')
-
-        for role_in_kb in roles_for_user_in_kb:
-            role_associated = any(role_in_kb.name == role_in_geoserver for role_in_geoserver in roles_for_user_in_geoserver)
-            if role_associated:
-                log.info(f'Role: [{role_in_kb.name}] is already associated with the user: [{user.email}] in the geoserver: [{self}].')
-            else:
-                log.info(f'Role: [{role_in_kb.name}] is not associated with the user: [{user.email}] in the geoserver: [{self}].')
-                role_exists = any(role_in_kb.name == role_in_geoserver for role_in_geoserver in all_roles_in_geoserver)
-                if not role_exists:
-                    log.info(f'Role: [{role_in_kb.name}] does not exist in the geoserver: [{self}].')
-                    self.create_new_role(role_in_kb.name)
-                self.associate_role_with_user(user.email, role_in_kb.name)
-        return roles_for_user_in_kb
-
-    def create_or_update_user(self, user):
-        """Create or update a user in GeoServer."""
-        user_data = {
-            "user": {
-                "userName": user.email,
-                "password": generate_random_password(50),
-                "enabled": user.is_active
-            }
-        }
-
-        # Check if user already exists
-        existing_users = self.get_all_users(settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-        user_exists = any(user_in_geoserver['userName'] == user_data['user']['userName'] for user_in_geoserver in existing_users)
-
-        # Create/Update user
-        if user_exists:
-            log.info(f'User: [{user.email}] exists in the geoserver: [{self}]')
-            response = self.update_existing_user(user_data, settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-        else:
-            log.info(f'User: [{user.email}] does not exist in the geoserver: [{self}]')
-            response = self.create_new_user(user_data, settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM)
-
-        response.raise_for_status()
-
     def sync_users_groups_users_roles(self):
-        """Synchronize users-groups and users-roles with GeoServer."""
+        """Synchronize users-groups and users-roles with GeoServer.
+
+        The users, groups and roles in the geoserver (and which users belong
+        to them) are read once, compared with the KB, and only the differences
+        are sent to the geoserver, concurrently.
+        """
         log.info(f'Synchronize users-groups and users-roles in the geoserver: [{self}]...')
+        service_name = settings.GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM
 
         # Retrieve only users associated with active roles or groups
         users = UserModel.objects.filter(
             Q(geoserverroleuser__geoserver_role__active=True) |
             Q(geoservergroupuser__geoserver_group__active=True)).distinct()
+        for user in users.filter(Q(email='') | Q(email__isnull=True)):
+            log.warning(f'User: [ID: {user.id}, username: {user.username}, first_name: {user.first_name}, last_name: {user.last_name}] does not have email address.  Skip the geoserver process for this user.')
+
+        # Desired state in the KB
+        users_in_kb = dict(users.exclude(Q(email='') | Q(email__isnull=True)).values_list('email', 'is_active'))
+        groups_in_kb = set(GeoServerGroup.objects.filter(active=True).values_list('name', flat=True))
+        roles_in_kb = set(GeoServerRole.objects.filter(active=True).values_list('name', flat=True))
+        groups_for_users_in_kb = {email: set() for email in users_in_kb}
+        for email, group_name in GeoServerGroupUser.objects.filter(geoserver_group__active=True, user__email__in=users_in_kb).values_list('user__email', 'geoserver_group__name'):
+            groups_for_users_in_kb[email].add(group_name)
+        roles_for_users_in_kb = {email: set() for email in users_in_kb}
+        for email, role_name in GeoServerRoleUser.objects.filter(geoserver_role__active=True, user__email__in=users_in_kb).values_list('user__email', 'geoserver_role__name'):
+            roles_for_users_in_kb[email].add(role_name)
+
+        # Actual state in the geoserver
+        users_in_geoserver = {user['userName']: user.get('enabled') for user in self.get_all_users(service_name)}
+        groups_in_geoserver = set(self.get_all_groups(service_name))
+        roles_in_geoserver = set(self.get_all_roles())
+
+        # Groups and roles
+        groups_to_create = groups_in_kb - groups_in_geoserver - set(settings.DEFAULT_USERGROUPS_IN_GEOSERVER)
+        groups_to_delete = groups_in_geoserver - groups_in_kb - set(settings.NON_DELETABLE_USERGROUPS)
+        roles_to_create = roles_in_kb - roles_in_geoserver - set(settings.DEFAULT_ROLES_IN_GEOSERVER)
+        roles_to_delete = roles_in_geoserver - roles_in_kb - set(settings.NON_DELETABLE_ROLES)
+
+        # Relations in the geoserver, read per remaining group and per existing user
+        remaining_groups = list(groups_in_geoserver - groups_to_delete)
+        groups_for_users_in_geoserver = {email: set() for email in users_in_kb}
+        for group_name, usernames in zip(remaining_groups, self._map_concurrently(
+                lambda group_name: self.get_all_users_for_group(group_name, service_name), remaining_groups)):
+            for username in set(usernames) & groups_for_users_in_geoserver.keys():
+                groups_for_users_in_geoserver[username].add(group_name)
+        existing_users = [email for email in users_in_kb if email in users_in_geoserver]
+        roles_for_users_in_geoserver = {email: set() for email in users_in_kb}
+        roles_for_users_in_geoserver.update(zip(existing_users, map(set, self._map_concurrently(self.get_all_roles_for_user, existing_users))))
+
+        # Apply groups and roles
+        self._call_concurrently(
+            [(self.create_new_group, group_name, service_name) for group_name in groups_to_create]
+            + [(self.delete_existing_group, group_name, service_name) for group_name in groups_to_delete]
+            + [(self.create_new_role, role_name) for role_name in roles_to_create]
+            + [(self.delete_existing_role, role_name) for role_name in roles_to_delete]
+        )
 
-        log.info(f'Users associated with active GeoServerRole or GeoServerGroup: [{users}]')
-
-        # Sync all the groups
-        self.sync_groups()
-
-        # Sync all the roles
-        self.sync_roles()
+        # Users
+        user_calls = []
+        for email, is_active in users_in_kb.items():
+            user_data = {"user": {"userName": email, "password": generate_random_password(50), "enabled": is_active}}
+            if email not in users_in_geoserver:
+                log.info(f'User: [{email}] does not exist in the geoserver: [{self}]')
+                user_calls.append((self.create_new_user, user_data, service_name))
+            elif users_in_geoserver[email] != is_active:
+                log.info(f'User: [{email}] exists in the geoserver: [{self}], but is not up to date')
+                user_calls.append((self.update_existing_user, user_data, service_name))
+        self._call_concurrently(user_calls)
+
+        # Relations between users and groups, and users and roles
+        relation_calls = []
+        for email in users_in_kb:
+            for group_name in groups_for_users_in_kb[email] - groups_for_users_in_geoserver[email]:
+                relation_calls.append((self.associate_user_with_group, email, group_name, service_name))
+            for group_name in groups_for_users_in_geoserver[email] - groups_for_users_in_kb[email]:
+                relation_calls.append((self.disassociate_user_from_group, email, group_name, service_name))
+            for role_name in roles_for_users_in_kb[email] - roles_for_users_in_geoserver[email]:
+                relation_calls.append((self.associate_role_with_user, email, role_name))
+            for role_name in roles_for_users_in_geoserver[email] - roles_for_users_in_kb[email] - roles_to_delete:
+                relation_calls.append((self.disassociate_role_from_user, email, role_name))
+        self._call_concurrently(relation_calls)
+
+        log.info(f'Synchronized users-groups and users-roles in the geoserver: [{self}]: {len(user_calls)} user(s) and {len(relation_calls)} relation(s) changed.')
+
+    def _map_concurrently(self, func, items):
+        """Calls a function for each item, at most `GEOSERVER_MAX_CONNECTIONS` at a time.
+
+        Args:
+            func (Callable): Function to call.
+            items (Iterable): Items to call the function with.
 
-        for user in users:
-            if not user.email:
-                log.warning(f'User: [ID: {user.id}, username: {user.username}, first_name: {user.first_name}, last_name: {user.last_name}] does not have email address.  Skip the geoserver process for this user.')
-                continue
-            self.create_or_update_user(user)
+        Returns:
+            list: The results, in the order of the items.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=settings.GEOSERVER_MAX_CONNECTIONS) as executor:
+            return list(executor.map(func, items))
 
-            # Sync relations between users and groups
-            groups_for_user_in_kb = self.associate_user_with_groups(user)
-            self.disassociate_user_from_groups(user, groups_for_user_in_kb)
+    def _call_concurrently(self, calls):
+        """Makes calls, at most `GEOSERVER_MAX_CONNECTIONS` at a time.
 
-            # Sync relations between users and roles
-            roles_for_user_in_kb = self.associate_user_with_roles(user)
-            self.disassociate_user_from_roles(user, roles_for_user_in_kb)
+        Args:
+            calls (list[tuple]): Functions to call, each followed by its arguments.
+        """
+        self._map_concurrently(lambda call: call[0](*call[1:]), calls)
 
     def sync_relations_groups_roles(self, group_in_kb):
         # Associate group with roles
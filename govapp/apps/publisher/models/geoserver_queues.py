@@ -59,9 +59,11 @@ class GeoServerQueue(mixins.RevisionedMixin):
         default=None
         )
     started_at = models.DateTimeField(null=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     converted_file_path = models.TextField(null=True, blank=True)
+    converted_file_sha256 = models.CharField(max_length=64, null=True, blank=True)
     
     class Meta:
         """Geoserver Queue Model Metadata."""
@@ -97,6 +99,7 @@ class GeoServerQueue(mixins.RevisionedMixin):
         self.status = status
         if status in (GeoServerQueueStatus.PROCESSING, GeoServerQueueStatus.UPLOAD_IN_PROGRESS):
             self.started_at = timezone.now()
+            self.heartbeat_at = self.started_at
         elif status in (GeoServerQueueStatus.PUBLISHED, GeoServerQueueStatus.READY_TO_PUBLISH):
             self.completed_at = timezone.now()
         self.save()
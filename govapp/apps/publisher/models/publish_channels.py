@@ -25,10 +25,14 @@ from govapp.apps.publisher.models.geoserver_pools import GeoServerPool
 from govapp.common import azure
 from govapp.common import mixins
 from govapp.common import sharepoint
+from govapp.common.utils import file_sha256
 from govapp.apps.publisher.models import publish_entries
 from govapp.apps.publisher.models import workspaces
 from govapp.gis.geoserver import geoserverWithCustomCreds
 
+# Typing
+from typing import Optional
+
 
 # Logging
 log = logging.getLogger(__name__)
@@ -60,6 +64,128 @@ class FTPPublishChannelFormat(models.IntegerChoices):
     GEOJSON = 4
 
 
+class PublishConversions:
+    """Converts a Publish Entry's active layer once per format for a publish.
+
+    Every CDDP (Azure and SharePoint) and FTP destination of a Publish Entry
+    requests its format from the same instance. Conversions are shared by
+    destinations with the same format, layer name and export method, as the
+    layer name is also the name of the layer inside the converted file (e.g.,
+    GeoPackage tables). Destinations must copy (not move or delete) the
+    converted files; they are removed when the publish is finished.
+    """
+
+    # Conversion Functions by Format
+    # The FTP formats share their values with the CDDP formats.
+    FUNCTIONS = {
+        CDDPPublishChannelFormat.GEOPACKAGE: gis.conversions.to_geopackage,
+        CDDPPublishChannelFormat.SHAPEFILE: gis.conversions.to_shapefile,
+        CDDPPublishChannelFormat.GEODATABASE: gis.conversions.to_geodatabase,
+        CDDPPublishChannelFormat.GEOJSON: gis.conversions.to_geojson,
+    }
+
+    def __init__(self, publish_entry: "publish_entries.PublishEntry") -> None:
+        """Instantiates the Publish Conversions.
+
+        Args:
+            publish_entry (publish_entries.PublishEntry): Publish Entry whose
+                active layer is to be converted.
+        """
+        # Instance Variables
+        self.publish_entry = publish_entry
+        self.converted: dict[tuple[int, str, str], dict] = {}
+
+    def __enter__(self) -> "PublishConversions":
+        """Enters the publish.
+
+        Returns:
+            PublishConversions: This instance.
+        """
+        # Return
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exits the publish, removing the converted files."""
+        # Clean Up
+        self.cleanup()
+
+    def convert(self, format: int, layer: str, export_method: str = 'cddp') -> dict:  # noqa: A002
+        """Retrieves the active layer converted to a format.
+
+        Args:
+            format (int): Format to convert to.
+            layer (str): Name of the layer in the converted file.
+            export_method (str): Export method passed to the conversion.
+
+        Returns:
+            dict: Paths to the converted file, as returned by the conversion.
+        """
+        # Check for an Existing Conversion
+        key = (format, layer, export_method)
+        if key in self.converted:
+            log.info(f"Reusing the {CDDPPublishChannelFormat(format).label} conversion of '{self.publish_entry}' as '{layer}'")
+            return self.converted[key]
+
+        # Convert
+        filepath = pathlib.Path(self.publish_entry.catalogue_entry.active_layer.file)
+        log.info(f'active_layer filepath: [{filepath}]')
+        self.converted[key] = self.FUNCTIONS[format](
+            filepath=filepath,
+            layer=layer,
+            catalogue_name=self.publish_entry.catalogue_entry.name,
+            export_method=export_method,
+        )
+
+        # Return
+        return self.converted[key]
+
+    def files(self, format: int, layer: str) -> list[pathlib.Path]:  # noqa: A002
+        """Lists the converted files of a format for a CDDP destination.
+
+        GeoDatabases are listed from inside their `.gdb` directory.
+
+        Args:
+            format (int): Format to convert to.
+            layer (str): Name of the layer in the converted files.
+
+        Returns:
+            list[pathlib.Path]: Path to each converted file.
+        """
+        # Retrieve the Converted Directory
+        directory = pathlib.Path(self.convert(format, layer)['uncompressed_filepath'])
+        if format == CDDPPublishChannelFormat.GEODATABASE:
+            file_names_geodb = os.listdir(directory)
+            if len(file_names_geodb) == 1:
+                directory = directory / file_names_geodb[0]
+
+        # Return
+        return [directory / file_name for file_name in sorted(os.listdir(directory))]
+
+    def cleanup(self) -> None:
+        """Removes the converted files."""
+        # Loop through Conversions
+        scratch_dirs = []
+        for converted in self.converted.values():
+            # uncompressed_filepath and the compressed archive's parent are
+            # always scratch directories created by the conversion function
+            # (tempfile.mkdtemp); it is safe to remove them once published.
+            if converted.get('compressed_filepath'):
+                # Shapefile and GeoDatabase conversions are made inside a
+                # further scratch directory
+                scratch_dirs.append(pathlib.Path(converted['compressed_filepath']).parent)
+                scratch_dirs.append(pathlib.Path(converted['uncompressed_filepath']).parent)
+            elif converted.get('uncompressed_filepath'):
+                scratch_dirs.append(pathlib.Path(converted['uncompressed_filepath']))
+
+        # Remove Scratch Directories
+        for scratch_dir in scratch_dirs:
+            if os.path.isdir(scratch_dir):
+                shutil.rmtree(scratch_dir, ignore_errors=True)
+
+        # Reset
+        self.converted = {}
+
+
 @reversion.register()
 class CDDPPublishChannel(mixins.RevisionedMixin):
     """Model for a CDDP Publish Channel."""
@@ -93,12 +219,21 @@ class CDDPPublishChannel(mixins.RevisionedMixin):
         # Generate String and Return
         return f"{self.name}"
 
-    def publish(self, symbology_only: bool = False) -> None:
+    def publish(self, symbology_only: bool = False, conversions: Optional[PublishConversions] = None) -> None:
         """Publishes the Catalogue Entry to this channel if applicable.
 
         Args:
             symbology_only (bool): Whether to publish symbology only.
+            conversions (Optional[PublishConversions]): Conversions shared with
+                the other channels of the Publish Entry.
         """
+        # Check Conversions
+        if conversions is None:
+            # Convert for this channel only
+            with PublishConversions(self.publish_entry) as conversions:
+                self.publish(symbology_only, conversions)
+            return
+
         # Log
         log.info(f"Attempting to publish '{self.publish_entry}' to channel '{self}'")
 
@@ -114,12 +249,12 @@ class CDDPPublishChannel(mixins.RevisionedMixin):
         match self.mode:
             case CDDPPublishChannelMode.AZURE:
                 # Publish only to Azure
-                self.publish_azure()
+                self.publish_azure(conversions)
 
             case CDDPPublishChannelMode.AZURE_AND_SHAREPOINT:
                 # Publish to Azure and Sharepoint
-                self.publish_azure()
-                self.publish_sharepoint()
+                self.publish_azure(conversions)
+                self.publish_sharepoint(conversions)
 
         # Update Published At
         publish_time = timezone.now()
@@ -128,137 +263,75 @@ class CDDPPublishChannel(mixins.RevisionedMixin):
         self.published_at = publish_time
         self.save()
 
-    def publish_azure(self) -> None:
-        """Publishes the Catalogue Entry to Azure if applicable."""
-        log.info(f"Publishing CDDPPublishChannel obj: [{self}] to Azure...")
-       
-        filepath = pathlib.Path(self.publish_entry.catalogue_entry.active_layer.file)
-        log.info(f'active_layer filepath: [{filepath}]')
+    def publish_azure(self, conversions: PublishConversions) -> None:
+        """Publishes the Catalogue Entry to Azure if applicable.
 
-        # Select Conversion Function
-        match self.format:
-            case CDDPPublishChannelFormat.GEOPACKAGE:
-                function = gis.conversions.to_geopackage
-            case CDDPPublishChannelFormat.SHAPEFILE:
-                function = gis.conversions.to_shapefile
-            case CDDPPublishChannelFormat.GEODATABASE:
-                function = gis.conversions.to_geodatabase
-            case CDDPPublishChannelFormat.GEOJSON:
-                function = gis.conversions.to_geojson
-
-        publish_directory = function(
-            filepath=filepath,
-            layer=self.publish_entry.name,
-            catalogue_name=self.publish_entry.catalogue_entry.name,
-            export_method='cddp'
-        )
+        Args:
+            conversions (PublishConversions): Conversions of the layer.
+        """
+        log.info(f"Publishing CDDPPublishChannel obj: [{self}] to Azure...")
 
-        try:
-            # # Construct Path
-            output_path = pathlib.Path(conf.settings.AZURE_OUTPUT_SYNC_DIRECTORY + os.path.sep + self.path)
-            if not os.path.exists(output_path):
-                os.makedirs(output_path)
+        # # Construct Path
+        output_path = pathlib.Path(conf.settings.AZURE_OUTPUT_SYNC_DIRECTORY + os.path.sep + self.path)
+        if not os.path.exists(output_path):
+            os.makedirs(output_path)
 
-            geodb_dir = ""
+        # Convert Layer to Chosen Format
+        for source_path in conversions.files(self.format, self.publish_entry.name):
+            new_output_path = os.path.join(output_path,source_path.name)
             if self.format == CDDPPublishChannelFormat.GEODATABASE:
-                file_names_geodb = os.listdir(publish_directory['uncompressed_filepath'])
-                if len(file_names_geodb) == 1:
-                    geodb_dir = file_names_geodb[0]
-
-            file_names = os.listdir(pathlib.Path(str(publish_directory['uncompressed_filepath']) + os.path.sep + str(geodb_dir)))
-            for file_name in file_names:            
-                new_output_path = os.path.join(output_path,file_name)
-                if self.format == CDDPPublishChannelFormat.GEODATABASE:
-                    if len(new_output_path) > 0:
-                        if os.path.isdir(new_output_path):
-                            shutil.rmtree(pathlib.Path(new_output_path))
-                        if os.path.isfile(new_output_path):
-                            os.remove(new_output_path)   
-
-                else:
+                if len(new_output_path) > 0:
+                    if os.path.isdir(new_output_path):
+                        shutil.rmtree(pathlib.Path(new_output_path))
                     if os.path.isfile(new_output_path):
-                        os.remove(new_output_path)
-                source_path = os.path.join(pathlib.Path(str(publish_directory['uncompressed_filepath']) + os.path.sep + str(geodb_dir)), file_name)
-                destination_path = os.path.join(output_path, file_name)
-                shutil.copyfile(source_path, destination_path)
-                os.unlink(source_path)
-
-            if self.format == CDDPPublishChannelFormat.GEODATABASE:
-                # Copy XML from orignal spatial archive.
-                xml_file = pathlib.Path(str(publish_directory['filepath_before_flatten']) + os.path.sep + self.name + ".xml")
-                if os.path.isfile(xml_file):
-                    xml_output_path = pathlib.Path(conf.settings.AZURE_OUTPUT_SYNC_DIRECTORY)
-                    if self.xml_path:
-                        xml_output_path = xml_output_path.joinpath(self.xml_path)
-                    log.info(f'Copy xml_file: [{xml_file}] to xml_output_path: [{xml_output_path}].')
-                    shutil.copy(xml_file, xml_output_path)
-        finally:
-            # uncompressed_filepath is always a scratch directory created by the conversion
-            # function (tempfile.mkdtemp); it is safe to remove once files are copied.
-            scratch_dir = publish_directory.get('uncompressed_filepath')
-            if scratch_dir and os.path.isdir(scratch_dir):
-                shutil.rmtree(scratch_dir, ignore_errors=True)
+                        os.remove(new_output_path)   
+
+            else:
+                if os.path.isfile(new_output_path):
+                    os.remove(new_output_path)
+            # Copy rather than move, the converted files are shared with the
+            # other destinations and removed once the publish is finished
+            shutil.copyfile(source_path, new_output_path)
+
+        if self.format == CDDPPublishChannelFormat.GEODATABASE:
+            # Copy XML from orignal spatial archive.
+            publish_directory = conversions.convert(self.format, self.publish_entry.name)
+            xml_file = pathlib.Path(str(publish_directory['filepath_before_flatten']) + os.path.sep + self.name + ".xml")
+            if os.path.isfile(xml_file):
+                xml_output_path = pathlib.Path(conf.settings.AZURE_OUTPUT_SYNC_DIRECTORY)
+                if self.xml_path:
+                    xml_output_path = xml_output_path.joinpath(self.xml_path)
+                log.info(f'Copy xml_file: [{xml_file}] to xml_output_path: [{xml_output_path}].')
+                shutil.copy(xml_file, xml_output_path)
+
+    def publish_sharepoint(self, conversions: PublishConversions) -> None:
+        """Publishes the Catalogue Entry to SharePoint if applicable.
 
-    def publish_sharepoint(self) -> None:
-        """Publishes the Catalogue Entry to SharePoint if applicable."""
+        Args:
+            conversions (PublishConversions): Conversions of the layer.
+        """
         # Log
         log.info(f"Publishing '{self}' to SharePoint")
 
-        # Retrieve the Layer File from Storage
-        filepath = pathlib.Path(self.publish_entry.catalogue_entry.active_layer.file)  
-
-        # Select Conversion Function
-        match self.format:
-            case CDDPPublishChannelFormat.GEOPACKAGE:
-                function = gis.conversions.to_geopackage
-            case CDDPPublishChannelFormat.SHAPEFILE:
-                function = gis.conversions.to_shapefile
-            case CDDPPublishChannelFormat.GEODATABASE:
-                function = gis.conversions.to_geodatabase
-            case CDDPPublishChannelFormat.GEOJSON:
-                function = gis.conversions.to_geojson
-
-        # Convert Layer to Chosen Format
-        publish_directory = function(
-            filepath=filepath,
-            layer=self.publish_entry.catalogue_entry.metadata.name,
-            catalogue_name=self.publish_entry.catalogue_entry.name,
-            export_method='cddp'
-        )    
-
-        try:
-            geodb_dir = ""
-            if self.format == CDDPPublishChannelFormat.GEODATABASE:
-                file_names_geodb = os.listdir(publish_directory['uncompressed_filepath'])
-                if len(file_names_geodb) == 1:
-                    geodb_dir = file_names_geodb[0]
-
-            # Push to Sharepoint
-            file_names = os.listdir(os.path.join(publish_directory['uncompressed_filepath'],geodb_dir))        
-            for file_name in file_names:            
-                new_output_path = os.path.join(conf.settings.SHAREPOINT_OUTPUT_PUBLISH_AREA,self.path,file_name)            
-                sharepoint.sharepoint_output().put(
-                    path=new_output_path,
-                    contents=pathlib.Path(os.path.join(publish_directory['uncompressed_filepath'],geodb_dir,file_name)).read_bytes(),
-                )
+        # Convert Layer to Chosen Format and Push to Sharepoint
+        for source_path in conversions.files(self.format, self.publish_entry.catalogue_entry.metadata.name):
+            new_output_path = os.path.join(conf.settings.SHAREPOINT_OUTPUT_PUBLISH_AREA,self.path,source_path.name)            
+            sharepoint.sharepoint_output().put(
+                path=new_output_path,
+                contents=source_path.read_bytes(),
+            )
 
-            if self.format == CDDPPublishChannelFormat.GEODATABASE:
-                # Copy XML from orignal spatial archive.
-                if len(self.xml_path) > 1:
-                    xml_file = pathlib.Path(str(publish_directory['filepath_before_flatten']) + os.path.sep + self.name + ".xml")
-                    print (xml_file)
-                    if os.path.isfile(xml_file):
-                        new_output_path = os.path.join(conf.settings.SHAREPOINT_OUTPUT_PUBLISH_AREA,self.xml_path,self.name + ".xml")            
-                        sharepoint.sharepoint_output().put(
-                            path=new_output_path,
-                            contents=pathlib.Path(os.path.join(xml_file)).read_bytes(),
-                        )
-        finally:
-            # uncompressed_filepath is always a scratch directory created by the conversion
-            # function (tempfile.mkdtemp); it is safe to remove once files are copied.
-            scratch_dir = publish_directory.get('uncompressed_filepath')
-            if scratch_dir and os.path.isdir(scratch_dir):
-                shutil.rmtree(scratch_dir, ignore_errors=True)
+        if self.format == CDDPPublishChannelFormat.GEODATABASE:
+            # Copy XML from orignal spatial archive.
+            if len(self.xml_path) > 1:
+                publish_directory = conversions.convert(self.format, self.publish_entry.catalogue_entry.metadata.name)
+                xml_file = pathlib.Path(str(publish_directory['filepath_before_flatten']) + os.path.sep + self.name + ".xml")
+                if os.path.isfile(xml_file):
+                    new_output_path = os.path.join(conf.settings.SHAREPOINT_OUTPUT_PUBLISH_AREA,self.xml_path,self.name + ".xml")            
+                    sharepoint.sharepoint_output().put(
+                        path=new_output_path,
+                        contents=pathlib.Path(os.path.join(xml_file)).read_bytes(),
+                    )
 
 
 class GeoServerPublishChannelMode(models.IntegerChoices):
@@ -374,55 +447,14 @@ class GeoServerPublishChannel(mixins.RevisionedMixin):
         return f"{self.id}: {self.publish_entry.name}"
 
     def perform_geoserver_layer_health_check(self):
-        if not self.geoserver_pool or not self.geoserver_pool.enabled:
-            return
-
-        try:
-            geoserver_obj = geoserverWithCustomCreds(self.geoserver_pool.url, self.geoserver_pool.username, self.geoserver_pool.password)
+        """Checks this channel's layer on GeoServer, recording its health.
 
-            try:
-                response_data = geoserver_obj.get_layer_details(self.layer_name_with_workspace)  # Return value can be the layer details or None
-                if response_data:
-                    health_status = GeoServerLayerHealthcheck.HEALTHY
-                    error_message = None
-                else:
-                    raise Exception('response data is something wrong...')
-            except Exception as e:
-                health_status = GeoServerLayerHealthcheck.UNHEALTHY
-                error_message = str(e)
-
-            # Delete stale records that were created with a different layer name
-            # (e.g. before a workspace was configured on this channel)
-            GeoServerLayerHealthcheck.objects.filter(
-                geoserver_publish_channel=self
-            ).exclude(
-                layer_name=self.layer_name_with_workspace
-            ).delete()
-
-            GeoServerLayerHealthcheck.objects.update_or_create(
-                geoserver_publish_channel=self,
-                defaults={
-                    'layer_name': self.layer_name_with_workspace,
-                    'health_status': health_status,
-                    'error_message': error_message,
-                    'last_check_time': timezone.now()
-                }
-            )
-        except Exception as e:
-            GeoServerLayerHealthcheck.objects.filter(
-                geoserver_publish_channel=self
-            ).exclude(
-                layer_name=self.layer_name_with_workspace
-            ).delete()
-            GeoServerLayerHealthcheck.objects.update_or_create(
-                geoserver_publish_channel=self,
-                defaults={
-                    'layer_name': self.layer_name_with_workspace,
-                    'health_status': GeoServerLayerHealthcheck.UNHEALTHY,
-                    'error_message': str(e),
-                    'last_check_time': timezone.now()
-                }
-            )
+        Many channels should be checked together with
+        `health_checks.check_layers()`, which lists each GeoServer's layers once.
+        """
+        # Local import to avoid a circular import
+        from govapp.apps.publisher import health_checks
+        health_checks.check_layers([self])
 
     @property
     def name(self) -> str:
@@ -466,7 +498,7 @@ class GeoServerPublishChannel(mixins.RevisionedMixin):
         """Converts the source layer file and returns the path to the file ready for transfer.
 
         For GEOPACKAGE: performs the conversion and returns the converted .gpkg file path.
-        For GEOTIFF: returns the original source file path (no conversion needed).
+        For GEOTIFF: converts to a Cloud-Optimised GeoTIFF and returns the converted .tif file path.
 
         Returns:
             pathlib.Path: Path to the file to be transferred to the shared volume.
@@ -492,8 +524,12 @@ class GeoServerPublishChannel(mixins.RevisionedMixin):
             )
             return pathlib.Path(geopackage['full_filepath'])
         elif self.store_type == StoreType.GEOTIFF:
-            log.info(f"Store type is GEOTIFF; using original file: [{filepath}]")
-            return filepath
+            log.info(f"Converting [{filepath}] to a Cloud-Optimised GeoTIFF...")
+            geotiff = gis.conversions.to_cloud_optimised_geotiff(
+                filepath=filepath,
+                layer=self.publish_entry.catalogue_entry.metadata.name,
+            )
+            return pathlib.Path(geotiff['full_filepath'])
         else:
             raise ValueError(f'Unknown store_type: [{self.store_type}]')
 
@@ -552,13 +588,23 @@ class GeoServerPublishChannel(mixins.RevisionedMixin):
         elif self.store_type == StoreType.GEOTIFF:
             workspace_name = self.workspace.name
             layer_name = self.publish_entry.catalogue_entry.metadata.name
-            geoserver.upload_tif(
-                workspace=workspace_name,
-                layer=layer_name,
-                filepath=filepath,
-            )
+
+            # Convert Layer to a Cloud-Optimised GeoTIFF
+            geotiff = gis.conversions.to_cloud_optimised_geotiff(filepath=filepath, layer=layer_name)
+            geotiff_filepath = pathlib.Path(geotiff['full_filepath'])
+            try:
+                uploaded = geoserver.upload_tif(
+                    workspace=workspace_name,
+                    layer=layer_name,
+                    filepath=geotiff_filepath,
+                    sha256=file_sha256(geotiff_filepath),
+                )
+            finally:
+                shutil.rmtree(geotiff_filepath.parent, ignore_errors=True)
+
             # Once uploaded, create a layer for the coverage store
-            geoserver.create_layer_from_coveragestore(workspace_name, layer_name)
+            if uploaded:
+                geoserver.create_layer_from_coveragestore(workspace_name, layer_name)
         else:
             log.warning(f'Unknown store_type: [{self.store_type}].')
 
@@ -614,12 +660,21 @@ class FTPPublishChannel(mixins.RevisionedMixin):
         return self.name
     
 
-    def publish(self, symbology_only: bool = False) -> None:
+    def publish(self, symbology_only: bool = False, conversions: Optional[PublishConversions] = None) -> None:
         """Publishes the Catalogue Entry to this channel if applicable.
 
         Args:
             symbology_only (bool): Whether to publish symbology only.
+            conversions (Optional[PublishConversions]): Conversions shared with
+                the other channels of the Publish Entry.
         """
+        # Check Conversions
+        if conversions is None:
+            # Convert for this channel only
+            with PublishConversions(self.publish_entry) as conversions:
+                self.publish(symbology_only, conversions)
+            return
+
         # Log
         log.info(f"Attempting to ftp publish '{self.publish_entry}' to channel '{self}'")
 
@@ -631,7 +686,7 @@ class FTPPublishChannel(mixins.RevisionedMixin):
             # Exit Early
             return
 
-        self.publish_ftp()
+        self.publish_ftp(conversions)
         
         # Update Published At
         publish_time = timezone.now()
@@ -640,54 +695,27 @@ class FTPPublishChannel(mixins.RevisionedMixin):
         self.published_at = publish_time
         self.save()
 
-    def publish_ftp(self) -> None:
-        """Publishes the Catalogue Entry to FTP. """
+    def publish_ftp(self, conversions: PublishConversions) -> None:
+        """Publishes the Catalogue Entry to FTP.
+
+        Args:
+            conversions (PublishConversions): Conversions of the layer.
+        """
         # Log
         log.info(f"Publishing '{self}' to FTP - Preparing")
-        
-        # Retrieve the Layer File from Storage
-        # filepath = sharepoint.sharepoint_input().get_from_url(
-        #     url=self.publish_entry.catalogue_entry.active_layer.file,
-        # )
-        filepath = pathlib.Path(self.publish_entry.catalogue_entry.active_layer.file)        
-
-        # Select Conversion Function
-        match self.format:
-            case CDDPPublishChannelFormat.GEOPACKAGE:
-                function = gis.conversions.to_geopackage
-            case CDDPPublishChannelFormat.SHAPEFILE:
-                function = gis.conversions.to_shapefile
-            case CDDPPublishChannelFormat.GEODATABASE:
-                function = gis.conversions.to_geodatabase
-            case CDDPPublishChannelFormat.GEOJSON:
-                function = gis.conversions.to_geojson
 
         t = Template(self.name)
         c = Context({"date_time": datetime.now()})
         generated_template = t.render(c)     
         log.info(f"Publishing '{self}' to FTP - Converting")
-        publish_directory = function(
-            filepath=filepath,
-            layer=generated_template,
-            catalogue_name=self.publish_entry.catalogue_entry.name,
-            export_method='ftp'
-        )
-        
-        try:
-            log.info(f"Publishing '{self}' to FTP - Uploading to FTP "+(self.path + os.path.sep + generated_template) + '.zip' )
-            session = ftplib.FTP(self.ftp_server.host,self.ftp_server.username,self.ftp_server.password)
-            file = open(publish_directory['compressed_filepath'],'rb')     
-            session.storbinary('STOR '+str(self.path + os.path.sep + generated_template) + '.zip', file)
-            file.close()  
-            session.quit()
-        finally:
-            # The compressed archive lives inside its own tempfile.mkdtemp(dir=_TMP_BASE)
-            # scratch directory; safe to remove once the FTP upload attempt is done.
-            compressed_filepath = publish_directory.get('compressed_filepath')
-            if compressed_filepath:
-                scratch_dir = pathlib.Path(compressed_filepath).parent
-                if os.path.isdir(scratch_dir):
-                    shutil.rmtree(scratch_dir, ignore_errors=True)
+        publish_directory = conversions.convert(self.format, generated_template, export_method='ftp')
+
+        log.info(f"Publishing '{self}' to FTP - Uploading to FTP "+(self.path + os.path.sep + generated_template) + '.zip' )
+        session = ftplib.FTP(self.ftp_server.host,self.ftp_server.username,self.ftp_server.password)
+        file = open(publish_directory['compressed_filepath'],'rb')     
+        session.storbinary('STOR '+str(self.path + os.path.sep + generated_template) + '.zip', file)
+        file.close()  
+        session.quit()
 
 
 class GeoServerLayerHealthcheck(mixins.RevisionedMixin):
@@ -2,6 +2,7 @@
 
 
 # Standard
+import contextlib
 import logging
 
 # Third-Party
@@ -19,12 +20,12 @@ from govapp.apps.catalogue.models import catalogue_entries
 from govapp.apps.publisher import geoserver_manager
 
 # Typing
-from typing import Optional, Union, TYPE_CHECKING
+from typing import ContextManager, Optional, Union, TYPE_CHECKING
 
 # Type Checking
 if TYPE_CHECKING:
     from govapp.apps.publisher.models import notifications
-    # from govapp.apps.publisher.models import publish_channels
+    from govapp.apps.publisher.models import publish_channels
     from govapp.apps.publisher.models import geoserver_queues
 
 
@@ -161,21 +162,50 @@ class PublishEntry(mixins.RevisionedMixin):
         """
         # Log
         log.info(f"Publishing '{self.catalogue_entry}' - '{self}' ({symbology_only=})")
+        from govapp.apps.publisher.models.publish_channels import PublishConversions
 
-        # Publish CDDP
-        self.publish_cddp(symbology_only)
+        # Share Conversions between the CDDP and FTP Channels
+        with PublishConversions(self) as conversions:
+            # Publish CDDP
+            self.publish_cddp(symbology_only, conversions)
 
-        # Publish GeoServer
-        self.publish_geoserver(symbology_only)
+            # Publish GeoServer
+            self.publish_geoserver(symbology_only)
 
-        # Publish FTP
-        self.publish_ftp(symbology_only)        
+            # Publish FTP
+            self.publish_ftp(symbology_only, conversions)
 
-    def publish_cddp(self, symbology_only: bool = False) -> None:
+    def _conversions(
+        self,
+        conversions: Optional["publish_channels.PublishConversions"] = None,
+    ) -> ContextManager["publish_channels.PublishConversions"]:
+        """Provides the conversions for publishing to a set of channels.
+
+        Args:
+            conversions (Optional[PublishConversions]): Conversions shared
+                with other channels, which are left for their owner to clean up.
+
+        Returns:
+            ContextManager[PublishConversions]: The shared conversions, or new
+                conversions that are removed once the channels are published.
+        """
+        # Check for Shared Conversions
+        if conversions is not None:
+            return contextlib.nullcontext(conversions)
+
+        # Local import to avoid a circular import
+        from govapp.apps.publisher.models.publish_channels import PublishConversions
+
+        # Return
+        return PublishConversions(self)
+
+    def publish_cddp(self, symbology_only: bool = False, conversions: Optional["publish_channels.PublishConversions"] = None) -> None:
         """Publishes to CDDP channel if applicable.
 
         Args:
             symbology_only (bool): Flag to only publish symbology.
+            conversions (Optional[PublishConversions]): Conversions shared
+                with the other channels, each format is converted once.
         """
         # Check for Publish Channel
         if not hasattr(self, "cddp_channels"):
@@ -192,8 +222,9 @@ class PublishEntry(mixins.RevisionedMixin):
         try:
             # Publish!
             publish_channel_obj = CDDPPublishChannel.objects.filter(publish_entry=self.id)
-            for pc in publish_channel_obj:
-                pc.publish(symbology_only)
+            with self._conversions(conversions) as conversions:
+                for pc in publish_channel_obj:
+                    pc.publish(symbology_only, conversions)
 
             #self.cddp_channel.publish(symbology_only)  # type: ignore[union-attr]
 
@@ -208,11 +239,13 @@ class PublishEntry(mixins.RevisionedMixin):
             # Send Success Emails
             notifications_utils.publish_entry_publish_success(self)
 
-    def publish_ftp(self, symbology_only: bool = False) -> None:
+    def publish_ftp(self, symbology_only: bool = False, conversions: Optional["publish_channels.PublishConversions"] = None) -> None:
         """Publishes to FTP channel if applicable.
 
         Args:
             symbology_only (bool): Flag to only publish symbology.
+            conversions (Optional[PublishConversions]): Conversions shared
+                with the other channels, each format is converted once.
         """
         # Check for Publish Channel
         if not hasattr(self, "ftp_channels"):
@@ -229,8 +262,9 @@ class PublishEntry(mixins.RevisionedMixin):
         try:
             # Publish!
             publish_channel_obj = FTPPublishChannel.objects.filter(publish_entry=self.id)
-            for pc in publish_channel_obj:
-                pc.publish(symbology_only)
+            with self._conversions(conversions) as conversions:
+                for pc in publish_channel_obj:
+                    pc.publish(symbology_only, conversions)
 
             #self.cddp_channel.publish(symbology_only)  # type: ignore[union-attr]
 
@@ -32,6 +32,7 @@ def publish_entry_lock(entry: "publish_entries.PublishEntry") -> None:
         *entry.email_notifications(manager="on_lock").filter(active=True).all(),  # type: ignore[operator]
         *entry.email_notifications(manager="both").filter(active=True).all(),  # type: ignore[operator]
         context={"name": entry.name},
+        about=entry,
     )
 
 
@@ -53,6 +54,7 @@ def publish_entry_publish_success(entry: "publish_entries.PublishEntry") -> None
         *entry.email_notifications(manager="on_publish").filter(active=True).all(),  # type: ignore[operator]
         *entry.email_notifications(manager="both").filter(active=True).all(),  # type: ignore[operator]
         context={"name": entry.name},
+        about=entry,
     )
 
 
@@ -74,4 +76,5 @@ def publish_entry_publish_failure(entry: "publish_entries.PublishEntry") -> None
         *entry.email_notifications(manager="on_publish").filter(active=True).all(),  # type: ignore[operator]
         *entry.email_notifications(manager="both").filter(active=True).all(),  # type: ignore[operator]
         context={"name": entry.name},
+        about=entry,
     )
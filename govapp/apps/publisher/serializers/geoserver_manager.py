@@ -19,11 +19,13 @@ class GeoServerManagerQueueSerializer(serializers.ModelSerializer):
     file_name = serializers.SerializerMethodField()
     # Workspace name from the first active GeoServerPublishChannel
     workspace = serializers.SerializerMethodField()
+    # SHA-256 (hex) of the converted file, to verify the downloaded file against
+    file_sha256 = serializers.CharField(source="converted_file_sha256", read_only=True)
 
     class Meta:
         model = GeoServerQueue
-        fields = ["id", "name", "status", "file_name", "workspace"]
-        read_only_fields = ["id", "name", "file_name", "workspace"]
+        fields = ["id", "name", "status", "file_name", "workspace", "file_sha256"]
+        read_only_fields = ["id", "name", "file_name", "workspace", "file_sha256"]
 
     def get_file_name(self, obj: GeoServerQueue) -> str | None:
         if obj.converted_file_path:
@@ -28,7 +28,6 @@ from rest_framework.renderers import JSONRenderer
 # Local
 from govapp import settings
 from govapp.apps.accounts.serializers import UserSerializer
-from govapp.apps.accounts.utils import get_file_list
 from govapp.apps.publisher.models.geoserver_roles_groups import GeoServerGroup, GeoServerGroupUser, GeoServerRole
 from govapp.apps.publisher.serializers.geoserver_group import GeoServerGroupSerializer, GeoServerRoleSerializer
 from govapp.common import mixins
@@ -36,6 +35,7 @@ from govapp.common import utils
 from govapp.apps.accounts import permissions as accounts_permissions
 from govapp.apps.logs import mixins as logs_mixins
 from govapp.apps.logs import utils as logs_utils
+from govapp.apps.publisher import cddp_index
 from govapp.apps.publisher import filters
 from govapp.apps.publisher import models
 from govapp.apps.publisher import permissions
@@ -893,43 +893,38 @@ class CDDPContentsViewSet(
     def list(self, request: http.HttpRequest, *args: Any, **kwargs: Any) -> http.HttpResponse:
         """
         List all files within the directory along with their metadata.
+
+        The listing is served from the CDDP file index, which is refreshed
+        incrementally first. Supports `order_by`, `offset`, `limit` and
+        `search` (text the file path must contain).
         """
         try:
             limit = request.GET.get('limit', None)
             offset = request.GET.get('offset', 0)
             order_by = request.GET.get('order_by', 'created_at')
+            search = request.GET.get('search', None)
 
-            results = self._get_files_with_metadata(limit, offset, order_by)
+            results = self._get_files_with_metadata(limit, offset, order_by, search)
             return Response(results)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def _get_files_with_metadata(self, limit, offset, order_by) -> list:
+    def _get_files_with_metadata(self, limit, offset, order_by, search=None) -> dict:
         """
         Retrieve file paths and metadata for files within the specified directory.
         """
+        # Parse Pagination
+        offset = int(offset)
+        limit = int(limit) if limit else None
 
         try:
-            file_list, num_of_files = get_file_list(self.pathToFolder)
-
-            reverse = order_by.startswith('-')
-            key = order_by.lstrip('-')
-            file_list.sort(key=lambda x: x.get(key, None), reverse=reverse)
-            
-            # Offset
-            offset = int(offset)
-            file_list = file_list[offset:]
-            
-            # limit
-            if limit:
-                limit = int(limit)
-                file_list = file_list[:limit]
-
-            return {
-                'count': num_of_files,
-                'results': file_list
-            }
+            cddp_index.refresh_if_stale(self.pathToFolder)
+            return cddp_index.list_files(order_by=order_by, offset=offset, limit=limit, search=search)
 
+        except ValueError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Error while retrieving file metadata: {str(e)}")
 
@@ -990,6 +985,7 @@ class CDDPContentsViewSet(
         if os.path.exists(filepath):
             try:
                 os.remove(filepath)
+                cddp_index.remove(request.query_params.get('filepath'))
                 log.info(f'File [{filepath}] deleted successfully')
 
                 # Check if the directory is empty
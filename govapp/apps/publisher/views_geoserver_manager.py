@@ -4,6 +4,7 @@ Provides three endpoints consumed exclusively by the kb_geoserver_manager servic
 
     GET  /api/geoserver-manager/layers/?status=<int>   — list queue items by status
     GET  /api/geoserver-manager/layers/<pk>/download/  — stream the converted GIS file
+                                                         (supports Range / If-Range)
     PATCH /api/geoserver-manager/layers/<pk>/          — update queue item status
 
 Authentication:
@@ -15,6 +16,7 @@ Authentication:
 """
 
 # Standard
+import base64
 import logging
 import pathlib
 
@@ -69,16 +71,59 @@ _VALID_PREDECESSORS = {
 }
 
 
-def _stream_file(file_path: pathlib.Path, chunk_size: int = _CHUNK_SIZE):
-    """Generator that yields a file in fixed-size chunks without loading it into memory."""
+def _stream_file(file_path: pathlib.Path, start: int = 0, length: int | None = None, chunk_size: int = _CHUNK_SIZE):
+    """Generator that yields a file (or a byte range of it) in fixed-size chunks without loading it into memory."""
     with file_path.open("rb") as fh:
-        while True:
-            chunk = fh.read(chunk_size)
+        fh.seek(start)
+        remaining = length
+        while remaining is None or remaining > 0:
+            chunk = fh.read(chunk_size if remaining is None else min(chunk_size, remaining))
             if not chunk:
                 break
+            if remaining is not None:
+                remaining -= len(chunk)
             yield chunk
 
 
+class _RangeNotSatisfiable(Exception):
+    """Raised when a Range header does not overlap the file."""
+
+
+def _parse_range(header: str | None, file_size: int) -> tuple[int, int] | None:
+    """Parses a single byte range from a ``Range`` header.
+
+    Returns ``(start, end)`` with ``end`` inclusive, or ``None`` when the whole file
+    should be served (no header, a malformed header, or multiple ranges, all of which
+    RFC 9110 allows a server to ignore).
+
+    Raises:
+        _RangeNotSatisfiable: If the range lies entirely outside the file.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if first:
+            # "bytes=<start>-" or "bytes=<start>-<end>"
+            start = int(first)
+            end = int(last) if last else None
+            if end is not None and start > end:
+                return None
+            if start >= file_size:
+                raise _RangeNotSatisfiable()
+            return start, file_size - 1 if end is None else min(end, file_size - 1)
+
+        # "bytes=-<suffix length>"
+        suffix = int(last)
+    except ValueError:
+        return None
+
+    if suffix <= 0 or file_size == 0:
+        raise _RangeNotSatisfiable()
+    return max(file_size - suffix, 0), file_size - 1
+
+
 class GeoServerManagerQueueViewSet(viewsets.GenericViewSet):
     """ViewSet for kb_geoserver_manager to interact with GeoServerQueue items.
 
@@ -150,6 +195,12 @@ class GeoServerManagerQueueViewSet(viewsets.GenericViewSet):
 
         Uses Django's ``StreamingHttpResponse`` with a generator that reads
         the file in ``_CHUNK_SIZE`` chunks.
+
+        A single ``Range`` is honoured with a 206 response so interrupted transfers
+        can resume. ``If-Range`` must then match the strong ``ETag``, otherwise the
+        whole file is sent. When the SHA-256 of the file was recorded at conversion
+        time it is used as the ETag and sent as ``Repr-Digest`` (RFC 9530), so the
+        reassembled file can be verified end to end.
         """
         queue_item = self.get_object()
 
@@ -170,15 +221,54 @@ class GeoServerManagerQueueViewSet(viewsets.GenericViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        file_size = file_path.stat().st_size
-        response = StreamingHttpResponse(
-            streaming_content=_stream_file(file_path),
-            content_type="application/octet-stream",
-        )
+        file_stat = file_path.stat()
+        file_size = file_stat.st_size
+        if queue_item.converted_file_sha256:
+            etag = f'"{queue_item.converted_file_sha256}"'
+        else:
+            # Converted before digests were recorded; identify the file by size and mtime
+            etag = f'"{file_size:x}-{file_stat.st_mtime_ns:x}"'
+
+        # Only resume if the file is the one the client started downloading
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if if_range is None or if_range == etag:
+            try:
+                byte_range = _parse_range(request.headers.get("Range"), file_size)
+            except _RangeNotSatisfiable:
+                response = Response(
+                    {"detail": "Requested range not satisfiable."},
+                    status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                )
+                response["Content-Range"] = f"bytes */{file_size}"
+                return response
+
+        if byte_range is None:
+            start, length = 0, file_size
+            response = StreamingHttpResponse(
+                streaming_content=_stream_file(file_path),
+                content_type="application/octet-stream",
+            )
+        else:
+            start, end = byte_range
+            length = end - start + 1
+            response = StreamingHttpResponse(
+                streaming_content=_stream_file(file_path, start=start, length=length),
+                content_type="application/octet-stream",
+                status=status.HTTP_206_PARTIAL_CONTENT,
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+            log.info(f"Resuming download of GeoServerQueue pk={queue_item.pk} from byte {start} of {file_size}.")
+
         response["Content-Disposition"] = f'attachment; filename="{file_path.name}"'
+        response["Accept-Ranges"] = "bytes"
+        response["ETag"] = etag
+        if queue_item.converted_file_sha256:
+            digest = base64.b64encode(bytes.fromhex(queue_item.converted_file_sha256)).decode()
+            response["Repr-Digest"] = f"sha-256=:{digest}:"
         # Set Content-Length so that upstream proxies (nginx / Auth2) do not need to
         # use chunked transfer encoding.  Without this header the proxy may re-encode
         # the body as chunked, producing malformed chunk-size lines that urllib3
         # rejects with InvalidChunkLength.
-        response["Content-Length"] = file_size
+        response["Content-Length"] = length
         return response
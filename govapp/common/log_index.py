@@ -0,0 +1,392 @@
+"""Kaartdijin Boodja Log File Line Index.
+
+Log files are paged by line number without reading them from the start:
+
+* A sidecar index records the byte offset of every `STRIDE`th line, with a
+  bitmask of the levels logged in each block of `STRIDE` lines. Lines
+  without a level (e.g. tracebacks) inherit the level of the line before.
+* `LogIndex.refresh()` only indexes the lines appended since the last
+  refresh. The index is rebuilt if the log file was rotated (new inode) or
+  truncated (smaller, or its first bytes have changed).
+* `LogIndex.read()` seeks straight to the block containing a line number,
+  and blocks without any of the requested levels are skipped unread.
+"""
+
+
+# Standard
+import fcntl
+import hashlib
+import os
+import pathlib
+import re
+import struct
+
+# Third-Party
+from django import conf
+
+# Typing
+from typing import BinaryIO, Iterator, Optional
+
+
+# Constants
+MAGIC = b"KBLI"
+VERSION = 1
+STRIDE = 64  # Lines per block
+HEAD_BYTES = 4096  # Bytes hashed to detect truncation
+READ_SIZE = 1024 * 1024  # 1 MiB
+BATCH = 4096  # Records read at once
+HEADER = struct.Struct("<4sHHQQQHB32s")  # Magic, version, stride, inode, indexed bytes, lines, head length, level, head hash
+RECORD = struct.Struct("<QBB")  # Offset, level before the block, levels in the block
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+LEVEL = re.compile(rb"^(?:\S+ +){0,3}?\[?(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b")
+
+
+def level_mask(minimum: Optional[str]) -> Optional[int]:
+    """Calculates the bitmask of a level and every level above it.
+
+    Args:
+        minimum (Optional[str]): Name of the minimum level, e.g. "WARNING".
+
+    Raises:
+        ValueError: If the level is not known.
+
+    Returns:
+        Optional[int]: The bitmask, or None to include every line.
+    """
+    # Check
+    if not minimum:
+        return None
+
+    # Calculate and Return
+    index = LEVELS.index(minimum.upper())
+    return sum(1 << (code - 1) for code in range(index + 1, len(LEVELS) + 1))
+
+
+class LogIndex:
+    """Line index of a log file."""
+
+    def __init__(self, log_path: pathlib.Path, index_path: Optional[pathlib.Path] = None) -> None:
+        """Instantiates the Log Index.
+
+        Args:
+            log_path (pathlib.Path): Path to the log file.
+            index_path (Optional[pathlib.Path]): Path to the index file. By
+                default it is kept in the `LOG_INDEX_DIR`.
+        """
+        # Instance Attributes
+        self.log_path = pathlib.Path(log_path)
+        self.index_path = pathlib.Path(index_path or pathlib.Path(conf.settings.LOG_INDEX_DIR) / f"{self.log_path.name}.idx")
+        self.line_count = 0
+        self.indexed_bytes = 0
+
+    def read(
+        self,
+        start: Optional[int] = None,
+        count: int = 1000,
+        pattern: Optional[re.Pattern] = None,
+        levels: Optional[int] = None,
+        reverse: bool = False,
+    ) -> list[tuple[int, str]]:
+        """Reads lines from the log file, refreshing the index first.
+
+        Lines are numbered from 1, and only complete lines are read.
+
+        Args:
+            start (Optional[int]): Line number to read from. When reading in
+                reverse, lines before it are read, and by default the last
+                lines in the file.
+            count (int): Maximum number of lines to read.
+            pattern (Optional[re.Pattern]): Only read lines matching this.
+            levels (Optional[int]): Only read lines with these levels, as
+                calculated by `level_mask()`.
+            reverse (bool): Whether to read the lines before `start`.
+
+        Returns:
+            list[tuple[int, str]]: Number and text of the lines, in order.
+        """
+        # Check
+        if not self.log_path.exists():
+            self.line_count = self.indexed_bytes = 0
+            return []
+
+        # Read under the Lock, so the Index is not Rebuilt Underneath us
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor = os.open(self.index_path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self.log_path.open("rb") as log, os.fdopen(descriptor, "r+b") as index:
+            fcntl.flock(index, fcntl.LOCK_EX)
+            try:
+                self._refresh(log, index)
+                if reverse:
+                    start = self.line_count + 1 if start is None else min(start, self.line_count + 1)
+                    lines = self._read_reverse(log, index, start, count, pattern, levels)
+                else:
+                    lines = self._read_forward(log, index, max(start or 1, 1), count, pattern, levels)
+            finally:
+                fcntl.flock(index, fcntl.LOCK_UN)
+
+        # Return
+        return lines
+
+    def refresh(self) -> None:
+        """Indexes the lines appended to the log file since the last refresh."""
+        self.read(count=0)
+
+    def _refresh(self, log: BinaryIO, index: BinaryIO) -> None:
+        """Brings the index up to date with the log file.
+
+        Args:
+            log (BinaryIO): Log file, opened for reading.
+            index (BinaryIO): Index file, opened for writing and locked.
+        """
+        # Read Header
+        index.seek(0)
+        header = index.read(HEADER.size)
+        stat = os.fstat(log.fileno())
+        if len(header) == HEADER.size:
+            magic, version, stride, inode, indexed_bytes, line_count, head_len, level, head_hash = HEADER.unpack(header)
+        else:
+            magic, version, stride, inode, indexed_bytes, line_count, head_len, level, head_hash = (b"", 0, 0, 0, 0, 0, 0, 0, b"")
+
+        # Check whether the Log File was Rotated or Truncated
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or stride != STRIDE
+            or inode != stat.st_ino
+            or stat.st_size < indexed_bytes
+            or _hash(log, head_len) != head_hash
+        ):
+            index.truncate(0)
+            indexed_bytes, line_count, head_len, level = 0, 0, 0, 0
+
+        # Load the Last Block, which may still be Growing
+        offset, before, mask = 0, level, 0
+        growing = bool(line_count % STRIDE)
+        if growing:
+            index.seek(HEADER.size + (line_count // STRIDE) * RECORD.size)
+            offset, before, mask = RECORD.unpack(index.read(RECORD.size))
+
+        # Index the Appended Lines
+        position = indexed_bytes
+        log.seek(indexed_bytes)
+        remainder = b""
+        while chunk := log.read(READ_SIZE):
+            *lines, remainder = (remainder + chunk).split(b"\n")
+            for line in lines:
+                # Start a Block
+                if not line_count % STRIDE:
+                    if growing:
+                        _write(index, line_count // STRIDE - 1, offset, before, mask)
+                    offset, before, mask = position, level, 0
+                    growing = True
+
+                # Index the Line
+                level = _level(line) or level
+                mask |= _bit(level)
+                position += len(line) + 1
+                line_count += 1
+
+        # Write the Last Block and Header
+        if growing:
+            _write(index, (line_count - 1) // STRIDE, offset, before, mask)
+        head_len = min(position, HEAD_BYTES)
+        index.seek(0)
+        index.write(HEADER.pack(MAGIC, VERSION, STRIDE, stat.st_ino, position, line_count, head_len, level, _hash(log, head_len)))
+        index.flush()
+
+        # Update
+        self.line_count = line_count
+        self.indexed_bytes = position
+
+    def _blocks(self, index: BinaryIO, first: int, reverse: bool) -> Iterator[tuple[int, int, int, int, int]]:
+        """Iterates over the index's blocks.
+
+        Args:
+            index (BinaryIO): Index file.
+            first (int): Block to start from.
+            reverse (bool): Whether to iterate towards the start of the file.
+
+        Yields:
+            tuple[int, int, int, int, int]: Block number, start and end byte
+                offsets, level before the block and levels in the block.
+        """
+        total = (self.line_count + STRIDE - 1) // STRIDE
+        while 0 <= first < total:
+            # Read a Batch of Records, and the Start of the Next Block
+            low = max(first - BATCH + 1, 0) if reverse else first
+            high = first if reverse else min(first + BATCH - 1, total - 1)
+            index.seek(HEADER.size + low * RECORD.size)
+            data = index.read((high - low + 2) * RECORD.size)
+            records = [RECORD.unpack_from(data, i * RECORD.size) for i in range(len(data) // RECORD.size)]
+
+            # Yield the Blocks
+            numbers = range(high, low - 1, -1) if reverse else range(low, high + 1)
+            for number in numbers:
+                offset, before, mask = records[number - low]
+                end = records[number - low + 1][0] if number + 1 < total else self.indexed_bytes
+                yield number, offset, end, before, mask
+            first = low - 1 if reverse else high + 1
+
+    def _read_block(
+        self,
+        log: BinaryIO,
+        number: int,
+        offset: int,
+        end: int,
+        before: int,
+        pattern: Optional[re.Pattern],
+        levels: Optional[int],
+    ) -> Iterator[tuple[int, str]]:
+        """Reads the lines in a block which match the filters.
+
+        Args:
+            log (BinaryIO): Log file.
+            number (int): Block number.
+            offset (int): Start byte offset of the block.
+            end (int): End byte offset of the block.
+            before (int): Level of the line before the block.
+            pattern (Optional[re.Pattern]): Only read lines matching this.
+            levels (Optional[int]): Only read lines with these levels.
+
+        Yields:
+            tuple[int, str]: Number and text of the matching lines.
+        """
+        # Split on newlines only, as the index counts them, so a carriage
+        # return within a line does not shift the following line numbers
+        log.seek(offset)
+        lines = [line + b"\n" for line in log.read(end - offset).split(b"\n")[:-1]]
+        level = before
+        for line_number, line in enumerate(lines, number * STRIDE + 1):
+            level = _level(line) or level
+            if levels is not None and not _bit(level) & levels:
+                continue
+            text = line.decode("utf-8", errors="replace")
+            if pattern is not None and not pattern.search(text):
+                continue
+            yield line_number, text
+
+    def _read_forward(
+        self,
+        log: BinaryIO,
+        index: BinaryIO,
+        start: int,
+        count: int,
+        pattern: Optional[re.Pattern],
+        levels: Optional[int],
+    ) -> list[tuple[int, str]]:
+        """Reads the first matching lines from a line number onwards.
+
+        Args:
+            log (BinaryIO): Log file.
+            index (BinaryIO): Index file.
+            start (int): Line number to read from.
+            count (int): Maximum number of lines to read.
+            pattern (Optional[re.Pattern]): Only read lines matching this.
+            levels (Optional[int]): Only read lines with these levels.
+
+        Returns:
+            list[tuple[int, str]]: Number and text of the lines, in order.
+        """
+        lines: list[tuple[int, str]] = []
+        if count <= 0:
+            return lines
+        for number, offset, end, before, mask in self._blocks(index, (start - 1) // STRIDE, reverse=False):
+            if levels is not None and not mask & levels:
+                continue
+            for line in self._read_block(log, number, offset, end, before, pattern, levels):
+                if line[0] >= start:
+                    lines.append(line)
+                    if len(lines) == count:
+                        return lines
+        return lines
+
+    def _read_reverse(
+        self,
+        log: BinaryIO,
+        index: BinaryIO,
+        start: int,
+        count: int,
+        pattern: Optional[re.Pattern],
+        levels: Optional[int],
+    ) -> list[tuple[int, str]]:
+        """Reads the last matching lines before a line number.
+
+        Args:
+            log (BinaryIO): Log file.
+            index (BinaryIO): Index file.
+            start (int): Line number to read before.
+            count (int): Maximum number of lines to read.
+            pattern (Optional[re.Pattern]): Only read lines matching this.
+            levels (Optional[int]): Only read lines with these levels.
+
+        Returns:
+            list[tuple[int, str]]: Number and text of the lines, in order.
+        """
+        blocks: list[list[tuple[int, str]]] = []
+        found = 0
+        if count <= 0 or start <= 1:
+            return []
+        for number, offset, end, before, mask in self._blocks(index, (start - 2) // STRIDE, reverse=True):
+            if levels is not None and not mask & levels:
+                continue
+            block = [line for line in self._read_block(log, number, offset, end, before, pattern, levels) if line[0] < start]
+            blocks.append(block)
+            found += len(block)
+            if found >= count:
+                break
+        lines = [line for block in reversed(blocks) for line in block]
+        return lines[-count:]
+
+
+def _level(line: bytes) -> int:
+    """Determines the level logged on a line.
+
+    Args:
+        line (bytes): Line of the log file.
+
+    Returns:
+        int: Code of the level (1 for DEBUG to 5 for CRITICAL), or 0 if the
+            line has no level.
+    """
+    match = LEVEL.match(line)
+    return LEVELS.index(match.group(1).decode()) + 1 if match else 0
+
+
+def _bit(level: int) -> int:
+    """Converts a level code to its bit in a level bitmask.
+
+    Args:
+        level (int): Code of the level.
+
+    Returns:
+        int: The bit, or 0 if there is no level.
+    """
+    return 1 << (level - 1) if level else 0
+
+
+def _hash(log: BinaryIO, length: int) -> bytes:
+    """Hashes the start of the log file, to detect it being truncated.
+
+    Args:
+        log (BinaryIO): Log file.
+        length (int): Number of bytes to hash.
+
+    Returns:
+        bytes: The SHA256 digest.
+    """
+    log.seek(0)
+    return hashlib.sha256(log.read(length)).digest()
+
+
+def _write(index: BinaryIO, number: int, offset: int, before: int, mask: int) -> None:
+    """Writes the record of a block to the index.
+
+    Args:
+        index (BinaryIO): Index file, opened for writing.
+        number (int): Block number.
+        offset (int): Start byte offset of the block.
+        before (int): Level of the line before the block.
+        mask (int): Levels in the block.
+    """
+    index.seek(HEADER.size + number * RECORD.size)
+    index.write(RECORD.pack(offset, before, mask))
@@ -1,5 +1,7 @@
 """Kaartdijin Boodja Django Application Utility Functions."""
 
+import hashlib
+import pathlib
 import re
 import string
 import random
@@ -55,6 +57,24 @@ class UserGroupServiceNotFoundError(Exception):
         self.status_code = status.HTTP_404_NOT_FOUND
 
 
+def file_sha256(filepath: pathlib.Path, chunk_size: int = 1024 * 1024) -> str:
+    """Calculates the SHA-256 of a file without loading it into memory.
+
+    Args:
+        filepath (pathlib.Path): File to hash.
+        chunk_size (int): Size of the chunks to read.
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    # Hash and Return
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def handle_http_exceptions(logger):
     """Decorator factory to handle HTTP exceptions and log them with the given logger."""
     def decorator(func):
@@ -0,0 +1,317 @@
+"""GIS Conversion Cache.
+
+Converted artefacts are stored on disk keyed on a hash of the source file
+contents together with the conversion parameters (layer, target format,
+engine and the GDAL options used) and the cache format version. A later conversion of the same source with the same
+parameters is served by copying the cached artefact instead of decompressing
+the archive and running GDAL again.
+
+Entries are evicted least-recently-used first once the total size of the
+cache exceeds the configured maximum.
+"""
+
+
+# Standard
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import time
+
+# Third-Party
+import decouple
+
+# Typing
+from typing import Any, Optional
+
+
+# Logging
+log = logging.getLogger(__name__)
+
+# Read Size for Hashing Source Files
+_HASH_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# Age in seconds after which an unfinished staging directory is abandoned
+_STAGING_EXPIRY = 24 * 60 * 60
+
+# Name of the artefact inside a cache entry
+_ARTEFACT = "artefact"
+
+# Version of the cache entry format, part of every key. Bump this whenever the
+# conversions change in a way their options do not capture, so stale entries
+# are no longer served.
+_VERSION = 1
+
+
+class ConversionCache:
+    """Persistent, content-addressed cache of converted GIS artefacts."""
+
+    def __init__(self, directory: pathlib.Path, max_size: int) -> None:
+        """Instantiates the Conversion Cache.
+
+        Args:
+            directory (pathlib.Path): Directory in which entries are stored.
+            max_size (int): Maximum total size of the cache in bytes. A value
+                of zero (or less) disables the cache.
+        """
+        # Store Configuration
+        self.directory = directory
+        self.max_size = max_size
+
+        # Hit/Miss Counters
+        self.hits = 0
+        self.misses = 0
+
+        # Memoised Source Hashes, keyed on the path and the (path, size, mtime)
+        # of each file hashed
+        self._hashes: dict[tuple[Any, ...], str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Determines whether the cache is enabled.
+
+        Returns:
+            bool: Whether the cache is enabled.
+        """
+        # Check and Return
+        return self.max_size > 0
+
+    def key(self, filepath: pathlib.Path, format: str, **options: Any) -> Optional[str]:  # noqa: A002
+        """Constructs the cache key for a conversion.
+
+        Args:
+            filepath (pathlib.Path): Source file (or directory) to be converted.
+            format (str): Target format of the conversion.
+            **options (Any): Any other parameters that affect the output.
+
+        Returns:
+            Optional[str]: Hex digest identifying the conversion, or None if
+                the cache is disabled.
+        """
+        # Check Enabled
+        if not self.enabled:
+            return None
+
+        # Construct Key
+        parameters = json.dumps(
+            {"version": _VERSION, "source": self.source_hash(filepath), "format": format, "options": options},
+            sort_keys=True,
+            default=str,
+        )
+
+        # Return
+        return hashlib.sha256(parameters.encode()).hexdigest()
+
+    def source_hash(self, filepath: pathlib.Path) -> str:
+        """Calculates the SHA-256 of a source file or directory.
+
+        Hashes are memoised on the path, size and modification time of every
+        file hashed, so repeated conversions of the same file within a process
+        only read it once. Directories are memoised on each of their files,
+        as overwriting a file in place does not change the directory itself.
+
+        Args:
+            filepath (pathlib.Path): File or directory to hash.
+
+        Returns:
+            str: Hex digest of the contents.
+        """
+        # Check Memoised Hashes
+        files = sorted(p for p in filepath.rglob("*") if p.is_file()) if filepath.is_dir() else [filepath]
+        stats = [(file, file.stat()) for file in files]
+        memo = (str(filepath), *((str(file), stat.st_size, stat.st_mtime_ns) for file, stat in stats))
+        with self._lock:
+            if memo in self._hashes:
+                return self._hashes[memo]
+
+        # Hash Contents
+        digest = hashlib.sha256()
+        for file in files:
+            # Include relative paths for directories, so renames are detected
+            if file != filepath:
+                digest.update(str(file.relative_to(filepath)).encode())
+            with file.open("rb") as f:
+                while chunk := f.read(_HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+
+        # Memoise and Return
+        with self._lock:
+            self._hashes[memo] = digest.hexdigest()
+        return digest.hexdigest()
+
+    def restore(self, key: Optional[str], destination: pathlib.Path) -> bool:
+        """Copies a cached artefact to the destination if one exists.
+
+        Args:
+            key (Optional[str]): Cache key for the conversion.
+            destination (pathlib.Path): Path to copy the artefact to.
+
+        Returns:
+            bool: Whether the artefact was found and restored.
+        """
+        # Check Cache Enabled
+        if key is None:
+            return False
+
+        # Check for Entry
+        entry = self.directory / key
+        artefact = entry / _ARTEFACT
+        if not artefact.exists():
+            self._count(hit=False, key=key)
+            return False
+
+        try:
+            # Copy Artefact
+            # shutil.copyfile is used so no timestamps or permissions are set
+            # on the destination (see the conversions module).
+            if artefact.is_dir():
+                shutil.copytree(artefact, destination, copy_function=shutil.copyfile, dirs_exist_ok=True)
+            else:
+                shutil.copyfile(artefact, destination)
+
+            # Mark as Recently Used
+            os.utime(entry)
+
+        except OSError as exc:
+            # Entry may have been evicted by another process mid-copy
+            log.warning(f"Unable to restore cached conversion [{key}]: {exc}")
+            if destination.is_dir():
+                shutil.rmtree(destination, ignore_errors=True)
+            else:
+                destination.unlink(missing_ok=True)
+            self._count(hit=False, key=key)
+            return False
+
+        # Return
+        self._count(hit=True, key=key)
+        return True
+
+    def store(self, key: Optional[str], source: pathlib.Path) -> None:
+        """Stores a converted artefact in the cache.
+
+        The artefact is copied into a staging directory and then renamed into
+        place, so concurrent readers never observe a partially written entry.
+
+        Args:
+            key (Optional[str]): Cache key for the conversion.
+            source (pathlib.Path): Converted file or directory to be stored.
+        """
+        # Check Cache Enabled
+        if key is None:
+            return
+
+        # Check Size
+        size = _size(source)
+        if size > self.max_size:
+            log.info(f"Conversion [{key}] of {size} bytes exceeds the cache size, not caching")
+            return
+
+        # Create Cache Directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        staging = pathlib.Path(tempfile.mkdtemp(dir=self.directory, prefix=".staging-"))
+
+        try:
+            # Copy Artefact to Staging
+            if source.is_dir():
+                shutil.copytree(source, staging / _ARTEFACT, copy_function=shutil.copyfile)
+            else:
+                shutil.copyfile(source, staging / _ARTEFACT)
+
+            # Move Staging into Place
+            os.rename(staging, self.directory / key)
+            log.info(f"Cached conversion [{key}] ({size} bytes)")
+
+        except OSError as exc:
+            # Another process may have stored the same key concurrently
+            log.warning(f"Unable to cache conversion [{key}]: {exc}")
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+
+        # Evict
+        self.evict()
+
+    def evict(self) -> None:
+        """Evicts least recently used entries until the cache fits its maximum size."""
+        # Retrieve Entries
+        entries = []
+        for entry in self.directory.iterdir():
+            try:
+                # Remove staging directories abandoned by crashed processes
+                if entry.name.startswith("."):
+                    if time.time() - entry.stat().st_mtime > _STAGING_EXPIRY:
+                        shutil.rmtree(entry, ignore_errors=True)
+                    continue
+
+                entries.append((entry.stat().st_mtime, _size(entry), entry))
+            except OSError:
+                continue  # Evicted concurrently
+
+        # Evict Oldest First
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            log.info(f"Evicting cached conversion [{entry.name}] ({size} bytes)")
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def stats(self) -> dict[str, int]:
+        """Retrieves the hit/miss counters for this process.
+
+        Returns:
+            dict[str, int]: Number of hits and misses.
+        """
+        # Return
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _count(self, hit: bool, key: str) -> None:
+        """Increments the hit or miss counter.
+
+        Args:
+            hit (bool): Whether the lookup was a hit.
+            key (str): Cache key that was looked up.
+        """
+        # Increment
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        # Log
+        log.info(f"Conversion cache {'hit' if hit else 'miss'} [{key}] ({self.hits} hits, {self.misses} misses)")
+
+
+def _size(path: pathlib.Path) -> int:
+    """Calculates the total size of a file or directory.
+
+    Args:
+        path (pathlib.Path): File or directory.
+
+    Returns:
+        int: Size in bytes.
+    """
+    # Check File
+    if path.is_file():
+        return path.stat().st_size
+
+    # Sum Directory Contents and Return
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+# Shared Conversion Cache
+conversion_cache = ConversionCache(
+    directory=pathlib.Path(
+        decouple.config(
+            "GIS_CONVERSION_CACHE_DIR",
+            default=str(pathlib.Path(decouple.config("GIS_WORK_DIR", default="/tmp")) / "conversion_cache"),
+        )
+    ),
+    max_size=decouple.config("GIS_CONVERSION_CACHE_MAX_SIZE_MB", default=10240, cast=int) * 1024 * 1024,
+)
+
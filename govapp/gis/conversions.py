@@ -8,13 +8,16 @@ import shutil
 import subprocess  # noqa: S404
 import tempfile
 from osgeo import gdal
+from typing import Iterator
 
 # Third-Party
 import decouple
 from django.utils.text import get_valid_filename
 
 # Local
+from govapp.gis import cache
 from govapp.gis import compression
+from govapp.gis import engines
 
 
 # Final storage directory for converted files (may be a network/Azure share)
@@ -26,16 +29,59 @@ _TMP_BASE.mkdir(parents=True, exist_ok=True)
 _WORK_DIR = pathlib.Path(decouple.config("GIS_WORK_DIR", default="/tmp"))
 _WORK_DIR.mkdir(parents=True, exist_ok=True)
 
+# GDAL block cache for raster conversions (MB). Rasters are read and written
+# one block at a time, so this bounds memory regardless of the raster size.
+_RASTER_CACHE_MB = decouple.config("GIS_RASTER_CACHE_MB", default=256, cast=int)
+
+# Pixels read and written at a time when copying raster bands
+_RASTER_WINDOW_PIXELS = 4 * 1024 * 1024
+
+# Cloud-Optimised GeoTIFF creation options: tiled, compressed and with
+# internal overviews, so GeoServer can read any window at any scale cheaply.
+_COG_OPTIONS = [
+    "-of", "COG",
+    "-co", "BLOCKSIZE=512",
+    "-co", "COMPRESS=DEFLATE",
+    "-co", "PREDICTOR=YES",
+    "-co", "OVERVIEWS=IGNORE_EXISTING",
+    "-co", "BIGTIFF=IF_SAFER",
+    "-co", "NUM_THREADS=ALL_CPUS",
+]
+
+# GeoPackage raster creation options (the raster table is named per layer)
+_GPKG_RASTER_OPTIONS = [
+    "-of", "GPKG",                                # Set output format to GeoPackage
+    "-co", "TILING_SCHEME=GoogleMapsCompatible",  # Recommended for performance
+    "-co", "COMPRESS=DEFLATE",                    # Use lossless compression
+]
+
+# GeoPackage raster overview (pyramid) resampling and levels
+_GPKG_OVERVIEWS = ("average", [2, 4, 8, 16])
+
+# ogr2ogr options for each vector conversion (layer names are added per layer)
+_GPKG_GEOSERVER_OPTIONS: list[str] = []
+_GPKG_CDDP_OPTIONS = ["-update", "-overwrite"]
+_GEOJSON_OPTIONS = ["-unsetFid"]
+_SHAPEFILE_OPTIONS = ["-overwrite", "-unsetFid"]
+_GEODATABASE_OPTIONS = ["-update", "-overwrite"]
+
 # Logging
 log = logging.getLogger(__name__)
 
 
-def to_geopackage(filepath: pathlib.Path, layer: str, catalogue_name: str, export_method: str) -> dict:
+def to_geopackage(
+    filepath: pathlib.Path,
+    layer: str,
+    catalogue_name: str,
+    export_method: str,
+    engine: engines.EngineType = None,
+) -> dict:
     """Converts a GIS file to the GeoPackage format.
 
     Args:
         filepath (pathlib.Path): Path to the file to be converted.
         layer (str): Layer to be converted.
+        engine (engines.EngineType): Conversion engine, or its name.
 
     Returns:
         pathlib.Path: Path to the converted GeoPackage file.
@@ -45,13 +91,6 @@ def to_geopackage(filepath: pathlib.Path, layer: str, catalogue_name: str, expor
     work_dir: pathlib.Path | None = None
     decompressed_dir: pathlib.Path | None = None
     try:
-        # Decompress and Flatten if Required
-        original_filepath = filepath
-        filepath = compression.decompress(filepath)
-        if filepath != original_filepath:
-            decompressed_dir = filepath
-        filepath = compression.flatten(filepath)
-
         # Construct Output Filepath
         # Use local container storage (_WORK_DIR) for the GDAL conversion.
         # SQLite/GeoPackage requires local filesystem locking and does not
@@ -59,60 +98,69 @@ def to_geopackage(filepath: pathlib.Path, layer: str, catalogue_name: str, expor
         work_dir = pathlib.Path(tempfile.mkdtemp(dir=_WORK_DIR))
         output_filepath = work_dir / f"{layer}.gpkg"
 
+        # Check the Conversion Cache
+        # Raster or vector is only known once decompressed, but follows from
+        # the source contents, so both option sets are part of the key.
+        engine = engines.get_engine(engine)
+        cache_key = cache.conversion_cache.key(
+            filepath,
+            "gpkg",
+            layer=layer,
+            catalogue_name=catalogue_name,
+            export_method=export_method,
+            engine=engine.name,
+            options={
+                "raster": _GPKG_RASTER_OPTIONS,
+                "overviews": _GPKG_OVERVIEWS,
+                "vector": _GPKG_GEOSERVER_OPTIONS if export_method == "geoserver" else _GPKG_CDDP_OPTIONS,
+            },
+        )
+        if cache.conversion_cache.restore(cache_key, output_filepath):
+            return _finalise(output_filepath, filepath)
+
+        # Decompress and Flatten if Required
+        original_filepath = filepath
+        filepath = compression.decompress(filepath)
+        if filepath != original_filepath:
+            decompressed_dir = filepath
+        filepath = compression.flatten(filepath)
+
         # --- START: NEW LOGIC TO DETECT RASTER/VECTOR ---
         is_raster = filepath.suffix.lower() in ['.tif', '.tiff']
-        command = []
 
         if is_raster:
-            # --- RASTER CONVERSION PATH (using gdal_translate) ---
-            log.info(f"Detected raster file ({filepath.suffix}), using gdal_translate.")
-            command = [
-                "gdal_translate",
-                "-of", "GPKG",                   # Set output format to GeoPackage
+            # --- RASTER CONVERSION PATH (as gdal_translate) ---
+            log.info(f"Detected raster file ({filepath.suffix}), using gdal_translate ({engine.name} engine).")
+            messages = engine.translate(output_filepath, filepath, [
+                *_GPKG_RASTER_OPTIONS,
                 "-co", "RASTER_TABLE=" + layer,  # Set the name of the raster table inside the GPKG
-                "-co", "TILING_SCHEME=GoogleMapsCompatible", # Recommended for performance
-                "-co", "COMPRESS=DEFLATE",       # Use lossless compression
-                str(filepath),                   # Input file
-                str(output_filepath),            # Output file
-            ]
+            ])
         else:
-            # --- VECTOR CONVERSION PATH (using ogr2ogr) ---
-            log.info(f"Detected vector file ({filepath.suffix}), using ogr2ogr.")
+            # --- VECTOR CONVERSION PATH (as ogr2ogr) ---
+            log.info(f"Detected vector file ({filepath.suffix}), using ogr2ogr ({engine.name} engine).")
             if export_method =='geoserver':
-                command = [
-                    "ogr2ogr",
-                    "--config", "OGR_SQLITE_SYNCHRONOUS", "OFF",
-                    str(output_filepath),
-                    str(filepath),
-                    str(layer),
-                    "-nln",
-                    str(layer),
-                ]
+                messages = engine.vector_translate(
+                    output_filepath,
+                    filepath,
+                    [*_GPKG_GEOSERVER_OPTIONS, "-nln", str(layer)],
+                    layers=[str(layer)],
+                    config={"OGR_SQLITE_SYNCHRONOUS": "OFF"},
+                )
             else:
-                command = [
-                    "ogr2ogr",
-                    "-update",
-                    "-overwrite",
-                    "-nln", 
-                    str(layer),                 #'Name' box in new CDDP dialogue
-                    str(output_filepath),
-                    str(filepath),
-                    str(catalogue_name)         # Catalogue name
-                ]
-
-        if not command:
-            raise NotImplementedError(f"File type '{filepath.suffix}' is not supported for GeoPackage conversion.")
-
-        # Run the command
-        result = subprocess.run(command, check=True, capture_output=True, text=True)
-        log.info(f"GDAL/OGR Output:\n{result.stdout}\n{result.stderr}")
+                messages = engine.vector_translate(
+                    output_filepath,
+                    filepath,
+                    [*_GPKG_CDDP_OPTIONS, "-nln", str(layer)],  #'Name' box in new CDDP dialogue
+                    layers=[str(catalogue_name)],                   # Catalogue name
+                )
+
+        log.info(f"GDAL/OGR Messages: {messages}")
         log.info(f"Success: Converted file [{filepath}] to GeoPackage successfully.")
         
         # Optional but recommended for rasters: Add overviews (pyramids) for better performance
         if is_raster:
             log.info("Adding overviews to the raster GeoPackage...")
-            gdaladdo_command = ["gdaladdo", "-r", "average", str(output_filepath), "2", "4", "8", "16"]
-            subprocess.run(gdaladdo_command, check=True, capture_output=True, text=True)
+            engine.build_overviews(output_filepath, *_GPKG_OVERVIEWS)
             log.info("Overviews added successfully.")
 
         # raise RuntimeError(
@@ -120,31 +168,20 @@ def to_geopackage(filepath: pathlib.Path, layer: str, catalogue_name: str, expor
         #     f"Please inspect the generated GeoPackage file at: {output_filepath}"
         # )
 
-        # Move the converted file from local working storage to the final
-        # destination (_TMP_BASE, which may be an Azure/network share).
-        # The move happens only after conversion is fully complete, so
-        # SQLite never operates on a network path.
-        final_dir = tempfile.mkdtemp(dir=_TMP_BASE)
-        final_filepath = pathlib.Path(final_dir) / output_filepath.name
-        # Use shutil.copyfile (not copy2 or copy) as the fallback copy function.
-        # Azure File Share rejects both utime (timestamps) and chmod (permissions),
-        # so we must use copyfile which copies file content only.
-        shutil.move(str(output_filepath), str(final_filepath), copy_function=shutil.copyfile)
-        log.info(f"Moved converted file to final storage: [{final_filepath}]")
-
-        converted = {"uncompressed_filepath": final_filepath.parent, "full_filepath": final_filepath, "orignal_filepath": filepath}
-        log.info(f'converted: [{converted}]')
+        # Record Metrics
+        _record_conversion("gpkg", filepath, output_filepath)
 
-        return converted
+        # Store in the Conversion Cache
+        cache.conversion_cache.store(cache_key, output_filepath)
 
-    except subprocess.TimeoutExpired as e:
+        return _finalise(output_filepath, filepath)
+
+    except engines.ConversionTimeout as e:
         log.error(f"The command has reached a timeout. Error converting file '{filepath}' layer: '{layer}' to GeoPackage: {e}")
         raise RuntimeError(f"Timeout error converting file '{filepath}' layer: '{layer}' to GeoPackage: {e}")
-    except subprocess.CalledProcessError as e:
-        # Provide more detailed error info from the failed command
-        error_message = f"GDAL/OGR command failed with exit code {e.returncode}.\n"
-        error_message += f"Command: {' '.join(e.cmd)}\n"
-        error_message += f"Stderr: {e.stderr}"
+    except engines.ConversionError as e:
+        # Provide more detailed error info from the failed conversion
+        error_message = str(e)
         log.error(error_message)
         raise RuntimeError(error_message) # Re-raise with the detailed message
     except FileNotFoundError as e:
@@ -160,12 +197,19 @@ def to_geopackage(filepath: pathlib.Path, layer: str, catalogue_name: str, expor
             shutil.rmtree(decompressed_dir, ignore_errors=True)
 
 
-def to_geojson(filepath: pathlib.Path, layer: str, catalogue_name: str = '', export_method: str = '') -> dict:
+def to_geojson(
+    filepath: pathlib.Path,
+    layer: str,
+    catalogue_name: str = '',
+    export_method: str = '',
+    engine: engines.EngineType = None,
+) -> dict:
     """Converts a GIS file to the GeoJSON format.
 
     Args:
         filepath (pathlib.Path): Path to the file to be converted.
         layer (str): Layer to be converted.
+        engine (engines.EngineType): Conversion engine, or its name.
 
     Returns:
         pathlib.Path: Path to the converted GeoJSON file.
@@ -175,50 +219,47 @@ def to_geojson(filepath: pathlib.Path, layer: str, catalogue_name: str = '', exp
     work_dir: pathlib.Path | None = None
     decompressed_dir: pathlib.Path | None = None
     try:
-        # Decompress and Flatten if Required
-        original_filepath = filepath
-        filepath = compression.decompress(filepath)
-        if filepath != original_filepath:
-            decompressed_dir = filepath
-        filepath = compression.flatten(filepath)
-
         # Construct Output Filepath
         # Use local container storage (_WORK_DIR) to avoid Azure File Share
         # rejecting utime/chmod calls made by ogr2ogr on the output file.
         work_dir = pathlib.Path(tempfile.mkdtemp(dir=_WORK_DIR))
         output_filepath = work_dir / f"{layer}.geojson"
 
-        command = [
-            "ogr2ogr",
-            "-unsetFid",
-            str(output_filepath),
-            str(filepath),
-            str(layer),
-        ]
-        log.info(f"Running command: [{' '.join(command)}]")
+        # Check the Conversion Cache
+        engine = engines.get_engine(engine)
+        cache_key = cache.conversion_cache.key(filepath, "geojson", layer=layer, engine=engine.name, options=_GEOJSON_OPTIONS)
+        if cache.conversion_cache.restore(cache_key, output_filepath):
+            return _finalise(output_filepath, filepath)
 
-        # Run the command
-        subprocess.check_call(  # noqa: S603,S607
-            command,
+        # Decompress and Flatten if Required
+        original_filepath = filepath
+        filepath = compression.decompress(filepath)
+        if filepath != original_filepath:
+            decompressed_dir = filepath
+        filepath = compression.flatten(filepath)
+
+        # Run the conversion
+        engine.vector_translate(
+            output_filepath,
+            filepath,
+            _GEOJSON_OPTIONS,
+            layers=[str(layer)],
             timeout=1800,  # 30min
         )
         log.info(f"Success: Converted file: [{filepath}], layer: [{layer}] to GeoJSON successfully.")
 
-        # Move converted file from local storage to final destination (Azure).
-        final_dir = tempfile.mkdtemp(dir=_TMP_BASE)
-        final_filepath = pathlib.Path(final_dir) / output_filepath.name
-        shutil.move(str(output_filepath), str(final_filepath), copy_function=shutil.copyfile)
-        log.info(f"Moved converted file to final storage: [{final_filepath}]")
+        # Record Metrics
+        _record_conversion("geojson", filepath, output_filepath)
 
-        converted = {"uncompressed_filepath": final_filepath.parent, "full_filepath": final_filepath, "orignal_filepath": filepath}
-        log.info(f'converted: [{converted}]')
+        # Store in the Conversion Cache
+        cache.conversion_cache.store(cache_key, output_filepath)
 
-        return converted
+        return _finalise(output_filepath, filepath)
 
-    except subprocess.TimeoutExpired as e:
+    except engines.ConversionTimeout as e:
         log.error(f"The command has reached a timeout.  Error converting file '{filepath}' layer: '{layer}' to GeoJSON: {e}")
         raise RuntimeError(f"Error converting file '{filepath}' layer: '{layer}' to GeoJSON")
-    except subprocess.CalledProcessError as e:
+    except engines.ConversionError as e:
         log.error(f"Error converting file '{filepath}' layer: '{layer}' to GeoJSON: {e}")
         raise RuntimeError(f"Error converting file '{filepath}' layer: '{layer}' to GeoJSON")
     except FileNotFoundError as e:
@@ -234,12 +275,19 @@ def to_geojson(filepath: pathlib.Path, layer: str, catalogue_name: str = '', exp
             shutil.rmtree(decompressed_dir, ignore_errors=True)
 
 
-def to_shapefile(filepath: pathlib.Path, layer: str, catalogue_name: str, export_method: str) -> dict:
+def to_shapefile(
+    filepath: pathlib.Path,
+    layer: str,
+    catalogue_name: str,
+    export_method: str,
+    engine: engines.EngineType = None,
+) -> dict:
     """Converts a GIS file to the ShapeFile format.
 
     Args:
         filepath (pathlib.Path): Path to the file to be converted.
         layer (str): Layer to be converted.
+        engine (engines.EngineType): Conversion engine, or its name.
 
     Returns:
         pathlib.Path: Path to the converted ShapeFile file.
@@ -248,13 +296,6 @@ def to_shapefile(filepath: pathlib.Path, layer: str, catalogue_name: str, export
 
     decompressed_dir: pathlib.Path | None = None
     try:
-        # Decompress and Flatten if Required
-        original_filepath = filepath
-        filepath = compression.decompress(filepath)
-        if filepath != original_filepath:
-            decompressed_dir = filepath
-        filepath = compression.flatten(filepath)
-
         # Construct Output Filepath
         # Use local container storage (_WORK_DIR) to avoid Azure File Share
         # rejecting utime/chmod calls made by ogr2ogr on the output file.
@@ -264,19 +305,38 @@ def to_shapefile(filepath: pathlib.Path, layer: str, catalogue_name: str, export
         output_filepath.mkdir(parents=True, exist_ok=True)
         output_filepath = output_filepath / f"{layer}.shp"
 
-        command = [
-            "ogr2ogr",
-            "-overwrite",
-            "-unsetFid",
-            str(output_filepath),
-            str(filepath),        
-            str(catalogue_name)
-        ]
-        log.info(f"Running command: [{' '.join(command)}]")
+        # Check the Conversion Cache
+        engine = engines.get_engine(engine)
+        cache_key = cache.conversion_cache.key(
+            filepath,
+            "shp",
+            layer=layer,
+            catalogue_name=catalogue_name,
+            engine=engine.name,
+            options=_SHAPEFILE_OPTIONS,
+        )
+        if not cache.conversion_cache.restore(cache_key, output_filepath.parent):
+            # Decompress and Flatten if Required
+            original_filepath = filepath
+            filepath = compression.decompress(filepath)
+            if filepath != original_filepath:
+                decompressed_dir = filepath
+            filepath = compression.flatten(filepath)
+
+            # Run the conversion
+            engine.vector_translate(
+                output_filepath,
+                filepath,
+                _SHAPEFILE_OPTIONS,
+                layers=[str(catalogue_name)],
+            )
+            log.info(f"Success: Converted file [{filepath}], layer: [{layer}] to Shapefile successfully.")
 
-        # Run the command
-        subprocess.check_call(command)
-        log.info(f"Success: Converted file [{filepath}], layer: [{layer}] to Shapefile successfully.")
+            # Record Metrics
+            _record_conversion("shp", filepath, output_filepath.parent)
+
+            # Store in the Conversion Cache
+            cache.conversion_cache.store(cache_key, output_filepath.parent)
 
         # Compress on local storage, then move the zip to Azure.
         # shutil.make_archive also sets timestamps; doing it locally avoids Azure utime errors.
@@ -291,10 +351,10 @@ def to_shapefile(filepath: pathlib.Path, layer: str, catalogue_name: str, export
 
         return converted
 
-    except subprocess.TimeoutExpired as e:
+    except engines.ConversionTimeout as e:
         log.error(f"The command has reached a 30-minute timeout.  Error converting file '{filepath}' layer: '{layer}' to Shapefile: {e}")
         raise RuntimeError(f"Error converting file '{filepath}' layer: '{layer}' to Shapefile")
-    except subprocess.CalledProcessError as e:
+    except engines.ConversionError as e:
         log.error(f"Error converting file '{filepath}' layer: '{layer}' to Shapefile: {e}")
         raise RuntimeError(f"Error converting file '{filepath}' layer: '{layer}' to Shapefile")
     except FileNotFoundError as e:
@@ -310,12 +370,19 @@ def to_shapefile(filepath: pathlib.Path, layer: str, catalogue_name: str, export
             shutil.rmtree(decompressed_dir, ignore_errors=True)
 
 
-def to_geodatabase(filepath: pathlib.Path, layer: str, catalogue_name: str, export_method: str) -> dict:
+def to_geodatabase(
+    filepath: pathlib.Path,
+    layer: str,
+    catalogue_name: str,
+    export_method: str,
+    engine: engines.EngineType = None,
+) -> dict:
     """Converts a GIS file to the GeoDatabase format.
 
     Args:
         filepath (pathlib.Path): Path to the file to be converted.
         layer (str): Layer to be converted.
+        engine (engines.EngineType): Conversion engine, or its name.
 
     Returns:
         pathlib.Path: Path to the converted GeoDatabase file.
@@ -324,14 +391,6 @@ def to_geodatabase(filepath: pathlib.Path, layer: str, catalogue_name: str, expo
 
     decompressed_dir: pathlib.Path | None = None
     try:
-        # Decompress and Flatten if Required
-        original_filepath = filepath
-        filepath = compression.decompress(filepath)
-        if filepath != original_filepath:
-            decompressed_dir = filepath
-        filepath_before_flatten = filepath
-        filepath = compression.flatten(filepath)
-
         # Construct Output Filepath
         # Use local container storage (_WORK_DIR) to avoid Azure File Share
         # rejecting utime/chmod calls made by ogr2ogr on the output file.
@@ -341,22 +400,33 @@ def to_geodatabase(filepath: pathlib.Path, layer: str, catalogue_name: str, expo
         output_filepath.mkdir(parents=True, exist_ok=True)
         output_filepath = output_filepath / f"{layer}.gdb"
 
-        # Construct the command
-        command = [
-            "ogr2ogr",
-            "-update",
-            "-overwrite",
-            "-nln", 
-            str(layer),
-            str(output_filepath),
-            str(filepath),
-            str(layer)
-        ]
-        log.info(f"Running command: [{' '.join(command)}]")
+        # Check the Conversion Cache
+        filepath_before_flatten = filepath
+        engine = engines.get_engine(engine)
+        cache_key = cache.conversion_cache.key(filepath, "gdb", layer=layer, engine=engine.name, options=_GEODATABASE_OPTIONS)
+        if not cache.conversion_cache.restore(cache_key, output_filepath.parent):
+            # Decompress and Flatten if Required
+            original_filepath = filepath
+            filepath = compression.decompress(filepath)
+            if filepath != original_filepath:
+                decompressed_dir = filepath
+            filepath_before_flatten = filepath
+            filepath = compression.flatten(filepath)
+
+            # Run the conversion
+            engine.vector_translate(
+                output_filepath,
+                filepath,
+                [*_GEODATABASE_OPTIONS, "-nln", str(layer)],
+                layers=[str(layer)],
+            )
+            log.info(f"Success: Converted file [{filepath}], layer: [{layer}] to GeoDatabase successfully.")
 
-        # Run the command
-        subprocess.check_call(command)
-        log.info(f"Success: Converted file [{filepath}], layer: [{layer}] to GeoDatabase successfully.")
+            # Record Metrics
+            _record_conversion("gdb", filepath, output_filepath.parent)
+
+            # Store in the Conversion Cache
+            cache.conversion_cache.store(cache_key, output_filepath.parent)
 
         # Compress on local storage, then move the zip to Azure.
         # shutil.make_archive also sets timestamps; doing it locally avoids Azure utime errors.
@@ -372,12 +442,12 @@ def to_geodatabase(filepath: pathlib.Path, layer: str, catalogue_name: str, expo
         # Return
         return converted
 
-    except subprocess.TimeoutExpired as e:
+    except engines.ConversionTimeout as e:
         log.error(f"The command has reached a 30-minute timeout. Error converting file '{filepath}' layer: '{layer}' to GeoDatabase: {e}")
         raise RuntimeError(f"Timeout error converting file '{filepath}' layer: '{layer}' to GeoDatabase: {e}")
-    except subprocess.CalledProcessError as e:
-        log.error(f"CalledProcessError: Error converting file '{filepath}' layer: '{layer}' to GeoDatabase: {e}")
-        raise RuntimeError(f"CalledProcessError converting file '{filepath}' layer: '{layer}' to GeoDatabase: {e}")
+    except engines.ConversionError as e:
+        log.error(f"ConversionError: Error converting file '{filepath}' layer: '{layer}' to GeoDatabase: {e}")
+        raise RuntimeError(f"ConversionError converting file '{filepath}' layer: '{layer}' to GeoDatabase: {e}")
     except FileNotFoundError as e:
         log.error(f"FileNotFoundError: Error converting file '{filepath}' layer: '{layer}' to GeoDatabase: {e}")
         raise RuntimeError(f"FileNotFoundError converting file '{filepath}' layer: '{layer}' to GeoDatabase: {e}")
@@ -391,6 +461,164 @@ def to_geodatabase(filepath: pathlib.Path, layer: str, catalogue_name: str, expo
             shutil.rmtree(decompressed_dir, ignore_errors=True)
 
 
+def to_cloud_optimised_geotiff(filepath: pathlib.Path, layer: str, engine: engines.EngineType = None) -> dict:
+    """Converts a GeoTIFF to a Cloud-Optimised GeoTIFF.
+
+    The COG driver reads and writes the raster one block at a time through the
+    GDAL block cache, so memory use is bounded by `GIS_RASTER_CACHE_MB` rather
+    than the size of the raster. Unchanged rasters are restored from the
+    conversion cache rather than being converted again.
+
+    Args:
+        filepath (pathlib.Path): Path to the GeoTIFF to be converted.
+        layer (str): Name of the layer, used as the file name.
+        engine (engines.EngineType): Conversion engine, or its name.
+
+    Returns:
+        dict: Paths to the converted Cloud-Optimised GeoTIFF.
+    """
+    log.info(f"Converting file '{filepath}' to a Cloud-Optimised GeoTIFF...")
+
+    work_dir: pathlib.Path | None = None
+    decompressed_dir: pathlib.Path | None = None
+    try:
+        # Construct Output Filepath
+        work_dir = pathlib.Path(tempfile.mkdtemp(dir=_WORK_DIR))
+        output_filepath = work_dir / f"{layer}.tif"
+
+        # Check the Conversion Cache
+        engine = engines.get_engine(engine)
+        cache_key = cache.conversion_cache.key(filepath, "cog", layer=layer, engine=engine.name, options=_COG_OPTIONS)
+        if cache.conversion_cache.restore(cache_key, output_filepath):
+            return _finalise(output_filepath, filepath)
+
+        # Decompress and Flatten if Required
+        original_filepath = filepath
+        filepath = compression.decompress(filepath)
+        if filepath != original_filepath:
+            decompressed_dir = filepath
+        filepath = compression.flatten(filepath)
+
+        # Run the conversion
+        engine.translate(
+            output_filepath,
+            filepath,
+            _COG_OPTIONS,
+            config={"GDAL_CACHEMAX": str(_RASTER_CACHE_MB)},
+        )
+        log.info(f"Success: Converted file [{filepath}] to a Cloud-Optimised GeoTIFF successfully.")
+
+        # Record Metrics
+        _record_conversion("cog", filepath, output_filepath)
+
+        # Store in the Conversion Cache
+        cache.conversion_cache.store(cache_key, output_filepath)
+
+        return _finalise(output_filepath, filepath)
+
+    except engines.ConversionTimeout as e:
+        log.error(f"The command has reached a timeout. Error converting file '{filepath}' to a Cloud-Optimised GeoTIFF: {e}")
+        raise RuntimeError(f"Timeout error converting file '{filepath}' to a Cloud-Optimised GeoTIFF: {e}")
+    except engines.ConversionError as e:
+        log.error(f"Error converting file '{filepath}' to a Cloud-Optimised GeoTIFF: {e}")
+        raise RuntimeError(f"Error converting file '{filepath}' to a Cloud-Optimised GeoTIFF: {e}")
+    except FileNotFoundError as e:
+        log.error(f"FileNotFoundError: Error converting file '{filepath}' to a Cloud-Optimised GeoTIFF: {e}")
+        raise RuntimeError(f"FileNotFoundError converting file '{filepath}' to a Cloud-Optimised GeoTIFF: {e}")
+    except Exception as e:
+        log.error(f"Unexpected error converting file '{filepath}' to a Cloud-Optimised GeoTIFF: {e}")
+        raise
+    finally:
+        if work_dir is not None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        if decompressed_dir is not None:
+            shutil.rmtree(decompressed_dir, ignore_errors=True)
+
+
+def _raster_windows(band: gdal.Band) -> Iterator[tuple[int, int, int, int]]:
+    """Divides a raster band into block aligned windows.
+
+    Each window spans whole blocks of the band, so reading it does not decode
+    any block more than once, and holds about `_RASTER_WINDOW_PIXELS` pixels.
+
+    Args:
+        band (gdal.Band): The raster band.
+
+    Yields:
+        tuple[int, int, int, int]: The x offset, y offset, width and height of
+            each window.
+    """
+    # Calculate Window Size
+    block_x, block_y = band.GetBlockSize()
+    blocks_per_window = max(1, _RASTER_WINDOW_PIXELS // (block_x * block_y))
+    window_y = block_y * blocks_per_window if block_x >= band.XSize else block_y
+    window_x = block_x if block_x >= band.XSize else block_x * blocks_per_window
+
+    # Yield Windows
+    for y in range(0, band.YSize, window_y):
+        for x in range(0, band.XSize, window_x):
+            yield x, y, min(window_x, band.XSize - x), min(window_y, band.YSize - y)
+
+
+def _record_conversion(output_format: str, filepath: pathlib.Path, output_filepath: pathlib.Path) -> None:
+    """Records the metrics of a conversion.
+
+    Args:
+        output_format (str): Format converted to.
+        filepath (pathlib.Path): File or directory that was converted.
+        output_filepath (pathlib.Path): Converted file or directory.
+    """
+    # Imported here, as the registry imports the ORM
+    from govapp.apps.metrics import registry
+
+    # Record
+    registry.CONVERSIONS.inc(format=output_format)
+    registry.CONVERSION_BYTES.inc(_size(filepath), format=output_format, direction="read")
+    registry.CONVERSION_BYTES.inc(_size(output_filepath), format=output_format, direction="written")
+
+
+def _size(path: pathlib.Path) -> int:
+    """Calculates the size of a file, or of the files within a directory.
+
+    Args:
+        path (pathlib.Path): File or directory.
+
+    Returns:
+        int: Size in bytes.
+    """
+    if path.is_dir():
+        return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+    return path.stat().st_size if path.exists() else 0
+
+
+def _finalise(output_filepath: pathlib.Path, filepath: pathlib.Path) -> dict:
+    """Moves a converted file from local working storage to final storage.
+
+    Args:
+        output_filepath (pathlib.Path): Converted file in the working directory.
+        filepath (pathlib.Path): Path to the file that was converted.
+
+    Returns:
+        dict: Paths to the converted file in final storage.
+    """
+    # Move the converted file from local working storage to the final
+    # destination (_TMP_BASE, which may be an Azure/network share).
+    # The move happens only after conversion is fully complete, so
+    # SQLite never operates on a network path.
+    final_dir = tempfile.mkdtemp(dir=_TMP_BASE)
+    final_filepath = pathlib.Path(final_dir) / output_filepath.name
+    # Use shutil.copyfile (not copy2 or copy) as the fallback copy function.
+    # Azure File Share rejects both utime (timestamps) and chmod (permissions),
+    # so we must use copyfile which copies file content only.
+    shutil.move(str(output_filepath), str(final_filepath), copy_function=shutil.copyfile)
+    log.info(f"Moved converted file to final storage: [{final_filepath}]")
+
+    converted = {"uncompressed_filepath": final_filepath.parent, "full_filepath": final_filepath, "orignal_filepath": filepath}
+    log.info(f'converted: [{converted}]')
+
+    return converted
+
+
 def postgres_to_shapefile(layer_name: str, hostname: str, username: str, password: str, database:  str, port: str, sqlquery: str) -> dict: 
     log.info(f"Converting custom query for the PostGIS to shapefile...")
 
@@ -506,11 +734,13 @@ def convert_tiff_to_geopackage(input_tiff, output_gpkg, output_layer_name):
             log.error("Failed to create the GeoPackage file.")
             raise ValueError("Failed to create the GeoPackage file.")
 
-        # Copy data from the TIFF file to the GeoPackage file
+        # Copy data from the TIFF file to the GeoPackage file, one window at a
+        # time, so that memory use does not grow with the size of the raster
         for band_number in range(1, tiff_dataset.RasterCount + 1):
             band = tiff_dataset.GetRasterBand(band_number)
             gpkg_band = gpkg_dataset.GetRasterBand(band_number)
-            gpkg_band.WriteArray(band.ReadAsArray())
+            for x, y, width, height in _raster_windows(band):
+                gpkg_band.WriteArray(band.ReadAsArray(x, y, width, height), x, y)
 
         # Set the layer name in the GeoPackage file
         gpkg_dataset.SetMetadataItem("LAYERS", output_layer_name)
@@ -0,0 +1,468 @@
+"""GIS Conversion Engines.
+
+Conversions are run by one of two interchangeable engines:
+
+* `SubprocessEngine` runs the GDAL command line utilities (`ogr2ogr`,
+  `gdal_translate` and `gdaladdo`) in subprocesses, which isolates the worker
+  from crashes in GDAL drivers.
+* `InProcessEngine` calls `gdal.VectorTranslate`, `gdal.Translate` and
+  `BuildOverviews` through the GDAL bindings, which avoids starting a process
+  per conversion and reports progress as the conversion runs.
+
+Both engines report GDAL errors and warnings as `GDALMessage` records, and
+support cancellation and timeouts. The engine is selected per call, defaulting
+to the `GIS_CONVERSION_ENGINE` environment variable.
+"""
+
+
+# Standard
+import abc
+import dataclasses
+import logging
+import pathlib
+import re
+import subprocess  # noqa: S404
+import threading
+import time
+
+# Third-Party
+from osgeo import gdal
+import decouple
+
+# Typing
+from typing import Any, Callable, Iterable, Optional, Union
+
+
+# Logging
+log = logging.getLogger(__name__)
+
+
+# Default Engine ("subprocess" or "gdal")
+DEFAULT_ENGINE = decouple.config("GIS_CONVERSION_ENGINE", default="subprocess")
+
+# Seconds between checks for cancellation of a subprocess
+POLL_SECONDS = 0.5
+
+# GDAL Error Classes
+ERROR_CLASSES = {0: "None", 1: "Debug", 2: "Warning", 3: "Failure", 4: "Fatal"}
+
+# GDAL Messages written to `stderr` by the command line utilities
+STDERR_MESSAGE = re.compile(r"^(ERROR|Warning) (\d+): (.*)$")
+
+# Type Aliases
+Progress = Callable[[float, str], None]
+EngineType = Union["Engine", str, None]
+
+
+@dataclasses.dataclass
+class GDALMessage:
+    """An error or warning reported by GDAL."""
+    level: str
+    number: int
+    message: str
+
+
+class ConversionError(RuntimeError):
+    """Raised when a conversion fails."""
+
+    def __init__(self, message: str, messages: Iterable[GDALMessage] = ()) -> None:
+        """Instantiates the Error.
+
+        Args:
+            message (str): Description of the failure.
+            messages (Iterable[GDALMessage]): Messages reported by GDAL.
+        """
+        super().__init__(message)
+        self.messages = list(messages)
+
+
+class ConversionTimeout(ConversionError):
+    """Raised when a conversion times out."""
+
+
+class ConversionCancelled(Exception):
+    """Raised when a conversion is cancelled."""
+
+
+class Engine(abc.ABC):
+    """Base Conversion Engine."""
+
+    # Name of the Engine
+    name = ""
+
+    def __init__(self, progress: Optional[Progress] = None, cancel: Optional[threading.Event] = None) -> None:
+        """Instantiates the Engine.
+
+        Args:
+            progress (Optional[Progress]): Called with the fraction complete
+                (0 to 1) and a message as each conversion progresses.
+            cancel (Optional[threading.Event]): Cancels the running conversion
+                when set.
+        """
+        # Instance Attributes
+        self.progress = progress
+        self.cancel = cancel
+
+    @abc.abstractmethod
+    def vector_translate(
+        self,
+        destination: pathlib.Path,
+        source: pathlib.Path,
+        options: Iterable[str] = (),
+        layers: Iterable[str] = (),
+        config: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> list[GDALMessage]:
+        """Converts a vector dataset, as `ogr2ogr`.
+
+        Args:
+            destination (pathlib.Path): Path to the output dataset.
+            source (pathlib.Path): Path to the input dataset.
+            options (Iterable[str]): `ogr2ogr` command line options.
+            layers (Iterable[str]): Layers of the input dataset to convert.
+            config (Optional[dict[str, str]]): GDAL configuration options.
+            timeout (Optional[float]): Seconds before the conversion times out.
+
+        Returns:
+            list[GDALMessage]: Warnings reported by GDAL.
+        """
+
+    @abc.abstractmethod
+    def translate(
+        self,
+        destination: pathlib.Path,
+        source: pathlib.Path,
+        options: Iterable[str] = (),
+        config: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> list[GDALMessage]:
+        """Converts a raster dataset, as `gdal_translate`.
+
+        Args:
+            destination (pathlib.Path): Path to the output dataset.
+            source (pathlib.Path): Path to the input dataset.
+            options (Iterable[str]): `gdal_translate` command line options.
+            config (Optional[dict[str, str]]): GDAL configuration options.
+            timeout (Optional[float]): Seconds before the conversion times out.
+
+        Returns:
+            list[GDALMessage]: Warnings reported by GDAL.
+        """
+
+    @abc.abstractmethod
+    def build_overviews(
+        self,
+        path: pathlib.Path,
+        resampling: str,
+        levels: Iterable[int],
+        timeout: Optional[float] = None,
+    ) -> list[GDALMessage]:
+        """Adds overviews to a raster dataset, as `gdaladdo`.
+
+        Args:
+            path (pathlib.Path): Path to the raster dataset.
+            resampling (str): Resampling method (e.g. "average").
+            levels (Iterable[int]): Overview decimation factors.
+            timeout (Optional[float]): Seconds before the build times out.
+
+        Returns:
+            list[GDALMessage]: Warnings reported by GDAL.
+        """
+
+
+class SubprocessEngine(Engine):
+    """Runs conversions with the GDAL command line utilities.
+
+    Progress is only reported on completion, as the utilities do not report
+    it in a structured form.
+    """
+
+    # Name of the Engine
+    name = "subprocess"
+
+    def vector_translate(
+        self,
+        destination: pathlib.Path,
+        source: pathlib.Path,
+        options: Iterable[str] = (),
+        layers: Iterable[str] = (),
+        config: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> list[GDALMessage]:
+        """Converts a vector dataset with `ogr2ogr`."""
+        command = ["ogr2ogr", *_config_options(config), *options, str(destination), str(source), *layers]
+        return self._run(command, timeout)
+
+    def translate(
+        self,
+        destination: pathlib.Path,
+        source: pathlib.Path,
+        options: Iterable[str] = (),
+        config: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> list[GDALMessage]:
+        """Converts a raster dataset with `gdal_translate`."""
+        command = ["gdal_translate", *_config_options(config), *options, str(source), str(destination)]
+        return self._run(command, timeout)
+
+    def build_overviews(
+        self,
+        path: pathlib.Path,
+        resampling: str,
+        levels: Iterable[int],
+        timeout: Optional[float] = None,
+    ) -> list[GDALMessage]:
+        """Adds overviews to a raster dataset with `gdaladdo`."""
+        return self._run(["gdaladdo", "-r", resampling, str(path), *map(str, levels)], timeout)
+
+    def _run(self, command: list[str], timeout: Optional[float]) -> list[GDALMessage]:
+        """Runs a command, checking for cancellation while it runs.
+
+        Args:
+            command (list[str]): Command to run.
+            timeout (Optional[float]): Seconds before the command times out.
+
+        Raises:
+            ConversionCancelled: If the conversion is cancelled.
+            ConversionTimeout: If the command times out.
+            ConversionError: If the command fails.
+
+        Returns:
+            list[GDALMessage]: Warnings written to `stderr`.
+        """
+        # Log
+        log.info(f"Running command: [{' '.join(command)}]")
+
+        # Run Command
+        deadline = time.monotonic() + timeout if timeout else None
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)  # noqa: S603
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=POLL_SECONDS)
+                break
+            except subprocess.TimeoutExpired:
+                # Check Cancellation and Timeout
+                if self.cancel is not None and self.cancel.is_set():
+                    process.kill()
+                    process.communicate()
+                    raise ConversionCancelled(f"Cancelled command: [{' '.join(command)}]")
+                if deadline is not None and time.monotonic() > deadline:
+                    process.kill()
+                    _, stderr = process.communicate()
+                    raise ConversionTimeout(
+                        f"Command timed out after {timeout} seconds: [{' '.join(command)}]",
+                        _parse_stderr(stderr),
+                    )
+
+        # Check Result
+        messages = _parse_stderr(stderr)
+        if process.returncode:
+            raise ConversionError(
+                f"GDAL/OGR command failed with exit code {process.returncode}.\n"
+                f"Command: {' '.join(command)}\n"
+                f"Stderr: {stderr}",
+                messages,
+            )
+
+        # Report Progress and Return
+        if stdout:
+            log.info(f"GDAL/OGR Output:\n{stdout}")
+        if self.progress is not None:
+            self.progress(1.0, "")
+        return messages
+
+
+class InProcessEngine(Engine):
+    """Runs conversions in-process with the GDAL bindings."""
+
+    # Name of the Engine
+    name = "gdal"
+
+    def vector_translate(
+        self,
+        destination: pathlib.Path,
+        source: pathlib.Path,
+        options: Iterable[str] = (),
+        layers: Iterable[str] = (),
+        config: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> list[GDALMessage]:
+        """Converts a vector dataset with `gdal.VectorTranslate`."""
+        def run(callback: Callable[..., int]) -> Any:
+            translate_options = gdal.VectorTranslateOptions(options=list(options), layers=list(layers) or None, callback=callback)
+            return gdal.VectorTranslate(str(destination), str(source), options=translate_options)
+
+        return self._run(f"VectorTranslate [{source}] to [{destination}]", run, config, timeout)
+
+    def translate(
+        self,
+        destination: pathlib.Path,
+        source: pathlib.Path,
+        options: Iterable[str] = (),
+        config: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> list[GDALMessage]:
+        """Converts a raster dataset with `gdal.Translate`."""
+        def run(callback: Callable[..., int]) -> Any:
+            translate_options = gdal.TranslateOptions(options=list(options), callback=callback)
+            return gdal.Translate(str(destination), str(source), options=translate_options)
+
+        return self._run(f"Translate [{source}] to [{destination}]", run, config, timeout)
+
+    def build_overviews(
+        self,
+        path: pathlib.Path,
+        resampling: str,
+        levels: Iterable[int],
+        timeout: Optional[float] = None,
+    ) -> list[GDALMessage]:
+        """Adds overviews to a raster dataset with `BuildOverviews`."""
+        def run(callback: Callable[..., int]) -> Any:
+            dataset = gdal.Open(str(path), gdal.GA_Update)
+            if dataset is None:
+                return None
+            if dataset.BuildOverviews(resampling.upper(), list(levels), callback=callback) != 0:
+                return None
+            return dataset
+
+        return self._run(f"BuildOverviews of [{path}]", run, None, timeout)
+
+    def _run(
+        self,
+        description: str,
+        run: Callable[[Callable[..., int]], Any],
+        config: Optional[dict[str, str]],
+        timeout: Optional[float],
+    ) -> list[GDALMessage]:
+        """Runs a GDAL operation, capturing its messages.
+
+        Args:
+            description (str): Description of the operation, for messages.
+            run (Callable[[Callable[..., int]], Any]): Runs the operation with a
+                GDAL progress callback, returning the dataset or None on failure.
+            config (Optional[dict[str, str]]): GDAL configuration options.
+            timeout (Optional[float]): Seconds before the operation times out.
+
+        Raises:
+            ConversionCancelled: If the conversion is cancelled.
+            ConversionTimeout: If the operation times out.
+            ConversionError: If the operation fails.
+
+        Returns:
+            list[GDALMessage]: Warnings reported by GDAL.
+        """
+        # Log
+        log.info(f"Running GDAL in-process: {description}")
+
+        # Error Handler
+        messages: list[GDALMessage] = []
+
+        def handler(error_class: int, number: int, message: str) -> None:
+            messages.append(GDALMessage(ERROR_CLASSES.get(error_class, str(error_class)), number, message))
+
+        # Progress Callback, which also Stops the Operation
+        deadline = time.monotonic() + timeout if timeout else None
+        stopped: list[Exception] = []
+
+        def callback(complete: float, message: Optional[str], data: Any) -> int:
+            if self.cancel is not None and self.cancel.is_set():
+                stopped.append(ConversionCancelled(f"Cancelled {description}"))
+                return 0
+            if deadline is not None and time.monotonic() > deadline:
+                stopped.append(ConversionTimeout(f"{description} timed out after {timeout} seconds", messages))
+                return 0
+            if self.progress is not None:
+                self.progress(complete, message or "")
+            return 1
+
+        # Run Operation
+        previous = {key: gdal.GetThreadLocalConfigOption(key, None) for key in config or {}}
+        for key, value in (config or {}).items():
+            gdal.SetThreadLocalConfigOption(key, value)
+        gdal.PushErrorHandler(handler)
+        try:
+            dataset = run(callback)
+            failed = dataset is None
+            dataset = None  # Closes and Flushes the Dataset
+        except RuntimeError as exc:
+            # Raised instead of Returning None if GDAL Exceptions are Enabled
+            if not any(m.message == str(exc) for m in messages):
+                messages.append(GDALMessage(ERROR_CLASSES[3], 0, str(exc)))
+            failed = True
+        finally:
+            gdal.PopErrorHandler()
+            for key, value in previous.items():
+                gdal.SetThreadLocalConfigOption(key, value)
+
+        # Check Result
+        if stopped:
+            raise stopped[0]
+        if failed:
+            errors = [m for m in messages if m.level in (ERROR_CLASSES[3], ERROR_CLASSES[4])]
+            details = "\n".join(f"{m.level} {m.number}: {m.message}" for m in errors)
+            raise ConversionError(f"GDAL {description} failed.\n{details}", messages)
+
+        # Report Progress and Return
+        if self.progress is not None:
+            self.progress(1.0, "")
+        return messages
+
+
+# Engines by Name
+ENGINES: dict[str, type[Engine]] = {
+    SubprocessEngine.name: SubprocessEngine,
+    InProcessEngine.name: InProcessEngine,
+}
+
+
+def get_engine(engine: EngineType = None) -> Engine:
+    """Retrieves a conversion engine.
+
+    Args:
+        engine (EngineType): Engine, name of an engine, or None for the
+            default engine.
+
+    Raises:
+        ValueError: If there is no engine with the name.
+
+    Returns:
+        Engine: The conversion engine.
+    """
+    # Check Engine
+    if isinstance(engine, Engine):
+        return engine
+
+    # Instantiate Engine by Name
+    name = engine or DEFAULT_ENGINE
+    if name not in ENGINES:
+        raise ValueError(f"Unknown GIS conversion engine [{name}], must be one of {', '.join(ENGINES)}")
+    return ENGINES[name]()
+
+
+def _config_options(config: Optional[dict[str, str]]) -> list[str]:
+    """Constructs the command line arguments for GDAL configuration options.
+
+    Args:
+        config (Optional[dict[str, str]]): GDAL configuration options.
+
+    Returns:
+        list[str]: `--config` arguments for a GDAL command line utility.
+    """
+    return [arg for key, value in (config or {}).items() for arg in ("--config", key, value)]
+
+
+def _parse_stderr(stderr: Optional[str]) -> list[GDALMessage]:
+    """Parses the GDAL messages written to `stderr` by a command line utility.
+
+    Args:
+        stderr (Optional[str]): Output of the utility.
+
+    Returns:
+        list[GDALMessage]: Messages reported by GDAL.
+    """
+    messages = []
+    for line in (stderr or "").splitlines():
+        if match := STDERR_MESSAGE.match(line.strip()):
+            level = ERROR_CLASSES[3] if match[1] == "ERROR" else ERROR_CLASSES[2]
+            messages.append(GDALMessage(level, int(match[2]), match[3]))
+    return messages
@@ -0,0 +1,361 @@
+"""Streaming access to GeoJSON feature collections.
+
+Stored GeoJSON layers can be far larger than memory allows, so rather than
+`json.load`-ing them, the file is read in chunks and decoded one top-level
+member (and one feature) at a time. Features can then be filtered and
+paginated lazily, and re-serialised as a stream.
+"""
+
+
+# Standard
+import json
+import logging
+import pathlib
+
+# Typing
+from typing import Any, Iterable, Iterator, Optional
+
+
+# Logging
+logger = logging.getLogger(__name__)
+
+
+# Constants
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+
+# Type Aliases
+BBox = tuple[float, float, float, float]
+
+
+class FeatureCollectionReader:
+    """Incremental reader of a GeoJSON feature collection."""
+
+    def __init__(self, filepath: pathlib.Path, chunk_size: int = CHUNK_SIZE) -> None:
+        """Instantiates the Reader.
+
+        Args:
+            filepath (pathlib.Path): Path to the GeoJSON file.
+            chunk_size (int): Number of characters to read at a time.
+        """
+        # Instance Attributes
+        self.file = open(filepath, encoding="utf-8")  # noqa: SIM115
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self._members: Optional[dict[str, Any]] = None
+        self._has_features = False
+
+    def __enter__(self) -> "FeatureCollectionReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying file."""
+        self.file.close()
+
+    def members(self) -> dict[str, Any]:
+        """Reads the top-level members preceding the `features` array.
+
+        Only the members before `features` are returned (e.g. `type`, `name`
+        and `crs` as written by GDAL), so the features are never read.
+
+        Returns:
+            dict[str, Any]: Top-level members keyed on name.
+        """
+        # Check Cache
+        if self._members is not None:
+            return self._members
+
+        # Read Members
+        self._members = {}
+        self._expect("{")
+        while self._peek() not in ("}", ""):
+            key = self._value()
+            self._expect(":")
+            if key == "features":
+                self._expect("[")
+                self._has_features = True
+                break
+            self._members[key] = self._value()
+            if self._peek() == ",":
+                self._expect(",")
+
+        # Return
+        return self._members
+
+    def has_member(self, key: str) -> bool:
+        """Determines whether the collection has a top-level member.
+
+        The members before `features` are checked first. Only if the member is
+        not among them are the features skipped, one at a time, to check the
+        members after them. The reader is exhausted afterwards.
+
+        Args:
+            key (str): Name of the member.
+
+        Returns:
+            bool: Whether the member exists.
+        """
+        # Check Members before the Features
+        if key in self.members():
+            return True
+        if not self._has_features:
+            return False
+
+        # Skip Features
+        for _ in self.features():
+            pass
+        self._expect("]")
+
+        # Check Members after the Features
+        while self._peek() == ",":
+            self._expect(",")
+            name = self._value()
+            self._expect(":")
+            self._value()
+            if name == key:
+                return True
+
+        # Return
+        return False
+
+    def features(self) -> Iterator[dict[str, Any]]:
+        """Reads the features one at a time.
+
+        Yields:
+            dict[str, Any]: The next feature.
+        """
+        # Read Up to the Features Array
+        self.members()
+        if not self._has_features:
+            return
+
+        # Read Features
+        while self._peek() != "]":
+            yield self._value()
+            if self._peek() == ",":
+                self._expect(",")
+
+    def _fill(self) -> bool:
+        """Reads more of the file into the buffer.
+
+        The read size grows with the buffer, so decoding a single very large
+        feature does not re-parse the buffer a quadratic number of times.
+
+        Returns:
+            bool: Whether any more data was read.
+        """
+        # Read
+        data = self.file.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not data:
+            return False
+
+        # Discard Consumed Data and Return
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skips whitespace and returns the next character.
+
+        Returns:
+            str: The next character, or an empty string at the end of the file.
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def _expect(self, char: str) -> None:
+        """Consumes the expected next character.
+
+        Args:
+            char (str): The expected character.
+
+        Raises:
+            ValueError: If the next character is not the expected one.
+        """
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos} of GeoJSON file [{self.file.name}]")
+        self.pos += 1
+
+    def _value(self) -> Any:
+        """Decodes the next JSON value.
+
+        Returns:
+            Any: The decoded value.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Value is Truncated by the End of the Buffer
+                if not self._fill():
+                    raise
+                continue
+
+            # A Number at the End of the Buffer may be Truncated
+            if end == len(self.buffer) and self._fill():
+                continue
+
+            # Return
+            self.pos = end
+            return value
+
+
+def geometry_bounds(geometry: Optional[dict[str, Any]]) -> Optional[BBox]:
+    """Calculates the bounding box of a GeoJSON geometry.
+
+    Args:
+        geometry (Optional[dict[str, Any]]): The geometry.
+
+    Returns:
+        Optional[BBox]: The (min x, min y, max x, max y) bounds, or None if the
+            geometry is empty.
+    """
+    # Collect Positions
+    if not geometry:
+        return None
+    if geometry.get("type") == "GeometryCollection":
+        bounds = [b for g in geometry.get("geometries", []) if (b := geometry_bounds(g))]
+        if not bounds:
+            return None
+        return (
+            min(b[0] for b in bounds),
+            min(b[1] for b in bounds),
+            max(b[2] for b in bounds),
+            max(b[3] for b in bounds),
+        )
+    positions = list(_positions(geometry.get("coordinates")))
+    if not positions:
+        return None
+
+    # Return
+    xs = [p[0] for p in positions]
+    ys = [p[1] for p in positions]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _positions(coordinates: Any) -> Iterator[list[float]]:
+    """Flattens nested GeoJSON coordinates into positions.
+
+    Args:
+        coordinates (Any): Coordinates of a geometry.
+
+    Yields:
+        list[float]: Each position.
+    """
+    if not coordinates:
+        return
+    if isinstance(coordinates[0], (int, float)):
+        yield coordinates
+        return
+    for child in coordinates:
+        yield from _positions(child)
+
+
+def intersects_bbox(feature: dict[str, Any], bbox: BBox) -> bool:
+    """Determines whether a feature's bounds intersect a bounding box.
+
+    Args:
+        feature (dict[str, Any]): The feature.
+        bbox (BBox): The (min x, min y, max x, max y) bounding box.
+
+    Returns:
+        bool: Whether the feature's bounds intersect the bounding box.
+    """
+    # Use the Feature's own Bounding Box if it has One
+    bounds = feature.get("bbox")
+    if bounds and len(bounds) >= 4:
+        half = len(bounds) // 2
+        bounds = (bounds[0], bounds[1], bounds[half], bounds[half + 1])
+    else:
+        bounds = geometry_bounds(feature.get("geometry"))
+
+    # Check and Return
+    if bounds is None:
+        return False
+    return bounds[0] <= bbox[2] and bounds[2] >= bbox[0] and bounds[1] <= bbox[3] and bounds[3] >= bbox[1]
+
+
+def select_features(
+    features: Iterable[dict[str, Any]],
+    bbox: Optional[BBox] = None,
+    filters: Optional[dict[str, str]] = None,
+    properties: Optional[list[str]] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> Iterator[dict[str, Any]]:
+    """Lazily filters, paginates and trims features.
+
+    Reading stops as soon as `limit` features have been selected.
+
+    Args:
+        features (Iterable[dict[str, Any]]): Features to select from.
+        bbox (Optional[BBox]): Bounding box the features must intersect.
+        filters (Optional[dict[str, str]]): Property values the features must
+            equal, compared as strings.
+        properties (Optional[list[str]]): Properties to keep on each feature.
+        offset (int): Number of matching features to skip.
+        limit (Optional[int]): Maximum number of features to select.
+
+    Yields:
+        dict[str, Any]: Each selected feature.
+    """
+    # Check Limit
+    if limit is not None and limit <= 0:
+        return
+
+    selected = 0
+    for feature in features:
+        # Filter
+        feature_properties = feature.get("properties") or {}
+        if bbox is not None and not intersects_bbox(feature, bbox):
+            continue
+        if filters and any(str(feature_properties.get(k)) != v for k, v in filters.items()):
+            continue
+
+        # Paginate
+        if offset > 0:
+            offset -= 1
+            continue
+
+        # Trim Properties
+        if properties is not None:
+            feature = {**feature, "properties": {k: feature_properties[k] for k in properties if k in feature_properties}}
+
+        # Yield
+        yield feature
+        selected += 1
+        if limit is not None and selected >= limit:
+            return
+
+
+def dump_feature_collection(members: dict[str, Any], features: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """Serialises a feature collection as a stream of bytes.
+
+    Args:
+        members (dict[str, Any]): Top-level members to write before the features.
+        features (Iterable[dict[str, Any]]): Features to write.
+
+    Yields:
+        bytes: Successive parts of the GeoJSON document.
+    """
+    # Header
+    header = {"type": "FeatureCollection", **{k: v for k, v in members.items() if k != "type"}}
+    yield (json.dumps(header)[:-1] + ', "features": [\n').encode()
+
+    # Features
+    count = 0
+    for feature in features:
+        yield ((",\n" if count else "") + json.dumps(feature)).encode()
+        count += 1
+
+    # Footer
+    yield f'\n], "numberReturned": {count}}}\n'.encode()
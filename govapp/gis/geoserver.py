@@ -2,10 +2,14 @@
 
 
 # Standard
+import collections
+import concurrent.futures
 import json
 import logging
+import os
 import pathlib
 import requests
+import threading
 import time
 from django.template import loader
 
@@ -24,6 +28,266 @@ import xml.etree.ElementTree as ET # Import the XML parser
 # Logging
 log = logging.getLogger(__name__)
 
+# HTTP methods which are safe to send more than once
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Prefix of the SHA-256 recorded in the description of a coverage store
+COVERAGE_HASH_PREFIX = "sha256:"
+
+# Transport errors after which a request is retried
+RETRY_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+# Keep-alive HTTP clients shared by every GeoServer in this process, by URL
+# and credentials (see `shared_client()`)
+_clients: dict[tuple[str, str, str], httpx.Client] = {}
+_clients_pid: Optional[int] = None
+_clients_lock = threading.Lock()
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Transport which retries idempotent requests with exponential backoff.
+
+    Requests are retried on connection errors and 5xx responses. Non-idempotent
+    requests (e.g., POST) and requests with a streamed body are sent once.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        retries: int,
+        backoff: float,
+    ) -> None:
+        """Instantiates the Retry Transport.
+
+        Args:
+            transport (httpx.BaseTransport): Transport to send requests with.
+            retries (int): Maximum number of retries for a request.
+            backoff (float): Delay in seconds before the first retry, doubled
+                for each subsequent retry.
+        """
+        # Instance Attributes
+        self.transport = transport
+        self.retries = retries
+        self.backoff = backoff
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Sends a request, retrying it if applicable, and records its latency.
+
+        Args:
+            request (httpx.Request): Request to send.
+
+        Returns:
+            httpx.Response: Response to the final attempt.
+        """
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = self._handle_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            # Imported here, as the registry imports the ORM
+            from govapp.apps.metrics import registry
+            registry.GEOSERVER_REQUEST_DURATION.observe(time.perf_counter() - started, method=request.method, status=status)
+
+    def _handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Sends a request, retrying it if applicable.
+
+        Args:
+            request (httpx.Request): Request to send.
+
+        Returns:
+            httpx.Response: Response to the final attempt.
+        """
+        # Check whether the Request can be Retried
+        # A streamed body is consumed by the first attempt, so cannot be resent
+        retries = 0
+        if request.method in IDEMPOTENT_METHODS and isinstance(request.stream, httpx.ByteStream):
+            retries = self.retries
+
+        for attempt in range(retries + 1):
+            try:
+                # Send Request
+                response = self.transport.handle_request(request)
+
+            except RETRY_EXCEPTIONS as exc:
+                # Check Attempts
+                if attempt == retries:
+                    raise
+
+                # Log
+                log.warning(f"{request.method} {request.url} failed: [{exc!r}], retrying ({attempt + 1}/{retries})...")
+
+            else:
+                # Check Response
+                if response.status_code < 500 or attempt == retries:
+                    return response
+
+                # Release the Connection back to the Pool
+                response.close()
+
+                # Log
+                log.warning(f"{request.method} {request.url} returned {response.status_code}, retrying ({attempt + 1}/{retries})...")
+
+            # Backoff
+            time.sleep(self.backoff * 2 ** attempt)
+
+        # Unreachable, the final attempt either returns or raises
+        raise AssertionError("unreachable")
+
+    def close(self) -> None:
+        """Closes the underlying transport."""
+        # Close
+        self.transport.close()
+
+
+class StyleUsageIndex:
+    """Index of the styles used by each layer on a GeoServer."""
+
+    def __init__(self) -> None:
+        """Instantiates the Style Usage Index."""
+        # Instance Attributes
+        self.styles_by_layer: dict[str, set[str]] = {}
+        self.layers_by_style: dict[str, set[str]] = collections.defaultdict(set)
+
+    def set_layer(self, layer_name: str, styles: set[str]) -> None:
+        """Records the styles used by a layer, replacing any previous entry.
+
+        Args:
+            layer_name (str): Fully qualified name of the layer.
+            styles (set[str]): Names of the styles used by the layer.
+        """
+        # Replace Entry
+        self.remove_layer(layer_name)
+        self.styles_by_layer[layer_name] = set(styles)
+        for style in styles:
+            self.layers_by_style[style].add(layer_name)
+
+    def remove_layer(self, layer_name: str) -> set[str]:
+        """Removes a layer from the index.
+
+        Args:
+            layer_name (str): Fully qualified name of the layer.
+
+        Returns:
+            set[str]: Names of the styles the layer used.
+        """
+        # Remove Entry
+        styles = self.styles_by_layer.pop(layer_name, set())
+        for style in styles:
+            self.layers_by_style[style].discard(layer_name)
+            if not self.layers_by_style[style]:
+                del self.layers_by_style[style]
+
+        # Return
+        return styles
+
+    def used_styles(self) -> set[str]:
+        """Retrieves the names of all styles used by at least one layer.
+
+        Returns:
+            set[str]: Names of the used styles.
+        """
+        # Return
+        return set(self.layers_by_style)
+
+
+def _session() -> requests.Session:
+    """Constructs a requests session which records the latency of its responses.
+
+    Returns:
+        requests.Session: The session.
+    """
+    session = requests.Session()
+    session.hooks["response"].append(_observe_response)
+    return session
+
+
+def shared_client(url: str, username: str, password: str) -> httpx.Client:
+    """Retrieves the keep-alive HTTP client for a GeoServer.
+
+    GeoServer abstractions (and GeoServer Pools) are created afresh for most
+    operations, so the client is shared by every one with the same URL and
+    credentials rather than opened per instance. The clients are recreated in
+    forked child processes, so connections are never shared between processes.
+
+    Args:
+        url (str): URL to the GeoServer service.
+        username (str): Username for the GeoServer service.
+        password (str): Password for the GeoServer service.
+
+    Returns:
+        httpx.Client: Client with a connection pool, timeouts and retries.
+    """
+    global _clients_pid
+    key = (url.rstrip("/"), username, password)
+    with _clients_lock:
+        # Forget Clients Inherited from a Parent Process
+        if _clients_pid != os.getpid():
+            _clients.clear()
+            _clients_pid = os.getpid()
+
+        # Check for an Existing Client
+        if key in _clients:
+            return _clients[key]
+
+        # Construct Client
+        _clients[key] = httpx.Client(
+            auth=(username, password),
+            timeout=httpx.Timeout(
+                conf.settings.GEOSERVER_READ_TIMEOUT,
+                connect=conf.settings.GEOSERVER_CONNECT_TIMEOUT,
+            ),
+            transport=RetryTransport(
+                transport=httpx.HTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=conf.settings.GEOSERVER_MAX_CONNECTIONS,
+                        max_keepalive_connections=conf.settings.GEOSERVER_MAX_CONNECTIONS,
+                    ),
+                ),
+                retries=conf.settings.GEOSERVER_MAX_RETRIES,
+                backoff=conf.settings.GEOSERVER_RETRY_BACKOFF,
+            ),
+        )
+
+        # Return
+        return _clients[key]
+
+
+def close_clients() -> None:
+    """Closes the HTTP clients shared by the GeoServers in this process."""
+    # Close Clients
+    with _clients_lock:
+        if _clients_pid == os.getpid():
+            for client in _clients.values():
+                client.close()
+        _clients.clear()
+
+
+def _observe_response(response: requests.Response, *args: Any, **kwargs: Any) -> None:
+    """Records the latency of a response from GeoServer.
+
+    Args:
+        response (requests.Response): The response.
+        *args (Any): Unused positional arguments from requests.
+        **kwargs (Any): Unused keyword arguments from requests.
+    """
+    # Imported here, as the registry imports the ORM
+    from govapp.apps.metrics import registry
+
+    # Record
+    registry.GEOSERVER_REQUEST_DURATION.observe(
+        response.elapsed.total_seconds(),
+        method=response.request.method,
+        status=str(response.status_code),
+    )
+
 
 class GeoServer:
     """GeoServer Abstraction."""
@@ -48,7 +312,42 @@ class GeoServer:
 
         # Strip Trailing Slash from Service URL
         self.service_url = self.service_url.rstrip("/")
-    
+
+        # Style Usage Index (built on first use)
+        self._style_index: Optional[StyleUsageIndex] = None
+
+    def __enter__(self) -> "GeoServer":
+        """Enters a block using this GeoServer.
+
+        Returns:
+            GeoServer: This instance.
+        """
+        # Return
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exits a block using this GeoServer."""
+        # Close
+        self.close()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Keep-alive HTTP client shared by every request to this GeoServer.
+
+        Returns:
+            httpx.Client: Client with a connection pool, timeouts and retries.
+        """
+        # Return
+        return shared_client(self.service_url, self.username, self.password)
+
+    def close(self) -> None:
+        """Releases this GeoServer's HTTP client.
+
+        The client is shared with every other GeoServer with the same URL and
+        credentials in this process, so it is kept open for them. Use
+        `close_clients()` to close every shared client.
+        """
+
     @property
     def auth(self):
         return (self.username, self.password)
@@ -66,9 +365,8 @@ class GeoServer:
         log.info(f'Creating/Updating the cached layer... url: [{url}]')
         
         template = loader.get_template('govapp/geoserver/gwc_layer_setting.xml')
-        response = httpx.put(
+        response = self.client.put(
             url=url,
-            auth=(self.username, self.password),
             headers={'content-type':'text/xml'},
             data=template.render({
                 'layer_name': layer_name,
@@ -98,8 +396,7 @@ class GeoServer:
 
         # Check if Store Exists
         log.info(f'Checking if the store exists...')
-        with httpx.Client(auth=(self.username, self.password)) as client:
-            response = client.get(store_get_url, headers=self.headers_json)
+        response = self.client.get(store_get_url, headers=self.headers_json)
 
         # data = data.replace('\n', '')
         # Decide whether to perform a POST or PUT request based on the existence of the store
@@ -110,15 +407,13 @@ class GeoServer:
             log.info(f'Store: [{store_name}] does not exist. Performing POST request to create the store.')
             log.info(f'POST url: {url}')
             log.info(f'data: {data}')
-            with httpx.Client(auth=(self.username, self.password)) as client:
-                response = client.post(url=url, headers=self.headers_json, data=data)
+            response = self.client.post(url=url, headers=self.headers_json, data=data)
         else:
             # Store exists, perform a PUT request
             log.info(f'Store: [{store_name}] exists. Performing PUT request to update the store.')
             log.info(f'PUT url: {store_get_url}')
             log.info(f'data: {data}')
-            with httpx.Client(auth=(self.username, self.password)) as client:
-                response = client.put(url=store_get_url, headers=self.headers_json, data=data)
+            response = self.client.put(url=store_get_url, headers=self.headers_json, data=data)
             
         return response
 
@@ -156,7 +451,7 @@ class GeoServer:
         datastore_url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{store_name}.json"
 
         try:
-            with requests.Session() as session:
+            with _session() as session:
                 session.auth = (self.username, self.password)
                 headers = {'Content-type': 'application/json', 'Accept': 'application/json'}
 
@@ -251,7 +546,7 @@ class GeoServer:
         file_size = filepath.stat().st_size
         log.info(f"File size: {file_size / (1024*1024):.2f} MB")
 
-        with requests.Session() as session:
+        with _session() as session:
             # Perform streaming upload
             try:
                 response = session.put(
@@ -323,23 +618,95 @@ class GeoServer:
                     log.warning(f"File was uploaded successfully, but failed to update memory map size for store [{layer}]. Please check manually. Error: {e}")
             # --- END: DATATORE CONFIGURATION UPDATE STEP ---
 
+    def _coverage_is_current(self, workspace: str, layer: str, sha256: Optional[str]) -> bool:
+        """Determines whether a published coverage already has the given contents.
+
+        The SHA-256 of a published GeoTIFF is recorded in the description of its
+        coverage store, so unchanged rasters do not have to be republished.
+
+        Args:
+            workspace (str): GeoServer workspace name.
+            layer (str): Coverage store and layer name.
+            sha256 (Optional[str]): SHA-256 of the GeoTIFF to publish.
+
+        Returns:
+            bool: Whether the coverage store and layer exist with the same contents.
+        """
+        # Check Hash
+        if not sha256:
+            return False
+
+        with _session() as session:
+            session.auth = (self.username, self.password)
+
+            # Check Coverage Store
+            store_url = f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{layer}.json"
+            response = session.get(store_url, timeout=(15, 60))
+            if response.status_code != 200:
+                return False
+            if response.json().get("coverageStore", {}).get("description") != f"{COVERAGE_HASH_PREFIX}{sha256}":
+                return False
+
+            # Check Layer
+            response = session.get(f"{self.service_url}/rest/layers/{workspace}:{layer}.json", timeout=(15, 60))
+
+        # Return
+        return response.status_code == 200
+
+    def _set_coverage_hash(self, workspace: str, layer: str, sha256: Optional[str]) -> None:
+        """Records the SHA-256 of a published GeoTIFF on its coverage store.
+
+        Args:
+            workspace (str): GeoServer workspace name.
+            layer (str): Coverage store and layer name.
+            sha256 (Optional[str]): SHA-256 of the published GeoTIFF.
+        """
+        # Check Hash
+        if not sha256:
+            return
+
+        # Update Description
+        with _session() as session:
+            response = session.put(
+                url=f"{self.service_url}/rest/workspaces/{workspace}/coveragestores/{layer}.json",
+                json={"coverageStore": {"description": f"{COVERAGE_HASH_PREFIX}{sha256}"}},
+                auth=(self.username, self.password),
+                timeout=(15, 60),
+            )
+            if not response.ok:
+                # The upload itself succeeded, so only the next skip is lost
+                log.warning(f"Failed to record the hash of coverage store '{layer}': [{response.status_code}]: [{response.text}]")
+
     @handle_http_exceptions(log)
     def upload_tif(
         self,
         workspace: str,
         layer: str,
         filepath: pathlib.Path,
-        chunk_size: Optional[int] = 1024 * 1024  # 1MB chunks by default
-    ) -> None:
+        chunk_size: Optional[int] = 1024 * 1024,  # 1MB chunks by default
+        sha256: Optional[str] = None,
+    ) -> bool:
         """Uploads a GeoTIFF file. It forcefully attempts to clean up any pre-existing 
-        resources (layer and store) before uploading, ignoring 404 errors on delete."""
+        resources (layer and store) before uploading, ignoring 404 errors on delete.
+
+        If `sha256` is given and the published coverage already has the same
+        contents, nothing is deleted or uploaded.
+
+        Returns:
+            bool: Whether the GeoTIFF was uploaded.
+        """
         log.info(f"Preparing to upload GeoTiff '{filepath.name}' as resource '{layer}' in workspace '{workspace}'")
 
+        # Skip Unchanged Rasters
+        if self._coverage_is_current(workspace, layer, sha256):
+            log.info(f"Coverage store '{layer}' already has the contents of '{filepath.name}'; skipping upload.")
+            return False
+
         # --- START: FORCEFUL PRE-FLIGHT CLEANUP ---
         # This approach attempts to delete both layer and store, ignoring 'Not Found' errors.
         # This is more robust against inconsistencies where GET might fail but the resource exists.
         try:
-            with requests.Session() as session:
+            with _session() as session:
                 session.auth = (self.username, self.password)
 
                 # Define URLs for both the layer and the store
@@ -388,7 +755,7 @@ class GeoServer:
         # The rest of the function (the PUT request) remains identical to your current version.
         # ... (your existing try/except block for the PUT request) ...
         try:
-            with requests.Session() as session:
+            with _session() as session:
                 response = session.put(
                     url=upload_url,
                     data=self._stream_file(filepath, chunk_size),
@@ -401,6 +768,7 @@ class GeoServer:
                 log.info(f"GeoServer response: [{response.status_code}]: [{response.text}]")
                 response.raise_for_status()
                 log.info(f"Successfully uploaded GeoTIFF and created resource '{layer}'.")
+            self._set_coverage_hash(workspace, layer, sha256)
         except requests.exceptions.HTTPError as e:
             log.error(
                 f"HTTP Error during upload for store '{layer}'. "
@@ -411,6 +779,9 @@ class GeoServer:
             log.error(f"An unexpected error occurred during upload for store '{layer}'. Details: {e}")
             raise
 
+        # Return
+        return True
+
     def _build_file_url(
         self,
         file_path: pathlib.Path,
@@ -482,7 +853,7 @@ class GeoServer:
         )
 
         try:
-            with requests.Session() as session:
+            with _session() as session:
                 session.auth = (self.username, self.password)
 
                 log.info(f"Attempting to delete layer (if it exists): {layer_delete_url}")
@@ -546,7 +917,7 @@ class GeoServer:
             }
         }
 
-        with requests.Session() as session:
+        with _session() as session:
             session.auth = (self.username, self.password)
 
             # Step 1: create the datastore (just writes catalog config, no file I/O).
@@ -595,7 +966,8 @@ class GeoServer:
         layer: str,
         file_path_on_volume: pathlib.Path,
         geoserver_data_dir: Optional[pathlib.Path] = None,
-    ) -> None:
+        sha256: Optional[str] = None,
+    ) -> bool:
         """Configures a GeoTIFF coveragestore in GeoServer using a file already present on the
         shared Docker volume (no HTTP file upload).
 
@@ -611,12 +983,22 @@ class GeoServer:
             geoserver_data_dir: GeoServer data directory root. When provided and the file
                 is under this directory, uses ``file:data/<relative>`` URL format to bypass
                 the GeoServer 2.23+ filesystem sandbox canonical-path check on SMB mounts.
+            sha256: SHA-256 of the GeoTIFF. If the configured coverage already has the same
+                contents, the store is left as it is.
+
+        Returns:
+            bool: Whether the coveragestore was (re)configured.
         """
         log.info(
             f"Configuring GeoTIFF store '{layer}' in workspace '{workspace}' "
             f"from volume path '{file_path_on_volume}'"
         )
 
+        # Skip Unchanged Rasters
+        if self._coverage_is_current(workspace, layer, sha256):
+            log.info(f"Coverage store '{layer}' already has the contents of '{file_path_on_volume.name}'; skipping.")
+            return False
+
         # Pre-flight cleanup: delete any stale layer and coveragestore so that
         # creation of the new store is not blocked by an existing resource.
         layer_delete_url = f"{self.service_url}/rest/layers/{workspace}:{layer}"
@@ -626,7 +1008,7 @@ class GeoServer:
         )
 
         try:
-            with requests.Session() as session:
+            with _session() as session:
                 session.auth = (self.username, self.password)
 
                 log.info(f"Attempting to delete layer (if it exists): {layer_delete_url}")
@@ -676,6 +1058,7 @@ class GeoServer:
                 "enabled": True,
                 "workspace": {"name": workspace},
                 "url": file_url,
+                **({"description": f"{COVERAGE_HASH_PREFIX}{sha256}"} if sha256 else {}),
             }
         }
         # nativeName must match the GeoTIFF's internal coverage name, which GeoServer
@@ -688,7 +1071,7 @@ class GeoServer:
             }
         }
 
-        with requests.Session() as session:
+        with _session() as session:
             session.auth = (self.username, self.password)
 
             # Step 1: create the coverage store (just writes catalog config, no file I/O).
@@ -721,6 +1104,9 @@ class GeoServer:
                     response=resp_coverage,
                 )
 
+        # Return
+        return True
+
     @handle_http_exceptions(log)
     def create_layer_from_coveragestore(self, workspace: str, layer: str) -> None:
         """
@@ -760,11 +1146,10 @@ class GeoServer:
         layers_url = f"{self.service_url}/rest/layers/{workspace}:{layer}.json"
 
         # Perform POST request to create the layer
-        response = httpx.put(
+        response = self.client.put(
             url=layers_url,
             content=json.dumps(response_data),
             headers=self.headers_json,
-            auth=(self.username, self.password),
             timeout=3000.0
         )
 
@@ -821,23 +1206,19 @@ class GeoServer:
 
             # Check if Layer Exists
             log.info(f'Checking if the layer exists...')
-            response = httpx.get(
+            response = self.client.get(
                 url=layer_get_url+"",
-                auth=(self.username, self.password),
                 headers=self.headers_json,
-                timeout=120.0
             )
 
             log.info(f'Response of the check: { response.status_code }: { response.text }')
 
             if response.status_code == 200:
                 log.info(f"Layer: {layer_name} exists.  Delete it...")
-                response = httpx.delete(
+                response = self.client.delete(
                     url=layer_get_url+"?recurse=true",
-                    auth=(self.username, self.password),
                     #data=xml_data,
                     headers=self.headers_json,
-                    timeout=120.0
                 )
             else:
                 log.info(f'Layer: {layer_name} does not exist.')
@@ -848,9 +1229,8 @@ class GeoServer:
             log.info(f'Creat the layer by post request...')
             log.info(f'Post url: { url }')
             log.info(f'data: {xml_data}')
-            response = httpx.post(
+            response = self.client.post(
                 url=url,
-                auth=(self.username, self.password),
                 data=xml_data,
                 headers=self.headers_json,
                 timeout=3000
@@ -966,21 +1346,17 @@ class GeoServer:
         layer_get_url = f"{self.service_url}/rest/workspaces/{workspace}/datastores/{store_name}/featuretypes/{layer_name}"
 
         # Check if Layer Exists
-        response = httpx.get(
+        response = self.client.get(
             url=layer_get_url,
-            auth=(self.username, self.password),
             headers=self.headers_json,
-            timeout=120.0
         )
         log.info(f'Layer existence check response: {response.status_code}')
 
         if response.status_code == 200:
             log.info(f'Layer: [{layer_name}] exists. Deleting for re-creation...')
-            delete_response = httpx.delete(
+            delete_response = self.client.delete(
                 url=layer_get_url+"?recurse=true",
-                auth=(self.username, self.password),
                 headers=self.headers_json,
-                timeout=120.0
             )
             log.info(f'Delete response: {delete_response.status_code}: {delete_response.text}')
             delete_response.raise_for_status()
@@ -992,11 +1368,9 @@ class GeoServer:
                 f'{response.status_code}: {response.text}. '
                 f'Attempting delete anyway to avoid "already exists" conflict.'
             )
-            delete_response = httpx.delete(
+            delete_response = self.client.delete(
                 url=layer_get_url+"?recurse=true",
-                auth=(self.username, self.password),
                 headers=self.headers_json,
-                timeout=120.0
             )
             log.info(f'Delete response: {delete_response.status_code}: {delete_response.text}')
             # 404 is acceptable (layer did not exist); anything else that is an error should raise
@@ -1009,9 +1383,8 @@ class GeoServer:
         log.info(f'Create the layer by post request...')
         log.info(f'Post url: { url }')
         log.info(f'Post data: {data_in_json}')
-        response = httpx.post(
+        response = self.client.post(
             url=url,
-            auth=(self.username, self.password),
             data=data_in_json,
             headers=self.headers_json,
             timeout=300.0
@@ -1058,7 +1431,7 @@ class GeoServer:
                 url = f"{self.service_url}/rest/workspaces/{workspace}/styles{parameters}"
 
                 # Perform Request
-                response = httpx.post(
+                response = self.client.post(
                     url=url,
                     json={
                         "style": {
@@ -1066,8 +1439,6 @@ class GeoServer:
                             "filename": f"{style_name}.sld"
                         }
                     },
-                    auth=(self.username, self.password),
-                    timeout=120.0
                 )
 
                 # Log
@@ -1083,12 +1454,10 @@ class GeoServer:
             url = f"{self.service_url}/rest/workspaces/{workspace}/styles/{style_name}.xml{parameters}"
 
             # Perform Request
-            response = httpx.put(
+            response = self.client.put(
                 url=url,
                 content=new_sld,
                 headers={"Content-Type": "application/vnd.ogc.sld+xml"},
-                auth=(self.username, self.password),
-                timeout=120.0
             )
 
             # Log
@@ -1123,10 +1492,8 @@ class GeoServer:
         url = f"{self.service_url}/rest/workspaces/{workspace}/styles/{name}.sld"
 
         # Perform Request
-        response = httpx.get(
+        response = self.client.get(
             url=url,
-            auth=(self.username, self.password),
-            timeout=120.0
         )
 
         # Log
@@ -1162,9 +1529,8 @@ class GeoServer:
         
         try:
             log.info(f"Fetching current layer details from: {get_url}")
-            get_response = httpx.get(
+            get_response = self.client.get(
                 url=get_url,
-                auth=(self.username, self.password),
                 timeout=30.0
             )
             get_response.raise_for_status()
@@ -1194,16 +1560,19 @@ class GeoServer:
             log.info(f"Putting updated layer configuration to: {put_url}")
             log.debug(f"Updated XML Payload: {updated_xml_content}") # For debugging
 
-            put_response = httpx.put(
+            put_response = self.client.put(
                 url=put_url,
                 content=updated_xml_content,
                 headers={"Content-Type": "application/xml"},
-                auth=(self.username, self.password),
-                timeout=120.0
             )
             put_response.raise_for_status()
             log.info(f"Successfully set default style '{style_name}' for layer '{layer_name}'.")
 
+            # Keep the style usage index (if already built) in step with the new style.
+            if self._style_index is not None:
+                styles = {name.text for name in tree.findall('defaultStyle/name') + tree.findall('styles/style/name') if name.text}
+                self._style_index.set_layer(f"{workspace_name}:{layer_name}", styles)
+
         except httpx.HTTPStatusError as e:
             # Provide more context on HTTP errors
             error_text = e.response.text
@@ -1234,13 +1603,11 @@ class GeoServer:
         url = "{0}/ogc/styles/styles".format(self.service_url)
 
         # Perform Request
-        response = httpx.post(
+        response = self.client.post(
             url=url,
-            auth=(self.username, self.password),
             content=sld,
             params={"validate": "only"},
             headers={"Content-Type": "application/vnd.ogc.se+xml"},
-            timeout=120.0
         )
 
         # Log
@@ -1269,11 +1636,9 @@ class GeoServer:
         url = "{0}/rest/layers".format(self.service_url)
 
         # Perform Request
-        response = httpx.get(
+        response = self.client.get(
             url=url,
-            auth=(self.username, self.password),
             headers=self.headers_json,
-            timeout=120.0
         )
         
         # Check Response
@@ -1309,11 +1674,9 @@ class GeoServer:
         url = f"{self.service_url}/rest/layers/{layer_name}"
         
         # Perform Request
-        response = httpx.get(
+        response = self.client.get(
             url=url,
-            auth=(self.username, self.password),
             headers=self.headers_json,
-            timeout=120.0
         )
 
         # Check Response
@@ -1328,6 +1691,43 @@ class GeoServer:
         # return json_response['layer']
         return json_response
 
+    @handle_http_exceptions(log)
+    def probe_layer_rendering(self, layer_name: str) -> None:
+        """Renders a tiny map of a layer, to check GeoServer can read its data.
+
+        Args:
+            layer_name (str): The name of the layer to render.
+
+        Raises:
+            ValueError: If GeoServer does not return an image, e.g. it returns
+                a WMS service exception.
+        """
+        # Log
+        log.info(f'Probing rendering of layer: [{layer_name}] on GeoServer: [{self.service_url}]')
+
+        # Perform Request
+        response = self.client.get(
+            url=f"{self.service_url}/wms",
+            params={
+                "service": "WMS",
+                "version": "1.1.1",
+                "request": "GetMap",
+                "layers": layer_name,
+                "styles": "",
+                "bbox": "-180,-90,180,90",
+                "srs": "EPSG:4326",
+                "width": 8,
+                "height": 8,
+                "format": "image/png",
+            },
+        )
+
+        # Check Response
+        # GeoServer reports WMS errors as a service exception with a 200 status
+        response.raise_for_status()
+        if not response.headers.get("Content-Type", "").startswith("image/"):
+            raise ValueError(f"GetMap for layer [{layer_name}] did not return an image: {response.text[:500]}")
+
     @handle_http_exceptions(log)
     def delete_layer(self, layer_name) -> None:
         try:
@@ -1342,16 +1742,9 @@ class GeoServer:
                 return
             
             layer_data = layer_details_response['layer']
-            styles_to_check = set()
 
-            # Check for the default style and add it to my set.
-            if 'defaultStyle' in layer_data and 'name' in layer_data['defaultStyle']:
-                styles_to_check.add(layer_data['defaultStyle']['name'])
-            
-            # Also check for any other associated styles.
-            if 'styles' in layer_data and 'style' in layer_data.get('styles', {}):
-                for style in layer_data['styles']['style']:
-                    styles_to_check.add(style['name'])
+            # Check for the default style and any other associated styles.
+            styles_to_check = self._layer_styles(layer_data)
 
             log.info(f"Layer [{layer_name}] uses the following styles: {list(styles_to_check)}. check them for cleanup after deletion.")
             # --- END PRE-DELETION ---
@@ -1376,11 +1769,9 @@ class GeoServer:
                     f"/datastores/{store_name}/featuretypes/{ft_name}?recurse=true"
                 )
                 log.info(f"Deleting featuretype [{ft_name}] from store [{store_name}] (recurse=true removes layer too)...")
-                response = httpx.delete(
+                response = self.client.delete(
                     url=featuretype_delete_url,
-                    auth=(self.username, self.password),
                     headers=self.headers_json,
-                    timeout=120.0
                 )
                 response.raise_for_status()
                 log.info(f"Featuretype [{ft_name}] deleted successfully.")
@@ -1390,11 +1781,9 @@ class GeoServer:
                     f"{self.service_url}/rest/workspaces/{workspace_name}"
                     f"/datastores/{store_name}/featuretypes.json"
                 )
-                ft_list_response = httpx.get(
+                ft_list_response = self.client.get(
                     url=store_ft_url,
-                    auth=(self.username, self.password),
                     headers=self.headers_json,
-                    timeout=120.0
                 )
                 remaining = []
                 if ft_list_response.status_code == 200:
@@ -1407,11 +1796,9 @@ class GeoServer:
                         f"/datastores/{store_name}?recurse=true"
                     )
                     log.info(f"Store [{store_name}] is now empty. Deleting store...")
-                    response = httpx.delete(
+                    response = self.client.delete(
                         url=store_delete_url,
-                        auth=(self.username, self.password),
                         headers=self.headers_json,
-                        timeout=120.0
                     )
                     response.raise_for_status()
                     log.info(f"Store [{store_name}] deleted successfully.")
@@ -1429,11 +1816,9 @@ class GeoServer:
                     f"/coveragestores/{store_name}/coverages/{coverage_name}?recurse=true"
                 )
                 log.info(f"Deleting coverage [{coverage_name}] from store [{store_name}]...")
-                response = httpx.delete(
+                response = self.client.delete(
                     url=coverage_delete_url,
-                    auth=(self.username, self.password),
                     headers=self.headers_json,
-                    timeout=120.0
                 )
                 response.raise_for_status()
                 log.info(f"Coverage [{coverage_name}] deleted successfully.")
@@ -1444,11 +1829,9 @@ class GeoServer:
                     f"/coveragestores/{store_name}?recurse=true"
                 )
                 log.info(f"Deleting coveragestore [{store_name}]...")
-                response = httpx.delete(
+                response = self.client.delete(
                     url=store_delete_url,
-                    auth=(self.username, self.password),
                     headers=self.headers_json,
-                    timeout=120.0
                 )
                 response.raise_for_status()
                 log.info(f"Coveragestore [{store_name}] deleted successfully.")
@@ -1460,23 +1843,25 @@ class GeoServer:
                     f"Falling back to deleting layer only via /rest/layers/{layer_name}."
                 )
                 layer_delete_url = f"{self.service_url}/rest/layers/{layer_name}"
-                response = httpx.delete(
+                response = self.client.delete(
                     url=layer_delete_url,
-                    auth=(self.username, self.password),
                     headers=self.headers_json,
-                    timeout=120.0
                 )
                 response.raise_for_status()
                 log.info(f"Layer [{layer_name}] deleted (fallback path).")
             # --- END: EXECUTION: DELETE FEATURETYPE ---
 
+            # Keep the style usage index (if already built) in step with the deletion.
+            if self._style_index is not None:
+                self._style_index.remove_layer(layer_data.get('resource', {}).get('name') or layer_name)
+
             # --- POST-DELETION: CLEANUP STYLES ---
             if not styles_to_check:
                 log.info("No styles were associated with the deleted layer. Cleanup is not needed.")
                 return
 
             log.info("Checking for orphaned styles...")
-            # get a fresh list of all styles that are still in use.
+            # get the styles that are still in use (from the index, built once per instance).
             all_currently_used_styles = self.get_used_styles()
 
             # must not delete the built-in styles by accident.
@@ -1505,36 +1890,92 @@ class GeoServer:
     def get_used_styles(self) -> set[str]:
         """
         Get a set of all style names currently used by any layer.
+
+        The style usage index is built on the first call and then kept up to date
+        as layers are deleted or restyled through this instance, so it can be
+        reused for the rest of a sync run.
+        """
+        # Return
+        return self.get_style_index().used_styles()
+
+    def get_style_index(self) -> StyleUsageIndex:
+        """Retrieves the style usage index, building it if required.
+
+        Layer details are retrieved concurrently, bounded by the size of the
+        connection pool.
+
+        Returns:
+            StyleUsageIndex: Index of the styles used by each layer.
         """
+        # Check for an Existing Index
+        if self._style_index is not None:
+            return self._style_index
+
         log.info("Checking all layers to determine which styles are in use...")
-        used_styles = set()
-        
+        index = StyleUsageIndex()
+
         # First, get a list of all layers.
         layers = self.get_layers()
         if not layers:
             log.info("No layers found in GeoServer.")
-            return used_styles
-        
-        # Iterate through each layer to get its details.
-        for layer_item in layers:
-            layer_name = layer_item['name']
-            
+        else:
+            layer_names = [layer_item['name'] for layer_item in layers]
+
+            # Retrieve the details of every layer concurrently.
+            max_workers = max(1, min(conf.settings.GEOSERVER_MAX_CONNECTIONS, len(layer_names)))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for layer_name, styles in zip(layer_names, executor.map(self._get_layer_styles, layer_names)):
+                    if styles is not None:
+                        index.set_layer(layer_name, styles)
+
+        log.info(f"Found {len(index.used_styles())} styles currently in use by {len(index.styles_by_layer)} layers.")
+        self._style_index = index
+        return index
+
+    def _get_layer_styles(self, layer_name: str) -> Optional[set[str]]:
+        """Retrieves the styles used by a layer.
+
+        Args:
+            layer_name (str): Name of the layer.
+
+        Returns:
+            Optional[set[str]]: Names of the styles, or None if the layer no
+                longer exists.
+        """
+        try:
             details_data = self.get_layer_details(layer_name)
-            
-            if details_data and 'layer' in details_data:
-                layer = details_data['layer']
-                
-                # Add the layer's default style.
-                if 'defaultStyle' in layer and 'name' in layer['defaultStyle']:
-                    used_styles.add(layer['defaultStyle']['name'])
-                
-                # Also add any alternate styles associated with the layer.
-                if 'styles' in layer and 'style' in layer.get('styles', {}):
-                    for style in layer['styles']['style']:
-                        used_styles.add(style['name'])
+        except httpx.HTTPStatusError as e:
+            # The layer may have been deleted since the layers were listed.
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        if details_data and 'layer' in details_data:
+            return self._layer_styles(details_data['layer'])
+        return None
+
+    @staticmethod
+    def _layer_styles(layer_data: dict) -> set[str]:
+        """Extracts the default and alternate style names from layer details.
+
+        Args:
+            layer_data (dict): The 'layer' object of the layer details.
+
+        Returns:
+            set[str]: Names of the styles used by the layer.
+        """
+        styles = set()
+
+        # Add the layer's default style.
+        if 'name' in (layer_data.get('defaultStyle') or {}):
+            styles.add(layer_data['defaultStyle']['name'])
+
+        # Also add any alternate styles (a single style is not wrapped in a list).
+        alternates = (layer_data.get('styles') or {}).get('style') or []
+        for style in alternates if isinstance(alternates, list) else [alternates]:
+            styles.add(style['name'])
 
-        log.info(f"Found {len(used_styles)} styles currently in use.")
-        return used_styles
+        return styles
 
     @handle_http_exceptions(log)
     def get_layer_group(self, workspace: str, name: str) -> Optional[dict]:
@@ -1551,11 +1992,9 @@ class GeoServer:
         url = f"{self.service_url}/rest/workspaces/{workspace}/layergroups/{name}"
         log.info(f"Retrieving layer group '{workspace}:{name}' from GeoServer: [{self.service_url}]")
 
-        response = httpx.get(
+        response = self.client.get(
             url=url,
-            auth=self.auth,
             headers=self.headers_json,
-            timeout=120.0,
         )
 
         if response.status_code == 404:
@@ -1632,12 +2071,10 @@ class GeoServer:
         log.info(f"Creating layer group '{workspace}:{name}' in GeoServer: [{self.service_url}]")
         log.debug(f"Payload: {payload}")
 
-        response = httpx.post(
+        response = self.client.post(
             url=url,
-            auth=self.auth,
             headers=self.headers_json,
             content=payload,
-            timeout=120.0,
         )
 
         response.raise_for_status()
@@ -1667,12 +2104,10 @@ class GeoServer:
         log.info(f"Updating layer group '{workspace}:{name}' in GeoServer: [{self.service_url}]")
         log.debug(f"Payload: {payload}")
 
-        response = httpx.put(
+        response = self.client.put(
             url=url,
-            auth=self.auth,
             headers=self.headers_json,
             content=payload,
-            timeout=120.0,
         )
 
         response.raise_for_status()
@@ -1689,10 +2124,8 @@ class GeoServer:
         url = f"{self.service_url}/rest/workspaces/{workspace}/layergroups/{name}"
         log.info(f"Deleting layer group '{workspace}:{name}' from GeoServer: [{self.service_url}]")
 
-        response = httpx.delete(
+        response = self.client.delete(
             url=url,
-            auth=self.auth,
-            timeout=120.0,
         )
 
         response.raise_for_status()
@@ -1707,10 +2140,8 @@ class GeoServer:
         log.info(f"Deleting style: [{style_name}] from the GeoServer: [{self.service_url}]...")
         url = f"{self.service_url}/rest/styles/{style_name}?purge={str(purge).lower()}"
         
-        response = httpx.delete(
+        response = self.client.delete(
             url=url,
-            auth=self.auth,
-            timeout=120.0
         )
         response.raise_for_status()
         log.info(f"Successfully deleted style: [{style_name}] from the geoserver: [{self.service_url}].")
@@ -4,8 +4,8 @@
 # Standard
 import pathlib
 import logging
-import json
 
+from govapp.gis import features
 from govapp.gis import utils
 
 # Local
@@ -49,9 +49,13 @@ class GeoJSONReader(base.LayerReader):
 
     @classmethod
     def name_property_exists(cls, geojson_file):
-        with open(geojson_file) as f:
-            data = json.load(f)
-            if 'name' in data:
+        """Determines whether the GeoJSON file has a top level 'name' property.
+
+        The file is parsed incrementally, stopping as soon as the property is
+        found, so the features are not loaded into memory.
+        """
+        with features.FeatureCollectionReader(pathlib.Path(geojson_file)) as reader:
+            if reader.has_member('name'):
                 return True
             msg = f'The GeoJSON file does not have a \'name\' property at the top level: [{geojson_file}].  The \'name\' property is used as a catalogue entry name.'
             logger.error(msg)
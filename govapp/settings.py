@@ -59,6 +59,7 @@ INSTALLED_APPS = [
     "govapp.apps.catalogue",
     "govapp.apps.emails",
     "govapp.apps.logs",
+    "govapp.apps.metrics",
     "govapp.apps.publisher",
     "govapp.apps.swagger",
     "rest_framework",
@@ -284,6 +285,11 @@ SHAREPOINT_OUTPUT_PUBLISH_AREA = decouple.config("SHAREPOINT_OUTPUT_PUBLISH_AREA
 AZURE_OUTPUT_SYNC_DIRECTORY = decouple.config("AZURE_OUTPUT_SYNC_DIRECTORY", default="sync")
 if not os.path.exists(AZURE_OUTPUT_SYNC_DIRECTORY):
     os.mkdir(AZURE_OUTPUT_SYNC_DIRECTORY)
+# The CDDP contents listing is served from an index of AZURE_OUTPUT_SYNC_DIRECTORY, refreshed
+# incrementally (only directories whose modification time changed are listed) at most every
+# CDDP_INDEX_REFRESH_SECONDS, and fully every CDDP_INDEX_FULL_REFRESH_PERIOD_MINS by a cron job.
+CDDP_INDEX_REFRESH_SECONDS = decouple.config('CDDP_INDEX_REFRESH_SECONDS', default=60, cast=int)
+CDDP_INDEX_FULL_REFRESH_PERIOD_MINS = decouple.config('CDDP_INDEX_FULL_REFRESH_PERIOD_MINS', default=60, cast=int)
 
 # Email
 #DISABLE_EMAIL = decouple.config("DISABLE_EMAIL", default=False, cast=bool)
@@ -297,6 +303,13 @@ EMAIL_INSTANCE = decouple.config("EMAIL_INSTANCE", default="PROD")
 NON_PROD_EMAIL = decouple.config("NON_PROD_EMAIL", default="")
 PRODUCTION_EMAIL= decouple.config("PRODUCTION_EMAIL", default=False, cast=bool)
 EMAIL_DELIVERY = decouple.config("EMAIL_DELIVERY", default="off")
+# Emails are queued in an outbox and sent by a cron job every EMAIL_OUTBOX_PERIOD_MINS. Failed
+# emails are retried after EMAIL_OUTBOX_BACKOFF_SECONDS, doubling each attempt, until
+# EMAIL_OUTBOX_MAX_ATTEMPTS attempts have been made. Nothing is sent unless EMAIL_DELIVERY is "on",
+# and unless PRODUCTION_EMAIL is set emails are redirected to NON_PROD_EMAIL.
+EMAIL_OUTBOX_PERIOD_MINS = decouple.config("EMAIL_OUTBOX_PERIOD_MINS", default=1, cast=int)
+EMAIL_OUTBOX_BACKOFF_SECONDS = decouple.config("EMAIL_OUTBOX_BACKOFF_SECONDS", default=60, cast=int)
+EMAIL_OUTBOX_MAX_ATTEMPTS = decouple.config("EMAIL_OUTBOX_MAX_ATTEMPTS", default=5, cast=int)
 
 # Group Settings
 # This must match what is in the database
@@ -334,13 +347,27 @@ ALLOWED_GROUPS_TO_VIEW_LOGFILE = [
 POSTGRES_SCANNER_PERIOD_MINS = decouple.config('POSTGRES_SCANNER_PERIOD_MINS', default=2)
 SHAREPOINT_SCANNER_PERIOD_MINS = decouple.config('SHAREPOINT_SCANNER_PERIOD_MINS', default=2)
 DIRECTORY_SCANNER_PERIOD_MINS = decouple.config('DIRECTORY_SCANNER_PERIOD_MINS', default=2)
+# Number of files the directory scanner absorbs concurrently, each in its own process.
+# Files larger than DIRECTORY_SCANNER_LARGE_FILE_MB never occupy every worker at once,
+# so small files keep being absorbed while large ones are in progress.
+DIRECTORY_SCANNER_MAX_WORKERS = decouple.config('DIRECTORY_SCANNER_MAX_WORKERS', default=2, cast=int)
+DIRECTORY_SCANNER_LARGE_FILE_MB = decouple.config('DIRECTORY_SCANNER_LARGE_FILE_MB', default=500, cast=int)
 PUBLISH_GEOSERVER_QUEUE_PERIOD_MINS = decouple.config('PUBLISH_GEOSERVER_QUEUE_PERIOD_MINS', default=2)
+# Number of geoserver queue items converted in parallel. While an item is processed its
+# heartbeat is updated every GEOSERVER_QUEUE_HEARTBEAT_SECONDS; an item whose heartbeat is
+# older than GEOSERVER_QUEUE_HEARTBEAT_TIMEOUT_SECONDS is assumed abandoned and reclaimed.
+GEOSERVER_QUEUE_MAX_WORKERS = decouple.config('GEOSERVER_QUEUE_MAX_WORKERS', default=2, cast=int)
+GEOSERVER_QUEUE_HEARTBEAT_SECONDS = decouple.config('GEOSERVER_QUEUE_HEARTBEAT_SECONDS', default=30, cast=int)
+GEOSERVER_QUEUE_HEARTBEAT_TIMEOUT_SECONDS = decouple.config('GEOSERVER_QUEUE_HEARTBEAT_TIMEOUT_SECONDS', default=180, cast=int)
 GEOSERVER_LAYER_HEALTH_CHECK_TIMES = decouple.config(
     'GEOSERVER_LAYER_HEALTH_CHECK_TIMES',
     default='08:00,11:00,14:00,16:00',  # Perth time, ~4x/day
     cast=lambda v: [t.strip() for t in v.split(',')]
 )
 # .env example: GEOSERVER_LAYER_HEALTH_CHECK_TIMES=08:00,11:00,14:00,16:00
+# Number of layers per GeoServer whose rendering is also probed with a tiny GetMap request
+# by the layer health check, chosen at random on each run. 0 disables the probe.
+GEOSERVER_LAYER_HEALTH_CHECK_GETMAP_SAMPLE = decouple.config('GEOSERVER_LAYER_HEALTH_CHECK_GETMAP_SAMPLE', default=0, cast=int)
 GEOSERVER_SYNC_LAYERS_PERIOD_MINS = decouple.config('GEOSERVER_SYNC_LAYERS_PERIOD_MINS', default=1)
 GEOSERVER_SYNC_RULES_PERIOD_MINS = decouple.config('GEOSERVER_SYNC_RULES_PERIOD_MINS', default=2)
 GEOSERVER_SYNC_USERS_PERIOD_MINS = decouple.config('GEOSERVER_SYNC_USERS_PERIOD_MINS', default=2)
@@ -353,11 +380,14 @@ CRON_CLASSES = [
     "govapp.apps.catalogue.cron.PostgresScannerCronJob",
     "govapp.apps.catalogue.cron.SharepointScannerCronJob",
     "govapp.apps.catalogue.cron.DirectoryScannerCronJob",
+    "govapp.apps.catalogue.cron.WebhookDeliveryCronJob",
+    "govapp.apps.emails.cron.SendOutboxCronJob",
     "govapp.apps.publisher.cron.PublishGeoServerQueueCronJob",
     "govapp.apps.publisher.cron.PublishGeoServerReadyToPublishCronJob",
     "govapp.apps.publisher.cron.GeoServerLayerHealthcheckCronJob",
     "govapp.apps.publisher.cron.GeoServerSyncLayersCronJob", # layers
     "govapp.apps.publisher.cron.GeoServerSyncRulesCronJob", # rules
+    "govapp.apps.publisher.cron.CDDPIndexCronJob",
     "govapp.apps.accounts.cron.GeoServerSyncUsersCronJob", # users
     "govapp.apps.accounts.cron.ItassetsUsersSyncCronJob", # users
     'appmonitor_client.cron.CronJobAppMonitorClient'
@@ -378,6 +408,14 @@ GEOSERVER_DATA_DIR = decouple.config("GEOSERVER_DATA_DIR", default="/opt/geoserv
 GEOSERVER_USERNAME = decouple.config("GEOSERVER_USERNAME", default="admin")
 GEOSERVER_PASSWORD = decouple.config("GEOSERVER_PASSWORD", default="geoserver")
 GEOSERVER_SECURITY_FILE_PATH=decouple.config("GEOSERVER_SECURITY_FILE_PATH", default="./config/geoserver_security/")
+# Timeouts (seconds), connection pool size and retries for GeoServer REST requests.
+# Idempotent requests are retried on connection errors and 5xx responses, waiting
+# GEOSERVER_RETRY_BACKOFF seconds before the first retry and doubling each time.
+GEOSERVER_CONNECT_TIMEOUT = decouple.config("GEOSERVER_CONNECT_TIMEOUT", default=15.0, cast=float)
+GEOSERVER_READ_TIMEOUT = decouple.config("GEOSERVER_READ_TIMEOUT", default=120.0, cast=float)
+GEOSERVER_MAX_CONNECTIONS = decouple.config("GEOSERVER_MAX_CONNECTIONS", default=10, cast=int)
+GEOSERVER_MAX_RETRIES = decouple.config("GEOSERVER_MAX_RETRIES", default=3, cast=int)
+GEOSERVER_RETRY_BACKOFF = decouple.config("GEOSERVER_RETRY_BACKOFF", default=0.5, cast=float)
 
 # Users, Groups, Roles
 DEFAULT_USERS_IN_GEOSERVER = ['admin']
@@ -418,6 +456,16 @@ WFS_URL = "https://mesonet.agron.iastate.edu/cgi-bin/wms/us/mrms.cgi?"
 WFS_CACHE_KEY = "wfs native layer names"
 POST_GIS_CACHE_KEY = "post gis table names"
 SUBSCRIPTION_CACHE_TTL = 3600
+# PostGIS subscriptions borrow connections from a pool of up to `max_connections` per subscription.
+# Connections idle for longer than POSTGIS_POOL_IDLE_SECONDS are closed, and connections idle for
+# longer than POSTGIS_POOL_HEALTH_CHECK_SECONDS are checked with `SELECT 1` before being reused.
+POSTGIS_POOL_IDLE_SECONDS = decouple.config("POSTGIS_POOL_IDLE_SECONDS", default=300, cast=int)
+POSTGIS_POOL_HEALTH_CHECK_SECONDS = decouple.config("POSTGIS_POOL_HEALTH_CHECK_SECONDS", default=30, cast=int)
+# WMS/WFS GetCapabilities documents are cached. They are served without contacting the upstream server
+# for CAPABILITIES_CACHE_FRESH_SECONDS, then served while being revalidated in the background (with
+# ETag/Last-Modified) until CAPABILITIES_CACHE_MAX_STALE_SECONDS, after which they are revalidated first.
+CAPABILITIES_CACHE_FRESH_SECONDS = decouple.config("CAPABILITIES_CACHE_FRESH_SECONDS", default=300, cast=int)
+CAPABILITIES_CACHE_MAX_STALE_SECONDS = decouple.config("CAPABILITIES_CACHE_MAX_STALE_SECONDS", default=86400, cast=int)
 
 APPLICATION_VERSION = decouple.config("APPLICATION_VERSION", default="1.0.0" + "-" + GIT_COMMIT_HASH[:7])
 RUNNING_DEVSERVER = len(sys.argv) > 1 and sys.argv[1] == "runserver"
@@ -432,6 +480,25 @@ SENTRY_SAMPLE_RATE = decouple.config("SENTRY_SAMPLE_RATE", default=1.0)  # Error
 SENTRY_TRANSACTION_SAMPLE_RATE = decouple.config("SENTRY_TRANSACTION_SAMPLE_RATE", default=0.0)  # Transaction sampling
 
 WEBHOOK_ENABLED = decouple.config("WEBHOOK_ENABLED", default=False, cast=bool)
+# Webhook payloads are spooled to WEBHOOK_SPOOL_DIR and POSTed by a cron job every
+# WEBHOOK_DELIVERY_PERIOD_MINS, to at most WEBHOOK_MAX_WORKERS receivers at once. Each connect,
+# read and write of a POST times out after WEBHOOK_TIMEOUT_SECONDS. A delivery interrupted mid-POST
+# counts as an attempt. Failed deliveries are retried after WEBHOOK_BACKOFF_SECONDS,
+# doubling each attempt, until WEBHOOK_MAX_ATTEMPTS attempts have been made.
+WEBHOOK_SPOOL_DIR = decouple.config("WEBHOOK_SPOOL_DIR", default=os.path.join(DATA_STORAGE, "webhooks"))
+WEBHOOK_DELIVERY_PERIOD_MINS = decouple.config("WEBHOOK_DELIVERY_PERIOD_MINS", default=1, cast=int)
+WEBHOOK_MAX_WORKERS = decouple.config("WEBHOOK_MAX_WORKERS", default=4, cast=int)
+WEBHOOK_TIMEOUT_SECONDS = decouple.config("WEBHOOK_TIMEOUT_SECONDS", default=30, cast=int)
+WEBHOOK_BACKOFF_SECONDS = decouple.config("WEBHOOK_BACKOFF_SECONDS", default=60, cast=int)
+WEBHOOK_MAX_ATTEMPTS = decouple.config("WEBHOOK_MAX_ATTEMPTS", default=8, cast=int)
+
+# Metrics Settings
+# Metrics are exported at /metrics/ in the Prometheus text format. Each process buffers its metrics and
+# adds them to the database after requests (at most every METRICS_FLUSH_SECONDS) and cron jobs, so they
+# add up across the gunicorn workers and cron processes. Prometheus scrapes with METRICS_TOKEN as a
+# bearer token, while Administrators can view the metrics when logged in.
+METRICS_FLUSH_SECONDS = decouple.config("METRICS_FLUSH_SECONDS", default=15, cast=int)
+METRICS_TOKEN = decouple.config("METRICS_TOKEN", default=None)
 
 # Catalogue entry type to be displayed on the catalogue entry list page
 CATALOGUE_ENTRY_TYPE_TO_DISPLAY = decouple.config("CATALOGUE_ENTRY_TYPE_TO_DISPLAY", default='1,2,3,4,5')
@@ -458,6 +525,9 @@ if not RUNNING_DEVSERVER and SENTRY_DSN and EMAIL_INSTANCE:
 FILE_UPLOAD_PERMISSIONS = None
 LOG_FILE_FETCHING_INTERVAL_MS = decouple.config("LOG_FILE_FETCHING_INTERVAL_MS", default=3000)
 LOG_FILE_NAMES_TO_DISPLAY = decouple.config("LOG_FILE_NAMES_TO_DISPLAY", default="kaartdijin_boodja.log,email.log,cronjob.log").split(',')
+# Line indexes of the log files, so the log viewer can page and filter them
+# without reading the whole file. They are rebuilt automatically if removed.
+LOG_INDEX_DIR = decouple.config("LOG_INDEX_DIR", default=os.path.join(PATH_TO_LOGS, ".index"))
 GEOSERVER_PROTECTED_STYLES = decouple.config("GEOSERVER_PROTECTED_STYLES", default='point,line,polygon,raster,generic,geometry').split(',')
 
 EXPIRE_SERVER_CACHE_AFTER_N_SECONDS_DEFAULT = decouple.config("EXPIRE_SERVER_CACHE_AFTER_N_SECONDS_DEFAULT", default=86400)
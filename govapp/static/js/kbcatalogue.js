@@ -424,10 +424,26 @@ var kbcatalogue = {
     // Function for uploading files using chunked upload (10 MB per chunk).
     // Each file is sliced into chunks and sent sequentially. Multiple files
     // are uploaded in parallel (one chunk-loop per file).
+    // Every chunk is sent with its byte offset (and its SHA-256 where the browser
+    // supports it). If a chunk fails, the committed offset is fetched from the
+    // server and the upload resumes from there, rather than from the start.
     uploadFiles: function(files) {
         var CHUNK_SIZE = 10 * 1024 * 1024; // 10 MB per chunk
+        var MAX_RETRIES = 5;
         var csrf_token = $("#csrfmiddlewaretoken").val();
 
+        // SHA-256 of a blob as hex, or null where SubtleCrypto is unavailable (e.g. plain http)
+        function sha256(blob) {
+            if (!(window.crypto && window.crypto.subtle && blob.arrayBuffer)) {
+                return Promise.resolve(null);
+            }
+            return blob.arrayBuffer()
+                .then(function(buffer) { return window.crypto.subtle.digest('SHA-256', buffer); })
+                .then(function(digest) {
+                    return Array.from(new Uint8Array(digest)).map(function(b) { return b.toString(16).padStart(2, '0'); }).join('');
+                });
+        }
+
         for (var i = 0; i < files.length; i++) {
             var fileName = files[i].name;
             var newFileName = kbcatalogue.addDateTimeToFilename(fileName);
@@ -438,6 +454,7 @@ var kbcatalogue = {
 
             (function(file, newFileName, progressBar, progressBarContainer, deleteIcon) {
                 var cancelled = false;
+                var retries = 0;
                 var totalChunks = Math.max(1, Math.ceil(file.size / CHUNK_SIZE));
 
                 // Cancel / delete button
@@ -447,47 +464,91 @@ var kbcatalogue = {
                     progressBarContainer.fadeOut('slow', function() { $(this).remove(); });
                 });
 
-                function uploadChunk(chunkIndex) {
+                function showProgress(offset) {
+                    var percent = file.size ? (offset / file.size) * 100 : 100;
+                    progressBar.find(".progress-bar").width(percent + '%');
+                    progressBar.find(".progress-bar").attr('aria-valuenow', percent);
+                    progressBarContainer.find(".progress-text").text(percent.toFixed(0) + '%');
+                }
+
+                function showError(message) {
+                    progressBarContainer.find('.progress-text').text('');
+                    progressBar.fadeOut('slow', function() {
+                        progressBar.replaceWith($('<span class="error-message">' + message + '</span>'));
+                    });
+                }
+
+                // Resume from the offset the server has committed
+                function resume(message) {
                     if (cancelled) return;
+                    if (retries++ >= MAX_RETRIES) {
+                        showError(message);
+                        return;
+                    }
+                    setTimeout(function() {
+                        $.ajax({
+                            url: kbcatalogue.var.catalogue_data_url + "upload_status/",
+                            type: 'GET',
+                            data: {newFileName: newFileName},
+                            success: function(response) {
+                                if (cancelled) return;
+                                if (response.complete) {
+                                    showProgress(file.size);
+                                } else {
+                                    uploadChunk(response.offset);
+                                }
+                            },
+                            error: function() { resume(message); }
+                        });
+                    }, 1000 * Math.pow(2, retries - 1));
+                }
 
-                    var start = chunkIndex * CHUNK_SIZE;
-                    var end = Math.min(start + CHUNK_SIZE, file.size);
-                    var chunkBlob = file.slice(start, end);
-
-                    var formData = new FormData();
-                    formData.append('chunk', chunkBlob, file.name);
-                    formData.append('newFileName', newFileName);
-                    formData.append('chunkIndex', chunkIndex);
-                    formData.append('totalChunks', totalChunks);
-                    formData.append('totalSize', file.size);
-
-                    $.ajax({
-                        url: kbcatalogue.var.catalogue_data_url + "upload_file/",
-                        type: 'POST',
-                        headers: {'X-CSRFToken': csrf_token},
-                        data: formData,
-                        cache: false,
-                        contentType: false,
-                        processData: false,
-                        success: function(response) {
-                            if (cancelled) return;
-                            var percent = ((chunkIndex + 1) / totalChunks) * 100;
-                            progressBar.find(".progress-bar").width(percent + '%');
-                            progressBar.find(".progress-bar").attr('aria-valuenow', percent);
-                            progressBarContainer.find(".progress-text").text(percent.toFixed(0) + '%');
-                            if (!response.complete) {
-                                uploadChunk(chunkIndex + 1);
-                            }
-                        },
-                        error: function(xhr) {
-                            if (cancelled) return;
-                            var errorResponse;
-                            try { errorResponse = JSON.parse(xhr.responseText); } catch(e) { errorResponse = {error: 'Upload failed.'}; }
-                            progressBarContainer.find('.progress-text').text('');
-                            progressBar.fadeOut('slow', function() {
-                                progressBar.replaceWith($('<span class="error-message">' + errorResponse.error + '</span>'));
-                            });
+                function uploadChunk(offset) {
+                    if (cancelled) return;
+
+                    var end = Math.min(offset + CHUNK_SIZE, file.size);
+                    var chunkBlob = file.slice(offset, end);
+
+                    sha256(chunkBlob).then(function(chunkSha256) {
+                        var formData = new FormData();
+                        formData.append('chunk', chunkBlob, file.name);
+                        formData.append('newFileName', newFileName);
+                        formData.append('chunkIndex', Math.floor(offset / CHUNK_SIZE));
+                        formData.append('totalChunks', totalChunks);
+                        formData.append('totalSize', file.size);
+                        formData.append('offset', offset);
+                        if (chunkSha256) {
+                            formData.append('chunkSha256', chunkSha256);
                         }
+
+                        $.ajax({
+                            url: kbcatalogue.var.catalogue_data_url + "upload_file/",
+                            type: 'POST',
+                            headers: {'X-CSRFToken': csrf_token},
+                            data: formData,
+                            cache: false,
+                            contentType: false,
+                            processData: false,
+                            success: function(response) {
+                                if (cancelled) return;
+                                retries = 0;
+                                showProgress(response.offset);
+                                if (!response.complete) {
+                                    uploadChunk(response.offset);
+                                }
+                            },
+                            error: function(xhr) {
+                                if (cancelled) return;
+                                var errorResponse;
+                                try { errorResponse = JSON.parse(xhr.responseText); } catch(e) { errorResponse = {error: 'Upload failed.'}; }
+                                if (xhr.status === 400 && errorResponse.error !== 'Checksum mismatch.') {
+                                    // Rejected outright (e.g. invalid file type), retrying will not help
+                                    showError(errorResponse.error);
+                                } else {
+                                    resume(errorResponse.error);
+                                }
+                            }
+                        });
                     });
                 }
 
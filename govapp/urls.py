@@ -53,6 +53,9 @@ urlpatterns = [
     urls.path("api/publish/", urls.include("govapp.apps.publisher.urls")),
     urls.path("api/geoserver-manager/", urls.include("govapp.apps.publisher.urls_geoserver_manager")),
 
+    # Metrics
+    urls.path("metrics/", urls.include("govapp.apps.metrics.urls")),
+
     # Management Command Endpoints
     urls.path("api/management/", urls.include("govapp.commands")),
     
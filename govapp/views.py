@@ -3,6 +3,7 @@
 
 # Third-Party
 import os
+import re
 import json
 import logging
 import requests
@@ -35,6 +36,7 @@ from govapp.apps.catalogue.models import layer_submissions as catalogue_layer_su
 from govapp.apps.catalogue.models import layer_subscriptions as catalogue_layer_subscription_models
 from govapp.apps.catalogue import utils as catalogue_utils
 from govapp.apps.accounts import utils
+from govapp.common import log_index
 
 # Typing
 from typing import Any
@@ -735,25 +737,6 @@ class GeoServerGroupView(base.TemplateView):
 
         return shortcuts.render(request, self.template_name, context)
 
-def tail_lines(file_path, lines=1000, block_size=1024):
-    """
-    Efficiently retrieves the last `lines` lines from file_path in binary mode.
-    Returns a list of decoded strings.
-    """
-    with open(file_path, 'rb') as f:
-        f.seek(0, os.SEEK_END)
-        file_size = f.tell()
-        data = b""
-        lines_to_find = lines + 1
-        while file_size > 0 and data.count(b'\n') < lines_to_find:
-            increment = min(block_size, file_size)
-            file_size -= increment
-            f.seek(file_size)
-            data = f.read(increment) + data
-        all_lines = data.splitlines(keepends=True)
-        return [line.decode('utf-8', errors='replace') for line in all_lines[-lines:]]
-
-
 @login_required # Ensures the user is logged in before any other checks.
 @user_passes_test(utils.user_can_view_logs) # Applies custom permission check.
 def get_logs(request):
@@ -762,13 +745,20 @@ def get_logs(request):
 
     - If the GET parameter 'last_position' is provided:
       Returns all new log lines from that file offset and the updated file pointer.
-    - If 'last_position' is not provided:
-      Returns the last 1000 lines of the log file and the file's current end position.
-    
+    - If 'before_line' or 'after_line' is provided:
+      Returns up to 'lines_count' lines before or after that line number.
+    - Otherwise:
+      Returns the last 'lines_count' lines of the log file and the file's current end position.
+
+    Lines are read through a line index of the log file (see govapp.common.log_index),
+    so they can also be filtered by a 'search' regular expression and a minimum 'level'.
+
     Returns:
         JsonResponse: A JSON response containing the log lines and current file position.
     """
     log_file_name = request.GET.get('log_file_name', settings.LOG_FILE_NAME)
+    if not log_file_name or os.path.basename(log_file_name) != log_file_name or log_file_name.startswith('.'):
+        return JsonResponse({'error': f"Invalid log file name: '{log_file_name}'"}, status=400)
     log_file_path = os.path.join(settings.BASE_DIR, 'logs', log_file_name)
     last_position_param = request.GET.get('last_position', None)
     MAX_NUM_LINES_TO_READ = 10000
@@ -801,21 +791,42 @@ def get_logs(request):
             'new_lines': new_lines,
             'current_position': current_position,
         })
-    else:
-        # Initial load.  Return the last X lines of the log file.
-        last_x_lines = []
-        if os.path.exists(log_file_path):
-            last_x_lines = tail_lines(log_file_path, lines=lines_count)
-        else:
-            logger.warning(f"Log file: '[{log_file_path}]' does not exist.")
-
-        # Get the current file pointer (i.e., file size)
-        current_position = os.path.getsize(log_file_path) if os.path.exists(log_file_path) else 0
 
-        return JsonResponse({
-            'log_lines': last_x_lines,
-            'current_position': current_position,
-        })
+    # Filters
+    try:
+        search = request.GET.get('search', '')
+        pattern = re.compile(search) if search else None
+    except re.error as exc:
+        return JsonResponse({'error': f"Invalid search pattern: {exc}"}, status=400)
+    try:
+        levels = log_index.level_mask(request.GET.get('level', ''))
+    except ValueError:
+        return JsonResponse({'error': f"Invalid level: '{request.GET.get('level')}'"}, status=400)
+    try:
+        before_line = request.GET.get('before_line', None)
+        after_line = request.GET.get('after_line', None)
+        before_line = int(before_line) if before_line is not None else None
+        after_line = int(after_line) if after_line is not None else None
+    except ValueError:
+        return JsonResponse({'error': "Line numbers must be integers"}, status=400)
+
+    if not os.path.exists(log_file_path):
+        logger.warning(f"Log file: '[{log_file_path}]' does not exist.")
+
+    index = log_index.LogIndex(log_file_path)
+    if after_line is not None:
+        # Lines after a line number, e.g. new lines matching the filters
+        lines = index.read(after_line + 1, lines_count, pattern, levels)
+    else:
+        # Lines before a line number, or the last X lines of the log file
+        lines = index.read(before_line, lines_count, pattern, levels, reverse=True)
+
+    return JsonResponse({
+        'log_lines': [text for _, text in lines],
+        'line_numbers': [number for number, _ in lines],
+        'line_count': index.line_count,
+        'current_position': index.indexed_bytes,
+    })
 
 
 class PurgeTileCacheAPIView(APIView):
@@ -0,0 +1,14 @@
+"""Provides configuration for the benchmarks.
+
+The benchmarks are slow and their results depend on the machine, so they are
+only collected when the `KB_BENCHMARKS` environment variable is set, e.g.
+`KB_BENCHMARKS=1 pytest tests/benchmarks`.
+"""
+
+
+# Standard
+import os
+
+
+# Skip Benchmarks unless Requested
+collect_ignore_glob = [] if os.environ.get("KB_BENCHMARKS") else ["test_*.py"]
@@ -0,0 +1,126 @@
+"""Benchmarks the GeoServer client against a local stub GeoServer.
+
+Compares opening a new connection for every request (as the client used to)
+against the pooled keep-alive client. The requests per second are recorded as
+test properties, e.g. in the `--junitxml` report.
+"""
+
+
+# Standard
+import http.server
+import json
+import threading
+import time
+
+# Third-Party
+import httpx
+import pytest
+
+# Local
+from govapp.gis import geoserver
+
+# Typing
+from typing import Callable, Iterator
+
+
+# Number of Requests per Benchmark
+REQUESTS = 100
+
+
+class StubGeoServerHandler(http.server.BaseHTTPRequestHandler):
+    """Responds to every GET with a minimal layer details document."""
+
+    # Keep-Alive, without delaying the body behind the headers
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    # Number of Connections Accepted
+    connections = 0
+
+    def setup(self) -> None:
+        """Counts the connection, as a handler is constructed per connection."""
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Responds with a layer."""
+        # Construct Body
+        body = json.dumps({"layer": {"name": self.path.rsplit("/", 1)[-1], "type": "VECTOR"}}).encode()
+
+        # Respond
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        """Silences request logging."""
+
+
+@pytest.fixture
+def stub_geoserver() -> Iterator[str]:
+    """Runs a stub GeoServer on an ephemeral local port.
+
+    Yields:
+        str: Service URL of the stub GeoServer.
+    """
+    # Start Server
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubGeoServerHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    # Yield
+    yield f"http://127.0.0.1:{server.server_address[1]}/geoserver"
+
+    # Stop Server
+    server.shutdown()
+    server.server_close()
+
+
+def requests_per_second(request: Callable[[int], None]) -> float:
+    """Measures the throughput of a request function.
+
+    Args:
+        request (Callable[[int], None]): Function sending the nth request.
+
+    Returns:
+        float: Requests per second.
+    """
+    # Time Requests
+    start = time.perf_counter()
+    for n in range(REQUESTS):
+        request(n)
+
+    # Return
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def test_benchmark_connection_pool(stub_geoserver: str, record_property: Callable[[str, object], None]) -> None:
+    """Benchmarks a new connection per request against the pooled client.
+
+    Args:
+        stub_geoserver (str): Service URL of the stub GeoServer.
+        record_property (Callable[[str, object], None]): Pytest property recording fixture.
+    """
+    def unpooled(n: int) -> None:
+        # New Client per Request
+        response = httpx.get(f"{stub_geoserver}/rest/layers/layer_{n}", auth=("admin", "geoserver"), timeout=120.0)
+        response.raise_for_status()
+
+    # Benchmark
+    with geoserver.GeoServer(stub_geoserver, "admin", "geoserver") as server:
+        StubGeoServerHandler.connections = 0
+        before = requests_per_second(unpooled)
+        unpooled_connections = StubGeoServerHandler.connections
+        StubGeoServerHandler.connections = 0
+        after = requests_per_second(lambda n: server.get_layer_details(f"layer_{n}"))
+        pooled_connections = StubGeoServerHandler.connections
+
+    # Report
+    record_property("unpooled_requests_per_second", round(before))
+    record_property("pooled_requests_per_second", round(after))
+
+    # Check the Pooled Client Reuses its Connection
+    assert unpooled_connections == REQUESTS
+    assert pooled_connections == 1
@@ -0,0 +1,403 @@
+"""Benchmarks the GIS readers and conversions on synthesised files.
+
+Shapefile, GeoPackage, GeoJSON, FileGDB and GeoTIFF fixtures are synthesised
+with GDAL at the configured scales. Each operation runs in a forked process,
+so the wall time, peak RSS (including GDAL child processes such as
+`ogr2ogr`) and peak temporary disk usage of one operation are not affected by
+the others. The results table is shown in the test summary.
+
+Configured through environment variables:
+
+* `GIS_BENCHMARK_SCALES`: Comma separated feature counts (default `1000`,
+  e.g. `1000,100000,1000000` for the full suite).
+* `GIS_BENCHMARK_RASTER_MB`: Comma separated raster sizes in MB (default
+  `16`, e.g. `16,128`).
+* `GIS_BENCHMARK_ENGINES`: Comma separated conversion engines to compare
+  (default `subprocess,gdal`). Each is also benchmarked on a 10 feature
+  layer, to measure the per-conversion overhead.
+* `GIS_BENCHMARK_RESULTS`: File to append the results to, as JSON lines.
+* `GIS_BENCHMARK_BASELINE`: Results file of an earlier run. An operation
+  fails if it is slower, or uses more memory or disk, than its baseline by
+  more than `GIS_BENCHMARK_TOLERANCE` (default `0.25`, i.e. 25%).
+"""
+
+
+# Standard
+import json
+import multiprocessing
+import os
+import pathlib
+import resource
+import threading
+import time
+
+# Third-Party
+import numpy
+import pytest
+from osgeo import gdal, ogr, osr
+
+# Local
+from govapp.apps.catalogue import utils as catalogue_utils
+from govapp.gis import cache
+from govapp.gis import conversions
+from govapp.gis import readers
+
+# Typing
+from typing import Any, Callable, Iterator, Optional
+
+
+# Configuration
+SCALES = [int(s) for s in os.environ.get("GIS_BENCHMARK_SCALES", "1000").split(",")]
+RASTER_MB = [int(s) for s in os.environ.get("GIS_BENCHMARK_RASTER_MB", "16").split(",")]
+ENGINES = os.environ.get("GIS_BENCHMARK_ENGINES", "subprocess,gdal").split(",")
+RESULTS = os.environ.get("GIS_BENCHMARK_RESULTS")
+BASELINE = os.environ.get("GIS_BENCHMARK_BASELINE")
+TOLERANCE = float(os.environ.get("GIS_BENCHMARK_TOLERANCE", "0.25"))
+
+# Vector Formats: OGR driver and the path the reader is given
+VECTOR_FORMATS = {
+    "shapefile": ("ESRI Shapefile", "{name}"),
+    "geopackage": ("GPKG", "{name}.gpkg"),
+    "geojson": ("GeoJSON", "{name}.geojson"),
+    "filegdb": ("OpenFileGDB", "{name}.gdb"),
+}
+
+# Operations on each Vector Layer
+VECTOR_OPERATIONS = ["open", "attributes", "metadata", "symbology", "to_geopackage", "to_geojson", "to_shapefile", "to_geodatabase"]
+
+# Interval between samples of the temporary disk usage
+DISK_SAMPLE_SECONDS = 0.05
+
+# Results of this Run
+results: list[dict[str, Any]] = []
+
+
+def synthesise_vector(directory: pathlib.Path, format_name: str, features: int) -> pathlib.Path:
+    """Synthesises a polygon layer with a few attributes.
+
+    Args:
+        directory (pathlib.Path): Directory to create the file in.
+        format_name (str): Key of the format in `VECTOR_FORMATS`.
+        features (int): Number of features.
+
+    Returns:
+        pathlib.Path: Path to the file (or directory) to read.
+    """
+    # Construct Path
+    driver_name, template = VECTOR_FORMATS[format_name]
+    name = f"synthetic_{features}"
+    path = directory / template.format(name=name)
+    if path.exists():
+        return path
+
+    # Create Data Source and Layer
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    datasource = ogr.GetDriverByName(driver_name).CreateDataSource(str(path))
+    layer = datasource.CreateLayer(name, srs, ogr.wkbPolygon)
+    layer.CreateField(ogr.FieldDefn("code", ogr.OFTInteger))
+    layer.CreateField(ogr.FieldDefn("label", ogr.OFTString))
+    layer.CreateField(ogr.FieldDefn("area", ogr.OFTReal))
+    layer.CreateField(ogr.FieldDefn("surveyed", ogr.OFTDate))
+    definition = layer.GetLayerDefn()
+
+    # Create Features on a Grid covering Western Australia
+    columns = max(1, int(features ** 0.5))
+    size = 20.0 / columns
+    layer.StartTransaction()
+    for n in range(features):
+        x = 113.0 + (n % columns) * size
+        y = -35.0 + (n // columns) * size
+        feature = ogr.Feature(definition)
+        feature.SetField("code", n)
+        feature.SetField("label", f"parcel {n}")
+        feature.SetField("area", size * size)
+        feature.SetField("surveyed", 2000 + n % 25, 1 + n % 12, 1 + n % 28, 0, 0, 0, 0)
+        feature.SetGeometry(ogr.CreateGeometryFromWkt(
+            f"POLYGON(({x} {y},{x + size} {y},{x + size} {y + size},{x} {y + size},{x} {y}))"))
+        layer.CreateFeature(feature)
+    layer.CommitTransaction()
+
+    # Close and Return
+    datasource = None
+    return path
+
+
+def synthesise_raster(directory: pathlib.Path, megabytes: int) -> pathlib.Path:
+    """Synthesises a single band float32 GeoTIFF.
+
+    Args:
+        directory (pathlib.Path): Directory to create the file in.
+        megabytes (int): Approximate uncompressed size of the raster.
+
+    Returns:
+        pathlib.Path: Path to the GeoTIFF.
+    """
+    # Construct Path
+    path = directory / f"synthetic_{megabytes}mb.tif"
+    if path.exists():
+        return path
+
+    # Create Dataset
+    side = int((megabytes * 1024 * 1024 / 4) ** 0.5)
+    dataset = gdal.GetDriverByName("GTiff").Create(str(path), side, side, 1, gdal.GDT_Float32, ["TILED=YES"])
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    dataset.SetProjection(srs.ExportToWkt())
+    dataset.SetGeoTransform((113.0, 20.0 / side, 0, -15.0, 0, -20.0 / side))
+
+    # Write Rows in Blocks
+    band = dataset.GetRasterBand(1)
+    rows = max(1, 16 * 1024 * 1024 // (side * 4))
+    for row in range(0, side, rows):
+        height = min(rows, side - row)
+        band.WriteArray(numpy.add.outer(numpy.arange(row, row + height), numpy.arange(side)).astype(numpy.float32), 0, row)
+
+    # Close and Return
+    dataset = None
+    return path
+
+
+def directory_size(directory: pathlib.Path) -> int:
+    """Calculates the total size of the files below a directory.
+
+    Args:
+        directory (pathlib.Path): Directory to measure.
+
+    Returns:
+        int: Total size in bytes.
+    """
+    total = 0
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except FileNotFoundError:
+                continue
+    return total
+
+
+def _run(setup: Callable[[], Any], operation: Callable[[Any], Any], directories: list[pathlib.Path], connection: Any) -> None:
+    """Runs and measures an operation in a forked process.
+
+    Args:
+        setup (Callable[[], Any]): Untimed preparation, returning the operation's argument.
+        operation (Callable[[Any], Any]): Operation to measure.
+        directories (list[pathlib.Path]): Temporary directories to measure the disk usage of.
+        connection (Any): Pipe to send the measurements back on.
+    """
+    # Disable the Conversion Cache, so Conversions always Run
+    cache.conversion_cache.max_size = 0
+    argument = setup()
+
+    # Sample Temporary Disk Usage
+    initial = sum(directory_size(d) for d in directories)
+    peak = initial
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.wait(DISK_SAMPLE_SECONDS):
+            peak = max(peak, sum(directory_size(d) for d in directories))
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+
+    # Run Operation
+    start = time.perf_counter()
+    operation(argument)
+    wall = time.perf_counter() - start
+    done.set()
+    sampler.join()
+    peak = max(peak, sum(directory_size(d) for d in directories))
+
+    # Send Measurements (ru_maxrss is in KB on Linux)
+    rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    connection.send({"wall_seconds": wall, "peak_rss_mb": rss / 1024, "peak_temp_disk_mb": (peak - initial) / 1024 / 1024})
+    connection.close()
+
+
+def measure(case: str, setup: Callable[[], Any], operation: Callable[[Any], Any]) -> dict[str, Any]:
+    """Measures an operation and checks it against the baseline.
+
+    Args:
+        case (str): Unique name of the benchmark case.
+        setup (Callable[[], Any]): Untimed preparation, returning the operation's argument.
+        operation (Callable[[Any], Any]): Operation to measure.
+
+    Returns:
+        dict[str, Any]: The measurements.
+    """
+    # Run in a Forked Process
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    directories = [conversions._WORK_DIR, conversions._TMP_BASE]
+    process = context.Process(target=_run, args=(setup, operation, directories, sender))
+    process.start()
+    sender.close()
+    try:
+        result = {"case": case, **receiver.recv()}
+    except EOFError:
+        pytest.fail(f"Benchmark [{case}] failed with exit code {process.exitcode}")
+    finally:
+        process.join()
+    results.append(result)
+
+    # Check Baseline
+    expected = baseline().get(case)
+    if expected is not None:
+        for metric in ("wall_seconds", "peak_rss_mb", "peak_temp_disk_mb"):
+            limit = expected[metric] * (1 + TOLERANCE)
+            assert result[metric] <= max(limit, 0.01), f"{case}: {metric} regressed from {expected[metric]:.2f} to {result[metric]:.2f}"
+
+    # Return
+    return result
+
+
+def baseline() -> dict[str, dict[str, Any]]:
+    """Loads the baseline results, if configured.
+
+    Returns:
+        dict[str, dict[str, Any]]: Baseline results keyed on case.
+    """
+    if not BASELINE or not os.path.exists(BASELINE):
+        return {}
+    with open(BASELINE) as f:
+        return {r["case"]: r for r in map(json.loads, filter(None, f.read().splitlines()))}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def report(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Reports the results once every benchmark has run.
+
+    Args:
+        request (pytest.FixtureRequest): Pytest request fixture.
+
+    Yields:
+        None: Nothing, the benchmarks run while suspended.
+    """
+    yield
+
+    # Write Table to the Test Output
+    reporter = request.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_sep("-", "GIS benchmark results")
+        reporter.write_line(f"{'case':<45} {'wall (s)':>10} {'rss (MB)':>10} {'temp (MB)':>10}")
+        for r in results:
+            reporter.write_line(f"{r['case']:<45} {r['wall_seconds']:>10.2f} {r['peak_rss_mb']:>10.0f} {r['peak_temp_disk_mb']:>10.1f}")
+
+    # Record Results
+    if RESULTS:
+        with open(RESULTS, "a") as f:
+            f.writelines(json.dumps(r) + "\n" for r in results)
+
+
+@pytest.fixture(scope="module")
+def fixtures_directory(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Directory the synthesised fixtures are shared in.
+
+    Args:
+        tmp_path_factory (pytest.TempPathFactory): Pytest temporary path factory.
+
+    Returns:
+        pathlib.Path: The directory.
+    """
+    return tmp_path_factory.mktemp("gis_benchmark")
+
+
+def first_layer(path: pathlib.Path) -> readers.base.LayerReader:
+    """Opens a file and returns its first layer.
+
+    Args:
+        path (pathlib.Path): Path to the file.
+
+    Returns:
+        LayerReader: Reader of the first layer.
+    """
+    return next(iter(readers.reader.FileReader(path).layers()))
+
+
+@pytest.mark.parametrize("scale", SCALES)
+@pytest.mark.parametrize("format_name", list(VECTOR_FORMATS))
+@pytest.mark.parametrize("operation", VECTOR_OPERATIONS)
+def test_benchmark_vector(fixtures_directory: pathlib.Path, format_name: str, scale: int, operation: str) -> None:
+    """Benchmarks reading and converting a vector layer.
+
+    Args:
+        fixtures_directory (pathlib.Path): Directory of the synthesised fixtures.
+        format_name (str): Format of the layer.
+        scale (int): Number of features.
+        operation (str): Operation to benchmark.
+    """
+    path = synthesise_vector(fixtures_directory, format_name, scale)
+    layer_name = f"synthetic_{scale}"
+
+    # Select Operation
+    setup: Callable[[], Any] = lambda: first_layer(path)  # noqa: E731
+    run: Callable[[Any], Any]
+    if operation == "open":
+        setup = lambda: path  # noqa: E731
+        run = lambda p: list(readers.reader.FileReader(p).layers())  # noqa: E731
+    elif operation in ("attributes", "metadata", "symbology"):
+        run = lambda layer: getattr(layer, operation)()  # noqa: E731
+    else:
+        setup = lambda: path  # noqa: E731
+        run = lambda p: getattr(conversions, operation)(p, layer_name, layer_name, "")  # noqa: E731
+
+    # Measure
+    result = measure(f"{format_name}/{scale}/{operation}", setup, run)
+
+    # Check
+    assert result["wall_seconds"] > 0
+
+
+@pytest.mark.parametrize("scale", sorted({10, *SCALES}))
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("operation", ["to_geopackage", "to_geojson"])
+def test_benchmark_engine(fixtures_directory: pathlib.Path, operation: str, engine: str, scale: int) -> None:
+    """Benchmarks converting a shapefile with each conversion engine.
+
+    Args:
+        fixtures_directory (pathlib.Path): Directory of the synthesised fixtures.
+        operation (str): Conversion to benchmark.
+        engine (str): Conversion engine.
+        scale (int): Number of features.
+    """
+    path = synthesise_vector(fixtures_directory, "shapefile", scale)
+    layer_name = f"synthetic_{scale}"
+
+    # Measure
+    run = lambda p: getattr(conversions, operation)(p, layer_name, layer_name, "", engine=engine)  # noqa: E731
+    result = measure(f"engine/{engine}/{scale}/{operation}", lambda: path, run)
+
+    # Check
+    assert result["wall_seconds"] > 0
+
+
+@pytest.mark.parametrize("megabytes", RASTER_MB)
+@pytest.mark.parametrize("operation", ["open", "to_geopackage", "to_cloud_optimised_geotiff"])
+def test_benchmark_raster(fixtures_directory: pathlib.Path, tmp_path: pathlib.Path, megabytes: int, operation: str) -> None:
+    """Benchmarks reading and converting a GeoTIFF.
+
+    Args:
+        fixtures_directory (pathlib.Path): Directory of the synthesised fixtures.
+        tmp_path (pathlib.Path): Temporary directory fixture.
+        megabytes (int): Size of the raster.
+        operation (str): Operation to benchmark.
+    """
+    path = synthesise_raster(fixtures_directory, megabytes)
+
+    # Select Operation
+    run: Callable[[Optional[Any]], Any]
+    if operation == "open":
+        run = lambda _: catalogue_utils.retrieve_additional_data(gdal.Open(str(path)))  # noqa: E731
+    elif operation == "to_geopackage":
+        run = lambda _: conversions.convert_tiff_to_geopackage(str(path), str(tmp_path / "raster.gpkg"), "raster")  # noqa: E731
+    else:
+        run = lambda _: conversions.to_cloud_optimised_geotiff(path, "raster")  # noqa: E731
+
+    # Measure
+    result = measure(f"geotiff/{megabytes}mb/{operation}", lambda: None, run)
+
+    # Check
+    assert result["wall_seconds"] > 0
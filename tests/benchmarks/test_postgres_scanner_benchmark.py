@@ -0,0 +1,123 @@
+"""Benchmarks a tick of the Postgres subscription scanner against the schedule size.
+
+The due queries are found with a single indexed query on the precomputed
+`next_run_at`, so a tick with the same amount of due work should take about
+as long with 5,000 schedules as with 500. The tick times are recorded as test
+properties, e.g. in the `--junitxml` report.
+"""
+
+
+# Standard
+import datetime
+import statistics
+import time
+from zoneinfo import ZoneInfo
+
+# Third-Party
+from django import conf
+from django import db
+from django.test import utils
+import pytest
+
+# Local
+from govapp.apps.catalogue import postgres_scanner
+from govapp.apps.catalogue.models import catalogue_entries
+from govapp.apps.catalogue.models import custom_query_frequency
+from govapp.apps.catalogue.models import layer_subscriptions
+from govapp.apps.publisher.models import workspaces
+
+# Typing
+from typing import Callable
+
+
+# Schedule Sizes to Compare, and Number of Due Queries at Each
+SCALES = (500, 5_000)
+DUE = 5
+TICKS = 5
+
+
+def schedule(subscription: layer_subscriptions.LayerSubscription, count: int, now: datetime.datetime) -> None:
+    """Schedules custom queries, of which `DUE` are due.
+
+    Args:
+        subscription (layer_subscriptions.LayerSubscription): Subscription of the queries.
+        count (int): Number of queries to schedule.
+        now (datetime.datetime): Current datetime.
+    """
+    # Clear Previous Schedule
+    catalogue_entries.CatalogueEntry.objects.filter(layer_subscription=subscription).delete()
+
+    # Create Entries
+    entries = catalogue_entries.CatalogueEntry.objects.bulk_create(
+        catalogue_entries.CatalogueEntry(
+            name=f"query_{n}",
+            type=catalogue_entries.CatalogueEntryType.SUBSCRIPTION_QUERY,
+            layer_subscription=subscription,
+        )
+        for n in range(count)
+    )
+
+    # Create Frequencies
+    custom_query_frequency.CustomQueryFrequency.objects.bulk_create(
+        custom_query_frequency.CustomQueryFrequency(
+            catalogue_entry=entry,
+            type=custom_query_frequency.FrequencyType.DAILY,
+            hour=n % 24,
+            minute=n % 60,
+            last_job_run=now,
+            next_run_at=now - datetime.timedelta(minutes=1) if n < DUE else now + datetime.timedelta(hours=1 + n % 23),
+        )
+        for n, entry in enumerate(entries)
+    )
+
+
+@pytest.mark.django_db()
+def test_benchmark_scanner_tick(
+    monkeypatch: pytest.MonkeyPatch,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmarks a scanner tick with a small and a large schedule.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        record_property (Callable[[str, object], None]): Pytest property recording fixture.
+    """
+    # Run no Queries
+    ran: list[int] = []
+    monkeypatch.setattr(
+        postgres_scanner.Scanner,
+        "run_postgres_to_shapefile",
+        staticmethod(lambda entry, freq, now_dt: ran.append(freq.id)),
+    )
+
+    subscription = layer_subscriptions.LayerSubscription.objects.create(
+        type=layer_subscriptions.LayerSubscriptionType.POST_GIS,
+        name="postgis",
+        workspace=workspaces.Workspace.objects.create(name="kb"),
+        status=layer_subscriptions.LayerSubscriptionStatus.LOCKED,
+    )
+    now = datetime.datetime.now(tz=ZoneInfo(conf.settings.TIME_ZONE))
+
+    # Benchmark
+    results = {}
+    for scale in SCALES:
+        schedule(subscription, scale, now)
+        timings = []
+        for _ in range(TICKS):
+            ran.clear()
+            with utils.CaptureQueriesContext(db.connection) as queries:
+                start = time.perf_counter()
+                postgres_scanner.Scanner().scan()
+                timings.append(time.perf_counter() - start)
+            assert len(ran) == DUE
+        results[scale] = (statistics.median(timings), len(queries))
+
+    # Report
+    for scale, (seconds, count) in results.items():
+        record_property(f"tick_ms_{scale}_schedules", round(seconds * 1000, 1))
+        record_property(f"tick_queries_{scale}_schedules", count)
+
+    # Check the Tick is Flat
+    (small, small_queries), (large, large_queries) = results.values()
+    assert small_queries == large_queries == 1
+    assert large < small * 3
@@ -0,0 +1,154 @@
+"""Provides unit tests for the WMS and WFS capabilities cache."""
+
+
+# Standard
+import http.server
+import threading
+import time
+import urllib.parse
+
+# Third-Party
+import pytest
+import pytest_django.fixtures
+from owslib.wms import WebMapService
+
+# Local
+from govapp.apps.catalogue import capabilities
+
+# Typing
+from typing import Iterator
+
+
+# WMS 1.3.0 Capabilities, which cannot be parsed as WMS 1.1.1
+CAPABILITIES = b"""<?xml version="1.0" encoding="UTF-8"?>
+<WMS_Capabilities version="1.3.0" xmlns="http://www.opengis.net/wms" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <Service>
+    <Name>WMS</Name>
+    <Title>Stub WMS</Title>
+    <OnlineResource xlink:href="http://localhost/wms"/>
+  </Service>
+  <Capability>
+    <Request>
+      <GetCapabilities>
+        <Format>text/xml</Format>
+        <DCPType><HTTP><Get><OnlineResource xlink:href="http://localhost/wms?"/></Get></HTTP></DCPType>
+      </GetCapabilities>
+      <GetMap>
+        <Format>image/png</Format>
+        <DCPType><HTTP><Get><OnlineResource xlink:href="http://localhost/wms?"/></Get></HTTP></DCPType>
+      </GetMap>
+    </Request>
+    <Layer>
+      <Title>Root</Title>
+      <Layer queryable="0">
+        <Name>roads</Name>
+        <Title>Roads</Title>
+      </Layer>
+    </Layer>
+  </Capability>
+</WMS_Capabilities>
+"""
+
+
+class StubWMSHandler(http.server.BaseHTTPRequestHandler):
+    """Serves WMS 1.3.0 capabilities with an ETag, recording every request."""
+
+    requests: list[tuple[str, str]]
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Responds with the capabilities, or 304 if the ETag matches."""
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(self.path).query))
+        self.requests.append((query["version"], self.headers.get("If-None-Match", "")))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(CAPABILITIES)))
+        self.end_headers()
+        self.wfile.write(CAPABILITIES)
+
+    def log_message(self, *args: object) -> None:
+        """Silences request logging."""
+
+
+@pytest.fixture
+def stub_wms(settings: pytest_django.fixtures.SettingsWrapper) -> Iterator[tuple[str, list[tuple[str, str]]]]:
+    """Runs a stub WMS on an ephemeral local port, with an empty local memory cache.
+
+    Args:
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+
+    Yields:
+        tuple[str, list[tuple[str, str]]]: URL of the stub WMS, and the
+            version and If-None-Match header of every request it received.
+    """
+    # Use a Local Memory Cache
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+    # Start Server
+    requests: list[tuple[str, str]] = []
+    handler = type("Handler", (StubWMSHandler,), {"requests": requests})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    # Yield
+    yield f"http://127.0.0.1:{server.server_address[1]}/wms?map=roads", requests
+
+    # Stop Server
+    server.shutdown()
+    server.server_close()
+
+
+def test_second_lookup_is_cached(stub_wms: tuple[str, list[tuple[str, str]]]) -> None:
+    """Tests the version is negotiated once, and the second lookup makes no requests.
+
+    Args:
+        stub_wms (tuple[str, list[tuple[str, str]]]): Stub WMS fixture.
+    """
+    url, requests = stub_wms
+    versions = ("1.1.1", "1.3.0")
+
+    # First Lookup: 1.1.1 Fails to Parse, then 1.3.0 Succeeds
+    wms = capabilities.get_service("WMS", WebMapService, url, versions, "user", "password")
+    assert list(wms.contents) == ["roads"]
+    assert [version for version, _ in requests] == ["1.1.1", "1.3.0"]
+
+    # Second Lookup
+    requests.clear()
+    wms = capabilities.get_service("WMS", WebMapService, url, versions, "user", "password")
+    assert list(wms.contents) == ["roads"]
+    assert requests == []
+
+    # Other Credentials are Cached Separately
+    capabilities.get_service("WMS", WebMapService, url, versions, "other", "password")
+    assert [version for version, _ in requests] == ["1.1.1", "1.3.0"]
+
+
+def test_stale_lookup_revalidates(
+    stub_wms: tuple[str, list[tuple[str, str]]],
+    settings: pytest_django.fixtures.SettingsWrapper,
+) -> None:
+    """Tests a stale document is served while it is revalidated with its ETag.
+
+    Args:
+        stub_wms (tuple[str, list[tuple[str, str]]]): Stub WMS fixture.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    url, requests = stub_wms
+    capabilities.get_capabilities("WMS", url, "1.3.0")
+
+    # Serve Stale Document and Revalidate in the Background
+    settings.CAPABILITIES_CACHE_FRESH_SECONDS = 0
+    requests.clear()
+    assert capabilities.get_capabilities("WMS", url, "1.3.0") == CAPABILITIES
+    for _ in range(50):
+        if requests:
+            break
+        time.sleep(0.05)
+
+    # Check
+    assert requests == [("1.3.0", '"v1"')]
@@ -0,0 +1,130 @@
+"""Provides unit tests for resumable chunked uploads."""
+
+
+# Standard
+import concurrent.futures
+import fcntl
+import hashlib
+import os
+import pathlib
+
+# Third-Party
+import pytest
+from django.core.files import uploadedfile
+
+# Local
+from govapp.apps.catalogue import chunked_uploads
+
+
+# File Contents
+CONTENT = b"0123456789" * 10
+
+
+def chunk(start: int, end: int) -> uploadedfile.SimpleUploadedFile:
+    """Constructs an uploaded chunk of the file contents.
+
+    Args:
+        start (int): First byte of the chunk.
+        end (int): Byte after the end of the chunk.
+
+    Returns:
+        uploadedfile.SimpleUploadedFile: The chunk.
+    """
+    # Construct and Return
+    return uploadedfile.SimpleUploadedFile("layer.zip", CONTENT[start:end])
+
+
+def test_resume_after_interruption(tmp_path: pathlib.Path) -> None:
+    """Tests an upload resumes from the committed offset, ignoring re-sent chunks."""
+    upload = chunked_uploads.ChunkedUpload(str(tmp_path), "layer.zip")
+
+    # Upload the First Chunks, then Re-send One
+    assert upload.write(chunk(0, 40), 0, len(CONTENT)) == 40
+    assert upload.write(chunk(40, 70), 40, len(CONTENT)) == 70
+    assert upload.write(chunk(40, 70), 40, len(CONTENT)) == 70
+
+    # Check Status
+    assert upload.status() == {"offset": 70, "totalSize": len(CONTENT), "complete": False}
+
+    # Resume with an Overlapping Chunk and Finish
+    assert upload.write(chunk(60, 100), 60, len(CONTENT)) == 100
+    upload.finish(sha256=hashlib.sha256(CONTENT).hexdigest())
+
+    # Check
+    assert (tmp_path / "layer.zip").read_bytes() == CONTENT
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["layer.zip"]
+    assert upload.status() == {"offset": len(CONTENT), "totalSize": None, "complete": True}
+
+
+def test_out_of_order_chunk(tmp_path: pathlib.Path) -> None:
+    """Tests a chunk leaving a gap is rejected with the committed offset."""
+    upload = chunked_uploads.ChunkedUpload(str(tmp_path), "layer.zip")
+    upload.write(chunk(0, 40), 0, len(CONTENT))
+
+    # Check
+    with pytest.raises(chunked_uploads.ChunkOutOfOrderError) as error:
+        upload.write(chunk(50, 60), 50, len(CONTENT))
+    assert error.value.offset == 40
+    assert upload.offset == 40
+
+
+def test_checksum_mismatch(tmp_path: pathlib.Path) -> None:
+    """Tests corrupt chunks are not written and a corrupt file is not released."""
+    upload = chunked_uploads.ChunkedUpload(str(tmp_path), "layer.zip")
+
+    # Chunk Digest
+    with pytest.raises(chunked_uploads.ChecksumMismatchError):
+        upload.write(chunk(0, 40), 0, len(CONTENT), sha256=hashlib.sha256(b"other").hexdigest())
+    assert upload.offset == 0
+    upload.write(chunk(0, 100), 0, len(CONTENT), sha256=hashlib.sha256(CONTENT).hexdigest())
+
+    # File Digest
+    with pytest.raises(chunked_uploads.ChecksumMismatchError):
+        upload.finish(sha256=hashlib.sha256(b"other").hexdigest())
+    assert not (tmp_path / "layer.zip").exists()
+
+
+def test_finish_concurrently(tmp_path: pathlib.Path) -> None:
+    """Tests finishing waits for the lock, and an already finished upload is left as is."""
+    upload = chunked_uploads.ChunkedUpload(str(tmp_path), "layer.zip")
+    upload.write(chunk(0, 100), 0, len(CONTENT))
+
+    # Finish while another Request Holds the Lock
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor, upload.tmp_path.open("r+b") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        finishing = executor.submit(upload.finish, sha256=hashlib.sha256(CONTENT).hexdigest())
+        with pytest.raises(concurrent.futures.TimeoutError):
+            finishing.result(timeout=0.2)
+
+        # Release the File from the other Request
+        os.rename(upload.tmp_path, upload.path)
+        fcntl.flock(f, fcntl.LOCK_UN)
+        assert finishing.result(timeout=5) is None
+
+    # Finish Again
+    upload.finish(sha256=hashlib.sha256(b"other").hexdigest())
+
+    # Check
+    assert (tmp_path / "layer.zip").read_bytes() == CONTENT
+    assert upload.complete
+
+
+def test_late_chunks_after_finishing(tmp_path: pathlib.Path) -> None:
+    """Tests chunks re-sent after finishing do not recreate the temporary files."""
+    upload = chunked_uploads.ChunkedUpload(str(tmp_path), "layer.zip")
+    upload.write(chunk(0, 100), 0, len(CONTENT))
+    upload.finish()
+
+    # Re-send Chunks
+    assert upload.write(chunk(0, 40), 0, len(CONTENT)) == len(CONTENT)
+    assert upload.write(chunk(40, 70), 40, len(CONTENT)) == len(CONTENT)
+
+    # Check
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["layer.zip"]
+    assert (tmp_path / "layer.zip").read_bytes() == CONTENT
+
+    # Check a Chunk of an Unknown Upload is Rejected
+    with pytest.raises(chunked_uploads.ChunkOutOfOrderError) as error:
+        chunked_uploads.ChunkedUpload(str(tmp_path), "other.zip").write(chunk(40, 70), 40, len(CONTENT))
+    assert error.value.offset == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["layer.zip"]
@@ -0,0 +1,101 @@
+"""Provides unit tests for the Catalogue directory scanner."""
+
+
+# Standard
+import json
+import pathlib
+from unittest import mock
+
+# Third-Party
+import pytest
+import pytest_django.fixtures
+
+# Local
+from govapp.apps.catalogue import directory_scanner
+from govapp.apps.metrics import models as metrics_models
+from govapp.apps.metrics import registry
+
+
+def test_scan_smallest_first(
+    tmp_path: pathlib.Path,
+    settings: pytest_django.fixtures.SettingsWrapper,
+) -> None:
+    """Tests files are absorbed smallest first, skipping in-progress files.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    # Create Staging Area
+    settings.PENDING_IMPORT_PATH = f"{tmp_path}/"
+    (tmp_path / "large.zip").write_bytes(b"x" * 300)
+    (tmp_path / "small.geojson").write_bytes(b"x" * 100)
+    (tmp_path / "medium.gpkg").write_bytes(b"x" * 200)
+    (tmp_path / "uploading.zip.tmp").write_bytes(b"x")
+    (tmp_path / "claimed.zip.absorbing").write_bytes(b"x")
+
+    # Scan
+    with mock.patch.object(directory_scanner.directory_absorber, "Absorber") as absorber:
+        directory_scanner.Scanner(max_workers=1).scan()
+
+    # Check
+    absorbed = [c.args[0] for c in absorber.return_value.absorb.call_args_list]
+    assert absorbed == ["small.geojson", "medium.gpkg", "large.zip"]
+
+
+def test_select_keeps_a_worker_for_small_files() -> None:
+    """Tests large files never occupy every worker while small files wait."""
+    # Create Scanner
+    scanner = directory_scanner.Scanner(max_workers=3)
+    small = [("small_1", 1), ("small_2", 2)]
+    large = [("large_2", 20), ("large_1", 10)]
+
+    # Large files start first, up to every worker but one
+    assert scanner.select(small, large, large_running=0) == ("large_2", True)
+    assert scanner.select(small, large, large_running=1) == ("large_1", True)
+    large.insert(0, ("large_3", 30))
+    assert scanner.select(small, large, large_running=2) == ("small_1", False)
+    assert scanner.select(small, large, large_running=2) == ("small_2", False)
+
+    # Once no small files are waiting, large files may use every worker
+    assert scanner.select(small, large, large_running=2) == ("large_3", True)
+    assert scanner.select(small, large, large_running=3) is None
+
+
+@pytest.mark.django_db()
+def test_absorb_concurrently_flushes_metrics(tmp_path: pathlib.Path) -> None:
+    """Tests metrics recorded by forked workers reach the shared samples.
+
+    The test database is in memory, so it is not shared with the workers.
+    The samples flushed by the workers are relayed through a file instead,
+    and added to the shared samples by this process.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+    """
+    # Discard Metrics Buffered by Other Tests
+    registry._pending.clear()
+    flushed = tmp_path / "flushed"
+
+    def absorb(file: str) -> None:
+        registry.CONVERSIONS.inc(format="geojson")
+
+    def relay(name: str, labels: str, amount: float) -> None:
+        with flushed.open("a") as f:
+            f.write(json.dumps([name, labels, amount]) + "\n")
+
+    # Absorb in Forked Workers
+    with (
+        mock.patch.object(directory_scanner.directory_absorber.Absorber, "absorb", side_effect=absorb),
+        mock.patch.object(registry, "_add", side_effect=relay),
+    ):
+        directory_scanner.Scanner(max_workers=2).absorb_concurrently([("first.geojson", 1), ("second.geojson", 2)])
+
+    # Add the Relayed Samples
+    assert not registry._pending
+    for line in flushed.read_text().splitlines():
+        registry._add(*json.loads(line))
+
+    # Check
+    sample = metrics_models.MetricSample.objects.get(name="kb_conversions_total", labels='format="geojson"')
+    assert sample.value == 2
@@ -0,0 +1,55 @@
+"""Provides unit tests for the bulk Layer Attribute writer."""
+
+
+# Third-Party
+import pytest
+import reversion.models
+
+# Local
+from govapp.apps.catalogue.models import catalogue_entries
+from govapp.apps.catalogue.models import layer_attributes
+from govapp.gis import readers
+
+# Typing
+from typing import Callable
+
+
+# Number of Columns of a Wide Layer
+COLUMNS = 300
+
+
+@pytest.mark.django_db()
+def test_bulk_write(django_assert_max_num_queries: Callable) -> None:
+    """Tests a wide layer's attributes are written in a few queries, as one revision.
+
+    Args:
+        django_assert_max_num_queries (Callable): Pytest Django query count
+            assertion fixture.
+    """
+    entry = catalogue_entries.CatalogueEntry.objects.create(name="wide_layer")
+    attributes = [readers.types.Attribute(name=f"column_{n}", type="String", order=n) for n in range(COLUMNS)]
+
+    # Create Attributes
+    with django_assert_max_num_queries(12):
+        created, updated, deleted = layer_attributes.LayerAttribute.bulk_write(entry, attributes, comment="Created")
+
+    # Check
+    assert (len(created), len(updated), len(deleted)) == (COLUMNS, 0, 0)
+    assert entry.attributes.count() == COLUMNS
+    revision = reversion.models.Revision.objects.get(comment="Created")
+    assert revision.version_set.count() == COLUMNS
+
+    # Change a Type, Remove a Column and Add a Column
+    attributes[0] = readers.types.Attribute(name="column_0", type="Integer", order=0)
+    attributes[-1] = readers.types.Attribute(name="added", type="Real", order=COLUMNS - 1)
+    ids = dict(entry.attributes.values_list("name", "id"))
+    with django_assert_max_num_queries(12):
+        created, updated, deleted = layer_attributes.LayerAttribute.bulk_write(entry, attributes, comment="Updated")
+
+    # Check
+    assert [a.name for a in created] == ["added"]
+    assert [a.name for a in updated] == ["column_0"]
+    assert [a.name for a in deleted] == [f"column_{COLUMNS - 1}"]
+    assert entry.attributes.get(name="column_0").type == "Integer"
+    assert entry.attributes.get(name="column_1").id == ids["column_1"]
+    assert reversion.models.Revision.objects.get(comment="Updated").version_set.count() == 2
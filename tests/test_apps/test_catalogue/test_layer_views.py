@@ -0,0 +1,127 @@
+"""Provides unit tests for the Catalogue layer views."""
+
+
+# Standard
+import gzip
+import json
+import pathlib
+
+# Third-Party
+from django import http
+from django import test
+import pytest
+from rest_framework import status
+
+# Local
+import factories
+from govapp.apps.catalogue import models
+
+
+@pytest.fixture()
+def layer_url(
+    tmp_path: pathlib.Path,
+    catalogue_entry_factory: factories.catalogue.catalogue_entries.CatalogueEntryFactory,
+    client: test.Client,
+) -> str:
+    """Creates a Catalogue Entry with a GeoJSON layer.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+        catalogue_entry_factory (CatalogueEntryFactory): PyTest fixture for a
+            Catalogue Entry factory.
+        client (test.Client): Django test client fixture.
+
+    Returns:
+        str: URL of the layer.
+    """
+    # Create GeoJSON File
+    geojson = tmp_path / "layer.geojson"
+    geojson.write_text(json.dumps({
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "properties": {"name": name}, "geometry": {"type": "Point", "coordinates": [i, i]}}
+            for i, name in enumerate(["first", "second", "third"])
+        ],
+    }))
+
+    # Create Catalogue Entry
+    entry = catalogue_entry_factory.create()
+    models.layer_submissions.LayerSubmission.objects.filter(catalogue_entry=entry).update(geojson=str(geojson))
+
+    # Authenticate
+    client.force_login(entry.assigned_to)
+
+    # Return
+    return f"/api/catalogue/entries/{entry.id}/layer/"
+
+
+def features(resp: http.StreamingHttpResponse) -> list[str]:
+    """Retrieves the names of the features in a layer response.
+
+    Args:
+        resp (http.StreamingHttpResponse): Layer response.
+
+    Returns:
+        list[str]: Name of each feature.
+    """
+    # Decompress and Parse
+    content = b"".join(resp.streaming_content)
+    if resp.get("Content-Encoding") == "gzip":
+        content = gzip.decompress(content)
+
+    # Return
+    return [f["properties"]["name"] for f in json.loads(content)["features"]]
+
+
+@pytest.mark.django_db()
+def test_layer_filters(client: test.Client, layer_url: str) -> None:
+    """Tests features are only filtered on namespaced query parameters.
+
+    Args:
+        client (test.Client): Django test client fixture.
+        layer_url (str): URL of the layer.
+    """
+    # Unfiltered, Ignoring Cache Busters
+    resp = client.get(layer_url, {"v": "1", "t": "2"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert features(resp) == ["first", "second", "third"]
+
+    # Filtered
+    resp = client.get(layer_url, {"filter[name]": "second", "v": "1"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert features(resp) == ["second"]
+
+    # Paginated
+    resp = client.get(layer_url, {"offset": "1", "limit": "1"})
+    assert features(resp) == ["second"]
+
+
+@pytest.mark.django_db()
+def test_layer_revalidation_and_compression(client: test.Client, layer_url: str) -> None:
+    """Tests layers are revalidated with their ETag and compressed when accepted.
+
+    Args:
+        client (test.Client): Django test client fixture.
+        layer_url (str): URL of the layer.
+    """
+    # Compressed
+    resp = client.get(layer_url, {"filter[name]": "third"}, headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["Content-Encoding"] == "gzip"
+    assert features(resp) == ["third"]
+
+    # Check the ETag was Weakened by Compression
+    assert resp["ETag"].startswith("W/")
+    etag = resp["ETag"].removeprefix("W/")
+
+    # Not Modified, with the Weak or Strong ETag
+    for if_none_match in (resp["ETag"], etag):
+        resp = client.get(layer_url, {"filter[name]": "third"}, headers={"If-None-Match": if_none_match})
+        assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+        assert resp["ETag"] == etag
+
+    # Another Query is Modified
+    resp = client.get(layer_url, {"filter[name]": "first"}, headers={"If-None-Match": etag})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["ETag"] != etag
+    assert features(resp) == ["first"]
@@ -0,0 +1,123 @@
+"""Provides unit tests for the Postgres subscription scanner schedule."""
+
+
+# Standard
+import datetime
+from zoneinfo import ZoneInfo
+
+# Third-Party
+from django import conf
+import pytest
+
+# Local
+from govapp.apps.catalogue import postgres_scanner
+from govapp.apps.catalogue.models import catalogue_entries
+from govapp.apps.catalogue.models import custom_query_frequency
+from govapp.apps.catalogue.models import layer_subscriptions
+from govapp.apps.publisher.models import workspaces
+
+# Typing
+from typing import Any
+
+
+def local(*args: int) -> datetime.datetime:
+    """Constructs a datetime in the local time zone.
+
+    Args:
+        *args (int): Year, month, day, hour and minute.
+
+    Returns:
+        datetime.datetime: The local datetime.
+    """
+    return datetime.datetime(*args, tzinfo=ZoneInfo(conf.settings.TIME_ZONE))
+
+
+@pytest.mark.parametrize(
+    ("options", "last_job_run", "expected"),
+    [
+        ({"type": 1, "every_minutes": 15}, local(2026, 3, 2, 9, 50), local(2026, 3, 2, 10, 5)),
+        ({"type": 2, "every_hours": 6}, local(2026, 3, 2, 21, 0), local(2026, 3, 3, 3, 0)),
+        ({"type": 3, "hour": 9, "minute": 30}, local(2026, 3, 2, 8, 0), local(2026, 3, 2, 9, 30)),
+        ({"type": 3, "hour": 9, "minute": 30}, local(2026, 3, 2, 9, 30), local(2026, 3, 3, 9, 30)),
+        ({"type": 4, "hour": 9, "minute": 0, "day_of_week": 1}, local(2026, 3, 2, 8, 0), local(2026, 3, 2, 9, 0)),  # Monday
+        ({"type": 4, "hour": 9, "minute": 0, "day_of_week": 1}, local(2026, 3, 2, 10, 0), local(2026, 3, 9, 9, 0)),
+        ({"type": 4, "hour": 9, "minute": 0, "day_of_week": 7}, local(2026, 3, 2, 10, 0), local(2026, 3, 8, 9, 0)),
+        ({"type": 5, "hour": 0, "minute": 0, "date": 31}, local(2026, 1, 31, 1, 0), local(2026, 2, 28, 0, 0)),
+        ({"type": 5, "hour": 0, "minute": 0, "date": 15}, local(2026, 12, 20, 0, 0), local(2027, 1, 15, 0, 0)),
+        ({"type": 3, "hour": 9, "minute": 30}, None, None),
+    ],
+)
+def test_calculate_next_run_at(
+    options: dict[str, Any],
+    last_job_run: datetime.datetime,
+    expected: datetime.datetime,
+) -> None:
+    """Tests the next run is the first scheduled time after the last run.
+
+    Args:
+        options (dict[str, Any]): Frequency options.
+        last_job_run (datetime.datetime): When the query was last run.
+        expected (datetime.datetime): When the query is next due.
+    """
+    frequency = custom_query_frequency.CustomQueryFrequency(last_job_run=last_job_run, **options)
+    assert custom_query_frequency.calculate_next_run_at(frequency) == expected
+
+
+@pytest.mark.django_db()
+def test_scan_runs_due_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests the scanner runs only the due queries, and reschedules them.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    subscription = layer_subscriptions.LayerSubscription.objects.create(
+        type=layer_subscriptions.LayerSubscriptionType.POST_GIS,
+        name="postgis",
+        workspace=workspaces.Workspace.objects.create(name="kb"),
+        status=layer_subscriptions.LayerSubscriptionStatus.LOCKED,
+    )
+    now = datetime.datetime.now(tz=ZoneInfo(conf.settings.TIME_ZONE))
+
+    def frequency(name: str, last_job_run: datetime.datetime, force_run: bool = False) -> custom_query_frequency.CustomQueryFrequency:
+        entry = catalogue_entries.CatalogueEntry.objects.create(
+            name=name,
+            type=catalogue_entries.CatalogueEntryType.SUBSCRIPTION_QUERY,
+            layer_subscription=subscription,
+            force_run_postgres_scanner=force_run,
+        )
+        return custom_query_frequency.CustomQueryFrequency.objects.create(
+            catalogue_entry=entry,
+            type=custom_query_frequency.FrequencyType.EVERY_HOURS,
+            every_hours=1,
+            last_job_run=last_job_run,
+        )
+
+    # Schedule Queries
+    due = frequency("due", now - datetime.timedelta(hours=2))
+    never_run = frequency("never_run", None)
+    not_due = frequency("not_due", now - datetime.timedelta(minutes=10))
+    forced = frequency("forced", now - datetime.timedelta(minutes=10), force_run=True)
+
+    # Scan, without Running the Queries
+    ran = []
+
+    def run(entry: catalogue_entries.CatalogueEntry, freq: custom_query_frequency.CustomQueryFrequency, now_dt: datetime.datetime) -> None:
+        ran.append(freq.id)
+        freq.last_job_run = now_dt
+        freq.save()
+
+    monkeypatch.setattr(postgres_scanner.Scanner, "run_postgres_to_shapefile", staticmethod(run))
+    postgres_scanner.Scanner().scan()
+
+    # Check
+    assert sorted(ran) == sorted([due.id, never_run.id, forced.id])
+    due.refresh_from_db()
+    assert due.next_run_at > now
+    forced.catalogue_entry.refresh_from_db()
+    assert not forced.catalogue_entry.force_run_postgres_scanner
+    assert not_due.id not in ran
+
+    # Check Nothing is Due on the Next Tick
+    ran.clear()
+    postgres_scanner.Scanner().scan()
+    assert ran == []
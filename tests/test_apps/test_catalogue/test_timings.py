@@ -0,0 +1,84 @@
+"""Provides unit tests for the ingestion timings of absorbed files."""
+
+
+# Standard
+import datetime
+
+# Third-Party
+from django import conf
+from django import test
+from django.contrib.auth import models as auth_models
+import pytest
+from rest_framework import status
+
+# Local
+from govapp.apps.catalogue import models
+from govapp.apps.catalogue import timings
+
+
+@pytest.mark.django_db()
+def test_timings_saved_and_reported(client: test.Client) -> None:
+    """Tests stage timings are saved against layer submissions and reported.
+
+    Args:
+        client (test.Client): Django test client fixture.
+    """
+    # Absorb a File with Two Layers
+    with timings.start() as file_timer:
+        with timings.span("archive", nbytes=1000):
+            pass
+        for layer in range(2):
+            with timings.start():
+                entry = models.catalogue_entries.CatalogueEntry.objects.create(name=f"layer_{layer}")
+                with timings.span("database"):
+                    submission = models.layer_submissions.LayerSubmission.objects.create(
+                        file="/data/layers.zip",
+                        file_size=1000,
+                        is_active=True,
+                        created_at=datetime.datetime.now(datetime.timezone.utc),
+                        hash="hash",
+                        catalogue_entry=entry,
+                    )
+                    timings.attach(submission)
+                with timings.span("convert_to_geojson") as span:
+                    span.bytes = 500 * (layer + 1)
+                with timings.span("database"):
+                    pass
+
+    # Check the File Timer only has its Own Stages
+    assert set(file_timer.stages) == {"archive"}
+
+    # Check each Layer Submission has the File and Layer Stages
+    for submission in models.layer_submissions.LayerSubmission.objects.all():
+        assert set(submission.timings) == {"archive", "database", "convert_to_geojson"}
+        assert submission.timings["archive"]["bytes"] == 1000
+        assert "bytes" not in submission.timings["database"]
+
+    # Spans outside of a Timer are not Recorded
+    with timings.span("notify"):
+        pass
+
+    # Check Anonymous Users cannot see the Report
+    path = "/api/catalogue/layers/submissions/timings/"
+    administrators, _ = auth_models.Group.objects.get_or_create(name=conf.settings.GROUP_ADMINISTRATORS)
+    assert client.get(path).status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+    # Report Percentiles as an Administrator
+    user = auth_models.User.objects.create_user(username="admin", email="admin@example.com")
+    user.groups.add(administrators)
+    client.force_login(user)
+    report = client.get(path).json()
+
+    # Check
+    assert report["count"] == 2
+    assert set(report["stages"]) == {"archive", "database", "convert_to_geojson", "total"}
+    assert report["stages"]["convert_to_geojson"]["bytes"] == {"p50": 750.0, "p90": 950.0, "p99": 995.0, "max": 1000}
+    assert report["stages"]["total"]["bytes"] is None
+
+
+def test_percentiles() -> None:
+    """Tests percentiles are interpolated between the closest ranks."""
+    report = timings.percentiles({"extract": {"seconds": float(s)}} for s in range(1, 101))
+    assert report["count"] == 100
+    assert report["stages"]["extract"]["seconds"] == {"p50": 50.5, "p90": 90.1, "p99": 99.01, "max": 100.0}
+    assert timings.percentiles([]) == {"count": 0, "stages": {}}
@@ -0,0 +1,193 @@
+"""Provides unit tests for the asynchronous webhook deliveries."""
+
+
+# Standard
+import datetime
+import http.server
+import pathlib
+import threading
+import time
+
+# Third-Party
+from django.utils import timezone
+import pytest
+import pytest_django.fixtures
+
+# Local
+from govapp.apps.catalogue import models
+from govapp.apps.catalogue import webhooks
+import factories
+
+# Typing
+from typing import Iterator
+
+
+class StubReceiverHandler(http.server.BaseHTTPRequestHandler):
+    """Receives webhook POSTs, responding according to the path."""
+
+    received: dict[str, bytes]
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Records the body, then responds slowly, successfully or with an error."""
+        self.received[self.path] = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/slow":
+            time.sleep(1)
+        status = {"/error": 500, "/gone": 404}.get(self.path, 200)
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        """Silences request logging."""
+
+
+@pytest.fixture
+def receiver() -> Iterator[tuple[str, dict[str, bytes]]]:
+    """Runs a stub webhook receiver on an ephemeral local port.
+
+    Yields:
+        tuple[str, dict[str, bytes]]: URL of the receiver, and the body it
+            received on each path.
+    """
+    # Start Server
+    received: dict[str, bytes] = {}
+    handler = type("Handler", (StubReceiverHandler,), {"received": received})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    # Yield
+    yield f"http://127.0.0.1:{server.server_address[1]}", received
+
+    # Stop Server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.django_db()
+def test_deliver_pending(
+    receiver: tuple[str, dict[str, bytes]],
+    catalogue_entry_factory: factories.catalogue.catalogue_entries.CatalogueEntryFactory,
+    webhook_notification_factory: factories.catalogue.notifications.WebhookNotificationFactory,
+    settings: pytest_django.fixtures.SettingsWrapper,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Tests queued deliveries are POSTed concurrently, and failures retried.
+
+    Args:
+        receiver (tuple[str, dict[str, bytes]]): Stub receiver fixture.
+        catalogue_entry_factory (CatalogueEntryFactory): Catalogue Entry factory.
+        webhook_notification_factory (WebhookNotificationFactory): Webhook
+            Notification factory.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+        tmp_path (pathlib.Path): Pytest temporary directory fixture.
+    """
+    url, received = receiver
+    settings.WEBHOOK_SPOOL_DIR = str(tmp_path / "spool")
+    settings.WEBHOOK_BACKOFF_SECONDS = 60
+    settings.WEBHOOK_MAX_ATTEMPTS = 3
+
+    # Queue a GeoJSON for Slow, Failing and Successful Receivers
+    entry = catalogue_entry_factory.create()
+    geojson = tmp_path / "layer.geojson"
+    geojson.write_bytes(b'{"type": "FeatureCollection", "features": []}')
+    paths = ["/slow", "/slow2", "/error", "/gone", "/ok"]
+    deliveries = webhooks.queue_geojson(
+        *(webhook_notification_factory.create(url=f"{url}{path}", catalogue_entry=entry) for path in paths),
+        geojson=geojson,
+    )
+    geojson.unlink()
+    assert len(deliveries) == len(paths)
+
+    # Deliver
+    start = time.monotonic()
+    assert webhooks.deliver_pending(max_workers=len(paths)) == len(paths)
+    elapsed = time.monotonic() - start
+
+    # Check the Slow Receivers did not Delay Each Other
+    assert elapsed < 1.9
+    assert received["/ok"] == b'{"type": "FeatureCollection", "features": []}'
+    statuses = {d.url.removeprefix(url): d for d in models.notifications.WebhookDelivery.objects.all()}
+    assert statuses["/slow"].status == models.notifications.WebhookDeliveryStatus.DELIVERED
+    assert statuses["/ok"].status == models.notifications.WebhookDeliveryStatus.DELIVERED
+    assert statuses["/gone"].status == models.notifications.WebhookDeliveryStatus.FAILED
+
+    # Check the Server Error is Retried Later
+    retry = statuses["/error"]
+    assert retry.status == models.notifications.WebhookDeliveryStatus.PENDING
+    assert retry.response_status == 500
+    assert retry.attempts == 1
+    assert retry.next_attempt_at > retry.last_attempt_at
+    assert webhooks.deliver_pending() == 0
+    assert pathlib.Path(retry.payload).exists()
+
+    # Give up after the Maximum Attempts
+    for _ in range(2):
+        models.notifications.WebhookDelivery.objects.filter(id=retry.id).update(next_attempt_at=retry.last_attempt_at)
+        assert webhooks.deliver_pending() == 1
+    retry.refresh_from_db()
+    assert retry.status == models.notifications.WebhookDeliveryStatus.FAILED
+    assert retry.attempts == 3
+    assert not pathlib.Path(retry.payload).exists()
+
+
+@pytest.mark.django_db()
+def test_recover_stalled(
+    receiver: tuple[str, dict[str, bytes]],
+    catalogue_entry_factory: factories.catalogue.catalogue_entries.CatalogueEntryFactory,
+    webhook_notification_factory: factories.catalogue.notifications.WebhookNotificationFactory,
+    settings: pytest_django.fixtures.SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Tests slow POSTs keep their heartbeat, and interrupted ones count as attempts.
+
+    Args:
+        receiver (tuple[str, dict[str, bytes]]): Stub receiver fixture.
+        catalogue_entry_factory (CatalogueEntryFactory): Catalogue Entry factory.
+        webhook_notification_factory (WebhookNotificationFactory): Webhook
+            Notification factory.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        tmp_path (pathlib.Path): Pytest temporary directory fixture.
+    """
+    url, _ = receiver
+    settings.WEBHOOK_SPOOL_DIR = str(tmp_path / "spool")
+    settings.WEBHOOK_MAX_ATTEMPTS = 3
+    monkeypatch.setattr(webhooks, "HEARTBEAT", datetime.timedelta(seconds=0.2))
+
+    # Queue a GeoJSON
+    entry = catalogue_entry_factory.create()
+    geojson = tmp_path / "layer.geojson"
+    geojson.write_bytes(b'{"type": "FeatureCollection", "features": []}')
+    slow, interrupted, exhausted = webhooks.queue_geojson(
+        *(webhook_notification_factory.create(url=f"{url}{path}", catalogue_entry=entry) for path in ["/slow", "/a", "/b"]),
+        geojson=geojson,
+    )
+
+    # Check the Heartbeat is Refreshed during a Slow POST
+    models.notifications.WebhookDelivery.objects.exclude(id=slow.id).update(next_attempt_at=timezone.now() + datetime.timedelta(days=1))
+    assert webhooks.deliver_pending() == 1
+    slow.refresh_from_db()
+    assert slow.status == models.notifications.WebhookDeliveryStatus.DELIVERED
+    assert slow.heartbeat_at > slow.last_attempt_at
+
+    # Interrupt the other Deliveries Mid-POST
+    stalled_at = timezone.now() - webhooks.STALLED_AFTER - datetime.timedelta(seconds=1)
+    for delivery, attempts in ((interrupted, 0), (exhausted, 2)):
+        models.notifications.WebhookDelivery.objects.filter(id=delivery.id).update(
+            status=models.notifications.WebhookDeliveryStatus.DELIVERING,
+            attempts=attempts,
+            last_attempt_at=stalled_at,
+            heartbeat_at=stalled_at,
+        )
+
+    # Check the Interruptions are Counted as Attempts
+    webhooks.deliver_pending()
+    interrupted.refresh_from_db()
+    exhausted.refresh_from_db()
+    assert interrupted.status == models.notifications.WebhookDeliveryStatus.PENDING
+    assert interrupted.attempts == 1
+    assert exhausted.status == models.notifications.WebhookDeliveryStatus.FAILED
+    assert exhausted.attempts == 3
+    assert exhausted.error == "Delivery was interrupted mid-POST"
@@ -0,0 +1,137 @@
+"""Provides unit tests for the Email Outbox."""
+
+
+# Third-Party
+from django.core import mail
+import pytest
+import pytest_django.fixtures
+
+# Local
+from govapp.apps.catalogue import emails as catalogue_emails
+from govapp.apps.emails import emails
+from govapp.apps.emails import models
+from govapp.apps.emails import outbox
+from govapp.apps.logs import models as logs_models
+import factories
+
+# Typing
+from typing import Any
+
+
+@pytest.mark.django_db()
+def test_send_outbox(
+    catalogue_entry_factory: factories.catalogue.catalogue_entries.CatalogueEntryFactory,
+    user_factory: factories.accounts.users.UserFactory,
+    settings: pytest_django.fixtures.SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests emails are rendered once per greeting, and sent over one connection.
+
+    Args:
+        catalogue_entry_factory (CatalogueEntryFactory): Catalogue Entry factory.
+        user_factory (UserFactory): User factory.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    settings.EMAIL_DELIVERY = "on"
+    settings.PRODUCTION_EMAIL = True
+    entry = catalogue_entry_factory.create()
+    users = [user_factory.create(first_name="Alex", username=f"alex{i}") for i in range(3)]
+    users.append(user_factory.create(first_name="Sam", username="sam"))
+
+    # Count Renders and Connections
+    renders = []
+    connections = []
+    render = emails.TemplateEmailBase.render
+    get_connection = outbox.mail.get_connection
+    monkeypatch.setattr(emails.TemplateEmailBase, "render", lambda self, context: renders.append(1) or render(self, context))
+    monkeypatch.setattr(outbox.mail, "get_connection", lambda **kw: connections.append(1) or get_connection(**kw))
+
+    # Queue Emails
+    queued = catalogue_emails.CatalogueEntryUpdateSuccessEmail().send_to(
+        *users,
+        users[0],  # Duplicated
+        context={"name": entry.name},
+        about=entry,
+    )
+    assert len(queued) == 4
+    assert len(renders) == 2
+    assert mail.outbox == []
+
+    # Fail to Send to one Recipient
+    send = mail.EmailMultiAlternatives.send
+
+    def flaky_send(self: mail.EmailMultiAlternatives, *args: Any, **kwargs: Any) -> int:
+        if self.to == ["sam@example.com"]:
+            raise ConnectionResetError("Connection reset by peer")
+        return send(self, *args, **kwargs)
+
+    monkeypatch.setattr(mail.EmailMultiAlternatives, "send", flaky_send)
+
+    # Send
+    assert outbox.send_pending() == 4
+    assert len(connections) == 1
+    assert sorted(m.to[0] for m in mail.outbox) == sorted(u.email for u in users[:3])
+    assert "Dear Alex" in mail.outbox[0].body
+    assert entry.name in mail.outbox[0].alternatives[0][0]
+
+    # Check the Failure is Retried Later
+    failed = models.OutboxEmail.objects.get(to="sam@example.com")
+    assert failed.status == models.OutboxEmailStatus.PENDING
+    assert failed.attempts == 1
+    assert outbox.send_pending() == 0
+
+    # Give up after the Maximum Attempts
+    settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 2
+    models.OutboxEmail.objects.filter(id=failed.id).update(next_attempt_at=failed.last_attempt_at)
+    assert outbox.send_pending() == 1
+    failed.refresh_from_db()
+    assert failed.status == models.OutboxEmailStatus.FAILED
+
+    # Check the Communications Log
+    subjects = sorted(e.subject for e in logs_models.CommunicationsLogEntry.objects.all())
+    assert len(subjects) == 4
+    assert subjects[-1] == f"[Undelivered] {catalogue_emails.CatalogueEntryUpdateSuccessEmail.subject}"
+    assert all(e.content_object == entry for e in logs_models.CommunicationsLogEntry.objects.all())
+
+
+@pytest.mark.django_db()
+def test_send_outbox_delivery_settings(
+    user_factory: factories.accounts.users.UserFactory,
+    settings: pytest_django.fixtures.SettingsWrapper,
+) -> None:
+    """Tests nothing is sent with delivery off, and non-production mail is redirected.
+
+    Args:
+        user_factory (UserFactory): User factory.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    user = user_factory.create(first_name="Alex", username="alex")
+    email = catalogue_emails.CatalogueEntryUpdateSuccessEmail()
+
+    # Send with Delivery Off
+    settings.EMAIL_DELIVERY = "off"
+    suppressed = email.send_to(user, context={"name": "layer"})[0]
+    assert outbox.send_pending() == 1
+    assert mail.outbox == []
+    suppressed.refresh_from_db()
+    assert suppressed.status == models.OutboxEmailStatus.SUPPRESSED
+    assert outbox.send_pending() == 0
+
+    # Send from a Non-Production Instance
+    settings.EMAIL_DELIVERY = "on"
+    settings.PRODUCTION_EMAIL = False
+    settings.EMAIL_INSTANCE = "UAT"
+    settings.NON_PROD_EMAIL = "dev@example.com, test@example.com"
+    email.send_to(user, context={"name": "layer"})
+    assert outbox.send_pending() == 1
+    assert mail.outbox[0].to == ["dev@example.com", "test@example.com"]
+    assert mail.outbox[0].subject == f"[UAT] {email.subject}"
+
+    # Send from a Non-Production Instance without Redirect Addresses
+    settings.NON_PROD_EMAIL = ""
+    unaddressed = email.send_to(user, context={"name": "layer"})[0]
+    assert outbox.send_pending() == 1
+    assert len(mail.outbox) == 1
+    unaddressed.refresh_from_db()
+    assert unaddressed.status == models.OutboxEmailStatus.SUPPRESSED
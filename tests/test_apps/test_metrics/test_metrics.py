@@ -0,0 +1,116 @@
+"""Provides unit tests for the Prometheus metrics."""
+
+
+# Standard
+import datetime
+
+# Third-Party
+from django import test
+from django.contrib.auth import models as auth_models
+from django.utils import timezone
+import django_cron.models
+import pytest
+import pytest_django.fixtures
+
+# Local
+from govapp.apps.metrics import models
+from govapp.apps.metrics import registry
+
+
+@pytest.fixture(autouse=True)
+def empty_buffer() -> None:
+    """Discards metrics buffered by other tests."""
+    registry._pending.clear()
+
+
+@pytest.mark.django_db()
+def test_metrics_add_up_across_processes() -> None:
+    """Tests values flushed by separate processes are summed."""
+    # Flush from "another Process"
+    registry.CONVERSION_BYTES.inc(100, format="geojson", direction="read")
+    registry.GEOSERVER_REQUEST_DURATION.observe(0.3, method="GET", status="200")
+    registry.flush()
+
+    # Flush from this Process
+    registry.CONVERSION_BYTES.inc(50, format="geojson", direction="read")
+    registry.GEOSERVER_REQUEST_DURATION.observe(20, method="GET", status="200")
+    registry.flush()
+
+    # Check
+    def value(name: str, labels: str) -> float:
+        return models.MetricSample.objects.get(name=name, labels=labels).value
+
+    assert value("kb_conversion_bytes_total", 'format="geojson",direction="read"') == 150
+    assert value("kb_geoserver_request_duration_seconds_bucket", 'method="GET",status="200",le="0.5"') == 1
+    assert value("kb_geoserver_request_duration_seconds_bucket", 'method="GET",status="200",le="30"') == 2
+    assert value("kb_geoserver_request_duration_seconds_bucket", 'method="GET",status="200",le="+Inf"') == 2
+    assert value("kb_geoserver_request_duration_seconds_sum", 'method="GET",status="200"') == 20.3
+    assert value("kb_geoserver_request_duration_seconds_count", 'method="GET",status="200"') == 2
+    assert not registry._pending
+
+    # Check the Labels must Match
+    with pytest.raises(ValueError):
+        registry.CONVERSIONS.inc(format="geojson", direction="read")
+
+
+@pytest.mark.django_db()
+def test_metrics_endpoint(client: test.Client, settings: pytest_django.fixtures.SettingsWrapper) -> None:
+    """Tests cron job runs are recorded and exported with the queue depths.
+
+    Args:
+        client (test.Client): Django test client fixture.
+        settings (pytest_django.fixtures.SettingsWrapper): Django settings fixture.
+    """
+    # Run Cron Jobs
+    now = timezone.now()
+    for success in (True, False):
+        django_cron.models.CronJobLog.objects.create(
+            code="govapp.catalogue.directory_scanner",
+            start_time=now - datetime.timedelta(seconds=4),
+            end_time=now,
+            is_success=success,
+        )
+
+    # Check Prometheus needs the Token
+    settings.METRICS_TOKEN = "secret"
+    auth_models.Group.objects.get_or_create(name=settings.GROUP_ADMINISTRATORS)
+    assert client.get("/metrics/", HTTP_AUTHORIZATION="Bearer wrong").status_code == 403
+
+    # Scrape
+    response = client.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    lines = response.content.decode().splitlines()
+
+    # Check
+    job = 'job="govapp.catalogue.directory_scanner"'
+    assert "# TYPE kb_cron_job_runs_total counter" in lines
+    assert f"kb_cron_job_runs_total{{{job}}} 2" in lines
+    assert f"kb_cron_job_failures_total{{{job}}} 1" in lines
+    assert f'kb_cron_job_duration_seconds_bucket{{{job},le="2.5"}} 0' in lines
+    assert f'kb_cron_job_duration_seconds_bucket{{{job},le="5"}} 2' in lines
+    assert f"kb_cron_job_duration_seconds_count{{{job}}} 2" in lines
+    assert f"kb_cron_job_last_success_timestamp_seconds{{{job}}} {now.timestamp()!r}" in lines
+    assert 'kb_geoserver_queue_items{status="ready"} 0' in lines
+    assert 'kb_webhook_deliveries{status="pending"} 0' in lines
+    assert 'kb_outbox_emails{status="failed"} 0' in lines
+
+    # Check Buckets are in Ascending Order
+    buckets = [line for line in lines if line.startswith("kb_cron_job_duration_seconds_bucket")]
+    assert buckets[0] == f'kb_cron_job_duration_seconds_bucket{{{job},le="0.005"}} 0'
+    assert buckets[-1] == f'kb_cron_job_duration_seconds_bucket{{{job},le="+Inf"}} 2'
+
+
+def test_flush_at_exit_without_database(caplog: pytest.LogCaptureFixture) -> None:
+    """Tests the exit flush is skipped quietly when the database is unavailable.
+
+    Args:
+        caplog (pytest.LogCaptureFixture): Pytest log capture fixture.
+    """
+    # Flush without Database Access
+    registry.CONVERSIONS.inc(format="geojson")
+    registry._flush_at_exit()
+
+    # Check
+    assert not caplog.records
+    assert registry._pending
@@ -0,0 +1,98 @@
+"""Provides unit tests for the CDDP file index."""
+
+
+# Standard
+import pathlib
+import shutil
+
+# Third-Party
+import pytest
+
+# Local
+from govapp.apps.publisher import cddp_index
+
+
+def indexed(**kwargs: object) -> list[str]:
+    """Lists the paths of the indexed files.
+
+    Args:
+        **kwargs (object): Arguments for `cddp_index.list_files`.
+
+    Returns:
+        list[str]: Paths of the listed files.
+    """
+    # Return
+    return [f["filepath"] for f in cddp_index.list_files(**kwargs)["results"]]
+
+
+@pytest.mark.django_db
+def test_refresh_incremental(tmp_path: pathlib.Path) -> None:
+    """Tests only modified directories are listed again when refreshing.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+    """
+    # Create Share
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "c").mkdir()
+    (tmp_path / "root.txt").write_bytes(b"1")
+    (tmp_path / "a" / "b" / "deep.zip").write_bytes(b"12")
+    (tmp_path / "c" / "other.zip").write_bytes(b"123")
+
+    # Initial Refresh
+    assert cddp_index.refresh(str(tmp_path)) == 4
+    assert indexed(order_by="filepath") == ["a/b/deep.zip", "c/other.zip", "root.txt"]
+    assert cddp_index.refresh(str(tmp_path)) == 0
+
+    # Add a File and Remove a Directory
+    (tmp_path / "a" / "b" / "new.zip").write_bytes(b"1234")
+    shutil.rmtree(tmp_path / "c")
+
+    # Check Only the Modified Directories are Listed
+    assert cddp_index.refresh(str(tmp_path)) == 2
+    assert indexed(order_by="-size_bytes") == ["a/b/new.zip", "a/b/deep.zip", "root.txt"]
+
+    # Check a Full Refresh Lists Everything
+    assert cddp_index.refresh(str(tmp_path), full=True) == 3
+
+
+@pytest.mark.django_db
+def test_list_files(tmp_path: pathlib.Path) -> None:
+    """Tests listings are filtered and paginated, and unknown sort fields rejected.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+    """
+    # Create Share
+    for n in range(5):
+        (tmp_path / f"layer_{n}.zip").write_bytes(b"0" * 2000)
+    (tmp_path / "readme.txt").write_bytes(b"0")
+    cddp_index.refresh(str(tmp_path))
+
+    # Check
+    listing = cddp_index.list_files(order_by="-filepath", offset=1, limit=2, search="LAYER")
+    assert listing["count"] == 5
+    assert [f["filepath"] for f in listing["results"]] == ["layer_3.zip", "layer_2.zip"]
+    assert listing["results"][0]["size_kb"] == 2
+    with pytest.raises(ValueError):
+        cddp_index.list_files(order_by="password")
+
+
+@pytest.mark.django_db
+def test_refresh_concurrently(tmp_path: pathlib.Path) -> None:
+    """Tests a directory indexed by a concurrent refresh is updated, not duplicated.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+    """
+    # Create Share
+    (tmp_path / "layer.zip").write_bytes(b"1")
+    modified_ns = tmp_path.stat().st_mtime_ns
+
+    # Index the Directory from Two Refreshes which Loaded an Empty Index
+    cddp_index._index_directory(str(tmp_path), "", modified_ns, None)
+    cddp_index._index_directory(str(tmp_path), "", modified_ns, None)
+
+    # Check
+    assert indexed() == ["layer.zip"]
+    assert cddp_index.refresh(str(tmp_path)) == 0
@@ -0,0 +1,133 @@
+"""Provides unit tests for resumable downloads from the GeoServer manager API."""
+
+
+# Standard
+import base64
+import hashlib
+import pathlib
+from unittest import mock
+
+# Third-Party
+import pytest
+from rest_framework import permissions
+from rest_framework import test
+
+# Local
+from govapp.apps.catalogue.models import catalogue_entries
+from govapp.apps.publisher import views_geoserver_manager
+from govapp.apps.publisher.models import geoserver_queues
+from govapp.apps.publisher.models import publish_entries
+
+# Typing
+from typing import Any, Callable
+
+
+# File Contents
+CONTENT = bytes(range(256)) * 16
+
+
+@pytest.fixture
+def download(tmp_path: pathlib.Path) -> Callable[..., Any]:
+    """Creates a converted queue item and returns a function to download it.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+
+    Returns:
+        Callable[..., Any]: Function performing a download with the given headers.
+    """
+    # Create Converted File and Queue Item
+    converted = tmp_path / "layer.gpkg"
+    converted.write_bytes(CONTENT)
+    catalogue_entry = catalogue_entries.CatalogueEntry.objects.create(name="layer", description="layer")
+    publish_entry = publish_entries.PublishEntry.objects.create(catalogue_entry=catalogue_entry)
+    queue_item = geoserver_queues.GeoServerQueue.objects.create(
+        publish_entry=publish_entry,
+        converted_file_path=str(converted),
+        converted_file_sha256=hashlib.sha256(CONTENT).hexdigest(),
+    )
+    view = views_geoserver_manager.GeoServerManagerQueueViewSet.as_view({"get": "download"})
+
+    def perform(**headers: str) -> Any:
+        request = test.APIRequestFactory().get(f"/api/geoserver-manager/layers/{queue_item.pk}/download/", headers=headers)
+        with (
+            mock.patch.object(views_geoserver_manager.GeoServerManagerQueueViewSet, "authentication_classes", []),
+            mock.patch.object(views_geoserver_manager.GeoServerManagerQueueViewSet, "permission_classes", [permissions.AllowAny]),
+        ):
+            return view(request, pk=queue_item.pk)
+
+    # Return
+    return perform
+
+
+@pytest.mark.django_db
+def test_download_full(download: Callable[..., Any]) -> None:
+    """Tests the whole file is served with its ETag and digest.
+
+    Args:
+        download (Callable[..., Any]): Download fixture.
+    """
+    response = download()
+
+    # Check
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == CONTENT
+    assert response["Accept-Ranges"] == "bytes"
+    assert response["ETag"] == f'"{hashlib.sha256(CONTENT).hexdigest()}"'
+    assert response["Repr-Digest"] == f"sha-256=:{base64.b64encode(hashlib.sha256(CONTENT).digest()).decode()}:"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("header", "start", "end"),
+    [
+        ("bytes=1000-", 1000, len(CONTENT) - 1),
+        ("bytes=10-19", 10, 19),
+        ("bytes=-100", len(CONTENT) - 100, len(CONTENT) - 1),
+        ("bytes=4000-99999", 4000, len(CONTENT) - 1),
+    ],
+)
+def test_download_range(download: Callable[..., Any], header: str, start: int, end: int) -> None:
+    """Tests a byte range is served as partial content.
+
+    Args:
+        download (Callable[..., Any]): Download fixture.
+        header (str): Range header to send.
+        start (int): Expected first byte.
+        end (int): Expected last byte (inclusive).
+    """
+    response = download(Range=header)
+
+    # Check
+    assert response.status_code == 206
+    assert b"".join(response.streaming_content) == CONTENT[start:end + 1]
+    assert response["Content-Range"] == f"bytes {start}-{end}/{len(CONTENT)}"
+    assert int(response["Content-Length"]) == end - start + 1
+
+
+@pytest.mark.django_db
+def test_download_if_range(download: Callable[..., Any]) -> None:
+    """Tests a range is only honoured when If-Range matches the ETag.
+
+    Args:
+        download (Callable[..., Any]): Download fixture.
+    """
+    etag = download()["ETag"]
+
+    # Check
+    assert download(Range="bytes=10-", **{"If-Range": etag}).status_code == 206
+    assert download(Range="bytes=10-", **{"If-Range": '"stale"'}).status_code == 200
+
+
+@pytest.mark.django_db
+def test_download_range_not_satisfiable(download: Callable[..., Any]) -> None:
+    """Tests a range beyond the end of the file is rejected.
+
+    Args:
+        download (Callable[..., Any]): Download fixture.
+    """
+    response = download(Range=f"bytes={len(CONTENT)}-")
+
+    # Check
+    assert response.status_code == 416
+    assert response["Content-Range"] == f"bytes */{len(CONTENT)}"
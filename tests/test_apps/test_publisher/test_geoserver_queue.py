@@ -0,0 +1,152 @@
+"""Provides unit tests for claiming and processing GeoServer queue items."""
+
+
+# Standard
+import datetime
+import threading
+import time
+from unittest import mock
+
+# Third-Party
+import pytest
+import pytest_django.fixtures
+from django.utils import timezone
+
+# Local
+from govapp.apps.catalogue.models import catalogue_entries
+from govapp.apps.publisher import geoserver_manager
+from govapp.apps.publisher.models import geoserver_queues
+from govapp.apps.publisher.models import publish_entries
+from govapp.apps.publisher.models.geoserver_queues import GeoServerQueueStatus
+
+
+def create_queue_item(name: str, **kwargs: object) -> geoserver_queues.GeoServerQueue:
+    """Creates a queue item for a new publish entry.
+
+    Args:
+        name (str): Name of the catalogue entry.
+        **kwargs (object): Fields of the queue item.
+
+    Returns:
+        GeoServerQueue: The created queue item.
+    """
+    # Create and Return
+    catalogue_entry = catalogue_entries.CatalogueEntry.objects.create(name=name, description=name)
+    publish_entry = publish_entries.PublishEntry.objects.create(catalogue_entry=catalogue_entry)
+    return geoserver_queues.GeoServerQueue.objects.create(publish_entry=publish_entry, **kwargs)
+
+
+@pytest.mark.django_db
+def test_claim_ready_and_stale_items(settings: pytest_django.fixtures.SettingsWrapper) -> None:
+    """Tests ready items and items with a stopped heartbeat are claimed, oldest first.
+
+    Args:
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    settings.GEOSERVER_QUEUE_HEARTBEAT_TIMEOUT_SECONDS = 60
+    long_ago = timezone.now() - datetime.timedelta(minutes=5)
+
+    # Create Queue Items
+    ready = create_queue_item("ready")
+    stale = create_queue_item("stale", status=GeoServerQueueStatus.PROCESSING, started_at=long_ago, heartbeat_at=long_ago)
+    create_queue_item("alive", status=GeoServerQueueStatus.PROCESSING, started_at=long_ago, heartbeat_at=timezone.now())
+    create_queue_item("published", status=GeoServerQueueStatus.PUBLISHED)
+
+    # Claim Items
+    executor = geoserver_manager.GeoServerQueueExcutor()
+    claimed: set[int] = set()
+    lock = threading.Lock()
+    first = executor._claim_next_item(claimed, lock)
+    second = executor._claim_next_item(claimed, lock)
+
+    # Check
+    assert [first.pk, second.pk] == [ready.pk, stale.pk]
+    assert executor._claim_next_item(claimed, lock) is None
+    first.refresh_from_db()
+    assert first.status == GeoServerQueueStatus.PROCESSING
+    assert first.heartbeat_at is not None
+
+
+@pytest.mark.django_db
+def test_excute_processes_each_item_once(settings: pytest_django.fixtures.SettingsWrapper) -> None:
+    """Tests every claimable item is processed exactly once per run.
+
+    Args:
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    settings.GEOSERVER_QUEUE_MAX_WORKERS = 1
+    settings.GEOSERVER_QUEUE_HEARTBEAT_TIMEOUT_SECONDS = 0
+
+    # Create Queue Items
+    items = [create_queue_item(f"item_{n}") for n in range(3)]
+
+    # Execute, leaving Items in Processing (as if their worker had crashed)
+    with mock.patch.object(geoserver_manager.GeoServerQueueExcutor, "_excute_item") as excute_item:
+        geoserver_manager.GeoServerQueueExcutor().excute()
+
+    # Check
+    assert [call.args[0].pk for call in excute_item.call_args_list] == [item.pk for item in items]
+
+
+@pytest.mark.django_db
+def test_two_workers_share_the_queue(settings: pytest_django.fixtures.SettingsWrapper) -> None:
+    """Tests two workers (e.g., in separate processes) never claim the same item.
+
+    Args:
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    settings.GEOSERVER_QUEUE_HEARTBEAT_TIMEOUT_SECONDS = 60
+
+    # Create Queue Items
+    items = [create_queue_item(f"item_{n}") for n in range(5)]
+
+    # Claim Items with Two Workers in Turn
+    # Each worker has its own claimed items, as if in another process
+    workers = [(geoserver_manager.GeoServerQueueExcutor(), set(), threading.Lock()) for _ in range(2)]
+    claims: list[list[int]] = [[], []]
+    while True:
+        claimed = [executor._claim_next_item(own, lock) for executor, own, lock in workers]
+        for index, item in enumerate(claimed):
+            if item is not None:
+                claims[index].append(item.pk)
+        if claimed == [None, None]:
+            break
+
+    # Check
+    assert all(claims)
+    assert not set(claims[0]) & set(claims[1])
+    assert sorted(claims[0] + claims[1]) == [item.pk for item in items]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stale_heartbeat_reclaimed(settings: pytest_django.fixtures.SettingsWrapper) -> None:
+    """Tests an item is only reclaimed by another worker once its heartbeat stops.
+
+    Args:
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    settings.GEOSERVER_QUEUE_HEARTBEAT_SECONDS = 0.05
+    settings.GEOSERVER_QUEUE_HEARTBEAT_TIMEOUT_SECONDS = 60
+    long_ago = timezone.now() - datetime.timedelta(minutes=5)
+
+    # Claim an Item
+    item = create_queue_item("item")
+    first = geoserver_manager.GeoServerQueueExcutor()
+    assert first._claim_next_item(set(), threading.Lock()).pk == item.pk
+    second = geoserver_manager.GeoServerQueueExcutor()
+
+    # Process with a Heartbeat, from a Stalled Start
+    geoserver_queues.GeoServerQueue.objects.filter(pk=item.pk).update(heartbeat_at=long_ago)
+    with first._heartbeat(item):
+        time.sleep(0.5)
+
+        # Check the Item is not Reclaimed
+        assert second._claim_next_item(set(), threading.Lock()) is None
+
+    # Stop the Heartbeat (as if the Worker had Crashed)
+    geoserver_queues.GeoServerQueue.objects.filter(pk=item.pk).update(heartbeat_at=long_ago)
+
+    # Check the Item is Reclaimed
+    reclaimed = second._claim_next_item(set(), threading.Lock())
+    assert reclaimed.pk == item.pk
+    assert reclaimed.heartbeat_at > long_ago
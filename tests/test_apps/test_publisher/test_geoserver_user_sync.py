@@ -0,0 +1,189 @@
+"""Provides unit tests for synchronising users, groups and roles with a GeoServer."""
+
+
+# Standard
+import collections
+import http.server
+import json
+import re
+import threading
+import urllib.parse
+
+# Third-Party
+import pytest
+from django.contrib import auth
+
+# Local
+from govapp import settings
+from govapp.apps.publisher.models import geoserver_pools
+from govapp.apps.publisher.models import geoserver_roles_groups
+from govapp.gis import geoserver
+
+# Typing
+from typing import Iterator
+
+
+# Shortcuts
+UserModel = auth.get_user_model()
+
+# Number of Users to Synchronise
+USERS = 2000
+
+
+class StubSecurityState:
+    """In-memory users, groups and roles of a stub GeoServer."""
+
+    def __init__(self) -> None:
+        self.users: dict[str, bool] = {}
+        self.groups: dict[str, set[str]] = {}
+        self.roles: dict[str, set[str]] = {"ADMIN": set()}
+        self.requests: collections.Counter = collections.Counter()
+        self.lock = threading.Lock()
+
+
+class StubSecurityHandler(http.server.BaseHTTPRequestHandler):
+    """Implements the GeoServer security REST API used by the user sync."""
+
+    # Keep-Alive, without delaying the body behind the headers
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    state: StubSecurityState
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Lists users, groups and roles."""
+        self.handle_request("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Creates users, groups, roles and relations."""
+        self.handle_request("POST")
+
+    def do_DELETE(self) -> None:  # noqa: N802
+        """Deletes groups, roles and relations."""
+        self.handle_request("DELETE")
+
+    def handle_request(self, method: str) -> None:
+        """Routes a request.
+
+        Args:
+            method (str): HTTP method of the request.
+        """
+        # Read Request
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = urllib.parse.unquote(self.path.split("/rest/security/", 1)[1]).removesuffix(".json").rstrip("/")
+        path = path.replace("usergroup/service/dbca/", "usergroup/")
+        state = self.state
+
+        # Route
+        with state.lock:
+            state.requests[method] += 1
+            response: object = {}
+            if method == "GET" and path == "usergroup/users":
+                response = {"users": [{"userName": u, "enabled": e} for u, e in state.users.items()]}
+            elif method == "POST" and path == "usergroup/users":
+                user = json.loads(body)["user"]
+                state.users[user["userName"]] = user["enabled"]
+            elif method == "POST" and (match := re.fullmatch(r"usergroup/user/([^/]+)", path)):
+                state.users[match[1]] = json.loads(body)["user"]["enabled"]
+            elif method == "GET" and path == "usergroup/groups":
+                response = {"groups": list(state.groups)}
+            elif match := re.fullmatch(r"usergroup/group/([^/]+)", path):
+                if method == "POST":
+                    state.groups[match[1]] = set()
+                else:
+                    del state.groups[match[1]]
+            elif match := re.fullmatch(r"usergroup/group/([^/]+)/users", path):
+                response = {"users": [{"userName": u, "enabled": True} for u in state.groups[match[1]]]}
+            elif match := re.fullmatch(r"usergroup/user/([^/]+)/group/([^/]+)", path):
+                getattr(state.groups[match[2]], "add" if method == "POST" else "discard")(match[1])
+            elif path == "roles":
+                response = {"roles": list(state.roles)}
+            elif match := re.fullmatch(r"roles/user/([^/]+)", path):
+                response = {"roles": [r for r, users in state.roles.items() if match[1] in users]}
+            elif match := re.fullmatch(r"roles/role/([^/]+)", path):
+                if method == "POST":
+                    state.roles[match[1]] = set()
+                else:
+                    del state.roles[match[1]]
+            elif match := re.fullmatch(r"roles/role/([^/]+)/user/([^/]+)", path):
+                getattr(state.roles[match[1]], "add" if method == "POST" else "discard")(match[2])
+            else:
+                raise AssertionError(f"Unexpected request: {method} {path}")
+
+        # Respond
+        data = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: object) -> None:
+        """Silences request logging."""
+
+
+@pytest.fixture
+def stub_pool(db: None) -> Iterator[tuple[geoserver_pools.GeoServerPool, StubSecurityState]]:
+    """Runs a stub GeoServer on an ephemeral local port.
+
+    Args:
+        db (None): Pytest Django database fixture.
+
+    Yields:
+        tuple[GeoServerPool, StubSecurityState]: Pool of the stub GeoServer and its state.
+    """
+    # Start Server
+    state = StubSecurityState()
+    handler = type("Handler", (StubSecurityHandler,), {"state": state})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    # Yield
+    pool = geoserver_pools.GeoServerPool.objects.create(
+        url=f"http://127.0.0.1:{server.server_address[1]}/geoserver", username="admin", password="geoserver")
+    yield pool, state
+
+    # Stop Server
+    geoserver.close_clients()
+    server.shutdown()
+    server.server_close()
+
+
+def test_sync_users(
+    stub_pool: tuple[geoserver_pools.GeoServerPool, StubSecurityState],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests a sync reads the GeoServer once and only sends the differences.
+
+    Args:
+        stub_pool (tuple[GeoServerPool, StubSecurityState]): Stub GeoServer fixture.
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    pool, state = stub_pool
+    monkeypatch.setattr(settings, "GEOSERVER_USERGROUP_SERVICE_NAME_CUSTOM", "dbca")
+    monkeypatch.setattr(settings, "NON_DELETABLE_ROLES", ["ADMIN"])
+
+    # Create Users in Two Groups and One Role
+    users = UserModel.objects.bulk_create(
+        UserModel(username=f"user_{n}", email=f"user_{n}@example.com") for n in range(USERS))
+    groups = [geoserver_roles_groups.GeoServerGroup.objects.create(name=f"group_{n}", geoserver_usergroup_service=None) for n in range(2)]
+    role = geoserver_roles_groups.GeoServerRole.objects.create(name="role")
+    geoserver_roles_groups.GeoServerGroupUser.objects.bulk_create(
+        geoserver_roles_groups.GeoServerGroupUser(user=user, geoserver_group=groups[n % 2]) for n, user in enumerate(users))
+    geoserver_roles_groups.GeoServerRoleUser.objects.bulk_create(
+        geoserver_roles_groups.GeoServerRoleUser(user=user, geoserver_role=role) for user in users[:10])
+
+    # Initial Sync: 3 listings, then 2 groups, 1 role, the users and their relations are created
+    pool.sync_users_groups_users_roles()
+    assert state.requests == {"GET": 3, "POST": 3 + USERS + USERS + 10}
+    assert state.groups["group_1"] == {f"user_{n}@example.com" for n in range(1, USERS, 2)}
+    assert state.roles["role"] == {f"user_{n}@example.com" for n in range(10)}
+
+    # Change One User, then Sync Again: 3 listings, 2 group member lists and the roles of each user
+    state.requests.clear()
+    geoserver_roles_groups.GeoServerGroupUser.objects.filter(user=users[0]).update(geoserver_group=groups[1])
+    UserModel.objects.filter(pk=users[1].pk).update(is_active=False)
+    pool.sync_users_groups_users_roles()
+    assert state.requests == {"GET": 3 + 2 + USERS, "POST": 2, "DELETE": 1}
+    assert "user_0@example.com" in state.groups["group_1"]
+    assert state.users["user_1@example.com"] is False
@@ -0,0 +1,162 @@
+"""Provides unit tests for the GeoServer layer health checks."""
+
+
+# Standard
+from unittest import mock
+
+# Third-Party
+from django.utils import timezone
+import httpx
+import pytest
+import pytest_django.fixtures
+
+# Local
+from govapp.apps.catalogue.models import catalogue_entries
+from govapp.apps.publisher import health_checks
+from govapp.apps.publisher.models import geoserver_pools
+from govapp.apps.publisher.models import publish_channels
+from govapp.apps.publisher.models import publish_entries
+from govapp.apps.publisher.models import workspaces
+from govapp.gis import geoserver
+
+
+def create_channel(name: str, pool: geoserver_pools.GeoServerPool) -> publish_channels.GeoServerPublishChannel:
+    """Creates a GeoServer publish channel for a new publish entry.
+
+    Args:
+        name (str): Name of the catalogue entry.
+        pool (GeoServerPool): GeoServer pool to publish to.
+
+    Returns:
+        GeoServerPublishChannel: The created publish channel.
+    """
+    # Create and Return
+    catalogue_entry = catalogue_entries.CatalogueEntry.objects.create(name=name, description=name)
+    publish_entry = publish_entries.PublishEntry.objects.create(catalogue_entry=catalogue_entry)
+    return publish_channels.GeoServerPublishChannel.objects.create(
+        publish_entry=publish_entry,
+        geoserver_pool=pool,
+        workspace=workspaces.Workspace.objects.get_or_create(name="kb")[0],
+        mode=publish_channels.GeoServerPublishChannelMode.WMS,
+        frequency=publish_channels.PublishChannelFrequency.ON_CHANGE,
+    )
+
+
+@pytest.mark.django_db
+def test_check_layers(monkeypatch: pytest.MonkeyPatch, settings: pytest_django.fixtures.SettingsWrapper) -> None:
+    """Tests each pool's layers are listed once, and the results saved in bulk.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    settings.GEOSERVER_LAYER_HEALTH_CHECK_GETMAP_SAMPLE = 10
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Record Request
+        calls.append(f"{request.url.host} {request.url.path}")
+
+        # List Layers
+        if request.url.path == "/geoserver/rest/layers":
+            if request.url.host == "down":
+                return httpx.Response(503)
+            return httpx.Response(200, json={"layers": {"layer": [{"name": "kb:healthy"}, {"name": "kb:broken"}]}})
+
+        # Layer Details
+        if request.url.path.startswith("/geoserver/rest/layers/"):
+            return httpx.Response(200, json={"layer": {"name": request.url.path.rsplit(":", 1)[1]}})
+
+        # Render Map
+        if request.url.params["layers"] == "kb:broken":
+            return httpx.Response(200, text="<ServiceExceptionReport/>", headers={"Content-Type": "application/vnd.ogc.se_xml"})
+        return httpx.Response(200, content=b"PNG", headers={"Content-Type": "image/png"})
+
+    # Mock GeoServer
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(geoserver.GeoServer, "client", property(lambda self: client))
+
+    # Create Channels
+    pool = geoserver_pools.GeoServerPool.objects.create(url="http://up/geoserver", username="admin", password="geoserver")
+    down = geoserver_pools.GeoServerPool.objects.create(url="http://down/geoserver", username="admin", password="geoserver")
+    disabled = geoserver_pools.GeoServerPool.objects.create(url="http://off/geoserver", username="admin", password="geoserver", enabled=False)
+    healthy = create_channel("healthy", pool)
+    broken = create_channel("broken", pool)
+    missing = create_channel("missing", pool)
+    unreachable = create_channel("unreachable", down)
+    create_channel("disabled", disabled)
+
+    # Record Stale Health Checks
+    health_check = publish_channels.GeoServerLayerHealthcheck.objects.create(
+        geoserver_publish_channel=healthy,
+        layer_name="kb:healthy",
+        last_check_time=timezone.now(),
+    )
+    publish_channels.GeoServerLayerHealthcheck.objects.create(
+        geoserver_publish_channel=healthy,
+        layer_name="healthy",
+        last_check_time=timezone.now(),
+    )
+
+    # Check Layers
+    health_checks.check_layers()
+
+    # Check Requests
+    assert sorted(calls) == [
+        "down /geoserver/rest/layers",
+        "up /geoserver/rest/layers",
+        "up /geoserver/rest/layers/kb:broken",
+        "up /geoserver/rest/layers/kb:healthy",
+        "up /geoserver/wms",
+        "up /geoserver/wms",
+    ]
+
+    # Check Health Checks
+    results = {h.geoserver_publish_channel_id: h for h in publish_channels.GeoServerLayerHealthcheck.objects.all()}
+    assert set(results) == {healthy.id, broken.id, missing.id, unreachable.id}
+    assert results[healthy.id].id == health_check.id
+    assert results[healthy.id].health_status == publish_channels.GeoServerLayerHealthcheck.HEALTHY
+    assert results[healthy.id].error_message is None
+    assert results[broken.id].health_status == publish_channels.GeoServerLayerHealthcheck.UNHEALTHY
+    assert "ServiceExceptionReport" in results[broken.id].error_message
+    assert results[missing.id].error_message == "Layer [kb:missing] was not found on GeoServer: [http://up/geoserver]"
+    assert results[unreachable.id].error_message.startswith("Unable to list the layers on GeoServer")
+
+
+def test_check_pool_without_workspace(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: pytest_django.fixtures.SettingsWrapper,
+) -> None:
+    """Tests layers published without a workspace are found in the inventory.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    settings.GEOSERVER_LAYER_HEALTH_CHECK_GETMAP_SAMPLE = 0
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Record Request
+        calls.append(request.url.path)
+
+        # List Layers
+        if request.url.path == "/geoserver/rest/layers":
+            return httpx.Response(200, json={"layers": {"layer": [{"name": "kb:bare"}]}})
+
+        # Layer Details
+        return httpx.Response(200, json={"layer": {"name": "bare"}})
+
+    # Mock GeoServer
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(geoserver.GeoServer, "client", property(lambda self: client))
+
+    # Check the Pool
+    pool = geoserver_pools.GeoServerPool(url="http://up/geoserver", username="admin", password="geoserver")
+    bare = mock.Mock(layer_name_with_workspace="bare")
+    missing = mock.Mock(layer_name_with_workspace="missing")
+    results = health_checks._check_pool(pool, [bare, missing])
+
+    # Check
+    assert results == {bare: None, missing: "Layer [missing] was not found on GeoServer: [http://up/geoserver]"}
+    assert calls == ["/geoserver/rest/layers", "/geoserver/rest/layers/bare"]
@@ -0,0 +1,180 @@
+"""Provides unit tests for converting layers once per publish."""
+
+
+# Standard
+import pathlib
+from unittest import mock
+
+# Third-Party
+import pytest
+import pytest_django.fixtures
+
+# Local
+from govapp.apps.catalogue import models as catalogue_models
+from govapp.apps.publisher import models
+from govapp.gis import cache
+from govapp.gis import engines
+
+# Typing
+from typing import Any
+
+
+def fake_ogr2ogr(command: list[str], *args: Any, **kwargs: Any) -> list[engines.GDALMessage]:
+    """Writes an output file for an `ogr2ogr` command instead of running it.
+
+    Args:
+        command (list[str]): Command that would have been run.
+        *args (Any): Ignored positional arguments.
+        **kwargs (Any): Ignored keyword arguments.
+
+    Returns:
+        list[engines.GDALMessage]: No GDAL messages.
+    """
+    # Find the Output Filepath in the Working Directory
+    for argument in command:
+        output = pathlib.Path(argument)
+        if output.suffix in (".gpkg", ".geojson", ".shp", ".gdb") and output.parent.exists():
+            break
+
+    # Write Output
+    if output.suffix == ".gdb":
+        output.mkdir()
+        (output / "a00000001.gdbtable").write_text("converted")
+    else:
+        output.write_text("converted")
+
+    # Return
+    return []
+
+
+@pytest.mark.parametrize("format", list(models.publish_channels.CDDPPublishChannelFormat))
+def test_cddp_azure_and_sharepoint_converts_once(
+    format: models.publish_channels.CDDPPublishChannelFormat,  # noqa: A002
+    tmp_path: pathlib.Path,
+    settings: pytest_django.fixtures.SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests `ogr2ogr` runs once per format and layer name for every target.
+
+    Azure and SharePoint publish the layer under different names, which are
+    also the names inside the converted files, so it is converted once for
+    each name rather than once for each channel and target.
+
+    Args:
+        format (CDDPPublishChannelFormat): Format to publish.
+        tmp_path (pathlib.Path): Temporary directory fixture.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    # Disable the Conversion Cache
+    monkeypatch.setattr(cache.conversion_cache, "max_size", 0)
+    settings.AZURE_OUTPUT_SYNC_DIRECTORY = str(tmp_path / "sync")
+
+    # Create Layer File
+    layer_file = tmp_path / "layer.geojson"
+    layer_file.write_text("{}")
+
+    # Create Publish Entry with Two Channels to Azure and SharePoint
+    # The layer is published to SharePoint under its metadata's name
+    catalogue_entry = catalogue_models.catalogue_entries.CatalogueEntry(name="layer")
+    publish_entry = models.publish_entries.PublishEntry(catalogue_entry=catalogue_entry)
+    channels = [
+        models.publish_channels.CDDPPublishChannel(
+            name="layer",
+            format=format,
+            mode=models.publish_channels.CDDPPublishChannelMode.AZURE_AND_SHAREPOINT,
+            path=path,
+            xml_path="",
+            publish_entry=publish_entry,
+        )
+        for path in ("first", "second")
+    ]
+    metadata = mock.Mock()
+    metadata.name = "metadata"
+
+    with (
+        mock.patch.object(
+            catalogue_models.catalogue_entries.CatalogueEntry,
+            "active_layer",
+            new_callable=mock.PropertyMock,
+            return_value=mock.Mock(file=str(layer_file)),
+        ),
+        mock.patch.object(
+            catalogue_models.catalogue_entries.CatalogueEntry,
+            "metadata",
+            new_callable=mock.PropertyMock,
+            return_value=metadata,
+        ),
+        mock.patch.object(models.publish_entries.PublishEntry, "save"),
+        mock.patch.object(models.publish_channels.CDDPPublishChannel, "save"),
+        mock.patch.object(models.publish_channels.sharepoint, "sharepoint_output") as sharepoint_output,
+        mock.patch.object(engines.SubprocessEngine, "_run", side_effect=fake_ogr2ogr) as run,
+    ):
+        # Publish
+        with models.publish_channels.PublishConversions(publish_entry) as publish_conversions:
+            for channel in channels:
+                channel.publish(conversions=publish_conversions)
+
+        # Check ogr2ogr ran once for each Layer Name
+        assert run.call_count == 2
+
+    # Check every Destination received the Output
+    assert sorted(p.name for p in (tmp_path / "sync").iterdir()) == ["first", "second"]
+    assert all(any(p.iterdir()) for p in (tmp_path / "sync").iterdir())
+    assert sharepoint_output.return_value.put.call_count == 2 * len(list((tmp_path / "sync" / "first").iterdir()))
+
+    # Check each Destination's Files were Named for its Layer
+    azure = sorted(p.name for p in (tmp_path / "sync" / "first").iterdir())
+    sharepoint = sorted(pathlib.Path(c.kwargs["path"]).name for c in sharepoint_output.return_value.put.call_args_list[:len(azure)])
+    if format == models.publish_channels.CDDPPublishChannelFormat.GEODATABASE:
+        assert azure == sharepoint == ["a00000001.gdbtable"]
+    else:
+        assert all(name.startswith("layer.") for name in azure)
+        assert sharepoint == [name.replace("layer", "metadata", 1) for name in azure]
+
+    # Check the Converted Files were Removed
+    assert not publish_conversions.converted
+
+
+def test_conversions_are_shared_by_layer_and_export_method(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests conversions are only shared for the same layer name and export method.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    # Disable the Conversion Cache
+    monkeypatch.setattr(cache.conversion_cache, "max_size", 0)
+
+    # Create Layer File
+    layer_file = tmp_path / "layer.geojson"
+    layer_file.write_text("{}")
+
+    # Create Publish Entry
+    catalogue_entry = catalogue_models.catalogue_entries.CatalogueEntry(name="layer")
+    publish_entry = models.publish_entries.PublishEntry(catalogue_entry=catalogue_entry)
+    format = models.publish_channels.CDDPPublishChannelFormat.SHAPEFILE  # noqa: A001
+
+    with (
+        mock.patch.object(
+            catalogue_models.catalogue_entries.CatalogueEntry,
+            "active_layer",
+            new_callable=mock.PropertyMock,
+            return_value=mock.Mock(file=str(layer_file)),
+        ),
+        mock.patch.object(engines.SubprocessEngine, "_run", side_effect=fake_ogr2ogr) as run,
+        models.publish_channels.PublishConversions(publish_entry) as publish_conversions,
+    ):
+        # Convert
+        cddp = publish_conversions.convert(format, "layer")
+        assert publish_conversions.convert(format, "layer") is cddp
+        ftp = publish_conversions.convert(format, "layer", export_method="ftp")
+        renamed = publish_conversions.convert(format, "renamed", export_method="ftp")
+
+        # Check the Conversions
+        assert run.call_count == 3
+        assert pathlib.Path(ftp["compressed_filepath"]).name == "layer.shp.zip"
+        assert pathlib.Path(renamed["compressed_filepath"]).name == "renamed.shp.zip"
+
+    # Check the Converted Files were Removed
+    assert not pathlib.Path(renamed["compressed_filepath"]).exists()
@@ -0,0 +1,128 @@
+"""Provides unit tests for the GIS conversion cache module."""
+
+
+# Standard
+import os
+import pathlib
+
+# Third-Party
+import pytest
+
+# Local
+from govapp.gis import cache
+
+
+def test_cache_hit_and_miss(tmp_path: pathlib.Path) -> None:
+    """Tests a conversion is only served from the cache once stored."""
+    # Create Cache and Source
+    conversion_cache = cache.ConversionCache(tmp_path / "cache", max_size=1024 * 1024)
+    source = tmp_path / "source.geojson"
+    source.write_text("source")
+    converted = tmp_path / "converted.gpkg"
+    converted.write_text("converted")
+
+    # Miss
+    key = conversion_cache.key(source, "gpkg", layer="layer")
+    assert not conversion_cache.restore(key, tmp_path / "restored.gpkg")
+
+    # Store and Hit
+    conversion_cache.store(key, converted)
+    assert conversion_cache.restore(key, tmp_path / "restored.gpkg")
+    assert (tmp_path / "restored.gpkg").read_text() == "converted"
+    assert conversion_cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_cache_key_options(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests the cache key depends on the source contents and options."""
+    # Create Cache and Source
+    conversion_cache = cache.ConversionCache(tmp_path / "cache", max_size=1024 * 1024)
+    source = tmp_path / "source.geojson"
+    source.write_text("source")
+    key = conversion_cache.key(source, "gpkg", layer="layer")
+
+    # Check Key
+    assert key == conversion_cache.key(source, "gpkg", layer="layer")
+    assert key != conversion_cache.key(source, "gpkg", layer="other")
+    assert key != conversion_cache.key(source, "geojson", layer="layer")
+    assert key != conversion_cache.key(source, "gpkg", layer="layer", engine="gdal")
+    assert key != conversion_cache.key(source, "gpkg", layer="layer", options=["-unsetFid"])
+    monkeypatch.setattr(cache, "_VERSION", cache._VERSION + 1)
+    assert key != conversion_cache.key(source, "gpkg", layer="layer")
+    monkeypatch.undo()
+    source.write_text("changed")
+    os.utime(source, ns=(0, 0))
+    assert key != conversion_cache.key(source, "gpkg", layer="layer")
+
+
+def test_cache_key_directory_source(tmp_path: pathlib.Path) -> None:
+    """Tests the cache key changes when a file in a source directory changes."""
+    # Create Cache and Source Directory
+    conversion_cache = cache.ConversionCache(tmp_path / "cache", max_size=1024 * 1024)
+    source = tmp_path / "source.gdb"
+    source.mkdir()
+    (source / "a.gdbtable").write_text("source")
+    stat = source.stat()
+    key = conversion_cache.key(source, "gpkg", layer="layer")
+
+    # Overwrite a File in Place, Keeping the Directory Unchanged
+    (source / "a.gdbtable").write_text("changed")
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    # Check Key
+    assert key != conversion_cache.key(source, "gpkg", layer="layer")
+
+
+def test_cache_directory_artefact(tmp_path: pathlib.Path) -> None:
+    """Tests directory artefacts (e.g., Shapefiles) are stored and restored."""
+    # Create Cache and Artefact
+    conversion_cache = cache.ConversionCache(tmp_path / "cache", max_size=1024 * 1024)
+    source = tmp_path / "source.geojson"
+    source.write_text("source")
+    converted = tmp_path / "layer.shp"
+    converted.mkdir()
+    (converted / "layer.shp").write_text("shp")
+    (converted / "layer.dbf").write_text("dbf")
+
+    # Store and Restore
+    key = conversion_cache.key(source, "shp", layer="layer")
+    conversion_cache.store(key, converted)
+    restored = tmp_path / "restored"
+    restored.mkdir()
+    assert conversion_cache.restore(key, restored)
+    assert sorted(p.name for p in restored.iterdir()) == ["layer.dbf", "layer.shp"]
+
+
+def test_cache_eviction(tmp_path: pathlib.Path) -> None:
+    """Tests the least recently used entries are evicted first."""
+    # Create Cache
+    conversion_cache = cache.ConversionCache(tmp_path / "cache", max_size=25)
+    artefact = tmp_path / "artefact"
+    artefact.write_bytes(b"x" * 10)
+
+    # Store Two Entries
+    conversion_cache.store("first", artefact)
+    os.utime(tmp_path / "cache" / "first", (1, 1))
+    conversion_cache.store("second", artefact)
+    os.utime(tmp_path / "cache" / "second", (2, 2))
+
+    # Use the First Entry, then Store a Third
+    assert conversion_cache.restore("first", tmp_path / "restored")
+    conversion_cache.store("third", artefact)
+
+    # Check the Second Entry was Evicted
+    assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == ["first", "third"]
+
+
+def test_cache_disabled(tmp_path: pathlib.Path) -> None:
+    """Tests nothing is cached when the maximum size is zero."""
+    # Create Cache and Source
+    conversion_cache = cache.ConversionCache(tmp_path / "cache", max_size=0)
+    source = tmp_path / "source.geojson"
+    source.write_text("source")
+
+    # Check
+    key = conversion_cache.key(source, "gpkg", layer="layer")
+    assert key is None
+    conversion_cache.store(key, source)
+    assert not conversion_cache.restore(key, tmp_path / "restored")
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,105 @@
+"""Provides unit tests for the GIS conversion engines."""
+
+
+# Standard
+import pathlib
+import threading
+import time
+
+# Third-Party
+import pytest
+from osgeo import ogr
+
+# Local
+from govapp.gis import conversions
+from govapp.gis import engines
+from tests import utils
+
+
+def layer_summary(filepath: pathlib.Path) -> list[tuple[str, int, list[str]]]:
+    """Summarises the layers of a converted dataset.
+
+    Args:
+        filepath (pathlib.Path): Path to the dataset.
+
+    Returns:
+        list[tuple[str, int, list[str]]]: Name, feature count and field names
+            of each layer.
+    """
+    dataset = ogr.Open(str(filepath))
+    summary = []
+    for layer in dataset:
+        definition = layer.GetLayerDefn()
+        fields = [definition.GetFieldDefn(i).GetName() for i in range(definition.GetFieldCount())]
+        summary.append((layer.GetName(), layer.GetFeatureCount(), fields))
+    return summary
+
+
+@pytest.mark.parametrize(
+    ("data_file", "layer", "conversion"),
+    [
+        ("geojson/regions.geojson", "regions", "to_geojson"),
+        ("geojson/regions.geojson", "regions", "to_geopackage"),
+        ("gpkg/Admin_boundaries.gpkg", "Admin_boundaries", "to_geojson"),
+    ],
+)
+def test_engine_parity(data_file: str, layer: str, conversion: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests both engines convert a file to the same layers, features and fields.
+
+    Args:
+        data_file (str): Test file to convert.
+        layer (str): Layer to convert.
+        conversion (str): Conversion function to run.
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    # Disable the Conversion Cache
+    monkeypatch.setattr(conversions.cache.conversion_cache, "max_size", 0)
+
+    # Convert with Each Engine
+    summaries = {}
+    for engine in engines.ENGINES:
+        filepath = utils.to_temporary_directory(utils.test_file(data_file))
+        converted = getattr(conversions, conversion)(filepath, layer, layer, "geoserver", engine=engine)
+        summaries[engine] = layer_summary(converted["full_filepath"])
+
+    # Check
+    assert summaries["gdal"] == summaries["subprocess"]
+    assert summaries["gdal"][0][1] > 0
+
+
+def test_subprocess_engine_messages() -> None:
+    """Tests GDAL messages are captured from a failing command."""
+    engine = engines.SubprocessEngine()
+    command = ["sh", "-c", "echo 'Warning 1: Field truncated' >&2; echo 'ERROR 4: No such file' >&2; exit 1"]
+
+    # Check
+    with pytest.raises(engines.ConversionError) as exc_info:
+        engine._run(command, timeout=None)
+    assert exc_info.value.messages == [
+        engines.GDALMessage("Warning", 1, "Field truncated"),
+        engines.GDALMessage("Failure", 4, "No such file"),
+    ]
+
+
+def test_subprocess_engine_cancel() -> None:
+    """Tests a running command is killed when the conversion is cancelled."""
+    cancel = threading.Event()
+    engine = engines.SubprocessEngine(cancel=cancel)
+    threading.Timer(0.1, cancel.set).start()
+
+    # Check
+    start = time.monotonic()
+    with pytest.raises(engines.ConversionCancelled):
+        engine._run(["sleep", "30"], timeout=None)
+    assert time.monotonic() - start < 5
+    with pytest.raises(engines.ConversionTimeout):
+        engines.SubprocessEngine()._run(["sleep", "30"], timeout=0.1)
+
+
+def test_get_engine() -> None:
+    """Tests engines are retrieved by name, and unknown names rejected."""
+    engine = engines.InProcessEngine()
+    assert engines.get_engine(engine) is engine
+    assert isinstance(engines.get_engine("subprocess"), engines.SubprocessEngine)
+    with pytest.raises(ValueError):
+        engines.get_engine("qgis")
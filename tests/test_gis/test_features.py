@@ -0,0 +1,133 @@
+"""Provides unit tests for streaming GeoJSON feature access."""
+
+
+# Standard
+import json
+import pathlib
+import tracemalloc
+
+# Third-Party
+import pytest
+
+# Local
+from govapp.gis import features
+from govapp.gis.readers.formats import geojson
+
+
+# Feature Collection
+COLLECTION = {
+    "type": "FeatureCollection",
+    "name": "suburbs",
+    "crs": {"type": "name", "properties": {"name": "urn:ogc:def:crs:EPSG::4326"}},
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {"suburb": f"suburb_{n}", "postcode": 6000 + n % 3},
+            "geometry": {"type": "Polygon", "coordinates": [[[n, n], [n + 1, n], [n + 1, n + 1.5], [n, n]]]},
+        }
+        for n in range(20)
+    ],
+}
+
+
+# Size of the Large Synthetic Feature Collection and its Memory Ceiling
+LARGE_FEATURES = 120_000
+MEMORY_CEILING = 4 * 1024 * 1024
+
+
+@pytest.fixture
+def collection_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Writes the feature collection to a GeoJSON file.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+
+    Returns:
+        pathlib.Path: Path to the GeoJSON file.
+    """
+    # Write and Return
+    filepath = tmp_path / "suburbs.geojson"
+    filepath.write_text(json.dumps(COLLECTION, indent=1))
+    return filepath
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, features.CHUNK_SIZE])
+def test_reader(collection_file: pathlib.Path, chunk_size: int) -> None:
+    """Tests members and features are read correctly regardless of chunk boundaries.
+
+    Args:
+        collection_file (pathlib.Path): GeoJSON file fixture.
+        chunk_size (int): Number of characters to read at a time.
+    """
+    with features.FeatureCollectionReader(collection_file, chunk_size=chunk_size) as reader:
+        # Check
+        assert reader.members() == {k: v for k, v in COLLECTION.items() if k != "features"}
+        assert list(reader.features()) == COLLECTION["features"]
+
+
+def test_select_features(collection_file: pathlib.Path) -> None:
+    """Tests features are filtered, paginated and trimmed.
+
+    Args:
+        collection_file (pathlib.Path): GeoJSON file fixture.
+    """
+    with features.FeatureCollectionReader(collection_file) as reader:
+        selected = list(features.select_features(
+            reader.features(),
+            bbox=(4.5, 0, 15.5, 100),
+            filters={"postcode": "6001"},
+            properties=["suburb"],
+            offset=1,
+            limit=2,
+        ))
+
+    # Check
+    assert [f["properties"] for f in selected] == [{"suburb": "suburb_7"}, {"suburb": "suburb_10"}]
+
+
+def test_dump_feature_collection(collection_file: pathlib.Path) -> None:
+    """Tests a streamed feature collection is valid GeoJSON.
+
+    Args:
+        collection_file (pathlib.Path): GeoJSON file fixture.
+    """
+    with features.FeatureCollectionReader(collection_file) as reader:
+        data = b"".join(features.dump_feature_collection(reader.members(), features.select_features(reader.features(), limit=3)))
+
+    # Check
+    document = json.loads(data)
+    assert document["name"] == "suburbs"
+    assert document["features"] == COLLECTION["features"][:3]
+    assert document["numberReturned"] == 3
+
+
+@pytest.mark.parametrize("position", ["first", "last", "missing"])
+def test_name_property_exists(tmp_path: pathlib.Path, position: str) -> None:
+    """Tests the 'name' property is found in a large file within a memory ceiling.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+        position (str): Where the 'name' property is written.
+    """
+    # Write a Large Feature Collection
+    filepath = tmp_path / "large.geojson"
+    feature = json.dumps(COLLECTION["features"][0])
+    with filepath.open("w") as f:
+        f.write('{"type": "FeatureCollection", ')
+        f.write('"name": "large", ' if position == "first" else "")
+        f.write('"features": [\n' + ",\n".join(feature for _ in range(LARGE_FEATURES)) + "\n]")
+        f.write(', "name": "large"}' if position == "last" else "}")
+    assert filepath.stat().st_size > MEMORY_CEILING * 4
+
+    # Check
+    tracemalloc.start()
+    try:
+        if position == "missing":
+            with pytest.raises(ValueError):
+                geojson.GeoJSONReader.name_property_exists(filepath)
+        else:
+            assert geojson.GeoJSONReader.name_property_exists(filepath)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < MEMORY_CEILING
@@ -0,0 +1,249 @@
+"""Provides unit tests for the GeoServer client module."""
+
+
+# Standard
+import json
+import pathlib
+
+# Third-Party
+import httpx
+import pytest
+import pytest_django.fixtures
+import requests
+
+# Local
+from govapp.gis import geoserver
+
+# Typing
+from typing import Any
+
+
+def retry_client(responses: list, calls: list[str]) -> httpx.Client:
+    """Constructs a client returning the given responses in order.
+
+    Args:
+        responses (list): Status codes to respond with, or exceptions to raise.
+        calls (list[str]): List to record the method of every request sent.
+
+    Returns:
+        httpx.Client: Client with a retrying transport.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Record and Respond
+        calls.append(request.method)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return httpx.Response(response)
+
+    # Construct and Return
+    transport = geoserver.RetryTransport(httpx.MockTransport(handler), retries=2, backoff=0)
+    return httpx.Client(transport=transport)
+
+
+def test_retry_server_error() -> None:
+    """Tests idempotent requests are retried on 5xx responses."""
+    # Send Request
+    calls: list[str] = []
+    response = retry_client([503, 502, 200], calls).get("http://geoserver/rest/layers")
+
+    # Check
+    assert response.status_code == 200
+    assert calls == ["GET", "GET", "GET"]
+
+
+def test_retry_connection_error() -> None:
+    """Tests idempotent requests are retried on connection errors until exhausted."""
+    # Send Request
+    calls: list[str] = []
+    responses = [httpx.ConnectError("refused")] * 3
+    with pytest.raises(httpx.ConnectError):
+        retry_client(responses, calls).delete("http://geoserver/rest/styles/style")
+
+    # Check
+    assert calls == ["DELETE"] * 3
+
+
+def test_no_retry_non_idempotent() -> None:
+    """Tests POST requests and streamed uploads are only sent once."""
+    # Send Requests
+    calls: list[str] = []
+    client = retry_client([503, 503], calls)
+    assert client.post("http://geoserver/rest/layers", json={}).status_code == 503
+    assert client.put("http://geoserver/rest/file", content=iter([b"data"])).status_code == 503
+
+    # Check
+    assert calls == ["POST", "PUT"]
+
+
+def test_client_shared(settings: pytest_django.fixtures.SettingsWrapper) -> None:
+    """Tests GeoServer instances share one client with the configured timeouts.
+
+    Args:
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    # Configure Timeouts
+    settings.GEOSERVER_CONNECT_TIMEOUT = 5.0
+    settings.GEOSERVER_READ_TIMEOUT = 60.0
+    geoserver.close_clients()
+
+    # Check Client
+    with geoserver.GeoServer("http://geoserver/", "admin", "geoserver") as server:
+        client = server.client
+        assert server.client is client
+        assert client.timeout == httpx.Timeout(60.0, connect=5.0)
+        assert isinstance(client._transport, geoserver.RetryTransport)
+
+    # Check Shared with Other Instances with the Same Credentials
+    assert not client.is_closed
+    assert geoserver.geoserverWithCustomCreds("http://geoserver", "admin", "geoserver").client is client
+    assert geoserver.GeoServer("http://geoserver", "admin", "other").client is not client
+
+    # Check Closed
+    geoserver.close_clients()
+    assert client.is_closed
+
+
+@pytest.fixture
+def mock_geoserver(monkeypatch: pytest.MonkeyPatch) -> tuple[geoserver.GeoServer, dict, list[str]]:
+    """Constructs a GeoServer backed by an in-memory REST API.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+
+    Returns:
+        tuple[GeoServer, dict, list[str]]: GeoServer, the styles of each layer
+            keyed on layer name, and a list recording every request sent.
+    """
+    layers = {
+        "kb:first": ["shared", "first"],
+        "kb:second": ["shared"],
+        "kb:third": ["third", "point"],
+    }
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Record Request
+        calls.append(f"{request.method} {request.url.path}")
+        path = request.url.path.removeprefix("/geoserver/rest/")
+
+        # List Layers
+        if request.method == "GET" and path == "layers":
+            return httpx.Response(200, json={"layers": {"layer": [{"name": name} for name in layers]}})
+
+        # Layer Details
+        if request.method == "GET" and path.startswith("layers/"):
+            name = path.removeprefix("layers/")
+            name = name if ":" in name else f"kb:{name}"
+            if name not in layers:
+                return httpx.Response(404)
+            default, *alternates = layers[name]
+            return httpx.Response(200, json={"layer": {
+                "name": name.split(":")[1],
+                "type": "VECTOR",
+                "defaultStyle": {"name": default},
+                "styles": {"style": [{"name": style} for style in alternates]} if alternates else "",
+                "resource": {"name": name, "href": f"http://geoserver/rest/workspaces/kb/datastores/{name.split(':')[1]}/featuretypes/{name.split(':')[1]}.json"},
+            }})
+
+        # Delete Featuretype
+        if request.method == "DELETE" and "/featuretypes/" in path:
+            del layers[f"kb:{path.rsplit('/', 1)[1]}"]
+            return httpx.Response(200)
+
+        # Everything Else
+        return httpx.Response(200, json={})
+
+    # Construct GeoServer
+    server = geoserver.GeoServer("http://geoserver/geoserver", "admin", "geoserver")
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(geoserver.GeoServer, "client", property(lambda self: client))
+    return server, layers, calls
+
+
+def test_style_index_built_once(mock_geoserver: tuple[geoserver.GeoServer, dict, list[str]]) -> None:
+    """Tests the style usage index is built once and reused.
+
+    Args:
+        mock_geoserver (tuple[GeoServer, dict, list[str]]): Mock GeoServer fixture.
+    """
+    server, _, calls = mock_geoserver
+
+    # Check Used Styles
+    assert server.get_used_styles() == {"shared", "first", "third", "point"}
+    assert len(calls) == 4
+    assert server.get_used_styles() == {"shared", "first", "third", "point"}
+    assert len(calls) == 4
+
+
+def test_style_index_delete_layer(
+    mock_geoserver: tuple[geoserver.GeoServer, dict, list[str]],
+    settings: pytest_django.fixtures.SettingsWrapper,
+) -> None:
+    """Tests deleting layers only removes orphaned styles, without re-reading every layer.
+
+    Args:
+        mock_geoserver (tuple[GeoServer, dict, list[str]]): Mock GeoServer fixture.
+        settings (fixtures.SettingsWrapper): Pytest Django settings fixture.
+    """
+    server, _, calls = mock_geoserver
+    settings.GEOSERVER_PROTECTED_STYLES = ["point"]
+    server.get_used_styles()
+
+    # Delete Layers
+    calls.clear()
+    server.delete_layer("first")
+    server.delete_layer("third")
+
+    # Check Deleted Styles and that no Layer Details were Re-read
+    deleted = [call.split("/")[-1] for call in calls if call.startswith("DELETE /geoserver/rest/styles/")]
+    assert deleted == ["first", "third"]
+    layer_requests = [call for call in calls if call.startswith("GET /geoserver/rest/layers")]
+    assert layer_requests == ["GET /geoserver/rest/layers/first", "GET /geoserver/rest/layers/third"]
+    assert server.get_used_styles() == {"shared"}
+
+
+def test_upload_tif_skips_unchanged(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests a GeoTIFF is only uploaded again when its contents change.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    stores: dict[str, str] = {}
+    calls: list[str] = []
+
+    def request(session: requests.Session, method: str, url: str, **kwargs: Any) -> requests.Response:
+        # Record Request
+        path = url.removeprefix("http://geoserver/geoserver/rest/").split("?")[0]
+        calls.append(f"{method} {path}")
+        response = requests.Response()
+        response.status_code = 200
+
+        # Coverage Store and Layer
+        if method == "GET" and path == "workspaces/kb/coveragestores/raster.json":
+            if "raster" not in stores:
+                response.status_code = 404
+            response._content = json.dumps({"coverageStore": {"description": stores.get("raster")}}).encode()
+        elif method == "GET" and path == "layers/kb:raster.json":
+            response.status_code = 200 if "raster" in stores else 404
+        elif method == "PUT" and path == "workspaces/kb/coveragestores/raster.json":
+            stores["raster"] = kwargs["json"]["coverageStore"]["description"]
+        elif method == "PUT":
+            b"".join(kwargs["data"])
+            stores["raster"] = ""
+        return response
+
+    # Upload Twice
+    monkeypatch.setattr(requests.Session, "request", request)
+    server = geoserver.GeoServer("http://geoserver/geoserver", "admin", "geoserver")
+    filepath = tmp_path / "raster.tif"
+    filepath.write_bytes(b"tiff")
+    assert server.upload_tif("kb", "raster", filepath, sha256="a" * 64)
+    assert stores["raster"] == f"sha256:{'a' * 64}"
+    calls.clear()
+    assert not server.upload_tif("kb", "raster", filepath, sha256="a" * 64)
+
+    # Check the Unchanged Raster was neither Deleted nor Uploaded
+    assert calls == ["GET workspaces/kb/coveragestores/raster.json", "GET layers/kb:raster.json"]
+    assert server.upload_tif("kb", "raster", filepath, sha256="b" * 64)
@@ -0,0 +1,107 @@
+"""Provides unit tests for the log file line index."""
+
+
+# Standard
+import os
+import pathlib
+import re
+
+# Third-Party
+import pytest
+
+# Local
+from govapp.common import log_index
+
+
+def write_log(path: pathlib.Path, start: int, stop: int, mode: str = "a") -> None:
+    """Writes numbered log lines, with a traceback after every 100th line.
+
+    Args:
+        path (pathlib.Path): Path to the log file.
+        start (int): First line to write.
+        stop (int): Line to stop before.
+        mode (str): Mode to open the log file with.
+    """
+    with path.open(mode) as log:
+        for number in range(start, stop):
+            if number % 100:
+                log.write(f"INFO 2025-01-01 00:00:00 govapp [Line:1][main] message {number}\n")
+            else:
+                log.write(f"ERROR 2025-01-01 00:00:00 govapp [Line:1][main] failure {number}\n")
+                log.write("Traceback (most recent call last):\n")
+
+
+def test_log_index_paging_and_filters(tmp_path: pathlib.Path) -> None:
+    """Tests lines are paged by number, and filtered by level and pattern.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+    """
+    # Write Log
+    log_path = tmp_path / "kaartdijin_boodja.log"
+    write_log(log_path, 1, 1000)
+    index = log_index.LogIndex(log_path, tmp_path / "index" / "kaartdijin_boodja.log.idx")
+
+    # Check the Last Lines
+    lines = index.read(count=3, reverse=True)
+    assert index.line_count == 999 + 9
+    assert index.indexed_bytes == log_path.stat().st_size
+    assert [number for number, _ in lines] == [1006, 1007, 1008]
+    assert lines[-1][1] == "INFO 2025-01-01 00:00:00 govapp [Line:1][main] message 999\n"
+
+    # Check Random Access
+    assert index.read(500, 2) == [
+        (500, "INFO 2025-01-01 00:00:00 govapp [Line:1][main] message 496\n"),
+        (501, "INFO 2025-01-01 00:00:00 govapp [Line:1][main] message 497\n"),
+    ]
+    assert [number for number, _ in index.read(500, 2, reverse=True)] == [498, 499]
+    assert index.read(5000, 2) == []
+
+    # Check Level Filter, where Tracebacks Inherit the Level
+    errors = index.read(count=4, levels=log_index.level_mask("warning"), reverse=True)
+    assert [text.split()[-1] for _, text in errors] == ["800", "last):", "900", "last):"]
+
+    # Check a Carriage Return does not Split a Line
+    with log_path.open("a", newline="") as log:
+        log.write("INFO progress 50%\rprogress 100%\n")
+        log.write("INFO done\n")
+    assert index.read(count=2, reverse=True) == [(1009, "INFO progress 50%\rprogress 100%\n"), (1010, "INFO done\n")]
+
+    # Check Pattern Filter
+    assert [text for _, text in index.read(count=10, pattern=re.compile(r"message 12\d$"))][-1].endswith("message 129\n")
+    with pytest.raises(ValueError):
+        log_index.level_mask("LOUD")
+
+
+def test_log_index_growth_and_rotation(tmp_path: pathlib.Path) -> None:
+    """Tests the index follows a log file as it grows, rotates and is truncated.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory fixture.
+    """
+    # Write Log with an Incomplete Last Line
+    log_path = tmp_path / "cronjob.log"
+    write_log(log_path, 1, 60)
+    with log_path.open("a") as log:
+        log.write("INFO partial")
+    index = log_index.LogIndex(log_path, tmp_path / "cronjob.log.idx")
+    assert [number for number, _ in index.read(count=1, reverse=True)] == [59]
+
+    # Grow the Log across a Block Boundary
+    with log_path.open("a") as log:
+        log.write(" line\n")
+    write_log(log_path, 61, 200)
+    lines = index.read(59, 3)
+    assert [text.split()[-1] for _, text in lines] == ["59", "line", "61"]
+    assert index.read(count=1, reverse=True)[0][1].endswith("message 199\n")
+    assert index.read(count=2, levels=log_index.level_mask("ERROR"))[0][1].endswith("failure 100\n")
+
+    # Rotate the Log
+    os.rename(log_path, tmp_path / "cronjob.log.1")
+    write_log(log_path, 1, 10)
+    assert [number for number, _ in index.read(count=100, reverse=True)] == list(range(1, 10))
+
+    # Truncate and Rewrite the Log with Longer Content
+    write_log(log_path, 1000, 1050, mode="w")
+    assert index.read(1, 1)[0][1].endswith("failure 1000\n")
+    assert index.line_count == 51